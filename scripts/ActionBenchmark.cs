@@ -0,0 +1,279 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text;
+using System.Text.Json;
+
+/// <summary>
+/// 메타 액션 처리량 벤치마크 (HeadlessHost + PlayerBot)
+/// 시나리오마다 봇이 고른 행동(또는 재생 목록)을 HandleAction → 대기 시간 소비까지 실행하고
+/// 행동 종류별 지연 시간(p50/p95/p99), Python 실행 시간 대 엔진 시간, 행동당 할당량을 JSON으로 기록
+/// </summary>
+public static class BenchmarkActions
+{
+	/// <summary>
+	/// 기본 대상 시나리오
+	/// </summary>
+	public static readonly string[] BundledScenarios =
+	{
+		"res://scenarios/scenario01/",
+		"res://scenarios/scenario02/",
+		"res://scenarios/scenario03/",
+	};
+
+	/// <summary>
+	/// 행동 하나의 측정값
+	/// </summary>
+	private readonly struct Sample
+	{
+		public readonly double TotalMs;
+		public readonly double InterpreterMs;
+		public readonly long AllocatedBytes;
+		public readonly long Steps;
+
+		public Sample(double totalMs, double interpreterMs, long allocatedBytes, long steps)
+		{
+			TotalMs = totalMs;
+			InterpreterMs = interpreterMs;
+			AllocatedBytes = allocatedBytes;
+			Steps = steps;
+		}
+	}
+
+	/// <summary>
+	/// 시나리오 하나의 측정 결과
+	/// </summary>
+	private sealed class ScenarioResult
+	{
+		public string Path = "";
+		public double BootMs;
+		public double TotalMs;
+		public readonly Dictionary<string, List<Sample>> ByType = new();
+		public readonly List<string> Trace = new();
+		public int Restarts;
+	}
+
+	/// <summary>
+	/// 봇으로 행동을 생성해 측정
+	/// </summary>
+	/// <param name="scenarioPaths">대상 시나리오 (null = 기본 시나리오 전체)</param>
+	/// <param name="actionsPerScenario">시나리오당 측정할 행동 수</param>
+	/// <param name="seed">봇 시드</param>
+	/// <param name="warmupActions">측정 전에 실행할 행동 수 (JIT/캐시 예열)</param>
+	/// <param name="outputPath">결과 JSON 경로 (null = 기록 안 함)</param>
+	/// <returns>결과 JSON</returns>
+	public static string Run(IReadOnlyList<string>? scenarioPaths = null, int actionsPerScenario = 500, int seed = 42, int warmupActions = 20, string? outputPath = null)
+	{
+		var results = new List<ScenarioResult>();
+		foreach (var path in scenarioPaths ?? BundledScenarios)
+		{
+			results.Add(RunScenario(path, null, actionsPerScenario, seed, warmupActions));
+		}
+
+		return Finish(results, "bot", seed, actionsPerScenario, outputPath);
+	}
+
+	/// <summary>
+	/// 기록된 행동 목록을 그대로 재생해 측정 (봇 결과의 trace를 재사용)
+	/// </summary>
+	/// <param name="scenarioPath">대상 시나리오</param>
+	/// <param name="actions">재생할 메타 액션 목록</param>
+	/// <param name="outputPath">결과 JSON 경로 (null = 기록 안 함)</param>
+	/// <returns>결과 JSON</returns>
+	public static string Replay(string scenarioPath, IReadOnlyList<string> actions, string? outputPath = null)
+	{
+		var result = RunScenario(scenarioPath, actions, actions.Count, 0, 0);
+		return Finish(new List<ScenarioResult> { result }, "replay", 0, actions.Count, outputPath);
+	}
+
+	private static ScenarioResult RunScenario(string scenarioPath, IReadOnlyList<string>? replay, int actionCount, int seed, int warmupActions)
+	{
+		var result = new ScenarioResult { Path = scenarioPath };
+
+		var host = new HeadlessHost(scenarioPath);
+		var bootStart = Stopwatch.GetTimestamp();
+		host.Boot();
+		result.BootMs = Stopwatch.GetElapsedTime(bootStart).TotalMilliseconds;
+
+		var bot = new PlayerBot(host, seed);
+		for (int i = 0; i < warmupActions; i++)
+		{
+			bot.Step();
+		}
+
+		var scriptSystem = host.ScriptSystem;
+		var runStart = Stopwatch.GetTimestamp();
+		for (int i = 0; i < actionCount; i++)
+		{
+			var meta = replay != null ? replay[i] : bot.Choose();
+			if (meta == null)
+			{
+				host.NewGame();
+				result.Restarts++;
+				continue;
+			}
+
+			var interpreterBefore = scriptSystem.InterpreterTicks;
+			var stepsBefore = host.StepCount;
+			var allocatedBefore = GC.GetAllocatedBytesForCurrentThread();
+			var start = Stopwatch.GetTimestamp();
+
+			host.Perform(meta);
+
+			var elapsed = Stopwatch.GetTimestamp() - start;
+			var allocated = GC.GetAllocatedBytesForCurrentThread() - allocatedBefore;
+			var interpreter = scriptSystem.InterpreterTicks - interpreterBefore;
+
+			var type = PlayerBot.GetActionType(meta);
+			if (!result.ByType.TryGetValue(type, out var samples))
+			{
+				samples = new List<Sample>();
+				result.ByType[type] = samples;
+			}
+			samples.Add(new Sample(TicksToMs(elapsed), TicksToMs(interpreter), allocated, host.StepCount - stepsBefore));
+			result.Trace.Add(meta);
+		}
+		result.TotalMs = Stopwatch.GetElapsedTime(runStart).TotalMilliseconds;
+
+		host.Shutdown();
+		return result;
+	}
+
+	private static double TicksToMs(long ticks) => ticks * 1000.0 / Stopwatch.Frequency;
+
+	// ===== 결과 출력 =====
+
+	private static string Finish(List<ScenarioResult> results, string mode, int seed, int actionsPerScenario, string? outputPath)
+	{
+		var json = WriteJson(results, mode, seed, actionsPerScenario);
+		if (outputPath != null)
+		{
+			var path = Morld.GamePath.Globalize(outputPath);
+			File.WriteAllText(path, json);
+		}
+
+		foreach (var result in results)
+		{
+			PrintSummary(result);
+		}
+		return json;
+	}
+
+	private static string WriteJson(List<ScenarioResult> results, string mode, int seed, int actionsPerScenario)
+	{
+		using var stream = new MemoryStream();
+		using (var writer = new Utf8JsonWriter(stream, new JsonWriterOptions { Indented = true }))
+		{
+			writer.WriteStartObject();
+			writer.WriteString("benchmark", "actions");
+			writer.WriteString("mode", mode);
+			writer.WriteNumber("seed", seed);
+			writer.WriteNumber("actionsPerScenario", actionsPerScenario);
+			writer.WriteString("timestamp", DateTime.UtcNow.ToString("o"));
+
+			writer.WriteStartArray("scenarios");
+			foreach (var result in results)
+			{
+				var all = new List<Sample>();
+				foreach (var samples in result.ByType.Values)
+					all.AddRange(samples);
+
+				writer.WriteStartObject();
+				writer.WriteString("path", result.Path);
+				writer.WriteNumber("bootMs", Round(result.BootMs));
+				writer.WriteNumber("totalMs", Round(result.TotalMs));
+				writer.WriteNumber("actionsPerSecond", result.TotalMs > 0 ? Round(all.Count * 1000.0 / result.TotalMs) : 0);
+				writer.WriteNumber("restarts", result.Restarts);
+
+				writer.WritePropertyName("all");
+				WriteStats(writer, all);
+
+				writer.WriteStartObject("byType");
+				foreach (var (type, samples) in result.ByType)
+				{
+					writer.WritePropertyName(type);
+					WriteStats(writer, samples);
+				}
+				writer.WriteEndObject();
+
+				writer.WriteStartArray("trace");
+				foreach (var meta in result.Trace)
+					writer.WriteStringValue(meta);
+				writer.WriteEndArray();
+
+				writer.WriteEndObject();
+			}
+			writer.WriteEndArray();
+
+			writer.WriteEndObject();
+		}
+		return Encoding.UTF8.GetString(stream.ToArray());
+	}
+
+	private static void WriteStats(Utf8JsonWriter writer, List<Sample> samples)
+	{
+		var totals = new List<double>(samples.Count);
+		double interpreterSum = 0, totalSum = 0;
+		long allocatedSum = 0, stepSum = 0;
+		foreach (var sample in samples)
+		{
+			totals.Add(sample.TotalMs);
+			totalSum += sample.TotalMs;
+			interpreterSum += sample.InterpreterMs;
+			allocatedSum += sample.AllocatedBytes;
+			stepSum += sample.Steps;
+		}
+		totals.Sort();
+
+		var count = Math.Max(samples.Count, 1);
+		writer.WriteStartObject();
+		writer.WriteNumber("count", samples.Count);
+		writer.WriteNumber("meanMs", Round(totalSum / count));
+		writer.WriteNumber("p50Ms", Round(Percentile(totals, 0.50)));
+		writer.WriteNumber("p95Ms", Round(Percentile(totals, 0.95)));
+		writer.WriteNumber("p99Ms", Round(Percentile(totals, 0.99)));
+		writer.WriteNumber("maxMs", Round(totals.Count > 0 ? totals[^1] : 0));
+		writer.WriteNumber("interpreterMsPerAction", Round(interpreterSum / count));
+		writer.WriteNumber("engineMsPerAction", Round((totalSum - interpreterSum) / count));
+		writer.WriteNumber("allocatedBytesPerAction", allocatedSum / count);
+		writer.WriteNumber("stepsPerAction", Round((double)stepSum / count));
+		writer.WriteEndObject();
+	}
+
+	/// <summary>
+	/// 정렬된 목록의 백분위수 (nearest-rank)
+	/// </summary>
+	private static double Percentile(List<double> sorted, double percentile)
+	{
+		if (sorted.Count == 0)
+			return 0;
+		var rank = (int)Math.Ceiling(percentile * sorted.Count);
+		return sorted[Math.Clamp(rank - 1, 0, sorted.Count - 1)];
+	}
+
+	private static double Round(double value) => Math.Round(value, 4);
+
+	private static void PrintSummary(ScenarioResult result)
+	{
+		int count = 0;
+		foreach (var samples in result.ByType.Values)
+			count += samples.Count;
+
+		Console.WriteLine($"=== Action Benchmark: {result.Path} ===");
+		Console.WriteLine($"   Boot: {result.BootMs:F1} ms, Actions: {count}, Total: {result.TotalMs:F1} ms ({(result.TotalMs > 0 ? count * 1000.0 / result.TotalMs : 0):F1} actions/s)");
+
+		foreach (var (type, samples) in result.ByType)
+		{
+			var totals = new List<double>(samples.Count);
+			double interpreter = 0;
+			foreach (var sample in samples)
+			{
+				totals.Add(sample.TotalMs);
+				interpreter += sample.InterpreterMs;
+			}
+			totals.Sort();
+			Console.WriteLine($"   {type,-24} n={samples.Count,5}  p50: {Percentile(totals, 0.50),8:F3} ms  p99: {Percentile(totals, 0.99),8:F3} ms  python: {interpreter / samples.Count,8:F3} ms");
+		}
+	}
+}
@@ -0,0 +1,173 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Text.Json;
+using Morld;
+
+/// <summary>
+/// 시뮬레이션 Step 할당량 벤치마크 (SyntheticScenarioGenerator + HeadlessHost)
+/// 1분 단위 Step을 반복하며 System별 할당 바이트(ECS.TrackAllocations)를 기록
+/// - 경로 계산 Step: 유닛이 새 Edge를 시작해 경로 탐색이 일어난 Step (PathResult 등 결과 객체 할당)
+/// - 정상 Step: 그 외 모든 Step - 할당이 0바이트여야 함 (zeroAllocSteadyState)
+/// </summary>
+public static class BenchmarkAllocation
+{
+	private sealed class Result
+	{
+		public SyntheticScenarioGenerator.Summary Summary = null!;
+		public int Seed;
+		public int WarmupSteps;
+		public int SteadySteps;
+		public long SteadyBytes;
+		public long MaxSteadyStepBytes;
+		public int PlanningSteps;
+		public long PlanningBytes;
+		public long PathQueries;
+		public ECS.SystemAllocation[] Systems = Array.Empty<ECS.SystemAllocation>();
+
+		public int Steps => SteadySteps + PlanningSteps;
+		public bool ZeroAllocSteadyState => SteadySteps > 0 && SteadyBytes == 0;
+	}
+
+	/// <summary>
+	/// 측정 실행
+	/// </summary>
+	/// <param name="options">합성 시나리오 생성 옵션 (null = 기본값)</param>
+	/// <param name="warmupSteps">측정 전 Step 수 (JIT, 캐시, 작업 컬렉션 용량 확보)</param>
+	/// <param name="measureSteps">측정 Step 수 (Step당 게임 시간 1분)</param>
+	/// <param name="outputPath">결과 JSON 경로 (null = 기록 안 함)</param>
+	/// <returns>정상 Step의 할당이 0바이트인지</returns>
+	public static bool Run(SyntheticScenarioOptions? options = null, int warmupSteps = 120, int measureSteps = 1440, string? outputPath = null)
+	{
+		options ??= new SyntheticScenarioOptions();
+		var directory = $"{BenchmarkScaling.OutputRoot}alloc_{options.Seed}/";
+		var result = new Result
+		{
+			Seed = options.Seed,
+			WarmupSteps = warmupSteps,
+			Summary = SyntheticScenarioGenerator.Generate(directory, options)
+		};
+
+		var host = new HeadlessHost(GamePath.Globalize(directory));
+		host.Boot();
+		BenchmarkScaling.DismissMonologues(host);
+
+		var world = host.World;
+		var playerSystem = host.PlayerSystem;
+		var movementSystem = (SE.MovementSystem)world.FindSystem("movementSystem");
+
+		// 로그 문자열이 측정에 섞이지 않도록
+		var logLevel = Log.MinLevel;
+		Log.MinLevel = LogLevel.Warning;
+		try
+		{
+			// Step 하나 = 1분, 측정 도중 대기 시간이 끝나지 않도록 넉넉히 요청
+			playerSystem.MaxStepMinutes = 1;
+			playerSystem.RequestTimeAdvance(warmupSteps + measureSteps + 1, "allocation benchmark");
+
+			for (int i = 0; i < warmupSteps; i++)
+				world.Update(HeadlessHost.DefaultFrameMs);
+
+			world.ResetAllocationStats();
+			world.TrackAllocations = true;
+			var queriesBefore = movementSystem.PathQueries;
+			for (int i = 0; i < measureSteps; i++)
+			{
+				var queries = movementSystem.PathQueries;
+				world.Update(HeadlessHost.DefaultFrameMs);
+				var bytes = world.LastStepAllocatedBytes;
+
+				if (movementSystem.PathQueries != queries)
+				{
+					result.PlanningSteps++;
+					result.PlanningBytes += bytes;
+				}
+				else
+				{
+					result.SteadySteps++;
+					result.SteadyBytes += bytes;
+					result.MaxSteadyStepBytes = Math.Max(result.MaxSteadyStepBytes, bytes);
+				}
+			}
+			world.TrackAllocations = false;
+			result.PathQueries = movementSystem.PathQueries - queriesBefore;
+			result.Systems = world.GetAllocationStats();
+		}
+		finally
+		{
+			world.TrackAllocations = false;
+			playerSystem.MaxStepMinutes = int.MaxValue;
+			Log.MinLevel = logLevel;
+			host.Shutdown();
+		}
+
+		var json = WriteJson(result);
+		if (outputPath != null)
+		{
+			var path = GamePath.Globalize(outputPath);
+			File.WriteAllText(path, json);
+		}
+
+		PrintSummary(result);
+		return result.ZeroAllocSteadyState;
+	}
+
+	// ===== 결과 출력 =====
+
+	private static string WriteJson(Result result)
+	{
+		using var stream = new MemoryStream();
+		using (var writer = new Utf8JsonWriter(stream, new JsonWriterOptions { Indented = true }))
+		{
+			writer.WriteStartObject();
+			writer.WriteString("benchmark", "allocation");
+			writer.WriteNumber("seed", result.Seed);
+			writer.WriteString("timestamp", DateTime.UtcNow.ToString("o"));
+			writer.WriteNumber("locations", result.Summary.Locations);
+			writer.WriteNumber("npcs", result.Summary.Npcs);
+			writer.WriteNumber("warmupSteps", result.WarmupSteps);
+			writer.WriteNumber("steps", result.Steps);
+
+			writer.WriteNumber("steadySteps", result.SteadySteps);
+			writer.WriteNumber("steadyBytes", result.SteadyBytes);
+			writer.WriteNumber("steadyBytesPerStep", PerStep(result.SteadyBytes, result.SteadySteps));
+			writer.WriteNumber("maxSteadyStepBytes", result.MaxSteadyStepBytes);
+			writer.WriteNumber("planningSteps", result.PlanningSteps);
+			writer.WriteNumber("planningBytes", result.PlanningBytes);
+			writer.WriteNumber("planningBytesPerStep", PerStep(result.PlanningBytes, result.PlanningSteps));
+			writer.WriteNumber("pathQueries", result.PathQueries);
+			writer.WriteBoolean("zeroAllocSteadyState", result.ZeroAllocSteadyState);
+
+			writer.WriteStartArray("systems");
+			foreach (var system in result.Systems)
+			{
+				writer.WriteStartObject();
+				writer.WriteString("name", system.Name);
+				writer.WriteNumber("totalBytes", system.TotalBytes);
+				writer.WriteNumber("bytesPerStep", PerStep(system.TotalBytes, result.Steps));
+				writer.WriteEndObject();
+			}
+			writer.WriteEndArray();
+
+			writer.WriteEndObject();
+		}
+		return Encoding.UTF8.GetString(stream.ToArray());
+	}
+
+	private static double PerStep(long bytes, int steps) => steps > 0 ? Math.Round((double)bytes / steps, 2) : 0;
+
+	private static void PrintSummary(Result result)
+	{
+		Console.WriteLine("=== Allocation Benchmark ===");
+		Console.WriteLine($"   {result.Summary.Locations} locations, {result.Summary.Npcs} NPCs, {result.Steps} steps ({result.PathQueries} path queries)");
+		Console.WriteLine($"   steady:   {result.SteadySteps,6} steps {PerStep(result.SteadyBytes, result.SteadySteps),12:F2} B/step (max {result.MaxSteadyStepBytes} B)");
+		Console.WriteLine($"   planning: {result.PlanningSteps,6} steps {PerStep(result.PlanningBytes, result.PlanningSteps),12:F2} B/step");
+		Console.WriteLine($"   {"system",-20} {"total B",12} {"B/step",12}");
+		foreach (var system in result.Systems)
+		{
+			Console.WriteLine($"   {system.Name,-20} {system.TotalBytes,12} {PerStep(system.TotalBytes, result.Steps),12:F2}");
+		}
+		Console.WriteLine(result.ZeroAllocSteadyState ? "   ✓ steady-state steps allocate 0 bytes" : "   ✗ steady-state steps allocate");
+	}
+}
@@ -0,0 +1,262 @@
+using System;
+using SE;
+
+/// <summary>
+/// 게임 부팅 공통 절차 (GameEngine, HeadlessHost 공용)
+/// 시스템 등록 → 데이터 로드(Python 또는 JSON) → 시스템 간 참조 설정 → 이벤트 콜백/액션 핸들러 등록 → 게임 시작
+/// 호스트마다 다른 부분은 TextUISystem 생성(RichTextLabel 또는 텍스트 싱크)뿐이며,
+/// 시간 진행 방식(StepScheduler, 직접 Step)은 각 호스트가 Boot 이후 구성
+/// </summary>
+public class GameBootstrap
+{
+	private static readonly Morld.LogCategory _log = Morld.Log.Category("GameBootstrap");
+
+	private readonly SE.World _world;
+	private readonly string _scenarioPath;
+	private readonly Func<DescribeSystem, TextUISystem> _createTextUISystem;
+
+	public SE.World World => _world;
+	public ScriptSystem ScriptSystem { get; private set; }
+	public PlayerSystem PlayerSystem { get; private set; }
+	public DescribeSystem DescribeSystem { get; private set; }
+	public InventorySystem InventorySystem { get; private set; }
+	public TextUISystem TextUISystem { get; private set; }
+	public EventSystem EventSystem { get; private set; }
+	public MetaActionHandler ActionHandler { get; private set; }
+
+	/// <summary>
+	/// 인메모리 체크포인트 (TakeNewGameCheckpoint 이후 사용 가능)
+	/// </summary>
+	public Morld.CheckpointManager Checkpoints { get; private set; }
+
+	/// <summary>
+	/// 새 게임용 체크포인트 id (0 = 아직 없음)
+	/// </summary>
+	public int NewGameCheckpoint { get; private set; }
+
+	/// <summary>
+	/// 시나리오 경로 (끝에 "/" 포함)
+	/// </summary>
+	public string ScenarioPath => _scenarioPath;
+	private string DataPath => _scenarioPath + "data/";
+
+	/// <param name="world">시스템을 등록할 World</param>
+	/// <param name="scenarioPath">시나리오 폴더 (res:// 또는 일반 디렉터리 경로)</param>
+	/// <param name="createTextUISystem">DescribeSystem을 받아 호스트에 맞는 TextUISystem 생성</param>
+	public GameBootstrap(SE.World world, string scenarioPath, Func<DescribeSystem, TextUISystem> createTextUISystem)
+	{
+		_world = world ?? throw new ArgumentNullException(nameof(world));
+		_scenarioPath = scenarioPath.EndsWith("/") ? scenarioPath : scenarioPath + "/";
+		_createTextUISystem = createTextUISystem ?? throw new ArgumentNullException(nameof(createTextUISystem));
+	}
+
+	/// <summary>
+	/// 시스템 등록부터 액션 핸들러 등록까지 (게임 시작 전 단계)
+	/// </summary>
+	public void Boot()
+	{
+		// 1. 모든 시스템 등록
+		using (Morld.TraceRecorder.Span("RegisterAllSystems"))
+			RegisterAllSystems();
+
+		// 2. 데이터 로드 (Python 또는 JSON)
+		if (ScriptSystem.IsPythonDataSource())
+		{
+			using (Morld.TraceRecorder.Span("LoadDataFromPython"))
+				LoadDataFromPython();
+		}
+		else
+		{
+			using (Morld.TraceRecorder.Span("LoadDataFromJson"))
+				LoadDataFromJson();
+		}
+
+		// 3. 시스템 간 참조 설정 및 후처리
+		using (Morld.TraceRecorder.Span("SetupSystemReferences"))
+			SetupSystemReferences();
+
+		// 4. 이벤트 콜백 및 핸들러 등록
+		using (Morld.TraceRecorder.Span("RegisterEventHandlers"))
+			RegisterEventHandlers();
+	}
+
+	/// <summary>
+	/// 모든 시스템 등록 (Data Systems + Logic Systems)
+	/// </summary>
+	private void RegisterAllSystems()
+	{
+		// Script System (시나리오 경로 설정 필요)
+		ScriptSystem = _world.AddSystem(new ScriptSystem(), "scriptSystem") as ScriptSystem;
+		ScriptSystem.SetScenarioPath(_scenarioPath);
+
+		// Data Systems
+		_world.AddSystem(new WorldSystem("aka"), "worldSystem");
+		_world.AddSystem(new UnitSystem(), "unitSystem");
+		_world.AddSystem(new ItemSystem(), "itemSystem");
+		InventorySystem = _world.AddSystem(new InventorySystem(), "inventorySystem") as InventorySystem;
+
+		// Logic Systems
+		_world.AddSystem(new ActionSystem(), "actionSystem");
+		_world.AddSystem(new MovementSystem(), "movementSystem");
+		_world.AddSystem(new BehaviorSystem(), "behaviorSystem");
+		PlayerSystem = _world.AddSystem(new PlayerSystem(), "playerSystem") as PlayerSystem;
+		DescribeSystem = _world.AddSystem(new DescribeSystem(), "describeSystem") as DescribeSystem;
+
+		// UI System (호스트별 출력 대상)
+		TextUISystem = _createTextUISystem(DescribeSystem);
+		_world.AddSystem(TextUISystem, "textUISystem");
+
+		// Event System
+		EventSystem = _world.AddSystem(new EventSystem(), "eventSystem") as EventSystem;
+
+		// 확장 시스템 (ActionProvider)
+		var singSystem = _world.AddSystem(new SingASongSystem(), "singASongSystem") as SingASongSystem;
+		singSystem?.RegisterToDescribeSystem();
+		InventorySystem.RegisterToDescribeSystem();
+
+		// ScriptSystem에 morld 모듈 등록 (Python에서 import morld 가능하게)
+		var unitSystem = _world.FindSystem("unitSystem") as UnitSystem;
+		ScriptSystem.SetSystemReferences(InventorySystem, PlayerSystem, unitSystem, TextUISystem);
+	}
+
+	/// <summary>
+	/// JSON 파일에서 데이터 로드
+	/// </summary>
+	private void LoadDataFromJson()
+	{
+		_log.Info("Loading data from JSON files...");
+
+		// 지형/시간/유닛/아이템/인벤토리 파일을 병렬로 읽고 스트리밍 파싱
+		// (inventory_data.json이 없으면 unit_data.json에서 마이그레이션)
+		Morld.ParallelDataLoader.Load(_world, DataPath);
+
+		// monologue 스크립트 로드
+		ScriptSystem.LoadMonologueScripts();
+
+		_log.Info("JSON data loaded.");
+	}
+
+	/// <summary>
+	/// Python에서 데이터 로드 (morld API 사용)
+	/// </summary>
+	private void LoadDataFromPython()
+	{
+		_log.Info("Data source: Python");
+		_log.Info("Loading data from Python via morld API...");
+
+		var worldSystem = _world.FindSystem("worldSystem") as WorldSystem;
+		var unitSystem = _world.FindSystem("unitSystem") as UnitSystem;
+		var itemSystem = _world.FindSystem("itemSystem") as ItemSystem;
+
+		// Data System 참조 설정 (morld.add_unit 등 데이터 API 등록)
+		ScriptSystem.SetDataSystemReferences(worldSystem, unitSystem, itemSystem, InventorySystem);
+
+		// Python의 initialize_scenario() 호출 - morld API로 데이터 등록
+		ScriptSystem.CallInitializeScenario();
+
+		// Python 패키지의 나머지 모듈 로드 (이벤트 핸들러 등)
+		ScriptSystem.LoadScenarioPackage();
+
+		_log.Info("Python data loaded.");
+	}
+
+	/// <summary>
+	/// 시스템 간 참조 설정
+	/// </summary>
+	private void SetupSystemReferences()
+	{
+		var unitSystem = _world.FindSystem("unitSystem") as UnitSystem;
+
+		// ScriptSystem 테스트 함수 등록
+		ScriptSystem.TestHelloWorld();
+		ScriptSystem.RegisterTestFunctions();
+
+		// TextUISystem 설정
+		TextUISystem.SetSystemReferences(PlayerSystem, InventorySystem, ScriptSystem);
+
+		// EventSystem 설정
+		EventSystem.SetSystemReferences(ScriptSystem, TextUISystem, unitSystem, PlayerSystem);
+		EventSystem.InitializeLocations();
+
+		// DescribeSystem 설정 (Python 모드에서는 data 폴더가 없을 수 있음)
+		if (!ScriptSystem.IsPythonDataSource())
+		{
+			DescribeSystem.LoadActionMessages(DataPath + "action_messages.json");
+		}
+	}
+
+	/// <summary>
+	/// 이벤트 핸들러 및 콜백 등록
+	/// </summary>
+	private void RegisterEventHandlers()
+	{
+		var itemSystem = _world.FindSystem("itemSystem") as ItemSystem;
+
+		// InventorySystem 이벤트 콜백 (행동 로그 자동 생성)
+		InventorySystem.OnInventoryChanged += (evt) =>
+		{
+			var itemName = itemSystem?.GetItem(evt.ItemId)?.Name ?? "아이템";
+			var countText = evt.Count > 1 ? $" x{evt.Count}" : "";
+
+			string? message = evt.Type switch
+			{
+				InventoryEventType.ItemAdded => $"{itemName}{countText}을(를) 획득했습니다",
+				InventoryEventType.ItemRemoved => $"{itemName}{countText}을(를) 잃었습니다",
+				InventoryEventType.ItemTransferred => $"{itemName}{countText}을(를) 옮겼습니다",
+				InventoryEventType.ItemEquipped => $"{itemName}을(를) 장착했습니다",
+				InventoryEventType.ItemUnequipped => $"{itemName}을(를) 장착 해제했습니다",
+				InventoryEventType.ItemLost => $"{itemName}{countText}을(를) 사용했습니다",
+				_ => null
+			};
+
+			if (message != null)
+			{
+				TextUISystem.AddActionLog(message);
+			}
+		};
+
+		// MetaActionHandler 초기화
+		ActionHandler = new MetaActionHandler(_world, PlayerSystem, TextUISystem);
+		ActionHandler.OnUpdateSituation += TextUISystem.ShowSituation;
+	}
+
+	/// <summary>
+	/// 현재 상태를 새 게임용 체크포인트로 보관 (StartGame 직전에 한 번 호출)
+	/// </summary>
+	public void TakeNewGameCheckpoint()
+	{
+		Checkpoints = Morld.CheckpointManager.ForWorld(_world);
+		NewGameCheckpoint = Checkpoints.Take();
+	}
+
+	/// <summary>
+	/// 게임 시작 (시작 이벤트 처리 후 초기 상황 표시)
+	/// </summary>
+	public void StartGame()
+	{
+		// 게임 시작 이벤트 등록
+		EventSystem.Enqueue(Morld.GameEvent.GameStart());
+
+		// 게임 시작 이벤트 처리 후 초기 상황 표시
+		var eventHandled = EventSystem.FlushEvents();
+		if (!eventHandled)
+		{
+			TextUISystem.ShowSituation();
+		}
+	}
+
+	/// <summary>
+	/// 데이터를 다시 로드하지 않고 새 게임용 체크포인트로 되돌린 뒤 게임 재시작
+	/// </summary>
+	/// <returns>새 게임용 체크포인트가 없으면 false</returns>
+	public bool RestartGame()
+	{
+		if (NewGameCheckpoint == 0)
+			return false;
+
+		Checkpoints.Restore(NewGameCheckpoint);
+		EventSystem.InitializeLocations();
+		StartGame();
+		return true;
+	}
+}
@@ -1,4 +1,7 @@
+// 디버그 덤프는 DEBUG 빌드에서만 (릴리스 빌드에서는 출력 문자열을 만들지 않음)
+#if DEBUG
 #define DEBUG_LOG
+#endif
 
 using Godot;
 using System;
@@ -8,6 +11,7 @@ using SE;
 public partial class GameEngine : Node
 {
 	private SE.World _world;
+	private GameBootstrap _bootstrap;
 	private PlayerSystem _playerSystem;
 	private DescribeSystem _describeSystem;
 	private InventorySystem _inventorySystem;
@@ -17,45 +21,97 @@ public partial class GameEngine : Node
 	private ScriptSystem _scriptSystem;
 	private EventSystem _eventSystem;
 
+	// 시간 진행 스케줄러 (프레임 예산 안에서만 Step 실행)
+	private Morld.StepScheduler _stepScheduler;
+
 	// 시나리오 경로 (res:// 기준)
 	// private string _scenarioPath = "res://scenarios/scenario01/";
 	// private string _scenarioPath = "res://scenarios/scenario02/";
 	private string _scenarioPath = "res://scenarios/scenario03/";
-	private string DataPath => _scenarioPath + "data/";
+
+	// 행동 로그 히스토리 (링 버퍼에서 밀려난 로그, gzip)
+	private const string ActionLogHistoryPath = "user://action_log_history.gz";
+
+	// 퀵세이브 스냅샷 (바이너리, WorldSnapshot)
+	private const string QuickSavePath = "user://quicksave.mrld";
+
+	// 로그 파일 (명령줄 사용자 인자 --log-file 지정 시 기록)
+	private const string LogFilePath = "user://logs/morld.log";
+
+	// 시작 구간 trace (명령줄 사용자 인자 --trace-startup 지정 시 기록)
+	private const string StartupTracePath = "user://startup_trace.json";
+
+	// 마지막 행동 되돌리기용 체크포인트 (새 게임용은 GameBootstrap이 보관)
+	private int _undoCheckpoint = 0;
+
+	// 마지막 행동 되돌리기 (명령줄 사용자 인자 --undo, Ctrl+Z)
+	// 되돌리기용 체크포인트는 클릭마다 모든 유닛 상태를 복사하므로(O(유닛 수)) 켠 경우에만 생성
+	private bool _undoEnabled = false;
 
 	public override void _Ready()
 	{
-		// 1. UI 초기화
-		InitializeUI();
+		var userArgs = OS.GetCmdlineUserArgs();
+		ConfigureLogging(userArgs);
+		var trace = Array.IndexOf(userArgs, "--trace-startup") >= 0 ? Morld.TraceRecorder.Start() : null;
 
-		// 2. World 초기화
-		this._world = new SE.World(this);
+		using (Morld.TraceRecorder.Span("GameEngine._Ready"))
+		{
+			// 1. UI 초기화
+			using (Morld.TraceRecorder.Span("InitializeUI"))
+				InitializeUI();
 
-		// 3. 모든 시스템 등록
-		RegisterAllSystems();
+			// 2. World 초기화
+			this._world = new SE.World(this);
 
-		// 4. 데이터 로드 (Python 또는 JSON)
-		if (_scriptSystem?.IsPythonDataSource() ?? false)
-		{
-			LoadDataFromPython();
-		}
-		else
-		{
-			LoadDataFromJson();
-		}
+			// 3. 시스템 등록, 데이터 로드, 시스템 간 참조 설정, 이벤트 콜백 등록 (HeadlessHost와 공용)
+			_bootstrap = new GameBootstrap(_world, _scenarioPath,
+				describeSystem => new TextUISystem(_textUi, describeSystem, ActionLogHistoryPath));
+			_bootstrap.Boot();
+			AssignSystems();
 
-		// 5. 시스템 간 참조 설정 및 후처리
-		SetupSystemReferences();
+			// 4. 시간 진행 스케줄러
+			SetupStepScheduler();
 
-		// 6. 이벤트 콜백 및 핸들러 등록
-		RegisterEventHandlers();
+			// 5. 게임 시작 (시작 직전 상태를 새 게임용 체크포인트로 보관)
+			using (Morld.TraceRecorder.Span("StartGame"))
+			{
+				_bootstrap.TakeNewGameCheckpoint();
+				_bootstrap.StartGame();
+			}
+
+			// 6. 비동기 스크립트 실행 (명령줄 사용자 인자 --async-scripts)
+			if (Array.IndexOf(userArgs, "--async-scripts") >= 0)
+				_scriptSystem?.EnableAsyncExecution();
 
-		// 7. 게임 시작
-		StartGame();
+			// 7. 마지막 행동 되돌리기 (명령줄 사용자 인자 --undo)
+			_undoEnabled = Array.IndexOf(userArgs, "--undo") >= 0;
 
 #if DEBUG_LOG
-		DebugPrintGameState();
+			using (Morld.TraceRecorder.Span("DebugPrintGameState"))
+				DebugPrintGameState();
 #endif
+		}
+
+		if (trace != null)
+		{
+			trace.Stop();
+			trace.Save(StartupTracePath);
+			GD.Print($"[GameEngine] Startup trace saved: {StartupTracePath} ({trace.EventCount} events)");
+		}
+	}
+
+	/// <summary>
+	/// 로그 설정 (--log=info 또는 --log=ScriptSystem=debug,morld=warning, --log-file)
+	/// </summary>
+	private static void ConfigureLogging(string[] userArgs)
+	{
+		foreach (var arg in userArgs)
+		{
+			if (arg.StartsWith("--log="))
+				Morld.Log.Configure(arg.Substring("--log=".Length));
+			else if (arg == "--log-file")
+				Morld.Log.EnableFileSink(LogFilePath);
+		}
 	}
 
 	/// <summary>
@@ -78,219 +134,156 @@ public partial class GameEngine : Node
 	}
 
 	/// <summary>
-	/// 모든 시스템 등록 (Data Systems + Logic Systems)
+	/// 부팅된 시스템 참조 보관
 	/// </summary>
-	private void RegisterAllSystems()
+	private void AssignSystems()
 	{
-		// Script System (시나리오 경로 설정 필요)
-		_scriptSystem = this._world.AddSystem(new ScriptSystem(), "scriptSystem") as ScriptSystem;
-		_scriptSystem?.SetScenarioPath(_scenarioPath);
-
-		// Data Systems
-		this._world.AddSystem(new WorldSystem("aka"), "worldSystem");
-		this._world.AddSystem(new UnitSystem(), "unitSystem");
-		this._world.AddSystem(new ItemSystem(), "itemSystem");
-		_inventorySystem = this._world.AddSystem(new InventorySystem(), "inventorySystem") as InventorySystem;
-
-		// Logic Systems
-		this._world.AddSystem(new ActionSystem(), "actionSystem");
-		this._world.AddSystem(new MovementSystem(), "movementSystem");
-		this._world.AddSystem(new BehaviorSystem(), "behaviorSystem");
-		_playerSystem = this._world.AddSystem(new PlayerSystem(), "playerSystem") as PlayerSystem;
-		_describeSystem = this._world.AddSystem(new DescribeSystem(), "describeSystem") as DescribeSystem;
-
-		// UI System
-		_textUISystem = new TextUISystem(_textUi, _describeSystem);
-		this._world.AddSystem(_textUISystem, "textUISystem");
-
-		// Event System
-		_eventSystem = this._world.AddSystem(new EventSystem(), "eventSystem") as EventSystem;
-
-		// 확장 시스템 (ActionProvider)
-		var singSystem = this._world.AddSystem(new SingASongSystem(), "singASongSystem") as SingASongSystem;
-		singSystem?.RegisterToDescribeSystem();
-		_inventorySystem?.RegisterToDescribeSystem();
-
-		// ScriptSystem에 morld 모듈 등록 (Python에서 import morld 가능하게)
-		var unitSystem = this._world.FindSystem("unitSystem") as UnitSystem;
-		_scriptSystem?.SetSystemReferences(_inventorySystem, _playerSystem, unitSystem, _textUISystem);
+		_scriptSystem = _bootstrap.ScriptSystem;
+		_playerSystem = _bootstrap.PlayerSystem;
+		_describeSystem = _bootstrap.DescribeSystem;
+		_inventorySystem = _bootstrap.InventorySystem;
+		_textUISystem = _bootstrap.TextUISystem;
+		_eventSystem = _bootstrap.EventSystem;
+		_actionHandler = _bootstrap.ActionHandler;
 	}
 
+#if DEBUG_LOG
 	/// <summary>
-	/// JSON 파일에서 데이터 로드
+	/// 디버그 정보 출력
 	/// </summary>
-	private void LoadDataFromJson()
+	private void DebugPrintGameState()
 	{
-		GD.Print("[GameEngine] Loading data from JSON files...");
-
-		var worldSystem = this._world.FindSystem("worldSystem") as WorldSystem;
-		var unitSystem = this._world.FindSystem("unitSystem") as UnitSystem;
-		var itemSystem = this._world.FindSystem("itemSystem") as ItemSystem;
+		(this._world.FindSystem("worldSystem") as WorldSystem)?.GetTerrain().DebugPrint();
+		(this._world.FindSystem("worldSystem") as WorldSystem)?.GetTime().DebugPrint();
+		(this._world.FindSystem("unitSystem") as UnitSystem)?.DebugPrint();
+		_inventorySystem?.DebugPrint();
 
-		// JSON 파일에서 데이터 로드
-		worldSystem?.GetTerrain().UpdateFromFile(DataPath + "location_data.json");
-		worldSystem?.GetTime().UpdateFromFile(DataPath + "time_data.json");
-		unitSystem?.UpdateFromFile(DataPath + "unit_data.json");
-		itemSystem?.UpdateFromFile(DataPath + "item_data.json");
+		Debug.Print($"System Count : {this._world.GetAllSystem().Count}");
+		GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+		GD.Print("[GameEngine] 입력 테스트 모드");
+		GD.Print("  마우스 왼쪽 클릭: 4시간 (240분) 진행");
+		GD.Print("  마우스 오른쪽 클릭: 15분 진행");
+		GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+	}
+#endif
 
-		// InventorySystem 데이터 로드 (없으면 unit_data.json에서 마이그레이션)
-		if (!_inventorySystem.LoadData(DataPath))
-		{
-			unitSystem?.MigrateInventoryData(DataPath + "unit_data.json", _inventorySystem);
-		}
+	public override void _Process(double delta)
+	{
+		// 비동기 스크립트가 쌓은 morld.* 명령 적용 및 완료된 호출 처리 (프레임 시작 = 안전한 시점)
+		_scriptSystem?.ApplyPendingCommands();
 
-		// monologue 스크립트 로드
-		_scriptSystem?.LoadMonologueScripts();
+		// 대기 중인 시간을 프레임 예산 안에서 진행 (시간 소비 → 이벤트 감지 → 이벤트 처리)
+		// 스크립트 실행 중에는 월드 상태를 바꾸지 않음 (이벤트 처리 대기는 스케줄러가 직접 확인)
+		if (!(_scriptSystem?.IsBusy ?? false) || _stepScheduler?.Current == Morld.StepScheduler.Phase.WaitingEvents)
+			_stepScheduler?.Tick((int)(delta * 1000));
 
-		GD.Print("[GameEngine] JSON data loaded.");
+		// 프레임 끝에서 한 번만 UI 렌더링 (lazy update 플러시)
+		_textUISystem?.FlushDisplay();
 	}
 
 	/// <summary>
-	/// Python에서 데이터 로드 (morld API 사용)
+	/// 시간 진행 스케줄러 생성 및 콜백 등록
 	/// </summary>
-	private void LoadDataFromPython()
+	private void SetupStepScheduler()
 	{
-		GD.Print("[GameEngine] Data source: Python");
-		GD.Print("[GameEngine] Loading data from Python via morld API...");
+		_stepScheduler = new Morld.StepScheduler(_world, _playerSystem, _eventSystem);
 
-		var worldSystem = this._world.FindSystem("worldSystem") as WorldSystem;
-		var unitSystem = this._world.FindSystem("unitSystem") as UnitSystem;
-		var itemSystem = this._world.FindSystem("itemSystem") as ItemSystem;
+		// 여러 프레임에 걸쳐 진행될 때만 진행률 표시
+		_stepScheduler.OnProgress += (progress) =>
+		{
+			_textUISystem?.SetProgress($"시간이 흐르는 중... {progress * 100:F0}%");
+		};
 
-		// Data System 참조 설정 (morld.add_unit 등 데이터 API 등록)
-		_scriptSystem?.SetDataSystemReferences(worldSystem, unitSystem, itemSystem, _inventorySystem);
+		// 이벤트 처리 (모놀로그 표시 시 상황 업데이트 스킵)
+		_stepScheduler.OnCompleted += (eventHandled) =>
+		{
+			_textUISystem?.SetProgress(null);
+			if (!eventHandled)
+			{
+				UpdateSituationText();
+			}
+		};
+	}
+
+	public override void _ExitTree()
+	{
+		// 대기 중인 행동 로그 히스토리 기록
+		_textUISystem?.FlushLogHistory();
 
-		// Python의 initialize_scenario() 호출 - morld API로 데이터 등록
-		_scriptSystem?.CallInitializeScenario();
+		// 대기 중인 세이브 저널 기록 (저널 활성화 시)
+		_inventorySystem?.FlushJournal();
+		_scriptSystem?.Flags.FlushJournal();
 
-		// Python 패키지의 나머지 모듈 로드 (이벤트 핸들러 등)
-		_scriptSystem?.LoadScenarioPackage();
+		// 실행 중인 비동기 스크립트 정리
+		_scriptSystem?.DisableAsyncExecution();
 
-		GD.Print("[GameEngine] Python data loaded.");
+		// 남은 로그 기록 후 파일 닫기
+		Morld.Log.DisableFileSink();
 	}
 
 	/// <summary>
-	/// 시스템 간 참조 설정
+	/// 월드 전체를 바이너리 스냅샷으로 저장
 	/// </summary>
-	private void SetupSystemReferences()
+	public void QuickSave()
 	{
-		var unitSystem = this._world.FindSystem("unitSystem") as UnitSystem;
-
-		// ScriptSystem 테스트 함수 등록
-		_scriptSystem?.TestHelloWorld();
-		_scriptSystem?.RegisterTestFunctions();
-
-		// TextUISystem 설정
-		_textUISystem?.SetSystemReferences(_playerSystem, _inventorySystem, _scriptSystem);
-
-		// EventSystem 설정
-		_eventSystem?.SetSystemReferences(_scriptSystem, _textUISystem, unitSystem, _playerSystem);
-		_eventSystem?.InitializeLocations();
-
-		// DescribeSystem 설정 (Python 모드에서는 data 폴더가 없을 수 있음)
-		if (!(_scriptSystem?.IsPythonDataSource() ?? false))
-		{
-			_describeSystem?.LoadActionMessages(DataPath + "action_messages.json");
-		}
+		Morld.WorldSnapshot.Save(_world, QuickSavePath);
 	}
 
 	/// <summary>
-	/// 이벤트 핸들러 및 콜백 등록
+	/// 퀵세이브 스냅샷에서 월드 복원 후 화면 갱신
 	/// </summary>
-	private void RegisterEventHandlers()
+	public bool QuickLoad()
 	{
-		var itemSystem = this._world.FindSystem("itemSystem") as ItemSystem;
+		// 비동기 스크립트 실행 중에는 월드를 교체하지 않음
+		if (_scriptSystem?.IsBusy ?? false)
+			return false;
 
-		// InventorySystem 이벤트 콜백 (행동 로그 자동 생성)
-		_inventorySystem.OnInventoryChanged += (evt) =>
-		{
-			var itemName = itemSystem?.GetItem(evt.ItemId)?.Name ?? "아이템";
-			var countText = evt.Count > 1 ? $" x{evt.Count}" : "";
+		if (!Morld.WorldSnapshot.Load(_world, QuickSavePath))
+			return false;
 
-			string? message = evt.Type switch
-			{
-				InventoryEventType.ItemAdded => $"{itemName}{countText}을(를) 획득했습니다",
-				InventoryEventType.ItemRemoved => $"{itemName}{countText}을(를) 잃었습니다",
-				InventoryEventType.ItemTransferred => $"{itemName}{countText}을(를) 옮겼습니다",
-				InventoryEventType.ItemEquipped => $"{itemName}을(를) 장착했습니다",
-				InventoryEventType.ItemUnequipped => $"{itemName}을(를) 장착 해제했습니다",
-				InventoryEventType.ItemLost => $"{itemName}{countText}을(를) 사용했습니다",
-				_ => null
-			};
-
-			if (message != null)
-			{
-				_textUISystem?.AddActionLog(message);
-			}
-		};
-
-		// MetaActionHandler 초기화
-		_actionHandler = new MetaActionHandler(_world, _playerSystem, _textUISystem);
-		_actionHandler.OnUpdateSituation += UpdateSituationText;
+		UpdateSituationText();
+		return true;
 	}
 
 	/// <summary>
-	/// 게임 시작
+	/// 데이터를 다시 로드하지 않고 시작 시점으로 되돌린 뒤 게임 재시작
 	/// </summary>
-	private void StartGame()
+	public void NewGame()
 	{
-		// 게임 시작 이벤트 등록
-		_eventSystem?.Enqueue(Morld.GameEvent.GameStart());
+		if (_bootstrap == null || (_scriptSystem?.IsBusy ?? false))
+			return;
 
-		// 게임 시작 이벤트 처리 후 초기 상황 표시
-		var eventHandled = _eventSystem?.FlushEvents() ?? false;
-		if (!eventHandled)
-		{
-			_textUISystem?.ShowSituation();
-		}
+		if (_bootstrap.RestartGame())
+			_undoCheckpoint = 0;
 	}
 
-#if DEBUG_LOG
 	/// <summary>
-	/// 디버그 정보 출력
+	/// 시간 진행, 진행 후 이벤트 처리 또는 비동기 스크립트 실행이 끝나지 않았는지
 	/// </summary>
-	private void DebugPrintGameState()
+	private bool IsTimeAdvancing => (_stepScheduler?.IsBusy ?? false) || (_playerSystem?.HasPendingTime ?? false)
+		|| (_scriptSystem?.IsBusy ?? false);
+
+	/// <summary>
+	/// 마지막 행동 되돌리기 (--undo로 켠 경우만, 시간 진행 중에는 불가)
+	/// </summary>
+	public bool UndoLastAction()
 	{
-		(this._world.FindSystem("worldSystem") as WorldSystem)?.GetTerrain().DebugPrint();
-		(this._world.FindSystem("worldSystem") as WorldSystem)?.GetTime().DebugPrint();
-		(this._world.FindSystem("unitSystem") as UnitSystem)?.DebugPrint();
-		_inventorySystem?.DebugPrint();
+		if (_undoCheckpoint == 0 || IsTimeAdvancing)
+			return false;
 
-		Debug.Print($"System Count : {this._world.GetAllSystem().Count}");
-		GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-		GD.Print("[GameEngine] 입력 테스트 모드");
-		GD.Print("  마우스 왼쪽 클릭: 4시간 (240분) 진행");
-		GD.Print("  마우스 오른쪽 클릭: 15분 진행");
-		GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+		_bootstrap.Checkpoints.Restore(_undoCheckpoint, keep: false);
+		_undoCheckpoint = 0;
+
+		_eventSystem?.InitializeLocations();
+		UpdateSituationText();
+		return true;
 	}
-#endif
 
-	public override void _Process(double delta)
+	public override void _UnhandledInput(InputEvent @event)
 	{
-		// 대기 중인 시간이 있을 때만 Step 실행
-		if (_playerSystem != null && _playerSystem.HasPendingTime)
-		{
-			int delta_int = (int)(delta * 1000);
-			this._world.Step(delta_int);
-
-			// 시간 진행 완료 후 이벤트 감지 및 상황 업데이트
-			if (!_playerSystem.HasPendingTime)
-			{
-				// 위치 변경 및 만남 이벤트 감지
-				_eventSystem?.DetectLocationChanges();
-				_eventSystem?.DetectMeetings();
-
-				// 이벤트 처리 (모놀로그 표시 시 상황 업데이트 스킵)
-				var eventHandled = _eventSystem?.FlushEvents() ?? false;
-				if (!eventHandled)
-				{
-					UpdateSituationText();
-				}
-			}
-		}
-
-		// 프레임 끝에서 한 번만 UI 렌더링 (lazy update 플러시)
-		_textUISystem?.FlushDisplay();
+		// Ctrl+Z: 마지막 행동 되돌리기
+		if (_undoEnabled && @event.IsActionPressed("ui_undo") && UndoLastAction())
+			GetViewport().SetInputAsHandled();
 	}
 
 	/// <summary>
@@ -309,6 +302,19 @@ public partial class GameEngine : Node
 	/// </summary>
 	private void OnMetaClicked(Variant meta)
 	{
+		// 시간 진행이나 스크립트 실행이 여러 프레임에 걸친 경우 끝날 때까지 입력 무시
+		if (IsTimeAdvancing)
+			return;
+
+		// 행동 직전 상태를 되돌리기용으로 보관 (한 단계만 유지, --undo일 때만)
+		var checkpoints = _bootstrap?.Checkpoints;
+		if (_undoEnabled && checkpoints != null)
+		{
+			if (_undoCheckpoint != 0)
+				checkpoints.Release(_undoCheckpoint);
+			_undoCheckpoint = checkpoints.Take();
+		}
+
 		_actionHandler?.HandleAction(meta.AsString());
 	}
 
@@ -0,0 +1,230 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using Morld;
+using SE;
+
+/// <summary>
+/// 헤드리스 저장/로드 검증 (HeadlessRunner --check)
+/// 부팅된 HeadlessHost에서 저장 경로를 실제로 왕복시키고, 결과가 다르면 예외를 던져 실패 종료
+/// - journal: 인벤토리/플래그 스냅샷 + 변경 저널 + 재생
+/// - snapshot: WorldSnapshot 저장 → 로드 → 다시 저장한 결과를 JSON 내보내기로 비교
+/// - chunks: Terrain.SaveChunks가 변경된 청크만 기록하는지 확인하고 LoadChunks로 왕복
+/// </summary>
+public static class HeadlessChecks
+{
+	/// <summary>
+	/// 검증용 파일을 두는 폴더
+	/// </summary>
+	public const string OutputRoot = "user://checks/";
+
+	/// <summary>
+	/// 지원하는 검증 이름
+	/// </summary>
+	public static readonly string[] Names = { "journal", "snapshot", "chunks" };
+
+	/// <summary>
+	/// 이름으로 검증 실행 ("all" = 전체)
+	/// </summary>
+	public static void Run(HeadlessHost host, string name)
+	{
+		if (name == "all")
+		{
+			foreach (var each in Names)
+				Run(host, each);
+			return;
+		}
+
+		var directory = $"{OutputRoot}{name}/";
+		PrepareDirectory(directory);
+
+		switch (name)
+		{
+			case "journal":
+				Journal(host, directory);
+				break;
+			case "snapshot":
+				Snapshot(host, directory);
+				break;
+			case "chunks":
+				Chunks(host, directory);
+				break;
+			default:
+				throw new ArgumentException($"Unknown check: {name} (expected {string.Join(", ", Names)} or all)");
+		}
+
+		Console.WriteLine($"   ✓ {name}");
+	}
+
+	/// <summary>
+	/// 스냅샷 저장 → 변경(저널에만 기록) → 상태 초기화 → LoadData(스냅샷 + 저널 재생) → 변경 직후 상태와 비교
+	/// </summary>
+	public static void Journal(HeadlessHost host, string directory)
+	{
+		var inventory = host.InventorySystem;
+		var flags = host.ScriptSystem.Flags;
+
+		inventory.EnableJournal(directory);
+		flags.EnableJournal(directory);
+
+		// 기준 스냅샷 (저널 비움)
+		inventory.SaveData(directory);
+		flags.SaveData(directory);
+
+		// 스냅샷 이후 변경
+		var itemSystem = (ItemSystem)host.World.FindSystem("itemSystem");
+		var itemId = itemSystem.Items.Count > 0 ? itemSystem.Items.Keys.Min() : 1;
+		var playerKey = InventorySystem.UnitKey(host.PlayerSystem.PlayerId);
+		inventory.AddItem(playerKey, itemId, 3);
+		inventory.RemoveItem(playerKey, itemId, 1);
+		inventory.SetVisible(playerKey, true);
+		flags.Set("check_journal", 7);
+
+		// 임계치 미만이므로 저널에만 추가되어야 함
+		if (inventory.Autosave(directory) || flags.Autosave(directory))
+			throw new InvalidOperationException("Autosave wrote a full snapshot instead of appending to the journal");
+
+		var expectedInventory = Describe(inventory.ExportToData());
+		var expectedFlags = Describe(flags.Flags);
+
+		// 메모리 상태를 지운 뒤 스냅샷 + 저널로 복원
+		inventory.ClearData();
+		flags.ClearData();
+		if (!inventory.LoadData(directory))
+			throw new InvalidOperationException("InventorySystem.LoadData found nothing to load");
+		if (!flags.LoadData(directory))
+			throw new InvalidOperationException("FlagStore.LoadData found nothing to load");
+
+		Expect("inventory", expectedInventory, Describe(inventory.ExportToData()));
+		Expect("flags", expectedFlags, Describe(flags.Flags));
+	}
+
+	/// <summary>
+	/// 스냅샷 저장 → 시간 진행/플래그 변경 → 스냅샷 로드 → 다시 저장
+	/// 처음 저장한 스냅샷과 로드 후 저장한 스냅샷의 JSON 내보내기가 같아야 함
+	/// </summary>
+	public static void Snapshot(HeadlessHost host, string directory)
+	{
+		var snapshotPath = $"{directory}quicksave.mrld";
+		var saved = SaveAndExport(host, snapshotPath, $"{directory}saved.json");
+
+		// 스냅샷 이후 변경 (유닛 이동, 시간, 플래그)
+		host.Perform("idle:180");
+		host.ScriptSystem.Flags.Set("check_snapshot", 1);
+		var changed = SaveAndExport(host, $"{directory}changed.mrld", $"{directory}changed.json");
+		if (changed == saved)
+			throw new InvalidOperationException("World state did not change after idle; snapshot check would prove nothing");
+
+		if (!WorldSnapshot.Load(host.World, snapshotPath))
+			throw new InvalidOperationException($"WorldSnapshot.Load failed: {snapshotPath}");
+
+		Expect("snapshot", saved, SaveAndExport(host, $"{directory}loaded.mrld", $"{directory}loaded.json"));
+	}
+
+	/// <summary>
+	/// 전체 저장 → 변경 없이 저장(0개) → Region 하나 변경(1개) → Region + RegionEdge 변경(2개)
+	/// → 새 Terrain에 LoadChunks → 원본과 JSON 비교
+	/// </summary>
+	public static void Chunks(HeadlessHost host, string directory)
+	{
+		var terrain = ((WorldSystem)host.World.FindSystem("worldSystem")).GetTerrain();
+
+		// 처음 저장하는 폴더는 전체 기록 (Region 청크 + RegionEdge 테이블 + 인덱스)
+		ExpectCount("first SaveChunks", terrain.RegionCount + 2, terrain.SaveChunks(directory));
+		ExpectCount("SaveChunks without changes", 0, terrain.SaveChunks(directory));
+
+		// Region 하나만 변경 → 해당 Region 청크만
+		var region = terrain.Regions.FirstOrDefault(r => r.EdgeCount > 0)
+			?? throw new InvalidOperationException("Scenario has no region with an edge to modify");
+		var edge = region.Edges.First();
+		region.RemoveEdge(edge.LocationA.LocalId, edge.LocationB.LocalId);
+		ExpectCount("SaveChunks after one region change", 1, terrain.SaveChunks(directory));
+
+		// Region + RegionEdge 변경 → Region 청크 + RegionEdge 테이블
+		var regionEdge = terrain.RegionEdges.FirstOrDefault();
+		if (regionEdge != null)
+		{
+			var other = region.Edges.FirstOrDefault();
+			if (other != null)
+				region.RemoveEdge(other.LocationA.LocalId, other.LocationB.LocalId);
+			terrain.RemoveRegionEdge(regionEdge.Id);
+			ExpectCount("SaveChunks after region + region edge change", other != null ? 2 : 1, terrain.SaveChunks(directory));
+		}
+
+		var loaded = new Terrain();
+		if (!loaded.LoadChunks(directory))
+			throw new InvalidOperationException($"LoadChunks found no index in {directory}");
+
+		Expect("chunks", terrain.ToJson(), loaded.ToJson());
+	}
+
+	private static string SaveAndExport(HeadlessHost host, string snapshotPath, string jsonPath)
+	{
+		WorldSnapshot.Save(host.World, snapshotPath);
+		WorldSnapshot.ExportJson(snapshotPath, jsonPath);
+		return File.ReadAllText(GamePath.Globalize(jsonPath));
+	}
+
+	// ===== 비교 =====
+
+	private static void ExpectCount(string label, int expected, int actual)
+	{
+		if (expected != actual)
+			throw new InvalidOperationException($"{label}: expected {expected} file(s) written, got {actual}");
+	}
+
+	private static void Expect(string label, string expected, string actual)
+	{
+		if (expected == actual)
+			return;
+
+		var expectedLines = expected.Split('\n');
+		var actualLines = actual.Split('\n');
+		int line = 0;
+		while (line < expectedLines.Length && line < actualLines.Length && expectedLines[line] == actualLines[line])
+			line++;
+
+		var want = line < expectedLines.Length ? expectedLines[line] : "<end>";
+		var got = line < actualLines.Length ? actualLines[line] : "<end>";
+		throw new InvalidOperationException($"{label} mismatch at line {line + 1}: expected '{want}', got '{got}'");
+	}
+
+	/// <summary>
+	/// 순서에 무관한 비교용 문자열 (저널 순번 제외)
+	/// </summary>
+	private static string Describe(InventoryDataJson data)
+	{
+		var lines = new List<string>();
+		foreach (var (owner, items) in data.Inventories ?? new())
+		{
+			foreach (var (itemId, count) in items)
+				lines.Add($"inventory {owner} {itemId} {count}");
+		}
+		foreach (var (owner, items) in data.EquippedItems ?? new())
+		{
+			foreach (var itemId in items)
+				lines.Add($"equipped {owner} {itemId}");
+		}
+		foreach (var (owner, visible) in data.Visibility ?? new())
+			lines.Add($"visible {owner} {visible}");
+
+		lines.Sort(StringComparer.Ordinal);
+		return string.Join("\n", lines);
+	}
+
+	private static string Describe(IReadOnlyDictionary<string, int> flags)
+	{
+		var lines = flags.Select(pair => $"{pair.Key}={pair.Value}").ToList();
+		lines.Sort(StringComparer.Ordinal);
+		return string.Join("\n", lines);
+	}
+
+	private static void PrepareDirectory(string directory)
+	{
+		var path = GamePath.Globalize(directory);
+		if (Directory.Exists(path))
+			Directory.Delete(path, recursive: true);
+		Directory.CreateDirectory(path);
+	}
+}
@@ -0,0 +1,252 @@
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// 헤드리스 실행 명령줄 처리 (HeadlessRunner, tools/Morld.Headless 공용)
+/// 빌드 머신에서 창 없이 시나리오를 구동:
+///   godot --headless res://scenes/headless.tscn -- --scenario /path/to/scenario01 --action idle:60 --action inventory --print
+///   dotnet run --project tools/Morld.Headless -- --scenario res://scenarios/scenario01/ --print (Godot 런타임 없이)
+/// 인자:
+///   --scenario PATH    시나리오 폴더 (기본: res://scenarios/scenario03/)
+///   --action META      메타 액션 실행 후 대기 시간까지 진행 (여러 번 지정 가능, 순서대로 실행)
+///   --actions FILE     한 줄에 메타 액션 하나씩 있는 파일 (빈 줄/#으로 시작하는 줄 무시)
+///   --print            액션마다 화면 텍스트와 링크 목록 출력
+///   --profile FILE     부팅 후 스크립트 진입점별 시간을 기록해 folded stack 파일로 저장 (flamegraph.pl/speedscope)
+///   --trace-python     --profile: 시나리오 Python 함수 호출까지 스택에 포함
+///   --trace-startup FILE  부팅 구간을 Chrome trace JSON으로 저장 (chrome://tracing, ui.perfetto.dev)
+///   --log SPEC         로그 레벨 (예: info, warning, ScriptSystem=debug,morld=warning)
+///   --log-file PATH    로그를 파일로도 기록 (링 버퍼 + 백그라운드 기록)
+///   --api-stats        부팅 후 morld API 호출 통계를 기록하고 종료 시 표 출력 (--out이 있으면 JSON 저장)
+///   --benchmark        행동 처리량 벤치마크 (--action/--actions가 있으면 그 목록을 재생, 없으면 봇 사용)
+///   --count N          벤치마크: 시나리오당 봇 행동 수 (기본 500)
+///   --seed N           벤치마크: 봇 시드 (기본 42)
+///   --out PATH         벤치마크: 결과 JSON 경로
+///   --scaling          월드 크기별 스케일링 벤치마크 (합성 시나리오를 user://synthetic/에 생성, --seed 사용) - 페이징 모드 경로가 다르면 실패 종료
+///   --generate DIR     합성 시나리오만 생성하고 종료 (--seed 사용)
+///   --alloc            Step 할당량 벤치마크 (합성 시나리오, --seed/--out 사용) - 정상 Step이 할당하면 실패 종료
+///   --check NAME       저장/로드 왕복 검증 후 종료 (HeadlessChecks.Names 또는 all, user://checks/에 기록) - 불일치 시 실패 종료
+///   --res DIR          dotnet 실행: res:// 에 해당하는 폴더 (기본: project.godot가 있는 폴더)
+///   --user DIR         dotnet 실행: user:// 에 해당하는 폴더 (기본: 로컬 앱 데이터 폴더의 Morld)
+/// --scenario 없이 --benchmark를 지정하면 기본 시나리오 전체를 측정
+/// </summary>
+public static class HeadlessCommand
+{
+	/// <summary>
+	/// 명령줄 인자를 처리하고 종료 코드 반환 (0 = 성공, 1 = 실패)
+	/// </summary>
+	public static int Run(string[] args)
+	{
+		int exitCode = 0;
+		try
+		{
+			Execute(args);
+		}
+		catch (Exception ex)
+		{
+			Console.Error.WriteLine($"[Headless] {ex}");
+			exitCode = 1;
+		}
+		Morld.Log.DisableFileSink();
+		return exitCode;
+	}
+
+	private static void Execute(string[] args)
+	{
+		string? scenarioPath = null;
+		var actions = new List<string>();
+		bool print = false;
+		bool apiStats = false;
+		string? tracePath = null;
+		string? profilePath = null;
+		bool tracePython = false;
+		bool benchmark = false;
+		bool scaling = false;
+		bool alloc = false;
+		string? generatePath = null;
+		string? checkName = null;
+		int count = 500;
+		int seed = 42;
+		string? outputPath = null;
+
+		for (int i = 0; i < args.Length; i++)
+		{
+			switch (args[i])
+			{
+				case "--scenario":
+					scenarioPath = RequireValue(args, ref i);
+					break;
+				case "--action":
+					actions.Add(RequireValue(args, ref i));
+					break;
+				case "--actions":
+					actions.AddRange(ReadActionFile(RequireValue(args, ref i)));
+					break;
+				case "--print":
+					print = true;
+					break;
+				case "--profile":
+					profilePath = RequireValue(args, ref i);
+					break;
+				case "--trace-python":
+					tracePython = true;
+					break;
+				case "--trace-startup":
+					tracePath = RequireValue(args, ref i);
+					break;
+				case "--log":
+					Morld.Log.Configure(RequireValue(args, ref i));
+					break;
+				case "--log-file":
+					Morld.Log.EnableFileSink(RequireValue(args, ref i));
+					break;
+				case "--api-stats":
+					apiStats = true;
+					break;
+				case "--benchmark":
+					benchmark = true;
+					break;
+				case "--scaling":
+					scaling = true;
+					break;
+				case "--alloc":
+					alloc = true;
+					break;
+				case "--check":
+					checkName = RequireValue(args, ref i);
+					break;
+				case "--generate":
+					generatePath = RequireValue(args, ref i);
+					break;
+				case "--count":
+					count = int.Parse(RequireValue(args, ref i));
+					break;
+				case "--seed":
+					seed = int.Parse(RequireValue(args, ref i));
+					break;
+				case "--out":
+					outputPath = RequireValue(args, ref i);
+					break;
+#if !GODOT
+				case "--res":
+					Morld.GamePath.ResourceRoot = RequireValue(args, ref i);
+					break;
+				case "--user":
+					Morld.GamePath.UserRoot = RequireValue(args, ref i);
+					break;
+#endif
+				default:
+					throw new ArgumentException($"Unknown argument: {args[i]}");
+			}
+		}
+
+		if (generatePath != null)
+		{
+			var summary = Morld.SyntheticScenarioGenerator.Generate(generatePath, new Morld.SyntheticScenarioOptions { Seed = seed });
+			Console.WriteLine($"[Headless] Generated {generatePath}: {summary.Locations} locations, {summary.Npcs} NPCs, {summary.Files} files");
+			return;
+		}
+
+		if (scaling)
+		{
+			BenchmarkScaling.Run(new Morld.SyntheticScenarioOptions { Seed = seed }, outputPath: outputPath);
+			return;
+		}
+
+		if (alloc)
+		{
+			if (!BenchmarkAllocation.Run(new Morld.SyntheticScenarioOptions { Seed = seed }, outputPath: outputPath))
+				throw new InvalidOperationException("Steady-state simulation steps allocated memory");
+			return;
+		}
+
+		if (benchmark)
+		{
+			if (actions.Count > 0)
+				BenchmarkActions.Replay(scenarioPath ?? "res://scenarios/scenario03/", actions, outputPath);
+			else
+				BenchmarkActions.Run(scenarioPath != null ? new[] { scenarioPath } : null, count, seed, outputPath: outputPath);
+			return;
+		}
+
+		scenarioPath ??= "res://scenarios/scenario03/";
+
+		if (checkName != null)
+		{
+			var checkHost = new HeadlessHost(scenarioPath);
+			checkHost.Boot();
+			Console.WriteLine($"[Headless] Checks: {scenarioPath}");
+			HeadlessChecks.Run(checkHost, checkName);
+			return;
+		}
+
+		var host = new HeadlessHost(scenarioPath);
+		var started = DateTime.UtcNow;
+		var trace = tracePath != null ? Morld.TraceRecorder.Start() : null;
+		host.Boot();
+		if (trace != null)
+		{
+			trace.Stop();
+			trace.Save(tracePath!);
+			Console.WriteLine($"[Headless] Startup trace saved: {tracePath} ({trace.EventCount} events)");
+		}
+		if (print)
+			PrintScreen(host, "boot");
+		host.ScriptSystem.ApiStats.Enabled = apiStats;
+		if (profilePath != null)
+		{
+			if (tracePython)
+				host.ScriptSystem.EnableScriptTracing();
+			host.ScriptSystem.Profiler.Enabled = true;
+		}
+
+		foreach (var action in actions)
+		{
+			host.Perform(action);
+			if (print)
+				PrintScreen(host, action);
+		}
+
+		if (apiStats)
+		{
+			Console.WriteLine(host.ScriptSystem.ApiStats.Format());
+			if (outputPath != null)
+				System.IO.File.WriteAllText(Morld.GamePath.Globalize(outputPath), host.ScriptSystem.ApiStats.ToJson());
+		}
+
+		if (profilePath != null)
+		{
+			host.ScriptSystem.Profiler.WriteFolded(Morld.GamePath.Globalize(profilePath));
+			Console.WriteLine(host.ScriptSystem.Profiler.FormatTop());
+		}
+
+		host.Shutdown();
+
+		var elapsed = DateTime.UtcNow - started;
+		Console.WriteLine($"[Headless] {scenarioPath}: {host.ActionCount} actions, {host.StepCount} steps, {elapsed.TotalMilliseconds:F0}ms");
+	}
+
+	private static string RequireValue(string[] args, ref int i)
+	{
+		if (i + 1 >= args.Length)
+			throw new ArgumentException($"Missing value for {args[i]}");
+		return args[++i];
+	}
+
+	private static IEnumerable<string> ReadActionFile(string path)
+	{
+		foreach (var line in System.IO.File.ReadLines(Morld.GamePath.Globalize(path)))
+		{
+			var trimmed = line.Trim();
+			if (trimmed.Length == 0 || trimmed.StartsWith("#"))
+				continue;
+			yield return trimmed;
+		}
+	}
+
+	private static void PrintScreen(HeadlessHost host, string label)
+	{
+		Console.WriteLine($"━━━━━━━━━━ {label} ━━━━━━━━━━");
+		Console.WriteLine(host.PlainText);
+		Console.WriteLine($"[links] {string.Join(" | ", host.Links)}");
+	}
+}
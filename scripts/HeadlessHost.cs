@@ -0,0 +1,233 @@
+using System;
+using System.Collections.Generic;
+using System.Text.RegularExpressions;
+using SE;
+
+/// <summary>
+/// 헤드리스 시뮬레이션 호스트
+/// GameEngine과 같은 부팅 절차(GameBootstrap)로 시스템을 구성하되 씬 트리/RichTextLabel 없이 동작
+/// - 시나리오 폴더(res:// 또는 일반 디렉터리 경로)에서 데이터 로드
+/// - 메타 액션과 시간 Step을 코드에서 직접 구동 (처리량 측정, 장시간 실행 테스트용)
+/// - 화면 출력은 마지막 렌더링 텍스트와 링크 목록으로 제공
+/// </summary>
+public class HeadlessHost
+{
+	/// <summary>
+	/// Step 한 번에 넘기는 기본 프레임 시간 (ms, 60fps 기준)
+	/// </summary>
+	public const int DefaultFrameMs = 16;
+
+	private static readonly Regex BbcodeTag = new(@"\[/?[a-z_]+(=[^\]]*)?\]", RegexOptions.Compiled);
+
+	private readonly string _scenarioPath;
+	private readonly string? _logHistoryPath;
+
+	private SE.World _world;
+	private GameBootstrap _bootstrap;
+	private PlayerSystem _playerSystem;
+	private DescribeSystem _describeSystem;
+	private InventorySystem _inventorySystem;
+	private TextUISystem _textUISystem;
+	private MetaActionHandler _actionHandler;
+	private ScriptSystem _scriptSystem;
+	private EventSystem _eventSystem;
+
+	private Morld.RenderedText _screen = Morld.RenderedText.Empty;
+
+	public SE.World World => _world;
+	public PlayerSystem PlayerSystem => _playerSystem;
+	public ScriptSystem ScriptSystem => _scriptSystem;
+	public EventSystem EventSystem => _eventSystem;
+	public InventorySystem InventorySystem => _inventorySystem;
+	public TextUISystem TextUISystem => _textUISystem;
+
+	/// <summary>
+	/// 시나리오 경로 (끝에 "/" 포함)
+	/// </summary>
+	public string ScenarioPath => _scenarioPath;
+
+	/// <summary>
+	/// Boot 완료 여부
+	/// </summary>
+	public bool IsBooted => _world != null;
+
+	/// <summary>
+	/// 마지막으로 렌더링된 화면 (BBCode)
+	/// </summary>
+	public string Text => _screen.Text;
+
+	/// <summary>
+	/// 마지막으로 렌더링된 화면 (BBCode 태그 제거)
+	/// </summary>
+	public string PlainText => BbcodeTag.Replace(_screen.Text, "");
+
+	/// <summary>
+	/// 현재 화면에서 선택 가능한 메타 액션 목록 (표시 순서)
+	/// </summary>
+	public IReadOnlyCollection<string> Links => _screen.Metas;
+
+	/// <summary>
+	/// 실제로 World.Step을 실행한 횟수
+	/// </summary>
+	public long StepCount { get; private set; }
+
+	/// <summary>
+	/// 처리한 메타 액션 수
+	/// </summary>
+	public long ActionCount { get; private set; }
+
+	/// <summary>
+	/// 화면이 갱신될 때마다 호출 (BBCode 텍스트)
+	/// </summary>
+	public event Action<string> OnScreenChanged;
+
+	/// <param name="scenarioPath">시나리오 폴더 (예: "res://scenarios/scenario01/", "/home/build/scenarios/scenario03")</param>
+	/// <param name="logHistoryPath">밀려난 행동 로그를 기록할 gzip 파일 경로 (null = 기록 안 함)</param>
+	public HeadlessHost(string scenarioPath, string? logHistoryPath = null)
+	{
+		if (string.IsNullOrEmpty(scenarioPath))
+			throw new ArgumentException("Scenario path cannot be empty", nameof(scenarioPath));
+
+		_scenarioPath = scenarioPath.EndsWith("/") ? scenarioPath : scenarioPath + "/";
+		_logHistoryPath = logHistoryPath;
+	}
+
+	/// <summary>
+	/// 시스템 구성 + 데이터 로드 + 게임 시작 (GameEngine._Ready와 같은 순서)
+	/// </summary>
+	public void Boot()
+	{
+		if (IsBooted)
+			throw new InvalidOperationException("HeadlessHost is already booted");
+
+		using var boot = Morld.TraceRecorder.Span("HeadlessHost.Boot");
+
+		// 1. World 초기화 (씬 루트 없음)
+		_world = new SE.World();
+
+		// 2. 시스템 등록, 데이터 로드, 시스템 간 참조 설정, 이벤트 콜백 등록 (GameEngine과 공용)
+		_bootstrap = new GameBootstrap(_world, _scenarioPath,
+			describeSystem => new TextUISystem(Present, describeSystem, _logHistoryPath));
+		_bootstrap.Boot();
+		_scriptSystem = _bootstrap.ScriptSystem;
+		_playerSystem = _bootstrap.PlayerSystem;
+		_describeSystem = _bootstrap.DescribeSystem;
+		_inventorySystem = _bootstrap.InventorySystem;
+		_textUISystem = _bootstrap.TextUISystem;
+		_eventSystem = _bootstrap.EventSystem;
+		_actionHandler = _bootstrap.ActionHandler;
+
+		// 3. 게임 시작 (NewGame용 체크포인트 보관)
+		using (Morld.TraceRecorder.Span("StartGame"))
+		{
+			_bootstrap.TakeNewGameCheckpoint();
+			_bootstrap.StartGame();
+			_textUISystem.FlushDisplay();
+		}
+	}
+
+	private void Present(string text)
+	{
+		_screen = new Morld.RenderedText(text);
+		OnScreenChanged?.Invoke(text);
+	}
+
+	/// <summary>
+	/// 메타 액션 처리 (링크 클릭과 동일) 후 화면 갱신
+	/// 시간이 필요한 행동은 시간 요청만 하므로 RunUntilIdle로 진행
+	/// </summary>
+	public void HandleAction(string meta)
+	{
+		EnsureBooted();
+
+		_actionHandler.HandleAction(meta);
+		ActionCount++;
+		_textUISystem.FlushDisplay();
+	}
+
+	/// <summary>
+	/// 한 프레임 진행 (GameEngine._Process와 동일)
+	/// </summary>
+	/// <returns>아직 대기 중인 시간이 남아 있는지</returns>
+	public bool Step(int deltaMs = DefaultFrameMs)
+	{
+		EnsureBooted();
+
+		if (_playerSystem.HasPendingTime)
+		{
+			_world.Step(deltaMs);
+			StepCount++;
+
+			// 시간 진행 완료 후 이벤트 감지 및 상황 업데이트
+			if (!_playerSystem.HasPendingTime)
+			{
+				_eventSystem.DetectLocationChanges();
+				_eventSystem.DetectMeetings();
+
+				var eventHandled = _eventSystem.FlushEvents();
+				if (!eventHandled)
+				{
+					_textUISystem.ShowSituation();
+				}
+			}
+		}
+
+		_textUISystem.FlushDisplay();
+		return _playerSystem.HasPendingTime;
+	}
+
+	/// <summary>
+	/// 대기 중인 시간이 모두 소비될 때까지 Step 반복
+	/// </summary>
+	/// <param name="maxSteps">최대 Step 수 (초과 시 예외 - 시간이 끝나지 않는 시나리오 감지용)</param>
+	/// <returns>실행한 Step 수</returns>
+	public int RunUntilIdle(int maxSteps = 100_000, int deltaMs = DefaultFrameMs)
+	{
+		int steps = 0;
+		while (Step(deltaMs))
+		{
+			if (++steps >= maxSteps)
+				throw new InvalidOperationException($"Pending time did not drain within {maxSteps} steps");
+		}
+		return steps;
+	}
+
+	/// <summary>
+	/// 메타 액션 처리 후 대기 시간까지 모두 진행
+	/// </summary>
+	public void Perform(string meta)
+	{
+		HandleAction(meta);
+		RunUntilIdle();
+	}
+
+	/// <summary>
+	/// 게임 시작 시점으로 되돌리고 다시 시작 (데이터 재로드 없음)
+	/// </summary>
+	public void NewGame()
+	{
+		EnsureBooted();
+
+		_bootstrap.RestartGame();
+		_textUISystem.FlushDisplay();
+	}
+
+	/// <summary>
+	/// 대기 중인 로그/저널 기록 (GameEngine._ExitTree와 동일)
+	/// </summary>
+	public void Shutdown()
+	{
+		if (!IsBooted)
+			return;
+
+		_textUISystem.FlushLogHistory();
+		_inventorySystem.FlushJournal();
+		_scriptSystem.Flags.FlushJournal();
+	}
+
+	private void EnsureBooted()
+	{
+		if (!IsBooted)
+			throw new InvalidOperationException("HeadlessHost.Boot() must be called first");
+	}
+}
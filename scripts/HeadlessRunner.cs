@@ -0,0 +1,14 @@
+using Godot;
+
+/// <summary>
+/// 헤드리스 실행 진입점 (scenes/headless.tscn)
+///   godot --headless res://scenes/headless.tscn -- --scenario /path/to/scenario01 --action idle:60 --print
+/// 인자 처리는 HeadlessCommand 참고 (Godot 런타임 없이 실행하려면 tools/Morld.Headless)
+/// </summary>
+public partial class HeadlessRunner : Node
+{
+	public override void _Ready()
+	{
+		GetTree().Quit(HeadlessCommand.Run(OS.GetCmdlineUserArgs()));
+	}
+}
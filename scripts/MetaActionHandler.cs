@@ -1,6 +1,3 @@
-#define DEBUG_LOG
-
-using Godot;
 using SE;
 using Morld;
 using System.Collections.Generic;
@@ -12,6 +9,8 @@ using System.Collections.Generic;
 /// </summary>
 public class MetaActionHandler
 {
+	private static readonly Morld.LogCategory _log = Morld.Log.Category("MetaActionHandler");
+
 	private readonly SE.World _world;
 	private readonly PlayerSystem _playerSystem;
 	private readonly TextUISystem _textUISystem;
@@ -43,9 +42,7 @@ public class MetaActionHandler
 		var parts = metaString.Split(':');
 		var action = parts[0];
 
-#if DEBUG_LOG
-		GD.Print($"[MetaActionHandler] Meta clicked: {metaString}");
-#endif
+		_log.Debug($"Meta clicked: {metaString}");
 
 		switch (action)
 		{
@@ -121,7 +118,7 @@ public class MetaActionHandler
 				HandleMonologueNoAction();
 				break;
 			default:
-				GD.PrintErr($"[MetaActionHandler] Unknown action: {action}");
+				_log.Error($"Unknown action: {action}");
 				break;
 		}
 	}
@@ -141,7 +138,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 3)
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid move format. Expected: move:regionId:localId");
+			_log.Error("Invalid move format. Expected: move:regionId:localId");
 			return;
 		}
 
@@ -159,7 +156,7 @@ public class MetaActionHandler
 		}
 		else
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid idle format. Expected: idle:minutes");
+			_log.Error("Invalid idle format. Expected: idle:minutes");
 		}
 	}
 
@@ -178,7 +175,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2)
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid toggle format. Expected: toggle:toggleId");
+			_log.Error("Invalid toggle format. Expected: toggle:toggleId");
 			return;
 		}
 
@@ -199,7 +196,7 @@ public class MetaActionHandler
 	/// </summary>
 	private void HandleDropAction(string[] parts)
 	{
-		GD.PrintErr("[MetaActionHandler] drop action is deprecated. Use put:unitId:itemId instead.");
+		_log.Error("drop action is deprecated. Use put:unitId:itemId instead.");
 	}
 
 	/// <summary>
@@ -209,7 +206,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2 || !int.TryParse(parts[1], out int unitId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid look_unit format. Expected: look_unit:unitId");
+			_log.Error("Invalid look_unit format. Expected: look_unit:unitId");
 			return;
 		}
 
@@ -224,7 +221,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 3 || !int.TryParse(parts[1], out int unitId) || !int.TryParse(parts[2], out int itemId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid take format");
+			_log.Error("Invalid take format");
 			return;
 		}
 
@@ -242,7 +239,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 3 || !int.TryParse(parts[1], out int unitId) || !int.TryParse(parts[2], out int itemId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid put format");
+			_log.Error("Invalid put format");
 			return;
 		}
 
@@ -260,7 +257,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 3)
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid action format. Expected: action:actionType:unitId");
+			_log.Error("Invalid action format. Expected: action:actionType:unitId");
 			return;
 		}
 
@@ -286,13 +283,11 @@ public class MetaActionHandler
 
 		if (!int.TryParse(parts[2], out int unitId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid unitId in action");
+			_log.Error("Invalid unitId in action");
 			return;
 		}
 
-#if DEBUG_LOG
-		GD.Print($"[MetaActionHandler] 유닛 행동: unitId={unitId}, type={actionType}");
-#endif
+		_log.Debug($"유닛 행동: unitId={unitId}, type={actionType}");
 
 		var actionSystem = _world.FindSystem("actionSystem") as ActionSystem;
 		var unitSystem = _world.FindSystem("unitSystem") as UnitSystem;
@@ -323,7 +318,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2 || !int.TryParse(parts[1], out int itemId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid item_ground_menu format. Expected: item_ground_menu:itemId");
+			_log.Error("Invalid item_ground_menu format. Expected: item_ground_menu:itemId");
 			return;
 		}
 
@@ -337,7 +332,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2 || !int.TryParse(parts[1], out int itemId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid item_inv_menu format. Expected: item_inv_menu:itemId");
+			_log.Error("Invalid item_inv_menu format. Expected: item_inv_menu:itemId");
 			return;
 		}
 
@@ -351,13 +346,11 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2 || !int.TryParse(parts[1], out int itemId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid item_use format. Expected: item_use:itemId");
+			_log.Error("Invalid item_use format. Expected: item_use:itemId");
 			return;
 		}
 
-#if DEBUG_LOG
-		GD.Print($"[MetaActionHandler] 아이템 사용: itemId={itemId}");
-#endif
+		_log.Debug($"아이템 사용: itemId={itemId}");
 
 		// TODO: 실제 사용 처리
 		_textUISystem?.ShowResult("사용 기능은 아직 구현되지 않았습니다.");
@@ -370,13 +363,11 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2 || !int.TryParse(parts[1], out int itemId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid item_combine format. Expected: item_combine:itemId");
+			_log.Error("Invalid item_combine format. Expected: item_combine:itemId");
 			return;
 		}
 
-#if DEBUG_LOG
-		GD.Print($"[MetaActionHandler] 아이템 조합: itemId={itemId}");
-#endif
+		_log.Debug($"아이템 조합: itemId={itemId}");
 
 		// TODO: 실제 조합 처리
 		_textUISystem?.ShowResult("조합 기능은 아직 구현되지 않았습니다.");
@@ -391,7 +382,7 @@ public class MetaActionHandler
 			!int.TryParse(parts[1], out int unitId) ||
 			!int.TryParse(parts[2], out int itemId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid item_unit_menu format. Expected: item_unit_menu:unitId:itemId");
+			_log.Error("Invalid item_unit_menu format. Expected: item_unit_menu:unitId:itemId");
 			return;
 		}
 
@@ -424,13 +415,11 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2 || !int.TryParse(parts[1], out int unitId))
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid put_select format. Expected: put_select:unitId");
+			_log.Error("Invalid put_select format. Expected: put_select:unitId");
 			return;
 		}
 
-#if DEBUG_LOG
-		GD.Print($"[MetaActionHandler] 넣기 대상 선택: unitId={unitId}");
-#endif
+		_log.Debug($"넣기 대상 선택: unitId={unitId}");
 
 		// 인벤토리 화면으로 전환 (현재 Unit Focus 위에 Push)
 		_textUISystem?.ShowInventory();
@@ -444,7 +433,7 @@ public class MetaActionHandler
 	{
 		if (parts.Length < 2)
 		{
-			GD.PrintErr("[MetaActionHandler] Invalid script format. Expected: script:functionName[:arg1:arg2:...]");
+			_log.Error("Invalid script format. Expected: script:functionName[:arg1:arg2:...]");
 			return;
 		}
 
@@ -457,19 +446,37 @@ public class MetaActionHandler
 		var currentFocus = _textUISystem?.CurrentFocus;
 		int? contextUnitId = currentFocus?.UnitId;
 
-#if DEBUG_LOG
-		GD.Print($"[MetaActionHandler] Script call: {functionName}({string.Join(", ", args)}) [context unitId={contextUnitId?.ToString() ?? "null"}]");
-#endif
+		_log.Debug($"Script call: {functionName}({string.Join(", ", args)}) [context unitId={contextUnitId?.ToString() ?? "null"}]");
 
 		var scriptSystem = _world.FindSystem("scriptSystem") as ScriptSystem;
 		if (scriptSystem == null)
 		{
-			GD.PrintErr("[MetaActionHandler] ScriptSystem not found");
+			_log.Error("ScriptSystem not found");
 			return;
 		}
 
-		var result = scriptSystem.CallFunctionEx(functionName, args, contextUnitId);
+		if (!scriptSystem.IsAsync)
+		{
+			HandleScriptResult(scriptSystem.CallFunctionEx(functionName, args, contextUnitId));
+			return;
+		}
 
+		// 비동기 모드: 스크립트 스레드에서 실행, 결과는 메인 스레드에서 처리 (명령 적용 후)
+		_textUISystem?.SetProgress("처리 중...");
+		scriptSystem.CallFunctionAsync(functionName, args, contextUnitId).ContinueWith(task =>
+		{
+			_textUISystem?.SetProgress(null);
+			HandleScriptResult(task.IsCompletedSuccessfully
+				? task.Result
+				: new SE.ScriptResult { Type = "error", Message = task.Exception?.InnerException?.Message ?? "cancelled" });
+		}, System.Threading.Tasks.TaskContinuationOptions.ExecuteSynchronously);
+	}
+
+	/// <summary>
+	/// 스크립트 함수 결과 처리 (모놀로그 표시, 메시지 출력 등)
+	/// </summary>
+	private void HandleScriptResult(SE.ScriptResult result)
+	{
 		// 결과 타입에 따른 처리
 		if (result == null)
 		{
@@ -483,9 +490,7 @@ public class MetaActionHandler
 				{
 					// 모놀로그 표시 (스택에 Push - 거절 시 이전 화면으로 돌아갈 수 있도록)
 					_textUISystem?.ShowMonologue(monoResult.Pages, monoResult.TimeConsumed, monoResult.ButtonType, monoResult.DoneCallback, monoResult.CancelCallback);
-#if DEBUG_LOG
-					GD.Print($"[MetaActionHandler] Script result: monologue ({monoResult.Pages.Count} pages, button={monoResult.ButtonType}, done={monoResult.DoneCallback}, cancel={monoResult.CancelCallback})");
-#endif
+					_log.Debug($"Script result: monologue ({monoResult.Pages.Count} pages, button={monoResult.ButtonType}, done={monoResult.DoneCallback}, cancel={monoResult.CancelCallback})");
 				}
 				break;
 
@@ -494,9 +499,7 @@ public class MetaActionHandler
 				if (result is SE.MonologueScriptResult updateResult)
 				{
 					_textUISystem?.UpdateMonologueContent(updateResult.Pages, updateResult.ButtonType);
-#if DEBUG_LOG
-					GD.Print($"[MetaActionHandler] Script result: update ({updateResult.Pages.Count} pages, button={updateResult.ButtonType})");
-#endif
+					_log.Debug($"Script result: update ({updateResult.Pages.Count} pages, button={updateResult.ButtonType})");
 				}
 				break;
 
@@ -508,7 +511,7 @@ public class MetaActionHandler
 				break;
 
 			case "error":
-				GD.PrintErr($"[MetaActionHandler] Script error: {result.Message}");
+				_log.Error($"Script error: {result.Message}");
 				_textUISystem?.ShowResult($"스크립트 오류: {result.Message}");
 				break;
 
@@ -526,9 +529,7 @@ public class MetaActionHandler
 	/// </summary>
 	private void HandleMonologueNextAction()
 	{
-#if DEBUG_LOG
-		GD.Print("[MetaActionHandler] Monologue next page");
-#endif
+		_log.Debug("Monologue next page");
 		_textUISystem?.MonologueNextPage();
 	}
 
@@ -539,9 +540,7 @@ public class MetaActionHandler
 	/// </summary>
 	private void HandleMonologueDoneAction(string[] parts)
 	{
-#if DEBUG_LOG
-		GD.Print("[MetaActionHandler] Monologue done");
-#endif
+		_log.Debug("Monologue done");
 
 		var currentFocus = _textUISystem?.CurrentFocus;
 		var timeConsumed = _textUISystem?.MonologueDone() ?? 0;
@@ -573,9 +572,7 @@ public class MetaActionHandler
 	/// </summary>
 	private void HandleMonologueYesAction()
 	{
-#if DEBUG_LOG
-		GD.Print("[MetaActionHandler] Monologue yes");
-#endif
+		_log.Debug("Monologue yes");
 
 		var currentFocus = _textUISystem?.CurrentFocus;
 		if (currentFocus?.DoneCallback == null)
@@ -605,9 +602,7 @@ public class MetaActionHandler
 	/// </summary>
 	private void HandleMonologueNoAction()
 	{
-#if DEBUG_LOG
-		GD.Print("[MetaActionHandler] Monologue no");
-#endif
+		_log.Debug("Monologue no");
 
 		var currentFocus = _textUISystem?.CurrentFocus;
 		if (currentFocus?.CancelCallback == null)
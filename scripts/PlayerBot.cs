@@ -0,0 +1,134 @@
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// 스크립트 플레이어 봇 (HeadlessHost용)
+/// 현재 화면의 링크 중 하나를 시드 고정 난수로 골라 실행
+/// - 같은 시나리오 + 같은 시드면 같은 행동 순서 (History를 저장해 재생 가능)
+/// - 모놀로그 진행 링크를 우선 선택 (대화가 열린 채로 멈추지 않도록)
+/// </summary>
+public class PlayerBot
+{
+	/// <summary>
+	/// 링크 종류별 선택 가중치 (없는 종류는 1)
+	/// </summary>
+	private static readonly Dictionary<string, int> Weights = new()
+	{
+		["move"] = 4,
+		["script"] = 3,
+		["action"] = 3,
+		["look_unit"] = 2,
+		["take"] = 2,
+		["put"] = 2,
+		["item_inv_menu"] = 2,
+		["item_ground_menu"] = 2,
+		["item_unit_menu"] = 2,
+		["inventory"] = 1,
+		["toggle"] = 1,
+		["idle"] = 1,
+		["back"] = 1,
+	};
+
+	/// <summary>
+	/// 모놀로그가 열려 있으면 이 링크들 중에서만 선택
+	/// </summary>
+	private static readonly HashSet<string> MonologueActions = new()
+	{
+		"monologue_next", "monologue_done", "monologue_yes", "monologue_no"
+	};
+
+	private readonly HeadlessHost _host;
+	private readonly Random _random;
+	private readonly List<string> _candidates = new();
+	private readonly List<string> _history = new();
+
+	/// <summary>
+	/// 실행한 메타 액션 (재생용)
+	/// </summary>
+	public IReadOnlyList<string> History => _history;
+
+	public PlayerBot(HeadlessHost host, int seed)
+	{
+		_host = host;
+		_random = new Random(seed);
+	}
+
+	/// <summary>
+	/// 메타 액션 종류 (통계 키)
+	/// script 링크는 함수 이름까지 포함 (예: "script:npc_talk")
+	/// </summary>
+	public static string GetActionType(string meta)
+	{
+		var first = meta.IndexOf(':');
+		if (first < 0)
+			return meta;
+
+		var type = meta.Substring(0, first);
+		if (type != "script")
+			return type;
+
+		var second = meta.IndexOf(':', first + 1);
+		return second < 0 ? meta : meta.Substring(0, second);
+	}
+
+	/// <summary>
+	/// 다음 행동 선택 (선택할 링크가 없으면 null)
+	/// </summary>
+	public string? Choose()
+	{
+		_candidates.Clear();
+		foreach (var meta in _host.Links)
+		{
+			if (MonologueActions.Contains(GetActionType(meta)))
+				_candidates.Add(meta);
+		}
+
+		if (_candidates.Count > 0)
+			return _candidates[_random.Next(_candidates.Count)];
+
+		int totalWeight = 0;
+		foreach (var meta in _host.Links)
+		{
+			_candidates.Add(meta);
+			totalWeight += GetWeight(meta);
+		}
+
+		if (_candidates.Count == 0)
+			return null;
+
+		var pick = _random.Next(totalWeight);
+		foreach (var meta in _candidates)
+		{
+			pick -= GetWeight(meta);
+			if (pick < 0)
+				return meta;
+		}
+		return _candidates[^1];
+	}
+
+	/// <summary>
+	/// 다음 행동을 골라 실행하고 대기 시간까지 진행
+	/// 선택할 링크가 없으면 새 게임으로 재시작
+	/// </summary>
+	/// <returns>실행한 메타 액션 (재시작한 경우 null)</returns>
+	public string? Step()
+	{
+		var meta = Choose();
+		if (meta == null)
+		{
+			_host.NewGame();
+			return null;
+		}
+
+		_host.Perform(meta);
+		_history.Add(meta);
+		return meta;
+	}
+
+	private static int GetWeight(string meta)
+	{
+		var first = meta.IndexOf(':');
+		var type = first < 0 ? meta : meta.Substring(0, first);
+		return Weights.TryGetValue(type, out var weight) ? weight : 1;
+	}
+}
@@ -0,0 +1,254 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using System.Text;
+using System.Text.Json;
+using Morld;
+
+/// <summary>
+/// 월드 크기별 스케일링 벤치마크 (SyntheticScenarioGenerator + HeadlessHost)
+/// 배율마다 합성 시나리오를 생성해 부팅 시간, 스텝당 이동 처리 시간, 경로 탐색 시간, 화면 렌더링 시간을 측정
+/// 마지막으로 Terrain 페이징 모드에서 같은 경로 탐색을 반복해 시간과 결과(도달 여부, 이동 시간)를 비교
+/// 결과 JSON의 steps 배열이 크기(Location/NPC 수) 대비 비용 곡선
+/// </summary>
+public static class BenchmarkScaling
+{
+	/// <summary>
+	/// 기본 배율 (기본 옵션: Region 4개 × Location 10개, NPC 20명)
+	/// </summary>
+	public static readonly double[] DefaultFactors = { 1, 2, 4, 8, 16 };
+
+	/// <summary>
+	/// 생성된 시나리오를 두는 폴더
+	/// </summary>
+	public const string OutputRoot = "user://synthetic/";
+
+	private sealed class StepResult
+	{
+		public double Factor;
+		public SyntheticScenarioGenerator.Summary Summary = null!;
+		public double GenerateMs;
+		public double BootMs;
+		public double StepMs;
+		public long Steps;
+		public double PathMs;
+		public int PathQueries;
+		public int PathFound;
+		public double RenderMs;
+		public int RenderCount;
+		public int PagedResidentRegions;
+		public double PagedPathMs;
+		public long PageIns;
+		public int RouteMismatches;
+	}
+
+	/// <summary>
+	/// 배율별 측정 실행
+	/// </summary>
+	/// <param name="baseOptions">배율 1의 생성 옵션 (null = 기본값)</param>
+	/// <param name="factors">측정할 배율 목록 (null = DefaultFactors)</param>
+	/// <param name="idleMinutes">이동 측정: idle로 흘려보낼 게임 시간 (분)</param>
+	/// <param name="pathQueries">경로 탐색 측정: 무작위 출발/도착 쌍 수</param>
+	/// <param name="renders">렌더링 측정: 상황 화면 재생성 횟수</param>
+	/// <param name="outputPath">결과 JSON 경로 (null = 기록 안 함)</param>
+	/// <returns>결과 JSON</returns>
+	public static string Run(SyntheticScenarioOptions? baseOptions = null, IReadOnlyList<double>? factors = null,
+		int idleMinutes = 240, int pathQueries = 500, int renders = 200, string? outputPath = null)
+	{
+		baseOptions ??= new SyntheticScenarioOptions();
+		var results = new List<StepResult>();
+
+		foreach (var factor in factors ?? DefaultFactors)
+		{
+			var options = baseOptions.Scale(factor);
+			var directory = $"{OutputRoot}scale_{options.Seed}_{factor:0.##}/";
+			results.Add(RunStep(directory, options, factor, idleMinutes, pathQueries, renders));
+		}
+
+		var json = WriteJson(results, baseOptions, idleMinutes);
+		if (outputPath != null)
+		{
+			var path = GamePath.Globalize(outputPath);
+			File.WriteAllText(path, json);
+		}
+
+		PrintSummary(results);
+
+		var mismatches = results.Sum(r => r.RouteMismatches);
+		if (mismatches > 0)
+			throw new InvalidOperationException($"Paged terrain returned {mismatches} route(s) different from the non-paged run");
+		return json;
+	}
+
+	private static StepResult RunStep(string directory, SyntheticScenarioOptions options, double factor, int idleMinutes, int pathQueries, int renders)
+	{
+		var result = new StepResult { Factor = factor };
+
+		var start = Stopwatch.GetTimestamp();
+		result.Summary = SyntheticScenarioGenerator.Generate(directory, options);
+		result.GenerateMs = Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+
+		var host = new HeadlessHost(GamePath.Globalize(directory));
+		start = Stopwatch.GetTimestamp();
+		host.Boot();
+		result.BootMs = Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+		DismissMonologues(host);
+
+		// 이동: idle 동안 모든 NPC가 스케줄을 따라 움직임
+		var stepsBefore = host.StepCount;
+		start = Stopwatch.GetTimestamp();
+		host.Perform($"idle:{idleMinutes}");
+		var elapsed = Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+		result.Steps = host.StepCount - stepsBefore;
+		result.StepMs = result.Steps > 0 ? elapsed / result.Steps : 0;
+		DismissMonologues(host);
+
+		// 경로 탐색: 무작위 Location 쌍 (조건 없는 컨텍스트)
+		var worldSystem = (SE.WorldSystem)host.World.FindSystem("worldSystem");
+		var terrain = worldSystem.GetTerrain();
+		var locations = new List<LocationRef>();
+		foreach (var region in terrain.Regions)
+		{
+			foreach (var location in region.Locations)
+				locations.Add(new LocationRef(location));
+		}
+
+		var random = new Random(options.Seed);
+		var routes = new List<(LocationRef From, LocationRef To, PathResult Path)>();
+		start = Stopwatch.GetTimestamp();
+		for (int i = 0; i < pathQueries && locations.Count > 1; i++)
+		{
+			var from = locations[random.Next(locations.Count)];
+			var to = locations[random.Next(locations.Count)];
+			var path = terrain.FindPath(from, to, null);
+			if (path.Found)
+				result.PathFound++;
+			result.PathQueries++;
+			routes.Add((from, to, path));
+		}
+		elapsed = Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+		result.PathMs = result.PathQueries > 0 ? elapsed / result.PathQueries : 0;
+
+		// 렌더링: 현재 위치 상황 화면을 매번 새로 생성
+		var textUISystem = host.TextUISystem;
+		start = Stopwatch.GetTimestamp();
+		for (int i = 0; i < renders; i++)
+		{
+			textUISystem.ShowSituation();
+			textUISystem.FlushDisplay();
+		}
+		elapsed = Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+		result.RenderCount = renders;
+		result.RenderMs = renders > 0 ? elapsed / renders : 0;
+
+		// 페이징: Region 1/4만 상주시킨 채 같은 쌍을 다시 탐색 (측정 마지막 - 이후 Region 객체가 교체됨)
+		result.PagedResidentRegions = Math.Max(2, terrain.RegionCount / 4);
+		terrain.EnablePaging(new RegionFileStore($"{directory}pages/"), result.PagedResidentRegions);
+		var pageInsBefore = terrain.PageInCount;
+		start = Stopwatch.GetTimestamp();
+		foreach (var (from, to, expected) in routes)
+		{
+			var path = terrain.FindPath(from, to, null);
+			if (path.Found != expected.Found || Math.Abs(path.TotalTravelTime - expected.TotalTravelTime) > 0.001f)
+				result.RouteMismatches++;
+		}
+		elapsed = Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+		result.PagedPathMs = routes.Count > 0 ? elapsed / routes.Count : 0;
+		result.PageIns = terrain.PageInCount - pageInsBefore;
+
+		host.Shutdown();
+		return result;
+	}
+
+	/// <summary>
+	/// 열린 모놀로그를 닫음 (첫 만남 이벤트 등이 측정을 막지 않도록)
+	/// </summary>
+	internal static void DismissMonologues(HeadlessHost host)
+	{
+		for (int guard = 0; guard < 100; guard++)
+		{
+			string? next = null;
+			foreach (var meta in host.Links)
+			{
+				if (meta.StartsWith("monologue_"))
+				{
+					next = meta;
+					break;
+				}
+			}
+			if (next == null)
+				return;
+			host.Perform(next);
+		}
+	}
+
+	// ===== 결과 출력 =====
+
+	private static string WriteJson(List<StepResult> results, SyntheticScenarioOptions baseOptions, int idleMinutes)
+	{
+		using var stream = new MemoryStream();
+		using (var writer = new Utf8JsonWriter(stream, new JsonWriterOptions { Indented = true }))
+		{
+			writer.WriteStartObject();
+			writer.WriteString("benchmark", "scaling");
+			writer.WriteNumber("seed", baseOptions.Seed);
+			writer.WriteNumber("idleMinutes", idleMinutes);
+			writer.WriteString("timestamp", DateTime.UtcNow.ToString("o"));
+
+			writer.WriteStartObject("baseOptions");
+			writer.WriteNumber("regionCount", baseOptions.RegionCount);
+			writer.WriteNumber("locationsPerRegion", baseOptions.LocationsPerRegion);
+			writer.WriteNumber("edgeDensity", baseOptions.EdgeDensity);
+			writer.WriteNumber("npcCount", baseOptions.NpcCount);
+			writer.WriteNumber("scheduleEntries", baseOptions.ScheduleEntries);
+			writer.WriteNumber("itemCount", baseOptions.ItemCount);
+			writer.WriteEndObject();
+
+			writer.WriteStartArray("steps");
+			foreach (var result in results)
+			{
+				writer.WriteStartObject();
+				writer.WriteNumber("factor", result.Factor);
+				writer.WriteNumber("regions", result.Summary.Regions);
+				writer.WriteNumber("locations", result.Summary.Locations);
+				writer.WriteNumber("edges", result.Summary.Edges);
+				writer.WriteNumber("regionEdges", result.Summary.RegionEdges);
+				writer.WriteNumber("npcs", result.Summary.Npcs);
+				writer.WriteNumber("objects", result.Summary.Objects);
+				writer.WriteNumber("items", result.Summary.Items);
+				writer.WriteNumber("generateMs", Round(result.GenerateMs));
+				writer.WriteNumber("bootMs", Round(result.BootMs));
+				writer.WriteNumber("steps", result.Steps);
+				writer.WriteNumber("msPerStep", Round(result.StepMs));
+				writer.WriteNumber("pathQueries", result.PathQueries);
+				writer.WriteNumber("pathFound", result.PathFound);
+				writer.WriteNumber("msPerPath", Round(result.PathMs));
+				writer.WriteNumber("renders", result.RenderCount);
+				writer.WriteNumber("msPerRender", Round(result.RenderMs));
+				writer.WriteNumber("pagedResidentRegions", result.PagedResidentRegions);
+				writer.WriteNumber("pagedMsPerPath", Round(result.PagedPathMs));
+				writer.WriteNumber("pageIns", result.PageIns);
+				writer.WriteNumber("pagedRouteMismatches", result.RouteMismatches);
+				writer.WriteEndObject();
+			}
+			writer.WriteEndArray();
+
+			writer.WriteEndObject();
+		}
+		return Encoding.UTF8.GetString(stream.ToArray());
+	}
+
+	private static double Round(double value) => Math.Round(value, 4);
+
+	private static void PrintSummary(List<StepResult> results)
+	{
+		Console.WriteLine("=== Scaling Benchmark ===");
+		Console.WriteLine($"   {"factor",6} {"locs",6} {"npcs",6} {"boot ms",10} {"ms/step",10} {"ms/path",10} {"ms/render",10} {"paged",10} {"mismatch",8}");
+		foreach (var result in results)
+		{
+			Console.WriteLine($"   {result.Factor,6:0.##} {result.Summary.Locations,6} {result.Summary.Npcs,6} {result.BootMs,10:F1} {result.StepMs,10:F4} {result.PathMs,10:F4} {result.RenderMs,10:F4} {result.PagedPathMs,10:F4} {result.RouteMismatches,8}");
+		}
+	}
+}
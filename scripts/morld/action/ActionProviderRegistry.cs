@@ -1,5 +1,4 @@
 using System.Collections.Generic;
-using Godot;
 
 namespace Morld;
 
@@ -9,6 +8,8 @@ namespace Morld;
 /// </summary>
 public class ActionProviderRegistry
 {
+	private static readonly LogCategory _log = Log.Category("ActionProviderRegistry");
+
 	private readonly List<IActionProvider> _providers = new();
 
 	/// <summary>
@@ -18,13 +19,13 @@ public class ActionProviderRegistry
 	{
 		if (_providers.Exists(p => p.ProviderId == provider.ProviderId))
 		{
-			GD.PrintErr($"[ActionProviderRegistry] Provider already registered: {provider.ProviderId}");
+			_log.Error($"Provider already registered: {provider.ProviderId}");
 			return;
 		}
 
 		_providers.Add(provider);
 #if DEBUG_LOG
-		GD.Print($"[ActionProviderRegistry] Registered: {provider.ProviderId}");
+		_log.Debug($"Registered: {provider.ProviderId}");
 #endif
 	}
 
@@ -36,7 +37,7 @@ public class ActionProviderRegistry
 		var removed = _providers.RemoveAll(p => p.ProviderId == providerId);
 #if DEBUG_LOG
 		if (removed > 0)
-			GD.Print($"[ActionProviderRegistry] Unregistered: {providerId}");
+			_log.Debug($"Unregistered: {providerId}");
 #endif
 	}
 
@@ -0,0 +1,257 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text;
+using System.Text.Json;
+
+namespace Morld;
+
+/// <summary>
+/// morld.* API 호출 통계 (호출 수, 누적/최대 시간, 지연 시간 히스토그램, 변환 시간)
+/// - ScriptSystem이 모든 builtin을 감싸서 기록, Enabled가 false면 bool 검사 한 번만 추가됨
+/// - 변환(bridge) 시간: PyDict/PyList ↔ C# 변환 구간을 BeginBridge/EndBridge로 표시한 합계
+/// - Python: morld.stats() / C#: Format(), ToJson()
+/// </summary>
+public class ApiCallStats
+{
+	/// <summary>
+	/// 히스토그램 구간 수 (0: 1µs 미만, k: 2^(k-1)µs 이상 2^k µs 미만, 마지막: 나머지 전부)
+	/// </summary>
+	public const int BucketCount = 20;
+
+	/// <summary>
+	/// API 하나의 누적 통계
+	/// </summary>
+	public sealed class Entry
+	{
+		public string Name { get; }
+		public long Calls { get; internal set; }
+		public long Errors { get; internal set; }
+		public long TotalTicks { get; internal set; }
+		public long BridgeTicks { get; internal set; }
+		public long MaxTicks { get; internal set; }
+		internal readonly long[] Buckets = new long[BucketCount];
+
+		public Entry(string name)
+		{
+			Name = name;
+		}
+
+		public ReadOnlySpan<long> Histogram => Buckets;
+
+		public double TotalMs => TicksToMs(TotalTicks);
+		public double BridgeMs => TicksToMs(BridgeTicks);
+		public double MeanMs => Calls > 0 ? TotalMs / Calls : 0;
+		public double MaxMs => TicksToMs(MaxTicks);
+
+		/// <summary>
+		/// 히스토그램 기반 백분위수 (해당 구간 상한, ms)
+		/// </summary>
+		public double PercentileMs(double percentile)
+		{
+			if (Calls == 0)
+				return 0;
+
+			var rank = (long)Math.Ceiling(percentile * Calls);
+			long seen = 0;
+			for (int i = 0; i < BucketCount; i++)
+			{
+				seen += Buckets[i];
+				if (seen >= rank)
+					return i == BucketCount - 1 ? MaxMs : Math.Min(BucketUpperUs(i) / 1000.0, MaxMs);
+			}
+			return MaxMs;
+		}
+
+		internal void Clear()
+		{
+			Calls = 0;
+			Errors = 0;
+			TotalTicks = 0;
+			BridgeTicks = 0;
+			MaxTicks = 0;
+			Array.Clear(Buckets);
+		}
+	}
+
+	private readonly Dictionary<string, Entry> _entries = new();
+
+	// 현재 호출의 변환 시간 누적 (중첩 호출 시 Wrap이 저장/복원)
+	private long _currentBridgeTicks;
+
+	/// <summary>
+	/// 기록 여부 (기본 꺼짐)
+	/// </summary>
+	public bool Enabled { get; set; }
+
+	/// <summary>
+	/// 등록된 API 통계 (이름 → 통계)
+	/// </summary>
+	public IReadOnlyDictionary<string, Entry> Entries => _entries;
+
+	/// <summary>
+	/// API 통계 항목 (등록 시 한 번 생성, 이후 호출마다 재사용)
+	/// </summary>
+	public Entry GetOrAdd(string name)
+	{
+		if (!_entries.TryGetValue(name, out var entry))
+		{
+			entry = new Entry(name);
+			_entries[name] = entry;
+		}
+		return entry;
+	}
+
+	/// <summary>
+	/// API 본문을 감싸 호출마다 시간 기록
+	/// </summary>
+	public Func<TArg, TResult> Wrap<TArg, TResult>(string name, Func<TArg, TResult> body)
+	{
+		var entry = GetOrAdd(name);
+		return arg =>
+		{
+			if (!Enabled)
+				return body(arg);
+
+			var outerBridge = _currentBridgeTicks;
+			_currentBridgeTicks = 0;
+			var start = Stopwatch.GetTimestamp();
+			bool failed = true;
+			try
+			{
+				var result = body(arg);
+				failed = false;
+				return result;
+			}
+			finally
+			{
+				Record(entry, Stopwatch.GetTimestamp() - start, _currentBridgeTicks, failed);
+				_currentBridgeTicks = outerBridge;
+			}
+		};
+	}
+
+	/// <summary>
+	/// 변환 구간 시작 (Enabled가 아니면 0)
+	/// </summary>
+	public long BeginBridge() => Enabled ? Stopwatch.GetTimestamp() : 0;
+
+	/// <summary>
+	/// 변환 구간 끝 - 현재 호출의 변환 시간에 더함
+	/// </summary>
+	public void EndBridge(long start)
+	{
+		if (start != 0)
+			_currentBridgeTicks += Stopwatch.GetTimestamp() - start;
+	}
+
+	private static void Record(Entry entry, long ticks, long bridgeTicks, bool failed)
+	{
+		entry.Calls++;
+		if (failed)
+			entry.Errors++;
+		entry.TotalTicks += ticks;
+		entry.BridgeTicks += bridgeTicks;
+		if (ticks > entry.MaxTicks)
+			entry.MaxTicks = ticks;
+		entry.Buckets[BucketIndex(ticks)]++;
+	}
+
+	/// <summary>
+	/// 모든 통계 초기화 (등록된 API 목록은 유지)
+	/// </summary>
+	public void Reset()
+	{
+		foreach (var entry in _entries.Values)
+			entry.Clear();
+	}
+
+	/// <summary>
+	/// 누적 시간 순으로 정렬된 호출된 API 목록
+	/// </summary>
+	public List<Entry> GetSorted()
+	{
+		var list = new List<Entry>();
+		foreach (var entry in _entries.Values)
+		{
+			if (entry.Calls > 0)
+				list.Add(entry);
+		}
+		list.Sort((a, b) => b.TotalTicks.CompareTo(a.TotalTicks));
+		return list;
+	}
+
+	// ===== 구간 계산 =====
+
+	private static int BucketIndex(long ticks)
+	{
+		var us = ticks * 1_000_000 / Stopwatch.Frequency;
+		if (us < 1)
+			return 0;
+		var index = 64 - System.Numerics.BitOperations.LeadingZeroCount((ulong)us);
+		return Math.Min(index, BucketCount - 1);
+	}
+
+	/// <summary>
+	/// 구간 상한 (µs)
+	/// </summary>
+	public static long BucketUpperUs(int index) => 1L << index;
+
+	private static double TicksToMs(long ticks) => ticks * 1000.0 / Stopwatch.Frequency;
+
+	// ===== 출력 =====
+
+	/// <summary>
+	/// 콘솔용 표 (누적 시간 순)
+	/// </summary>
+	public string Format()
+	{
+		var sb = new StringBuilder();
+		sb.AppendLine($"{"api",-26} {"calls",8} {"total ms",10} {"mean ms",9} {"p50 ms",9} {"p99 ms",9} {"max ms",9} {"bridge ms",10}");
+		foreach (var entry in GetSorted())
+		{
+			sb.AppendLine($"{entry.Name,-26} {entry.Calls,8} {entry.TotalMs,10:F3} {entry.MeanMs,9:F4} {entry.PercentileMs(0.5),9:F4} {entry.PercentileMs(0.99),9:F4} {entry.MaxMs,9:F4} {entry.BridgeMs,10:F3}");
+		}
+		return sb.ToString();
+	}
+
+	/// <summary>
+	/// JSON 덤프 (누적 시간 순, 히스토그램 포함)
+	/// </summary>
+	public string ToJson()
+	{
+		using var stream = new MemoryStream();
+		using (var writer = new Utf8JsonWriter(stream, new JsonWriterOptions { Indented = true }))
+		{
+			writer.WriteStartObject();
+			writer.WriteStartArray("bucketUpperUs");
+			for (int i = 0; i < BucketCount - 1; i++)
+				writer.WriteNumberValue(BucketUpperUs(i));
+			writer.WriteEndArray();
+
+			writer.WriteStartObject("apis");
+			foreach (var entry in GetSorted())
+			{
+				writer.WriteStartObject(entry.Name);
+				writer.WriteNumber("calls", entry.Calls);
+				writer.WriteNumber("errors", entry.Errors);
+				writer.WriteNumber("totalMs", Math.Round(entry.TotalMs, 4));
+				writer.WriteNumber("meanMs", Math.Round(entry.MeanMs, 4));
+				writer.WriteNumber("p50Ms", Math.Round(entry.PercentileMs(0.5), 4));
+				writer.WriteNumber("p99Ms", Math.Round(entry.PercentileMs(0.99), 4));
+				writer.WriteNumber("maxMs", Math.Round(entry.MaxMs, 4));
+				writer.WriteNumber("bridgeMs", Math.Round(entry.BridgeMs, 4));
+				writer.WriteStartArray("histogram");
+				foreach (var count in entry.Histogram)
+					writer.WriteNumberValue(count);
+				writer.WriteEndArray();
+				writer.WriteEndObject();
+			}
+			writer.WriteEndObject();
+
+			writer.WriteEndObject();
+		}
+		return Encoding.UTF8.GetString(stream.ToArray());
+	}
+}
@@ -0,0 +1,191 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace Morld;
+
+/// <summary>
+/// 변경 저널 레코드 (JSON Lines 한 줄)
+/// 인벤토리/플래그 변경을 공통 형식으로 기록
+/// </summary>
+public class JournalRecord
+{
+	/// <summary>
+	/// 순번 (스냅샷의 JournalSeq 이하인 레코드는 이미 반영된 것으로 간주)
+	/// </summary>
+	public long Seq { get; set; }
+
+	/// <summary>
+	/// 연산 ("add", "remove", "transfer", "equip", "unequip", "visible", "flag" 등)
+	/// </summary>
+	public string Op { get; set; } = "";
+
+	public string? Owner { get; set; }
+	public string? ToOwner { get; set; }
+	public int ItemId { get; set; }
+	public int Count { get; set; }
+	public string? Key { get; set; }
+	public int Value { get; set; }
+}
+
+/// <summary>
+/// 추가 전용 변경 저널
+/// - 변경 사항을 메모리에 모았다가 Flush 시 파일 끝에 추가 (비용 = 변경량)
+/// - 스냅샷 저장(압축) 후 Truncate로 비움
+/// - 로드 시 스냅샷 이후 레코드만 재생
+/// </summary>
+public class ChangeJournal
+{
+	private static readonly LogCategory _log = Log.Category("ChangeJournal");
+
+	private static readonly JsonSerializerOptions JsonOptions = new()
+	{
+		PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+		DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingDefault
+	};
+
+	private readonly string _path;
+	private readonly List<JournalRecord> _pending = new();
+	private long _nextSeq = 1;
+	private int _writtenCount = 0;
+
+	/// <summary>
+	/// 이 레코드 수를 넘으면 스냅샷으로 압축할 시점
+	/// </summary>
+	public int CompactThreshold { get; set; }
+
+	/// <summary>
+	/// 저널 파일 경로 (user:// 경로 가능)
+	/// </summary>
+	public string Path => _path;
+
+	/// <summary>
+	/// 아직 파일에 기록되지 않은 레코드 수
+	/// </summary>
+	public int PendingCount => _pending.Count;
+
+	/// <summary>
+	/// 마지막 압축 이후 저널에 쌓인 레코드 수 (대기분 포함)
+	/// </summary>
+	public int EntryCount => _writtenCount + _pending.Count;
+
+	/// <summary>
+	/// 마지막으로 발급된 순번 (스냅샷에 기록)
+	/// </summary>
+	public long LastSeq => _nextSeq - 1;
+
+	/// <summary>
+	/// 압축이 필요한지 여부
+	/// </summary>
+	public bool NeedsCompaction => EntryCount >= CompactThreshold;
+
+	public ChangeJournal(string path, int compactThreshold = 512)
+	{
+		_path = path;
+		CompactThreshold = compactThreshold;
+	}
+
+	/// <summary>
+	/// 레코드 추가 (순번 발급, 파일 기록은 Flush 시)
+	/// </summary>
+	public void Append(JournalRecord record)
+	{
+		record.Seq = _nextSeq++;
+		_pending.Add(record);
+	}
+
+	/// <summary>
+	/// 대기 중인 레코드를 파일 끝에 추가
+	/// </summary>
+	public void Flush()
+	{
+		if (_pending.Count == 0)
+			return;
+
+		try
+		{
+			using var file = new FileStream(GamePath.Globalize(_path), FileMode.Append, System.IO.FileAccess.Write, FileShare.Read);
+			using var writer = new StreamWriter(file, new UTF8Encoding(false));
+			foreach (var record in _pending)
+			{
+				writer.WriteLine(JsonSerializer.Serialize(record, JsonOptions));
+			}
+			_writtenCount += _pending.Count;
+			_pending.Clear();
+		}
+		catch (Exception ex)
+		{
+			// 대기분은 유지 (다음 Flush에서 재시도)
+			_log.Error($"Failed to write journal: {ex.Message}");
+		}
+	}
+
+	/// <summary>
+	/// 저널 비우기 (스냅샷 저장 직후 호출, 순번은 계속 증가)
+	/// </summary>
+	public void Truncate()
+	{
+		_pending.Clear();
+		_writtenCount = 0;
+
+		try
+		{
+			var path = GamePath.Globalize(_path);
+			if (File.Exists(path))
+				File.Delete(path);
+		}
+		catch (Exception ex)
+		{
+			_log.Error($"Failed to truncate journal: {ex.Message}");
+		}
+	}
+
+	/// <summary>
+	/// 파일의 레코드 중 afterSeq 이후 것만 읽기 (로드 시 재생용)
+	/// 손상된 마지막 줄(기록 중 종료)은 무시
+	/// </summary>
+	public List<JournalRecord> ReadAfter(long afterSeq)
+	{
+		var result = new List<JournalRecord>();
+		var path = GamePath.Globalize(_path);
+		_writtenCount = 0;
+
+		if (!File.Exists(path))
+		{
+			_nextSeq = Math.Max(_nextSeq, afterSeq + 1);
+			return result;
+		}
+
+		long maxSeq = afterSeq;
+		foreach (var line in File.ReadLines(path, Encoding.UTF8))
+		{
+			if (string.IsNullOrWhiteSpace(line))
+				continue;
+
+			JournalRecord? record;
+			try
+			{
+				record = JsonSerializer.Deserialize<JournalRecord>(line, JsonOptions);
+			}
+			catch (JsonException)
+			{
+				_log.Warning($"Skipping corrupt record in {_path}");
+				continue;
+			}
+
+			if (record == null)
+				continue;
+
+			_writtenCount++;
+			maxSeq = Math.Max(maxSeq, record.Seq);
+			if (record.Seq > afterSeq)
+				result.Add(record);
+		}
+
+		_nextSeq = Math.Max(_nextSeq, maxSeq + 1);
+		return result;
+	}
+}
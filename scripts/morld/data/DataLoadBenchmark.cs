@@ -0,0 +1,350 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text.Json;
+using SE;
+
+namespace Morld;
+
+/// <summary>
+/// 시작 시 JSON 데이터 로드 벤치마크
+/// 기존 순차 로드(UpdateFromFile → 문자열 → DTO → 변환)와
+/// ParallelDataLoader(병렬 읽기 + Utf8JsonReader 스트리밍 파싱)를 합성 데이터로 비교
+/// </summary>
+public static class BenchmarkDataLoad
+{
+	/// <summary>
+	/// 합성 시나리오 데이터(수 MB)를 만들어 두 로드 방식의 시간과 결과를 비교
+	/// </summary>
+	/// <param name="regionCount">Region 수</param>
+	/// <param name="locationsPerRegion">Region당 Location 수</param>
+	/// <param name="unitCount">유닛 수</param>
+	/// <param name="itemCount">아이템 수</param>
+	/// <param name="iterations">반복 횟수</param>
+	public static void Run(int regionCount = 200, int locationsPerRegion = 50, int unitCount = 5000, int itemCount = 5000, int iterations = 5)
+	{
+		Console.WriteLine("=== Data Load Benchmark ===\n");
+
+		var dataPath = Path.Combine(Path.GetTempPath(), "morld_load_benchmark") + "/";
+		Directory.CreateDirectory(dataPath);
+
+		// 1. 합성 데이터 생성
+		Console.WriteLine("1. Generating synthetic data...");
+		WriteTerrain(dataPath + ParallelDataLoader.TerrainFile, regionCount, locationsPerRegion);
+		WriteTime(dataPath + ParallelDataLoader.TimeFile);
+		WriteUnits(dataPath + ParallelDataLoader.UnitFile, unitCount, regionCount, locationsPerRegion, itemCount);
+		WriteItems(dataPath + ParallelDataLoader.ItemFile, itemCount);
+		File.Delete(dataPath + "inventory_data.json");  // unit_data.json 마이그레이션 경로 사용
+
+		long totalBytes = 0;
+		foreach (var file in new[] { ParallelDataLoader.TerrainFile, ParallelDataLoader.TimeFile, ParallelDataLoader.UnitFile, ParallelDataLoader.ItemFile })
+		{
+			var size = new FileInfo(dataPath + file).Length;
+			totalBytes += size;
+			Console.WriteLine($"   {file}: {size / 1024.0 / 1024.0:F2} MB");
+		}
+		Console.WriteLine($"   Total: {totalBytes / 1024.0 / 1024.0:F2} MB, Iterations: {iterations}\n");
+
+		// 2. 결과 동일성 확인
+		Console.WriteLine("2. Verifying output...");
+		var legacy = LoadLegacy(dataPath);
+		var parallel = LoadParallel(dataPath);
+		var mismatches = Compare(legacy, parallel);
+		if (mismatches.Count == 0)
+		{
+			Console.WriteLine("   ✓ SUCCESS: Legacy and streaming loaders produce identical data");
+		}
+		else
+		{
+			foreach (var name in mismatches)
+				Console.WriteLine($"   ✗ FAILED: {name} mismatch");
+		}
+
+		// 3. 로드 시간 비교
+		Console.WriteLine("\n3. Startup load...");
+		var legacyTime = Measure(iterations, () => LoadLegacy(dataPath));
+		var parallelTime = Measure(iterations, () => LoadParallel(dataPath));
+		PrintResult("Sequential UpdateFromFile", legacyTime, iterations, totalBytes);
+		PrintResult("ParallelDataLoader", parallelTime, iterations, totalBytes);
+
+		Console.WriteLine("\n=== Benchmark Complete ===");
+	}
+
+	/// <summary>
+	/// 벤치마크용 독립 시스템 묶음
+	/// </summary>
+	private sealed class LoadedSystems
+	{
+		public WorldSystem World = new("benchmark");
+		public UnitSystem Units = new();
+		public ItemSystem Items = new();
+		public InventorySystem Inventory = new();
+	}
+
+	/// <summary>
+	/// 기존 GameEngine.LoadDataFromJson 순서 그대로 로드
+	/// </summary>
+	private static LoadedSystems LoadLegacy(string dataPath)
+	{
+		var systems = new LoadedSystems();
+		systems.World.GetTerrain().UpdateFromFile(dataPath + ParallelDataLoader.TerrainFile);
+		systems.World.GetTime().UpdateFromFile(dataPath + ParallelDataLoader.TimeFile);
+		systems.Units.UpdateFromFile(dataPath + ParallelDataLoader.UnitFile);
+		systems.Items.UpdateFromFile(dataPath + ParallelDataLoader.ItemFile);
+		if (!systems.Inventory.LoadData(dataPath))
+		{
+			systems.Units.MigrateInventoryData(dataPath + ParallelDataLoader.UnitFile, systems.Inventory);
+		}
+		return systems;
+	}
+
+	private static LoadedSystems LoadParallel(string dataPath)
+	{
+		var systems = new LoadedSystems();
+		ParallelDataLoader.Load(dataPath, systems.World, systems.Units, systems.Items, systems.Inventory);
+		return systems;
+	}
+
+	/// <summary>
+	/// 각 시스템의 내보내기 결과(JSON)를 비교
+	/// </summary>
+	private static List<string> Compare(LoadedSystems a, LoadedSystems b)
+	{
+		var mismatches = new List<string>();
+		if (JsonSerializer.Serialize(a.World.GetTerrain().ExportToData()) != JsonSerializer.Serialize(b.World.GetTerrain().ExportToData()))
+			mismatches.Add("terrain");
+		if (JsonSerializer.Serialize(a.World.GetTime().ExportToData()) != JsonSerializer.Serialize(b.World.GetTime().ExportToData()))
+			mismatches.Add("time");
+		if (JsonSerializer.Serialize(a.Units.ExportToData()) != JsonSerializer.Serialize(b.Units.ExportToData()))
+			mismatches.Add("units");
+		if (JsonSerializer.Serialize(a.Items.ExportToData()) != JsonSerializer.Serialize(b.Items.ExportToData()))
+			mismatches.Add("items");
+		if (JsonSerializer.Serialize(a.Inventory.ExportToData()) != JsonSerializer.Serialize(b.Inventory.ExportToData()))
+			mismatches.Add("inventory");
+		return mismatches;
+	}
+
+	// ===== 합성 데이터 생성 =====
+
+	private static FileStream CreateFile(string path)
+	{
+		return new FileStream(path, FileMode.Create, FileAccess.Write, FileShare.None, 1 << 16);
+	}
+
+	private static readonly JsonWriterOptions WriterOptions = new() { Indented = true };
+
+	private static void WriteTerrain(string path, int regionCount, int locationsPerRegion)
+	{
+		using var stream = CreateFile(path);
+		using var writer = new Utf8JsonWriter(stream, WriterOptions);
+
+		writer.WriteStartObject();
+		writer.WriteString("name", "합성 지형");
+
+		writer.WriteStartArray("regions");
+		for (int r = 0; r < regionCount; r++)
+		{
+			writer.WriteStartObject();
+			writer.WriteNumber("id", r);
+			writer.WriteString("name", $"지역 {r}");
+			writer.WriteStartObject("appearance");
+			writer.WriteString("default", $"지역 {r}의 풍경이 펼쳐져 있다.");
+			writer.WriteEndObject();
+
+			writer.WriteStartArray("locations");
+			for (int l = 0; l < locationsPerRegion; l++)
+			{
+				writer.WriteStartObject();
+				writer.WriteNumber("id", l);
+				writer.WriteString("name", $"장소 {r}-{l}");
+				if (l % 3 == 0)
+				{
+					writer.WriteStartObject("appearance");
+					writer.WriteString("default", $"장소 {r}-{l}은(는) 조용한 곳이다.");
+					writer.WriteString("아침", "이른 아침 안개가 깔려 있다.");
+					writer.WriteString("밤", "달빛이 희미하게 비춘다.");
+					writer.WriteEndObject();
+				}
+				writer.WriteEndObject();
+			}
+			writer.WriteEndArray();
+
+			writer.WriteStartArray("edges");
+			for (int l = 1; l < locationsPerRegion; l++)
+			{
+				writer.WriteStartObject();
+				writer.WriteNumber("a", l - 1);
+				writer.WriteNumber("b", l);
+				writer.WriteNumber("timeAtoB", 5 + l % 7);
+				writer.WriteNumber("timeBtoA", 5 + l % 5);
+				if (l % 10 == 0)
+				{
+					writer.WriteStartObject("conditionsAtoB");
+					writer.WriteNumber("열쇠", 1);
+					writer.WriteEndObject();
+				}
+				writer.WriteEndObject();
+			}
+			writer.WriteEndArray();
+			writer.WriteEndObject();
+		}
+		writer.WriteEndArray();
+
+		writer.WriteStartArray("regionEdges");
+		for (int r = 1; r < regionCount; r++)
+		{
+			writer.WriteStartObject();
+			writer.WriteNumber("id", r - 1);
+			writer.WriteString("name", $"연결 {r - 1}-{r}");
+			writer.WriteNumber("regionA", r - 1);
+			writer.WriteNumber("localA", locationsPerRegion - 1);
+			writer.WriteNumber("regionB", r);
+			writer.WriteNumber("localB", 0);
+			writer.WriteNumber("timeAtoB", 30);
+			writer.WriteNumber("timeBtoA", 30);
+			writer.WriteEndObject();
+		}
+		writer.WriteEndArray();
+
+		writer.WriteEndObject();
+	}
+
+	private static void WriteTime(string path)
+	{
+		File.WriteAllText(path, """
+			{
+				"calendar": {
+					"daysPerMonth": [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+					"weekdayNames": ["일", "월", "화", "수", "목", "금", "토"]
+				},
+				"currentTime": { "year": 1, "month": 1, "day": 1, "hour": 6, "minute": 0 },
+				"holidays": [ { "name": "신년", "month": 1, "startDay": 1, "endDay": 3 } ]
+			}
+			""");
+	}
+
+	private static void WriteUnits(string path, int unitCount, int regionCount, int locationsPerRegion, int itemCount)
+	{
+		var random = new Random(42);
+		using var stream = CreateFile(path);
+		using var writer = new Utf8JsonWriter(stream, WriterOptions);
+
+		writer.WriteStartArray();
+		for (int u = 0; u < unitCount; u++)
+		{
+			writer.WriteStartObject();
+			writer.WriteNumber("id", u);
+			writer.WriteString("name", $"주민 {u}");
+			writer.WriteString("comment", $"npc_{u:D5}");
+			writer.WriteString("type", u % 10 == 9 ? "object" : (u % 2 == 0 ? "male" : "female"));
+			writer.WriteNumber("regionId", random.Next(regionCount));
+			writer.WriteNumber("locationId", random.Next(locationsPerRegion));
+
+			writer.WriteStartObject("tags");
+			writer.WriteNumber("관찰", random.Next(5));
+			writer.WriteNumber("힘", random.Next(10));
+			writer.WriteEndObject();
+
+			writer.WriteStartArray("actions");
+			writer.WriteStringValue("script:npc_talk:대화");
+			writer.WriteStringValue("trade");
+			writer.WriteEndArray();
+
+			writer.WriteStartObject("appearance");
+			writer.WriteString("default", "평범한 주민이다. 차분한 표정을 짓고 있다.");
+			writer.WriteString("기쁨", "환하게 웃고 있다.");
+			writer.WriteEndObject();
+
+			writer.WriteStartArray("scheduleStack");
+			writer.WriteStartObject();
+			writer.WriteString("name", "일상");
+			writer.WriteStartArray("schedule");
+			for (int e = 0; e < 4; e++)
+			{
+				writer.WriteStartObject();
+				writer.WriteString("name", $"일과 {e}");
+				writer.WriteNumber("regionId", random.Next(regionCount));
+				writer.WriteNumber("locationId", random.Next(locationsPerRegion));
+				writer.WriteNumber("start", e * 360);
+				writer.WriteNumber("end", e * 360 + 300);
+				writer.WriteString("activity", e % 2 == 0 ? "식사" : "수면");
+				writer.WriteEndObject();
+			}
+			writer.WriteEndArray();
+			writer.WriteNull("endConditionType");
+			writer.WriteNull("endConditionParam");
+			writer.WriteEndObject();
+			writer.WriteEndArray();
+
+			writer.WriteStartObject("inventory");
+			for (int i = 0; i < 3; i++)
+			{
+				writer.WriteNumber(((u * 3 + i) % itemCount).ToString(), 1 + random.Next(5));
+			}
+			writer.WriteEndObject();
+
+			writer.WriteEndObject();
+		}
+		writer.WriteEndArray();
+	}
+
+	private static void WriteItems(string path, int itemCount)
+	{
+		using var stream = CreateFile(path);
+		using var writer = new Utf8JsonWriter(stream, WriterOptions);
+
+		writer.WriteStartArray();
+		for (int i = 0; i < itemCount; i++)
+		{
+			writer.WriteStartObject();
+			writer.WriteNumber("id", i);
+			writer.WriteString("name", $"아이템 {i}");
+			writer.WriteString("comment", $"item_{i:D5}");
+			writer.WriteStartObject("passiveTags");
+			if (i % 4 == 0)
+				writer.WriteNumber("열쇠", 1);
+			writer.WriteEndObject();
+			writer.WriteStartObject("equipTags");
+			if (i % 5 == 0)
+				writer.WriteNumber("관찰", 2);
+			writer.WriteEndObject();
+			writer.WriteNumber("value", i * 10);
+			writer.WriteStartArray("actions");
+			writer.WriteStringValue("take@container");
+			writer.WriteStringValue("use@inventory");
+			writer.WriteEndArray();
+			writer.WriteEndObject();
+		}
+		writer.WriteEndArray();
+	}
+
+	// ===== 측정 =====
+
+	/// <summary>
+	/// 실행 시간 측정 (ms)
+	/// </summary>
+	private static List<double> Measure(int iterations, Action action)
+	{
+		var results = new List<double>(iterations);
+		for (int i = 0; i < iterations; i++)
+		{
+			var stopwatch = Stopwatch.StartNew();
+			action();
+			results.Add(stopwatch.Elapsed.TotalMilliseconds);
+		}
+		return results;
+	}
+
+	private static void PrintResult(string name, List<double> times, int iterations, long totalBytes)
+	{
+		times.Sort();
+		double sum = 0;
+		foreach (var time in times)
+			sum += time;
+
+		var average = sum / iterations;
+		var throughput = totalBytes / 1024.0 / 1024.0 / (times[0] / 1000.0);
+		Console.WriteLine($"   {name,-28} Avg: {average,9:F2} ms  Best: {times[0],9:F2} ms  ({throughput:F1} MB/s)");
+	}
+}
@@ -0,0 +1,233 @@
+using System;
+using System.Collections.Generic;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace Morld;
+
+/// <summary>
+/// 스크립트 플래그 저장소 (morld.set_flag / clear_flag 기록)
+/// - 실제 값은 플레이어 TraversalContext 태그에 있고, 여기서는 세이브용 사본을 유지
+/// - IDataProvider: flags_data.json 스냅샷 저장/로드
+/// - 저널 활성화 시 변경분만 flags_journal.jsonl에 추가 기록
+/// - ICheckpointable: 체크포인트 이후 처음 바뀌는 플래그만 이전 값 보관
+/// </summary>
+public class FlagStore : IDataProvider, ICheckpointable
+{
+	private static readonly LogCategory _log = Log.Category("FlagStore");
+
+	// === IDataProvider ===
+	public string DataId => "flags";
+
+	private readonly Dictionary<string, int> _flags = new();
+	private ChangeJournal? _journal;
+	private bool _snapshotRequired = false;
+	private readonly UndoLayers<string, int> _undo = new();
+
+	/// <summary>
+	/// 기록된 플래그 (이름 → 값, 0 = 해제됨)
+	/// </summary>
+	public IReadOnlyDictionary<string, int> Flags => _flags;
+
+	/// <summary>
+	/// 플래그 변경 기록
+	/// </summary>
+	public void Set(string name, int value)
+	{
+		if (_flags.TryGetValue(name, out var current) && current == value)
+			return;
+
+		Touch(name);
+		_flags[name] = value;
+		_journal?.Append(new JournalRecord { Op = "flag", Key = name, Value = value });
+	}
+
+	/// <summary>
+	/// 기록된 플래그를 태그 컨텍스트에 적용 (로드 후 플레이어에 반영)
+	/// </summary>
+	public void ApplyTo(TraversalContext context)
+	{
+		foreach (var (name, value) in _flags)
+		{
+			context.SetTag(name, value);
+		}
+	}
+
+	/// <summary>
+	/// 전체 플래그 교체 (스냅샷 복원용, 저널 기록 없음)
+	/// </summary>
+	public void ReplaceAll(IEnumerable<KeyValuePair<string, int>> flags)
+	{
+		foreach (var name in _flags.Keys)
+			Touch(name);
+		_flags.Clear();
+
+		foreach (var (name, value) in flags)
+		{
+			Touch(name);
+			_flags[name] = value;
+		}
+	}
+
+	// ===== 체크포인트 =====
+
+	private void Touch(string name)
+	{
+		if (!_undo.NeedsCapture(name))
+			return;
+
+		bool present = _flags.TryGetValue(name, out var value);
+		_undo.Capture(name, present, value);
+	}
+
+	public void BeginCheckpoint()
+	{
+		_undo.Push();
+	}
+
+	public void RollbackCheckpoint()
+	{
+		foreach (var (name, (present, value)) in _undo.Pop())
+		{
+			if (present)
+				_flags[name] = value;
+			else
+				_flags.Remove(name);
+		}
+
+		// 저널에 되돌린 변경이 남아 있으므로 다음 자동 저장은 스냅샷으로
+		if (_journal != null)
+			_snapshotRequired = true;
+	}
+
+	public void ReleaseCheckpoint()
+	{
+		_undo.Merge();
+	}
+
+	// ===== 변경 저널 =====
+
+	/// <summary>
+	/// 변경 저널 활성화 ({DataId}_journal.jsonl)
+	/// </summary>
+	public void EnableJournal(string basePath, int compactThreshold = 256)
+	{
+		_journal = new ChangeJournal($"{basePath}{DataId}_journal.jsonl", compactThreshold);
+	}
+
+	/// <summary>
+	/// 자동 저장 (변경분만 저널에 추가, 임계치를 넘으면 스냅샷으로 압축)
+	/// </summary>
+	/// <returns>전체 스냅샷을 저장했으면 true</returns>
+	public bool Autosave(string basePath)
+	{
+		if (_journal == null || _journal.NeedsCompaction || _snapshotRequired)
+		{
+			SaveData(basePath);
+			return true;
+		}
+
+		_journal.Flush();
+		return false;
+	}
+
+	/// <summary>
+	/// 대기 중인 저널 기록 (종료 시 호출)
+	/// </summary>
+	public void FlushJournal()
+	{
+		_journal?.Flush();
+	}
+
+	// ===== IDataProvider 구현 =====
+
+	public void SaveData(string basePath)
+	{
+		var data = new FlagDataJson
+		{
+			Flags = new Dictionary<string, int>(_flags),
+			JournalSeq = _journal?.LastSeq ?? 0
+		};
+
+		var json = JsonSerializer.Serialize(data, new JsonSerializerOptions { WriteIndented = true });
+		var path = $"{basePath}{DataId}_data.json";
+
+		if (!GamePath.TryWriteAllText(path, json))
+		{
+			_log.Error($"저장 실패: {path}");
+			return;
+		}
+
+		// 스냅샷에 모두 반영되었으므로 저널 비움
+		_journal?.Truncate();
+		_snapshotRequired = false;
+	}
+
+	public bool LoadData(string basePath)
+	{
+		var path = $"{basePath}{DataId}_data.json";
+		long journalSeq = 0;
+		bool loaded = false;
+
+		ClearData();
+
+		if (GamePath.FileExists(path))
+		{
+			if (!GamePath.TryReadAllText(path, out var json))
+			{
+				_log.Error($"파일 열기 실패: {path}");
+				return false;
+			}
+
+			try
+			{
+				var data = JsonSerializer.Deserialize<FlagDataJson>(json);
+				if (data?.Flags != null)
+				{
+					foreach (var (name, value) in data.Flags)
+						_flags[name] = value;
+				}
+				journalSeq = data?.JournalSeq ?? 0;
+				loaded = true;
+			}
+			catch (Exception ex)
+			{
+				_log.Error($"JSON 파싱 실패: {ex.Message}");
+				return false;
+			}
+		}
+
+		// 스냅샷 이후 변경 재생
+		if (_journal != null)
+		{
+			var records = _journal.ReadAfter(journalSeq);
+			foreach (var record in records)
+			{
+				if (record.Op == "flag" && record.Key != null)
+					_flags[record.Key] = record.Value;
+			}
+			loaded |= records.Count > 0;
+		}
+
+		return loaded;
+	}
+
+	public void ClearData()
+	{
+		foreach (var name in _flags.Keys)
+			Touch(name);
+		_flags.Clear();
+	}
+
+	/// <summary>
+	/// 플래그 데이터 JSON 포맷
+	/// </summary>
+	private class FlagDataJson
+	{
+		[JsonPropertyName("flags")]
+		public Dictionary<string, int>? Flags { get; set; }
+
+		[JsonPropertyName("journalSeq")]
+		public long JournalSeq { get; set; }
+	}
+}
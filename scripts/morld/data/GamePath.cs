@@ -0,0 +1,157 @@
+using System;
+using System.IO;
+
+namespace Morld;
+
+/// <summary>
+/// Godot 가상 경로 처리 (user://, res://) 및 파일 읽기/쓰기
+/// - Godot 빌드(GODOT): ProjectSettings.GlobalizePath와 Godot.FileAccess 사용 (.pck 안의 res:// 파일 포함)
+/// - 그 외(dotnet 헤드리스 실행): ResourceRoot/UserRoot 기준 경로와 System.IO 사용
+/// </summary>
+public static class GamePath
+{
+#if !GODOT
+	/// <summary>
+	/// res:// 에 해당하는 폴더 (기본: 현재 폴더, project.godot가 있는 폴더로 지정)
+	/// </summary>
+	public static string ResourceRoot { get; set; } = Directory.GetCurrentDirectory();
+
+	/// <summary>
+	/// user:// 에 해당하는 폴더 (기본: 로컬 앱 데이터 폴더의 Morld)
+	/// </summary>
+	public static string UserRoot { get; set; } =
+		Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData), "Morld");
+#endif
+
+	/// <summary>
+	/// user://, res:// 경로는 실제 파일 시스템 경로로 바꾸고 일반 경로는 그대로 반환
+	/// </summary>
+	public static string Globalize(string path)
+	{
+#if GODOT
+		return path.StartsWith("user://") || path.StartsWith("res://")
+			? Godot.ProjectSettings.GlobalizePath(path)
+			: path;
+#else
+		if (path.StartsWith("res://"))
+			return Path.Combine(ResourceRoot, path.Substring("res://".Length));
+		if (path.StartsWith("user://"))
+			return Path.Combine(UserRoot, path.Substring("user://".Length));
+		return path;
+#endif
+	}
+
+	/// <summary>
+	/// 파일 API를 직접 쓰는 라이브러리(sharpPy import 경로 등)에 넘길 경로
+	/// Godot 빌드에서는 가상 경로를 그대로 두고, 그 외에는 Globalize
+	/// </summary>
+	public static string Platform(string path)
+	{
+#if GODOT
+		return path;
+#else
+		return Globalize(path);
+#endif
+	}
+
+	/// <summary>
+	/// 파일 존재 여부
+	/// </summary>
+	public static bool FileExists(string path)
+	{
+#if GODOT
+		return Godot.FileAccess.FileExists(path);
+#else
+		return File.Exists(Globalize(path));
+#endif
+	}
+
+	/// <summary>
+	/// 텍스트 파일 전체 읽기
+	/// </summary>
+	/// <returns>파일을 열 수 없으면 false</returns>
+	public static bool TryReadAllText(string path, out string text)
+	{
+#if GODOT
+		using var file = Godot.FileAccess.Open(path, Godot.FileAccess.ModeFlags.Read);
+		text = file?.GetAsText() ?? "";
+		return file != null;
+#else
+		try
+		{
+			text = File.ReadAllText(Globalize(path));
+			return true;
+		}
+		catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+		{
+			text = "";
+			return false;
+		}
+#endif
+	}
+
+	/// <summary>
+	/// 텍스트 파일 전체 읽기 (열 수 없으면 InvalidOperationException)
+	/// </summary>
+	public static string ReadAllText(string path)
+	{
+		if (!TryReadAllText(path, out var text))
+			throw new InvalidOperationException($"Failed to open file for reading: {path}");
+		return text;
+	}
+
+	/// <summary>
+	/// 파일 전체를 바이트로 읽기 (열 수 없으면 InvalidOperationException, 워커 스레드에서 호출 가능)
+	/// </summary>
+	public static byte[] ReadAllBytes(string path)
+	{
+#if GODOT
+		using var file = Godot.FileAccess.Open(path, Godot.FileAccess.ModeFlags.Read)
+			?? throw new InvalidOperationException($"Failed to open file for reading: {path}");
+		return file.GetBuffer((long)file.GetLength());
+#else
+		try
+		{
+			return File.ReadAllBytes(Globalize(path));
+		}
+		catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+		{
+			throw new InvalidOperationException($"Failed to open file for reading: {path}", ex);
+		}
+#endif
+	}
+
+	/// <summary>
+	/// 텍스트 파일 쓰기 (기존 내용 교체)
+	/// </summary>
+	/// <returns>파일을 열 수 없으면 false</returns>
+	public static bool TryWriteAllText(string path, string text)
+	{
+#if GODOT
+		using var file = Godot.FileAccess.Open(path, Godot.FileAccess.ModeFlags.Write);
+		if (file == null)
+			return false;
+		file.StoreString(text);
+		return true;
+#else
+		try
+		{
+			File.WriteAllText(Globalize(path), text);
+			return true;
+		}
+		catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+		{
+			return false;
+		}
+#endif
+	}
+
+	/// <summary>
+	/// 텍스트 파일 쓰기 (열 수 없으면 InvalidOperationException)
+	/// </summary>
+	public static void WriteAllText(string path, string text)
+	{
+		if (!TryWriteAllText(path, text))
+			throw new InvalidOperationException($"Failed to open file for writing: {path}");
+	}
+}
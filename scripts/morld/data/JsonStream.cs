@@ -0,0 +1,220 @@
+using System;
+using System.Collections.Generic;
+using System.Text.Json;
+
+namespace Morld;
+
+/// <summary>
+/// Utf8JsonReader 기반 전진 전용(forward-only) 파싱 헬퍼
+/// - 중간 DTO/문자열 없이 UTF-8 바이트에서 바로 도메인 객체를 채울 때 사용
+/// - 속성 이름은 데이터 파일의 camelCase 이름과 정확히 일치해야 함
+/// - 주석과 끝 쉼표 허용 (JsonSerializer 로드와 동일하게 관대하게)
+/// </summary>
+internal static class JsonStream
+{
+	private static readonly JsonReaderOptions ReaderOptions = new()
+	{
+		CommentHandling = JsonCommentHandling.Skip,
+		AllowTrailingCommas = true
+	};
+
+	/// <summary>
+	/// 리더 생성 (UTF-8 BOM 제거)
+	/// </summary>
+	public static Utf8JsonReader CreateReader(ReadOnlySpan<byte> utf8)
+	{
+		if (utf8.Length >= 3 && utf8[0] == 0xEF && utf8[1] == 0xBB && utf8[2] == 0xBF)
+			utf8 = utf8[3..];
+
+		return new Utf8JsonReader(utf8, ReaderOptions);
+	}
+
+	/// <summary>
+	/// 다음 토큰으로 이동 (데이터 끝이면 예외)
+	/// </summary>
+	public static void Read(ref Utf8JsonReader reader)
+	{
+		if (!reader.Read())
+			throw new JsonException("Unexpected end of JSON data");
+	}
+
+	/// <summary>
+	/// 다음 토큰이 지정한 타입인지 확인
+	/// </summary>
+	public static void Expect(ref Utf8JsonReader reader, JsonTokenType type)
+	{
+		Read(ref reader);
+		if (reader.TokenType != type)
+			throw new JsonException($"Expected {type} but found {reader.TokenType} at byte {reader.TokenStartIndex}");
+	}
+
+	/// <summary>
+	/// 다음 속성 이름으로 이동 (객체 끝이면 false)
+	/// </summary>
+	public static bool NextProperty(ref Utf8JsonReader reader)
+	{
+		Read(ref reader);
+		if (reader.TokenType == JsonTokenType.EndObject)
+			return false;
+		if (reader.TokenType != JsonTokenType.PropertyName)
+			throw new JsonException($"Expected property name but found {reader.TokenType} at byte {reader.TokenStartIndex}");
+		return true;
+	}
+
+	/// <summary>
+	/// 다음 배열 요소의 첫 토큰으로 이동 (배열 끝이면 false)
+	/// </summary>
+	public static bool NextElement(ref Utf8JsonReader reader)
+	{
+		Read(ref reader);
+		return reader.TokenType != JsonTokenType.EndArray;
+	}
+
+	/// <summary>
+	/// 객체 값 시작으로 이동 (null이면 false)
+	/// </summary>
+	public static bool BeginObject(ref Utf8JsonReader reader)
+	{
+		Read(ref reader);
+		if (reader.TokenType == JsonTokenType.Null)
+			return false;
+		if (reader.TokenType != JsonTokenType.StartObject)
+			throw new JsonException($"Expected object but found {reader.TokenType} at byte {reader.TokenStartIndex}");
+		return true;
+	}
+
+	/// <summary>
+	/// 배열 값 시작으로 이동 (null이면 false)
+	/// </summary>
+	public static bool BeginArray(ref Utf8JsonReader reader)
+	{
+		Read(ref reader);
+		if (reader.TokenType == JsonTokenType.Null)
+			return false;
+		if (reader.TokenType != JsonTokenType.StartArray)
+			throw new JsonException($"Expected array but found {reader.TokenType} at byte {reader.TokenStartIndex}");
+		return true;
+	}
+
+	public static int ReadInt(ref Utf8JsonReader reader, int defaultValue = 0)
+	{
+		Read(ref reader);
+		return reader.TokenType == JsonTokenType.Null ? defaultValue : reader.GetInt32();
+	}
+
+	public static bool ReadBool(ref Utf8JsonReader reader)
+	{
+		Read(ref reader);
+		return reader.TokenType == JsonTokenType.True;
+	}
+
+	public static string? ReadString(ref Utf8JsonReader reader)
+	{
+		Read(ref reader);
+		return reader.TokenType == JsonTokenType.Null ? null : reader.GetString();
+	}
+
+	/// <summary>
+	/// 현재 속성 값 건너뛰기
+	/// </summary>
+	public static void SkipValue(ref Utf8JsonReader reader)
+	{
+		Read(ref reader);
+		reader.Skip();
+	}
+
+	/// <summary>
+	/// 현재 속성의 정수 키 (딕셔너리 키가 "3" 형태인 경우)
+	/// </summary>
+	public static int GetIntKey(ref Utf8JsonReader reader)
+	{
+		if (System.Buffers.Text.Utf8Parser.TryParse(reader.ValueSpan, out int key, out int consumed)
+			&& consumed == reader.ValueSpan.Length)
+			return key;
+
+		return int.Parse(reader.GetString()!);
+	}
+
+	/// <summary>
+	/// {"태그": 값} 객체를 대상 딕셔너리에 채움
+	/// </summary>
+	public static void ReadStringIntMap(ref Utf8JsonReader reader, IDictionary<string, int> target)
+	{
+		if (!BeginObject(ref reader))
+			return;
+
+		while (NextProperty(ref reader))
+		{
+			var key = reader.GetString()!;
+			target[key] = ReadInt(ref reader);
+		}
+	}
+
+	/// <summary>
+	/// {"키": "문자열"} 객체를 대상 딕셔너리에 채움
+	/// </summary>
+	public static void ReadStringStringMap(ref Utf8JsonReader reader, IDictionary<string, string> target)
+	{
+		if (!BeginObject(ref reader))
+			return;
+
+		while (NextProperty(ref reader))
+		{
+			var key = reader.GetString()!;
+			target[key] = ReadString(ref reader) ?? string.Empty;
+		}
+	}
+
+	/// <summary>
+	/// ["문자열", ...] 배열을 대상 컬렉션에 채움
+	/// </summary>
+	public static void ReadStringList(ref Utf8JsonReader reader, ICollection<string> target)
+	{
+		if (!BeginArray(ref reader))
+			return;
+
+		while (NextElement(ref reader))
+		{
+			if (reader.TokenType != JsonTokenType.Null)
+				target.Add(reader.GetString()!);
+		}
+	}
+
+	/// <summary>
+	/// {"아이템ID": 개수} 객체를 (키, 값) 목록에 채움
+	/// </summary>
+	public static void ReadIntIntMap(ref Utf8JsonReader reader, List<(int Key, int Value)> target)
+	{
+		if (!BeginObject(ref reader))
+			return;
+
+		while (NextProperty(ref reader))
+		{
+			var key = GetIntKey(ref reader);
+			target.Add((key, ReadInt(ref reader)));
+		}
+	}
+
+	/// <summary>
+	/// [정수, ...] 배열을 대상 컬렉션에 채움
+	/// </summary>
+	public static void ReadIntList(ref Utf8JsonReader reader, ICollection<int> target)
+	{
+		if (!BeginArray(ref reader))
+			return;
+
+		while (NextElement(ref reader))
+		{
+			if (reader.TokenType != JsonTokenType.Null)
+				target.Add(reader.GetInt32());
+		}
+	}
+
+	/// <summary>
+	/// 객체 생성에 필요한 속성(id)보다 하위 컬렉션이 먼저 나온 경우
+	/// </summary>
+	public static JsonException MissingId(string owner, ref Utf8JsonReader reader)
+	{
+		return new JsonException($"{owner}: 'id' must appear before '{reader.GetString()}' (byte {reader.TokenStartIndex})");
+	}
+}
@@ -0,0 +1,166 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading.Tasks;
+using SE;
+
+namespace Morld;
+
+/// <summary>
+/// JSON 시나리오 데이터 병렬 로더
+/// - location/time/unit/item/inventory 파일을 스레드 풀에서 동시에 읽고 파싱
+/// - 지형/유닛/아이템은 Utf8JsonReader로 바이트에서 바로 도메인 객체 생성 (중간 DTO, 문자열 변환 없음)
+/// - 파싱 결과는 어떤 시스템에도 연결되지 않은 상태로 만들고, 시스템 반영은 호출 스레드에서 수행
+/// </summary>
+public static class ParallelDataLoader
+{
+	private static readonly LogCategory _log = Log.Category("ParallelDataLoader");
+
+	public const string TerrainFile = "location_data.json";
+	public const string TimeFile = "time_data.json";
+	public const string UnitFile = "unit_data.json";
+	public const string ItemFile = "item_data.json";
+
+	/// <summary>
+	/// 월드에 등록된 시스템으로 시나리오 데이터 로드
+	/// </summary>
+	/// <param name="dataPath">데이터 폴더 (예: "res://scenarios/scenario01/data/")</param>
+	public static void Load(World world, string dataPath)
+	{
+		Load(
+			dataPath,
+			world.FindSystem("worldSystem") as WorldSystem,
+			world.FindSystem("unitSystem") as UnitSystem,
+			world.FindSystem("itemSystem") as ItemSystem,
+			world.FindSystem("inventorySystem") as InventorySystem);
+	}
+
+	/// <summary>
+	/// 지정한 시스템으로 시나리오 데이터 로드 (null인 시스템은 건너뜀)
+	/// inventory_data.json이 없으면 unit_data.json의 구버전 인벤토리를 마이그레이션
+	/// </summary>
+	public static void Load(
+		string dataPath,
+		WorldSystem? worldSystem,
+		UnitSystem? unitSystem,
+		ItemSystem? itemSystem,
+		InventorySystem? inventorySystem)
+	{
+		var stopwatch = Stopwatch.StartNew();
+
+		// 1. 파일 읽기 + 파싱 (스레드 풀)
+		var terrainTask = worldSystem != null
+			? Task.Run(() => Traced(TerrainFile, () => TerrainStreamParser.Parse(ReadFile(dataPath + TerrainFile))))
+			: null;
+		var timeTask = worldSystem != null
+			? Task.Run(() => Traced(TimeFile, () => GameTime.ParseJson(ReadFile(dataPath + TimeFile))))
+			: null;
+		// 유닛 파일은 인벤토리 마이그레이션에도 쓰이므로 인벤토리만 있어도 파싱
+		var unitTask = unitSystem != null || inventorySystem != null
+			? Task.Run(() => Traced(UnitFile, () => UnitStreamParser.Parse(ReadFile(dataPath + UnitFile))))
+			: null;
+		var itemTask = itemSystem != null
+			? Task.Run(() => Traced(ItemFile, () => ItemStreamParser.Parse(ReadFile(dataPath + ItemFile))))
+			: null;
+		var inventoryTask = inventorySystem != null
+			? Task.Run(() => Traced("inventory", () => ReadInventory($"{dataPath}{inventorySystem.DataId}_data.json")))
+			: null;
+
+		var tasks = new List<Task>(5);
+		if (terrainTask != null) tasks.Add(terrainTask);
+		if (timeTask != null) tasks.Add(timeTask);
+		if (unitTask != null) tasks.Add(unitTask);
+		if (itemTask != null) tasks.Add(itemTask);
+		if (inventoryTask != null) tasks.Add(inventoryTask);
+
+		try
+		{
+			Task.WaitAll(tasks.ToArray());
+		}
+		catch (AggregateException ex)
+		{
+			// 첫 번째 원인을 그대로 전달 (UpdateFromFile과 같은 예외 타입 유지)
+			var inner = ex.Flatten().InnerException ?? ex;
+			System.Runtime.ExceptionServices.ExceptionDispatchInfo.Capture(inner).Throw();
+		}
+		var parseMs = stopwatch.Elapsed.TotalMilliseconds;
+
+		// 2. 시스템 반영 (호출 스레드, 기존 로드 순서 유지)
+		using var apply = TraceRecorder.Span("apply loaded data");
+		if (worldSystem != null)
+		{
+			worldSystem.GetTerrain().ReplaceWith(terrainTask!.Result);
+			worldSystem.GetTime().UpdateFromData(timeTask!.Result);
+		}
+
+		var units = unitTask?.Result;
+		if (unitSystem != null && units != null)
+		{
+			unitSystem.ClearUnits();
+			foreach (var unit in units.Units)
+			{
+				unitSystem.AddUnit(unit);
+			}
+		}
+
+		if (itemSystem != null)
+		{
+			itemSystem.ClearItems();
+			foreach (var item in itemTask!.Result)
+			{
+				itemSystem.AddItem(item);
+			}
+		}
+
+		if (inventorySystem != null && !inventorySystem.ApplyLoadedData(inventoryTask!.Result) && units != null)
+		{
+			MigrateInventory(units, inventorySystem);
+		}
+
+		_log.Info($"로드 완료: 파싱 {parseMs:F2} ms, 전체 {stopwatch.Elapsed.TotalMilliseconds:F2} ms");
+	}
+
+	/// <summary>
+	/// 워커 스레드 작업을 시작 trace 구간으로 기록
+	/// </summary>
+	private static T Traced<T>(string name, Func<T> load)
+	{
+		using (TraceRecorder.Span($"parse {name}", "load"))
+			return load();
+	}
+
+	/// <summary>
+	/// 파일 전체를 바이트로 읽기 (res:// 포함, 워커 스레드에서 호출 가능)
+	/// </summary>
+	private static byte[] ReadFile(string path)
+	{
+		return GamePath.ReadAllBytes(path);
+	}
+
+	/// <summary>
+	/// 인벤토리 스냅샷 읽기 (파일이 없으면 null)
+	/// </summary>
+	private static InventoryDataJson? ReadInventory(string path)
+	{
+		if (!GamePath.FileExists(path))
+			return null;
+
+		return InventorySystem.ParseData(GamePath.ReadAllBytes(path));
+	}
+
+	/// <summary>
+	/// unit_data.json의 구버전 인벤토리/장착 정보를 InventorySystem으로 이동
+	/// (UnitSystem.MigrateInventoryData와 동일, 파일을 다시 읽지 않음)
+	/// </summary>
+	private static void MigrateInventory(UnitStreamResult units, InventorySystem inventorySystem)
+	{
+		foreach (var (unitId, itemId, count) in units.Inventory)
+		{
+			inventorySystem.AddItemToUnit(unitId, itemId, count);
+		}
+		foreach (var (unitId, itemId) in units.EquippedItems)
+		{
+			inventorySystem.EquipItemOnUnit(unitId, itemId);
+		}
+	}
+}
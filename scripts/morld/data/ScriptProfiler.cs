@@ -0,0 +1,189 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text;
+
+namespace Morld;
+
+/// <summary>
+/// 시나리오 스크립트 프로파일러 (ScriptSystem 진입점 단위 시간 측정)
+/// - 프레임: "script:npc_talk", "event:on_meet", "presence", "morld.get_unit_info", "py:characters.cheolsu.events.npc_talk" 등
+/// - 중첩된 프레임 경로별 self 시간을 모아 folded stack 형식으로 출력 (flamegraph.pl, speedscope 호환)
+/// - Enabled가 false면 Enter가 false를 반환하고 아무것도 기록하지 않음
+/// </summary>
+public class ScriptProfiler
+{
+	/// <summary>
+	/// 프레임 하나의 누적 통계 (경로와 무관하게 이름 기준)
+	/// </summary>
+	public sealed class FrameStats
+	{
+		public string Name { get; }
+		public long Calls { get; internal set; }
+		public long TotalTicks { get; internal set; }
+		public long SelfTicks { get; internal set; }
+		public long MaxTicks { get; internal set; }
+
+		public FrameStats(string name)
+		{
+			Name = name;
+		}
+
+		public double TotalMs => TicksToMs(TotalTicks);
+		public double SelfMs => TicksToMs(SelfTicks);
+		public double MaxMs => TicksToMs(MaxTicks);
+	}
+
+	private struct OpenFrame
+	{
+		public string Name;
+		public string Path;
+		public long Start;
+		public long ChildTicks;
+	}
+
+	private readonly List<OpenFrame> _stack = new();
+	private readonly Dictionary<string, long> _selfByPath = new();
+	private readonly Dictionary<string, FrameStats> _frames = new();
+
+	/// <summary>
+	/// 기록 여부 (기본 꺼짐)
+	/// </summary>
+	public bool Enabled { get; set; }
+
+	/// <summary>
+	/// 현재 열린 프레임 깊이
+	/// </summary>
+	public int Depth => _stack.Count;
+
+	/// <summary>
+	/// 프레임 이름별 통계
+	/// </summary>
+	public IReadOnlyDictionary<string, FrameStats> Frames => _frames;
+
+	/// <summary>
+	/// 프레임 시작 (kind:name 형식, kind가 비어 있으면 name만)
+	/// </summary>
+	/// <returns>기록을 시작했으면 true - 같은 호출에서 Exit를 짝으로 불러야 함</returns>
+	public bool Enter(string kind, string name)
+	{
+		if (!Enabled)
+			return false;
+
+		var frame = string.IsNullOrEmpty(kind) ? name : $"{kind}:{name}";
+		// 세미콜론은 folded 형식 구분자
+		frame = frame.Replace(';', ',');
+
+		_stack.Add(new OpenFrame
+		{
+			Name = frame,
+			Path = _stack.Count == 0 ? frame : $"{_stack[^1].Path};{frame}",
+			Start = Stopwatch.GetTimestamp()
+		});
+		return true;
+	}
+
+	/// <summary>
+	/// 가장 안쪽 프레임 종료 (Enter가 true를 반환한 경우에만 호출)
+	/// </summary>
+	public void Exit()
+	{
+		if (_stack.Count == 0)
+			return;
+
+		var frame = _stack[^1];
+		_stack.RemoveAt(_stack.Count - 1);
+
+		var total = Stopwatch.GetTimestamp() - frame.Start;
+		var self = Math.Max(0, total - frame.ChildTicks);
+
+		_selfByPath.TryGetValue(frame.Path, out var pathSelf);
+		_selfByPath[frame.Path] = pathSelf + self;
+
+		if (!_frames.TryGetValue(frame.Name, out var stats))
+		{
+			stats = new FrameStats(frame.Name);
+			_frames[frame.Name] = stats;
+		}
+		stats.Calls++;
+		stats.SelfTicks += self;
+		// 재귀 호출은 가장 바깥 호출만 total에 포함
+		if (!IsOpen(frame.Name))
+			stats.TotalTicks += total;
+		if (total > stats.MaxTicks)
+			stats.MaxTicks = total;
+
+		if (_stack.Count > 0)
+		{
+			var parent = _stack[^1];
+			parent.ChildTicks += total;
+			_stack[^1] = parent;
+		}
+	}
+
+	private bool IsOpen(string name)
+	{
+		foreach (var frame in _stack)
+		{
+			if (frame.Name == name)
+				return true;
+		}
+		return false;
+	}
+
+	/// <summary>
+	/// 기록 초기화 (열린 프레임은 유지)
+	/// </summary>
+	public void Reset()
+	{
+		_selfByPath.Clear();
+		_frames.Clear();
+	}
+
+	/// <summary>
+	/// folded stack 형식 ("a;b;c 123", 값은 self 시간 µs)
+	/// </summary>
+	public string ToFolded()
+	{
+		var paths = new List<string>(_selfByPath.Keys);
+		paths.Sort(StringComparer.Ordinal);
+
+		var sb = new StringBuilder();
+		foreach (var path in paths)
+		{
+			var us = _selfByPath[path] * 1_000_000 / Stopwatch.Frequency;
+			if (us > 0)
+				sb.Append(path).Append(' ').Append(us).Append('\n');
+		}
+		return sb.ToString();
+	}
+
+	/// <summary>
+	/// folded stack 파일 저장
+	/// </summary>
+	public void WriteFolded(string path)
+	{
+		File.WriteAllText(path, ToFolded());
+	}
+
+	/// <summary>
+	/// total 시간 순 상위 프레임 표
+	/// </summary>
+	public string FormatTop(int count = 20)
+	{
+		var list = new List<FrameStats>(_frames.Values);
+		list.Sort((a, b) => b.TotalTicks.CompareTo(a.TotalTicks));
+
+		var sb = new StringBuilder();
+		sb.AppendLine($"{"frame",-48} {"calls",8} {"total ms",10} {"self ms",10} {"max ms",9}");
+		for (int i = 0; i < list.Count && i < count; i++)
+		{
+			var stats = list[i];
+			sb.AppendLine($"{stats.Name,-48} {stats.Calls,8} {stats.TotalMs,10:F3} {stats.SelfMs,10:F3} {stats.MaxMs,9:F3}");
+		}
+		return sb.ToString();
+	}
+
+	private static double TicksToMs(long ticks) => ticks * 1000.0 / Stopwatch.Frequency;
+}
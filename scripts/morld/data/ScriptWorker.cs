@@ -0,0 +1,161 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Morld;
+
+/// <summary>
+/// 스크립트 전용 실행 스레드 (Python 호출을 메인 스레드 밖에서 실행)
+/// - Submit: 작업을 전용 스레드 큐에 넣고 Task 반환
+/// - Post: 실행 중 생긴 게임 상태 변경(morld.* 명령)을 현재 작업의 명령 버퍼에 넣음
+/// - Pump: 메인 스레드의 안전한 시점(프레임 시작)에 끝난 작업의 명령을 순서대로 적용한 뒤 작업 결과를 완료 처리
+///   → 작업이 실행 중인 동안에는 그 작업의 명령이 하나도 적용되지 않음 (Python 호출과 메인 스레드가 상태를 나눠 쓰지 않음)
+///   → Task 완료(와 ExecuteSynchronously 후속 작업)는 항상 메인 스레드, 해당 작업의 명령이 모두 적용된 뒤
+/// - 작업은 한 번에 하나씩 순서대로 실행 (인터프리터는 단일 스레드 전제)
+///   다음 작업은 이전 작업의 명령이 메인 스레드에 적용된 뒤 시작 (예측이 적용 전 상태를 읽지 않도록)
+/// </summary>
+public sealed class ScriptWorker : IDisposable
+{
+	private readonly BlockingCollection<Action> _jobs = new();
+	private readonly ConcurrentQueue<Action> _mainThreadQueue = new();
+	private readonly SemaphoreSlim _applied = new(0);
+	private readonly Thread _thread;
+
+	// 실행 중인 작업이 Post한 명령 (스크립트 스레드 전용, 작업이 끝나면 한꺼번에 메인 스레드로)
+	private List<Action> _commands = new();
+	private int _pending;
+
+	/// <summary>
+	/// 아직 완료 처리되지 않은 작업 수 (메인 스레드 기준, Pump에서 감소)
+	/// </summary>
+	public int PendingCount => _pending;
+
+	/// <summary>
+	/// 완료 처리되지 않은 작업이 있는지
+	/// </summary>
+	public bool IsBusy => _pending > 0;
+
+	/// <summary>
+	/// 현재 스레드가 스크립트 스레드인지
+	/// </summary>
+	public bool IsWorkerThread => Thread.CurrentThread == _thread;
+
+	/// <param name="stackSize">스레드 스택 크기 - 인터프리터 재귀 호출용으로 넉넉히</param>
+	public ScriptWorker(int stackSize = 16 * 1024 * 1024)
+	{
+		_thread = new Thread(Run, stackSize)
+		{
+			Name = "Morld Script",
+			IsBackground = true
+		};
+		_thread.Start();
+	}
+
+	/// <summary>
+	/// 작업 제출 (메인 스레드에서 호출)
+	/// </summary>
+	/// <returns>Pump에서 메인 스레드로 완료되는 Task</returns>
+	public Task<T> Submit<T>(Func<T> work)
+	{
+		var completion = new TaskCompletionSource<T>();
+		_pending++;
+
+		_jobs.Add(() =>
+		{
+			T result = default!;
+			Exception? error = null;
+			try
+			{
+				result = work();
+			}
+			catch (Exception ex)
+			{
+				error = ex;
+			}
+
+			var commands = _commands;
+			_commands = new List<Action>();
+
+			_mainThreadQueue.Enqueue(() =>
+			{
+				try
+				{
+					foreach (var command in commands)
+						command();
+				}
+				catch (Exception ex)
+				{
+					error ??= ex;
+				}
+
+				_pending--;
+				_applied.Release();
+
+				if (error != null)
+					completion.SetException(error);
+				else
+					completion.SetResult(result);
+			});
+
+			// 이 작업의 명령이 적용될 때까지 다음 작업을 시작하지 않음
+			_applied.Wait();
+		});
+		return completion.Task;
+	}
+
+	/// <summary>
+	/// 메인 스레드에서 적용할 명령 추가 (스크립트 스레드에서 호출, 제출 순서 유지)
+	/// 작업이 끝난 뒤 Pump에서 그 작업의 다른 명령과 함께 적용
+	/// </summary>
+	public void Post(Action command)
+	{
+		_commands.Add(command);
+	}
+
+	/// <summary>
+	/// 끝난 작업의 명령 적용 및 완료 처리 (메인 스레드에서 프레임마다 호출)
+	/// </summary>
+	/// <returns>처리한 항목 수</returns>
+	public int Pump()
+	{
+		int count = 0;
+		while (_mainThreadQueue.TryDequeue(out var command))
+		{
+			command();
+			count++;
+		}
+		return count;
+	}
+
+	/// <summary>
+	/// 남은 작업 완료까지 대기 후 모두 처리 (종료 시, 헤드리스 실행용 - 메인 스레드를 멈춤)
+	/// </summary>
+	public void Drain()
+	{
+		while (IsBusy)
+		{
+			if (Pump() == 0)
+				Thread.Sleep(1);
+		}
+	}
+
+	private void Run()
+	{
+		foreach (var job in _jobs.GetConsumingEnumerable())
+			job();
+	}
+
+	public void Dispose()
+	{
+		_jobs.CompleteAdding();
+
+		// 스크립트 스레드가 명령 적용을 기다릴 수 있으므로 종료될 때까지 계속 처리
+		while (!_thread.Join(1))
+			Pump();
+		Pump();
+		_jobs.Dispose();
+		_applied.Dispose();
+	}
+}
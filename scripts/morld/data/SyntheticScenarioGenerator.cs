@@ -0,0 +1,1034 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
+using System.Text;
+
+namespace Morld;
+
+/// <summary>
+/// 합성 시나리오 생성 옵션
+/// 같은 옵션(Seed 포함)이면 항상 같은 시나리오가 생성됨
+/// </summary>
+public sealed record SyntheticScenarioOptions
+{
+	/// <summary>
+	/// 난수 시드
+	/// </summary>
+	public int Seed { get; init; } = 1;
+
+	public int RegionCount { get; init; } = 4;
+
+	public int LocationsPerRegion { get; init; } = 10;
+
+	/// <summary>
+	/// Region 내부 신장 트리 외 추가 Edge 수 (Location당 비율)
+	/// </summary>
+	public double EdgeDensity { get; init; } = 0.5;
+
+	/// <summary>
+	/// Region 체인 외 추가 RegionEdge 수 (Region당 비율)
+	/// </summary>
+	public double RegionEdgeDensity { get; init; } = 0.5;
+
+	/// <summary>
+	/// "열쇠" 조건이 붙는 Edge 비율
+	/// </summary>
+	public double ConditionalEdgeRatio { get; init; } = 0.05;
+
+	public int NpcCount { get; init; } = 20;
+
+	/// <summary>
+	/// NPC 하루 스케줄 항목 수 (하루를 균등 분할, 마지막 항목은 집에서 수면)
+	/// </summary>
+	public int ScheduleEntries { get; init; } = 6;
+
+	/// <summary>
+	/// 스케줄 장소가 집과 같은 Region일 확률 (나머지는 전체 월드에서 선택)
+	/// </summary>
+	public double HomeRegionBias { get; init; } = 0.7;
+
+	public int ItemCount { get; init; } = 50;
+
+	public int ContainersPerRegion { get; init; } = 2;
+
+	/// <summary>
+	/// 상자 하나에 넣는 아이템 종류 수
+	/// </summary>
+	public int ItemsPerContainer { get; init; } = 3;
+
+	/// <summary>
+	/// 월드 크기(Region/NPC/아이템/상자)를 배율만큼 키운 옵션 (스케일링 측정용)
+	/// </summary>
+	public SyntheticScenarioOptions Scale(double factor) => this with
+	{
+		RegionCount = Math.Max(1, (int)Math.Round(RegionCount * factor)),
+		NpcCount = Math.Max(1, (int)Math.Round(NpcCount * factor)),
+		ItemCount = Math.Max(1, (int)Math.Round(ItemCount * factor)),
+	};
+}
+
+/// <summary>
+/// 합성 시나리오 패키지 생성기 (스케일 테스트용)
+/// scenario03과 같은 Python 패키지 구조로 출력:
+///   scenario.json
+///   python/__init__.py, world.py (REGIONS/REGION_EDGES), items.py, events.py
+///   python/characters/__init__.py, characters/player/, characters/npc_NNNN/ (data.py의 scheduleStack 포함)
+///   python/objects/__init__.py, containers.py, furniture.py, grounds.py
+/// 생성된 폴더는 HeadlessHost에 그대로 넘겨 로드 가능
+/// </summary>
+public static class SyntheticScenarioGenerator
+{
+	private static readonly string[] Activities = { "준비", "식사", "쇼핑", "산책", "휴식", "작업" };
+	private const string SleepActivity = "수면";
+	private const string ConditionTag = "열쇠";
+
+	/// <summary>
+	/// 생성 결과 요약
+	/// </summary>
+	public sealed class Summary
+	{
+		public int Regions;
+		public int Locations;
+		public int Edges;
+		public int RegionEdges;
+		public int Npcs;
+		public int Objects;
+		public int Items;
+		public int Files;
+	}
+
+	/// <summary>
+	/// 시나리오 패키지 생성 (기존 python 폴더는 삭제 후 다시 생성)
+	/// </summary>
+	/// <param name="directory">출력 폴더 (user://, res:// 또는 일반 경로)</param>
+	public static Summary Generate(string directory, SyntheticScenarioOptions options)
+	{
+		var root = GamePath.Globalize(directory);
+		var pythonDir = Path.Combine(root, "python");
+		if (Directory.Exists(pythonDir))
+			Directory.Delete(pythonDir, recursive: true);
+		Directory.CreateDirectory(pythonDir);
+
+		var random = new Random(options.Seed);
+		var summary = new Summary();
+		var context = new GeneratorContext(pythonDir, summary);
+
+		WriteText(context, Path.Combine(root, "scenario.json"), $$"""
+			{
+			  "name": "합성 시나리오 (seed {{options.Seed}})",
+			  "version": "1.0.0",
+			  "description": "스케일 테스트용 자동 생성 시나리오 - Region {{options.RegionCount}}, NPC {{options.NpcCount}}",
+			  "dataSource": "python"
+			}
+
+			""");
+
+		var regions = BuildRegions(random, options, summary);
+		var regionEdges = BuildRegionEdges(random, options, summary);
+		WriteWorld(context, options, regions, regionEdges);
+
+		WriteItems(context, random, options);
+		WriteCharacters(context, random, options);
+		WriteObjects(context, random, options);
+
+		context.Write("__init__.py", PackageInit);
+		context.Write("events.py", EventsModule);
+
+		return summary;
+	}
+
+	// ===== 지형 =====
+
+	private static List<object?> BuildRegions(Random random, SyntheticScenarioOptions options, Summary summary)
+	{
+		var regions = new List<object?>();
+		int locationCount = Math.Max(1, options.LocationsPerRegion);
+
+		for (int r = 0; r < options.RegionCount; r++)
+		{
+			var locations = new List<object?>();
+			for (int l = 0; l < locationCount; l++)
+			{
+				locations.Add(new Dictionary<string, object?>
+				{
+					["id"] = l,
+					["name"] = $"장소 {r}-{l}",
+					["appearance"] = new Dictionary<string, object?>
+					{
+						["default"] = $"장소 {r}-{l}은(는) 평범한 곳이다.",
+						["아침"] = "이른 아침 안개가 깔려 있다.",
+						["밤"] = "달빛이 희미하게 비춘다."
+					}
+				});
+			}
+
+			// 신장 트리로 연결 보장 후 추가 Edge
+			var edges = new List<object?>();
+			var connected = new HashSet<(int, int)>();
+			for (int l = 1; l < locationCount; l++)
+			{
+				AddEdge(random, options, edges, connected, random.Next(l), l);
+			}
+			var extra = (int)Math.Round(options.EdgeDensity * locationCount);
+			for (int attempt = 0; extra > 0 && attempt < extra * 4; attempt++)
+			{
+				int a = random.Next(locationCount), b = random.Next(locationCount);
+				if (a != b && AddEdge(random, options, edges, connected, a, b))
+					extra--;
+			}
+
+			regions.Add(new Dictionary<string, object?>
+			{
+				["id"] = r,
+				["name"] = $"지역 {r}",
+				["appearance"] = new Dictionary<string, object?> { ["default"] = $"지역 {r}의 풍경이 펼쳐져 있다." },
+				["locations"] = locations,
+				["edges"] = edges
+			});
+
+			summary.Regions++;
+			summary.Locations += locationCount;
+			summary.Edges += edges.Count;
+		}
+
+		return regions;
+	}
+
+	private static bool AddEdge(Random random, SyntheticScenarioOptions options, List<object?> edges, HashSet<(int, int)> connected, int a, int b)
+	{
+		if (!connected.Add((Math.Min(a, b), Math.Max(a, b))))
+			return false;
+
+		var time = 3 + random.Next(18);
+		var edge = new Dictionary<string, object?>
+		{
+			["a"] = a,
+			["b"] = b,
+			["timeAtoB"] = time,
+			["timeBtoA"] = time
+		};
+		if (random.NextDouble() < options.ConditionalEdgeRatio)
+			edge["conditions"] = new Dictionary<string, object?> { [ConditionTag] = 1 };
+
+		edges.Add(edge);
+		return true;
+	}
+
+	private static List<object?> BuildRegionEdges(Random random, SyntheticScenarioOptions options, Summary summary)
+	{
+		var regionEdges = new List<object?>();
+		var connected = new HashSet<(int, int)>();
+		int locationCount = Math.Max(1, options.LocationsPerRegion);
+
+		void Add(int a, int b)
+		{
+			if (!connected.Add((Math.Min(a, b), Math.Max(a, b))))
+				return;
+			var time = 15 + random.Next(30);
+			regionEdges.Add(new Dictionary<string, object?>
+			{
+				["id"] = regionEdges.Count,
+				["name"] = $"연결 {a}-{b}",
+				["regionA"] = a,
+				["localA"] = random.Next(locationCount),
+				["regionB"] = b,
+				["localB"] = random.Next(locationCount),
+				["timeAtoB"] = time,
+				["timeBtoA"] = time
+			});
+		}
+
+		for (int r = 1; r < options.RegionCount; r++)
+		{
+			Add(r - 1, r);
+		}
+		if (options.RegionCount > 2)
+		{
+			var extra = (int)Math.Round(options.RegionEdgeDensity * options.RegionCount);
+			for (int attempt = 0; attempt < extra * 4 && regionEdges.Count < options.RegionCount - 1 + extra; attempt++)
+			{
+				int a = random.Next(options.RegionCount), b = random.Next(options.RegionCount);
+				if (a != b)
+					Add(a, b);
+			}
+		}
+
+		summary.RegionEdges = regionEdges.Count;
+		return regionEdges;
+	}
+
+	private static void WriteWorld(GeneratorContext context, SyntheticScenarioOptions options, List<object?> regions, List<object?> regionEdges)
+	{
+		var sb = new StringBuilder();
+		sb.Append("# world.py - 지도 및 시간 설정 (SyntheticScenarioGenerator로 생성)\n\n");
+		sb.Append("import morld\n\n");
+		sb.Append($"WORLD_NAME = {Py($"합성 월드 {options.Seed}")}\n\n");
+		sb.Append("REGIONS = ").Append(Py(regions)).Append("\n\n");
+		sb.Append("REGION_EDGES = ").Append(Py(regionEdges)).Append("\n\n");
+		sb.Append(""""
+			TIME_SETTINGS = {
+			    "year": 1,
+			    "month": 4,
+			    "day": 1,
+			    "hour": 6,
+			    "minute": 0
+			}
+
+
+			def initialize_world():
+			    """morld API를 사용하여 월드 데이터 등록"""
+			    for region_data in REGIONS:
+			        region_id = region_data["id"]
+			        morld.add_region(region_id, region_data["name"], region_data.get("appearance"))
+
+			        for loc_data in region_data["locations"]:
+			            morld.add_location(region_id, loc_data["id"], loc_data["name"], loc_data.get("appearance"))
+
+			        for edge_data in region_data.get("edges", []):
+			            morld.add_edge(region_id, edge_data["a"], edge_data["b"], edge_data.get("timeAtoB", 5), edge_data.get("conditions"))
+
+			    for re_data in REGION_EDGES:
+			        morld.add_region_edge(
+			            re_data["regionA"], re_data["localA"],
+			            re_data["regionB"], re_data["localB"],
+			            re_data.get("timeAtoB", 30),
+			            re_data.get("timeBtoA", 30)
+			        )
+
+			    print(f"[world.py] {len(REGIONS)} regions initialized via morld API")
+
+
+			def initialize_time():
+			    """morld API를 사용하여 시간 설정"""
+			    t = TIME_SETTINGS
+			    morld.set_time(t["year"], t["month"], t["day"], t["hour"], t.get("minute", 0))
+
+			"""");
+		context.Write("world.py", sb.ToString());
+	}
+
+	// ===== 아이템 =====
+
+	private static void WriteItems(GeneratorContext context, Random random, SyntheticScenarioOptions options)
+	{
+		var items = new List<object?>();
+		for (int i = 0; i < options.ItemCount; i++)
+		{
+			var passiveTags = new Dictionary<string, object?>();
+			var equipTags = new Dictionary<string, object?>();
+			var actions = new List<object?> { "take@container", "use@inventory" };
+
+			// 일부 아이템은 조건부 Edge를 여는 열쇠, 일부는 장비
+			if (i % 10 == 0)
+				passiveTags[ConditionTag] = 1;
+			if (i % 4 == 1)
+			{
+				equipTags[i % 8 == 1 ? "공격" : "방어"] = 1 + random.Next(5);
+				actions.Add("equip@inventory");
+			}
+
+			items.Add(new Dictionary<string, object?>
+			{
+				["id"] = i,
+				["name"] = $"아이템 {i}",
+				["passiveTags"] = passiveTags,
+				["equipTags"] = equipTags,
+				["value"] = 1 + random.Next(200),
+				["actions"] = actions
+			});
+		}
+		context.Summary.Items = items.Count;
+
+		var sb = new StringBuilder();
+		sb.Append("# items.py - 아이템 정의 (SyntheticScenarioGenerator로 생성)\n\n");
+		sb.Append("import morld\n\n");
+		sb.Append("ITEMS = ").Append(Py(items)).Append("\n\n");
+		sb.Append(""""
+
+
+			def initialize_items():
+			    """morld API를 사용하여 아이템 데이터 등록"""
+			    for item in ITEMS:
+			        morld.add_item_def(
+			            item["id"],
+			            item["name"],
+			            item.get("passiveTags"),
+			            item.get("equipTags"),
+			            item.get("value", 0),
+			            item.get("actions")
+			        )
+			    print(f"[items.py] {len(ITEMS)} items initialized via morld API")
+
+
+			def get_item(item_id):
+			    """특정 아이템 조회 (Python 내부용)"""
+			    for item in ITEMS:
+			        if item["id"] == item_id:
+			            return item
+			    return None
+
+			"""");
+		context.Write("items.py", sb.ToString());
+	}
+
+	// ===== 캐릭터 =====
+
+	private static string NpcModule(int npcId) => $"npc_{npcId:D4}";
+
+	private static void WriteCharacters(GeneratorContext context, Random random, SyntheticScenarioOptions options)
+	{
+		int locationCount = Math.Max(1, options.LocationsPerRegion);
+
+		// 플레이어
+		context.Write("characters/player/__init__.py", """"
+			# player 캐릭터 패키지
+			from characters.player import data
+			from characters.player import events
+
+			"""");
+		context.Write("characters/player/data.py", """"
+			# characters/player/data.py - 플레이어 캐릭터 정의
+
+			CHARACTER_ID = 0
+
+			CHARACTER_DATA = {
+			    "id": CHARACTER_ID,
+			    "name": "플레이어",
+			    "comment": "player",
+			    "type": "male",
+			    "regionId": 0,
+			    "locationId": 0,
+			    "tags": {"관찰": 3, "힘": 5},
+			    "actions": ["rest", "sleep", "wait"],
+			    "scheduleStack": [
+			        {"name": "대기", "schedule": [], "endConditionType": None, "endConditionParam": None}
+			    ]
+			}
+
+			"""");
+		context.Write("characters/player/events.py", """"
+			# characters/player/events.py - 플레이어 이벤트 (합성 시나리오는 인트로 없음)
+
+
+			def on_game_start():
+			    return None
+
+
+			def job_select(context_unit_id, job_type):
+			    return {"type": "message", "message": job_type}
+
+
+			def job_confirm(context_unit_id, job_type):
+			    return None
+
+			"""");
+
+		// NPC
+		for (int id = 1; id <= options.NpcCount; id++)
+		{
+			var module = NpcModule(id);
+			var homeRegion = random.Next(options.RegionCount);
+			var homeLocation = random.Next(locationCount);
+
+			var schedule = new List<object?>();
+			int entries = Math.Max(1, options.ScheduleEntries);
+			int slot = 1440 / entries;
+			for (int e = 0; e < entries; e++)
+			{
+				int start = (360 + e * slot) % 1440;
+				int end = e == entries - 1 ? 360 : (360 + (e + 1) * slot) % 1440;
+				bool last = e == entries - 1;
+
+				int region = last || random.NextDouble() < options.HomeRegionBias ? homeRegion : random.Next(options.RegionCount);
+				int location = last ? homeLocation : random.Next(locationCount);
+				var activity = last ? SleepActivity : Activities[random.Next(Activities.Length)];
+
+				schedule.Add(new Dictionary<string, object?>
+				{
+					["name"] = $"일과 {e}",
+					["regionId"] = region,
+					["locationId"] = location,
+					["start"] = start,
+					["end"] = end,
+					["activity"] = activity
+				});
+			}
+
+			var presence = new Dictionary<string, object?>();
+			foreach (var activity in Activities)
+				presence[$"activity:{activity}"] = $"{{name}}이(가) {activity} 중이다.";
+			presence[$"activity:{SleepActivity}"] = "{name}이(가) 깊이 잠들어 있다.";
+			presence["default"] = "{name}이(가) 주변에 있다.";
+
+			var data = new Dictionary<string, object?>
+			{
+				["id"] = id,
+				["name"] = $"주민 {id}",
+				["comment"] = module,
+				["type"] = id % 2 == 0 ? "female" : "male",
+				["regionId"] = homeRegion,
+				["locationId"] = homeLocation,
+				["tags"] = new Dictionary<string, object?>(),
+				["actions"] = new List<object?> { "script:npc_talk:대화" },
+				["appearance"] = new Dictionary<string, object?>
+				{
+					["default"] = "평범한 주민이다.",
+					["기쁨"] = "환하게 웃고 있다."
+				},
+				["mood"] = new List<object?>(),
+				["scheduleStack"] = new List<object?>
+				{
+					new Dictionary<string, object?>
+					{
+						["name"] = "일상",
+						["schedule"] = schedule,
+						["endConditionType"] = null,
+						["endConditionParam"] = null
+					}
+				}
+			};
+
+			context.Write($"characters/{module}/__init__.py",
+				$"# {module} 캐릭터 패키지\nfrom characters.{module} import data\nfrom characters.{module} import events\n");
+			context.Write($"characters/{module}/data.py",
+				$"# characters/{module}/data.py - 주민 {id} (자동 생성)\n\n" +
+				$"CHARACTER_ID = {id}\n\n" +
+				$"PRESENCE_TEXT = {Py(presence)}\n\n" +
+				$"CHARACTER_DATA = {Py(data)}\n");
+			context.Write($"characters/{module}/events.py",
+				$"# characters/{module}/events.py - 주민 {id} 이벤트 (자동 생성)\n\n" +
+				$"from characters.{module}.data import CHARACTER_ID\n" + NpcEvents);
+			context.Summary.Npcs++;
+		}
+
+		// characters/__init__.py
+		var sb = new StringBuilder();
+		sb.Append("# characters/__init__.py - 모든 캐릭터 모듈 집합 (자동 생성)\n\n");
+		sb.Append("import morld\n\n");
+		sb.Append("from characters.player import data as player_data\n");
+		sb.Append("from characters.player import events as player_events\n");
+		for (int id = 1; id <= options.NpcCount; id++)
+		{
+			var module = NpcModule(id);
+			sb.Append($"from characters.{module} import data as {module}_data\n");
+			sb.Append($"from characters.{module} import events as {module}_events\n");
+		}
+
+		sb.Append("\nALL_CHARACTERS = [\n    player_data.CHARACTER_DATA,\n");
+		for (int id = 1; id <= options.NpcCount; id++)
+			sb.Append($"    {NpcModule(id)}_data.CHARACTER_DATA,\n");
+		sb.Append("]\n\nCHARACTER_EVENTS = {\n    player_data.CHARACTER_ID: player_events,\n");
+		for (int id = 1; id <= options.NpcCount; id++)
+			sb.Append($"    {NpcModule(id)}_data.CHARACTER_ID: {NpcModule(id)}_events,\n");
+		sb.Append("}\n\nCHARACTER_PRESENCE = {\n");
+		for (int id = 1; id <= options.NpcCount; id++)
+			sb.Append($"    {NpcModule(id)}_data.CHARACTER_ID: {NpcModule(id)}_data.PRESENCE_TEXT,\n");
+		sb.Append("}\n");
+		sb.Append(CharactersFunctions);
+		context.Write("characters/__init__.py", sb.ToString());
+	}
+
+	// ===== 오브젝트 =====
+
+	private static void WriteObjects(GeneratorContext context, Random random, SyntheticScenarioOptions options)
+	{
+		int locationCount = Math.Max(1, options.LocationsPerRegion);
+		int nextId = options.NpcCount + 1;
+
+		var containers = new List<object?>();
+		for (int r = 0; r < options.RegionCount; r++)
+		{
+			for (int c = 0; c < options.ContainersPerRegion; c++)
+			{
+				var inventory = new List<object?>();
+				for (int i = 0; i < options.ItemsPerContainer && options.ItemCount > 0; i++)
+				{
+					inventory.Add(new List<object?> { random.Next(options.ItemCount), 1 + random.Next(3) });
+				}
+
+				containers.Add(new Dictionary<string, object?>
+				{
+					["id"] = nextId++,
+					["name"] = "나무 상자",
+					["comment"] = $"box_{r}_{c}",
+					["type"] = "object",
+					["regionId"] = r,
+					["locationId"] = random.Next(locationCount),
+					["actions"] = new List<object?> { "open", "putinobject" },
+					["inventory"] = inventory,
+					["scheduleStack"] = new List<object?>()
+				});
+			}
+		}
+
+		var furniture = new List<object?>();
+		for (int r = 0; r < options.RegionCount; r++)
+		{
+			furniture.Add(new Dictionary<string, object?>
+			{
+				["id"] = nextId++,
+				["name"] = "거울",
+				["comment"] = $"mirror_{r}_0",
+				["type"] = "object",
+				["regionId"] = r,
+				["locationId"] = 0,
+				["actions"] = new List<object?> { "script:mirror_look:보기" },
+				["scheduleStack"] = new List<object?>()
+			});
+		}
+
+		context.Summary.Objects = containers.Count + furniture.Count + options.RegionCount * locationCount;
+
+		context.Write("objects/containers.py",
+			"# objects/containers.py - 상자 (자동 생성, inventory = [아이템 ID, 개수] 목록)\n\n" +
+			$"CONTAINERS = {Py(containers)}\n");
+		context.Write("objects/furniture.py",
+			"# objects/furniture.py - 거울 (자동 생성)\n\n" +
+			$"FURNITURE = {Py(furniture)}\n" + FurnitureFunctions);
+		context.Write("objects/grounds.py",
+			"# objects/grounds.py - 바닥 오브젝트 자동 생성\n\n" +
+			"from world import REGIONS\n\n" +
+			$"GROUND_ID_START = {nextId}\n" + GroundsFunctions);
+		context.Write("objects/__init__.py", ObjectsInit);
+	}
+
+	// ===== 출력 =====
+
+	private sealed class GeneratorContext
+	{
+		public readonly string PythonDir;
+		public readonly Summary Summary;
+
+		public GeneratorContext(string pythonDir, Summary summary)
+		{
+			PythonDir = pythonDir;
+			Summary = summary;
+		}
+
+		public void Write(string relativePath, string content)
+		{
+			WriteText(this, Path.Combine(PythonDir, relativePath), content);
+		}
+	}
+
+	private static void WriteText(GeneratorContext context, string path, string content)
+	{
+		Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+		File.WriteAllText(path, content, new UTF8Encoding(false));
+		context.Summary.Files++;
+	}
+
+	/// <summary>
+	/// C# 값을 Python 리터럴로 변환 (dict/list는 scenario03 데이터와 비슷하게 들여쓰기)
+	/// </summary>
+	private static string Py(object? value)
+	{
+		var sb = new StringBuilder();
+		AppendPy(sb, value, 0);
+		return sb.ToString();
+	}
+
+	private static void AppendPy(StringBuilder sb, object? value, int indent)
+	{
+		switch (value)
+		{
+			case null:
+				sb.Append("None");
+				break;
+			case bool b:
+				sb.Append(b ? "True" : "False");
+				break;
+			case int or long:
+				sb.Append(Convert.ToString(value, CultureInfo.InvariantCulture));
+				break;
+			case string s:
+				AppendPyString(sb, s);
+				break;
+			case IDictionary<string, object?> dict:
+				if (dict.Count == 0)
+				{
+					sb.Append("{}");
+					break;
+				}
+				if (IsFlat(dict.Values))
+				{
+					// 값이 모두 스칼라면 한 줄로 (Edge, 스케줄 항목 등)
+					sb.Append('{');
+					bool first = true;
+					foreach (var (key, item) in dict)
+					{
+						if (!first) sb.Append(", ");
+						first = false;
+						AppendPyString(sb, key);
+						sb.Append(": ");
+						AppendPy(sb, item, indent);
+					}
+					sb.Append('}');
+					break;
+				}
+				sb.Append("{\n");
+				int n = 0;
+				foreach (var (key, item) in dict)
+				{
+					sb.Append(' ', (indent + 1) * 4);
+					AppendPyString(sb, key);
+					sb.Append(": ");
+					AppendPy(sb, item, indent + 1);
+					sb.Append(++n < dict.Count ? ",\n" : "\n");
+				}
+				sb.Append(' ', indent * 4).Append('}');
+				break;
+			case IList list:
+				if (list.Count == 0)
+				{
+					sb.Append("[]");
+					break;
+				}
+				if (IsFlat(list))
+				{
+					sb.Append('[');
+					for (int i = 0; i < list.Count; i++)
+					{
+						if (i > 0) sb.Append(", ");
+						AppendPy(sb, list[i], indent);
+					}
+					sb.Append(']');
+					break;
+				}
+				sb.Append("[\n");
+				for (int i = 0; i < list.Count; i++)
+				{
+					sb.Append(' ', (indent + 1) * 4);
+					AppendPy(sb, list[i], indent + 1);
+					sb.Append(i < list.Count - 1 ? ",\n" : "\n");
+				}
+				sb.Append(' ', indent * 4).Append(']');
+				break;
+			default:
+				throw new ArgumentException($"Unsupported value type: {value.GetType().Name}");
+		}
+	}
+
+	private static bool IsFlat(IEnumerable values)
+	{
+		foreach (var value in values)
+		{
+			// [아이템 ID, 개수] 같은 짧은 스칼라 목록은 한 줄로 취급
+			if (value is IDictionary<string, object?> { Count: > 0 })
+				return false;
+			if (value is IList { Count: > 0 } list && (list.Count > 2 || !IsScalarList(list)))
+				return false;
+		}
+		return true;
+	}
+
+	private static bool IsScalarList(IList list)
+	{
+		foreach (var value in list)
+		{
+			if (value is IDictionary<string, object?> or IList)
+				return false;
+		}
+		return true;
+	}
+
+	private static void AppendPyString(StringBuilder sb, string s)
+	{
+		sb.Append('"');
+		foreach (var ch in s)
+		{
+			switch (ch)
+			{
+				case '\\': sb.Append("\\\\"); break;
+				case '"': sb.Append("\\\""); break;
+				case '\n': sb.Append("\\n"); break;
+				default: sb.Append(ch); break;
+			}
+		}
+		sb.Append('"');
+	}
+
+	// ===== 고정 Python 모듈 (scenario03과 같은 진입점) =====
+
+	private const string PackageInit = """"
+		# 합성 시나리오 Python 패키지 (SyntheticScenarioGenerator로 생성)
+		# morld 모듈을 사용하여 직접 게임 시스템에 데이터 등록
+
+		from . import world
+		from . import items
+		from . import events
+		from .characters import initialize_characters, get_character_event_handler, get_all_presence_texts
+		from .objects import initialize_objects
+
+
+		def initialize_scenario():
+		    """시나리오 데이터 초기화 - C#에서 호출"""
+		    world.initialize_world()
+		    world.initialize_time()
+		    items.initialize_items()
+		    initialize_characters()
+		    initialize_objects()
+
+		"""";
+
+	private const string EventsModule = """"
+		# events.py - 메인 이벤트 핸들러 (자동 생성)
+		# C#의 EventSystem에서 호출하는 진입점
+
+		import morld
+		from characters import get_character_event_handler
+		from characters.player import events as player_events
+		from objects.furniture import mirror_look
+
+		_triggered_events = set()
+
+
+		def on_event_list(ev_list):
+		    """이벤트 리스트 처리 (C#에서 호출) - 첫 번째 모놀로그 결과 반환"""
+		    player_id = morld.get_player_id()
+
+		    for event in ev_list:
+		        event_type = event[0]
+
+		        if event_type == "game_start":
+		            if "game_start" not in _triggered_events:
+		                _triggered_events.add("game_start")
+		                result = player_events.on_game_start()
+		                if result:
+		                    return result
+
+		        elif event_type == "on_meet":
+		            unit_ids = event[1:]
+		            if player_id in unit_ids:
+		                for other_id in unit_ids:
+		                    if other_id == player_id:
+		                        continue
+		                    handler = get_character_event_handler(other_id)
+		                    if handler and hasattr(handler, "on_meet_player"):
+		                        result = handler.on_meet_player(player_id)
+		                        if result:
+		                            return result
+
+		    return None
+
+
+		def npc_talk(context_unit_id):
+		    """NPC 대화 - context_unit_id의 캐릭터 events.npc_talk로 위임"""
+		    unit_info = morld.get_unit_info(context_unit_id)
+		    if unit_info is None:
+		        return None
+
+		    handler = get_character_event_handler(unit_info.get("id"))
+		    if handler and hasattr(handler, "npc_talk"):
+		        return handler.npc_talk(context_unit_id)
+		    return None
+
+
+		def job_select(context_unit_id, job_type):
+		    return player_events.job_select(context_unit_id, job_type)
+
+
+		def job_confirm(context_unit_id, job_type):
+		    return player_events.job_confirm(context_unit_id, job_type)
+
+		"""";
+
+	private const string NpcEvents = """"
+
+		import morld
+
+		_flags = {}
+
+
+		def on_meet_player(player_id):
+		    """플레이어와 처음 만났을 때 (수면 중이면 무시)"""
+		    if _flags.get("first_meet"):
+		        return None
+
+		    unit_info = morld.get_unit_info(CHARACTER_ID)
+		    if unit_info and unit_info.get("activity") == "수면":
+		        return None
+
+		    _flags["first_meet"] = True
+		    name = unit_info.get("name", "???") if unit_info else "???"
+		    return {
+		        "type": "monologue",
+		        "pages": [f"[{name}]", "처음 보는 얼굴이네. 반가워."],
+		        "time_consumed": 1,
+		        "button_type": "ok"
+		    }
+
+
+		def npc_talk(context_unit_id):
+		    """대화 스크립트 함수 - script:npc_talk 로 호출됨"""
+		    unit_info = morld.get_unit_info(context_unit_id)
+		    if unit_info is None or unit_info.get("id") != CHARACTER_ID:
+		        return None
+
+		    name = unit_info.get("name", "???")
+		    activity = unit_info.get("activity") or "휴식"
+		    return {
+		        "type": "monologue",
+		        "pages": [f"[{name}]", f"지금은 {activity} 중이야."],
+		        "time_consumed": 1,
+		        "button_type": "ok"
+		    }
+
+		"""";
+
+	private const string CharactersFunctions = """"
+
+
+		def initialize_characters():
+		    """morld API를 사용하여 모든 캐릭터 데이터 등록"""
+		    for char_data in ALL_CHARACTERS:
+		        _register_unit(char_data)
+		    print(f"[characters] {len(ALL_CHARACTERS)} characters initialized via morld API")
+
+
+		def _register_unit(data):
+		    """단일 유닛 데이터를 morld API로 등록"""
+		    unit_id = data["id"]
+		    morld.add_unit(
+		        unit_id, data["name"],
+		        data.get("regionId", 0), data.get("locationId", 0),
+		        data.get("type", "male"), data.get("actions"),
+		        data.get("appearance"), data.get("mood")
+		    )
+
+		    tags = data.get("tags")
+		    if tags:
+		        morld.set_unit_tags(unit_id, tags)
+
+		    for layer in data.get("scheduleStack", []):
+		        morld.push_schedule(
+		            unit_id,
+		            layer.get("name", ""),
+		            layer.get("endConditionType"),
+		            layer.get("endConditionParam"),
+		            layer.get("schedule")
+		        )
+
+
+		def get_character_event_handler(unit_id):
+		    """특정 캐릭터의 이벤트 핸들러 모듈 반환"""
+		    return CHARACTER_EVENTS.get(unit_id)
+
+
+		def get_all_character_data():
+		    return ALL_CHARACTERS
+
+
+		def get_presence_text(unit_id, region_id, location_id):
+		    """캐릭터 presence text (activity > default)"""
+		    presence_dict = CHARACTER_PRESENCE.get(unit_id)
+		    if not presence_dict:
+		        return None
+
+		    unit_info = morld.get_unit_info(unit_id)
+		    if not unit_info:
+		        return None
+
+		    name = unit_info.get("name", "???")
+		    activity = unit_info.get("activity")
+		    if activity:
+		        key = f"activity:{activity}"
+		        if key in presence_dict:
+		            return presence_dict[key].format(name=name)
+
+		    if "default" in presence_dict:
+		        return presence_dict["default"].format(name=name)
+		    return None
+
+
+		def get_all_presence_texts(unit_ids, region_id, location_id):
+		    """여러 캐릭터의 presence text를 한 번에 반환 (C#에서 호출)"""
+		    result = []
+		    for unit_id in unit_ids:
+		        text = get_presence_text(unit_id, region_id, location_id)
+		        if text:
+		            result.append(text)
+		    return result
+
+		"""";
+
+	private const string FurnitureFunctions = """"
+
+
+		def mirror_look(context_unit_id):
+		    """거울 보기"""
+		    return {
+		        "type": "monologue",
+		        "pages": ["거울 속에 내 얼굴이 비친다."],
+		        "time_consumed": 1,
+		        "button_type": "ok"
+		    }
+
+		"""";
+
+	private const string GroundsFunctions = """"
+
+
+		def get_ground_objects():
+		    """world.py의 REGIONS를 기반으로 Location마다 바닥 오브젝트 생성"""
+		    grounds = []
+		    ground_id = GROUND_ID_START
+
+		    for region in REGIONS:
+		        region_id = region["id"]
+		        for location in region["locations"]:
+		            location_id = location["id"]
+		            grounds.append({
+		                "id": ground_id,
+		                "name": "바닥",
+		                "comment": f"ground_{region_id}_{location_id}",
+		                "type": "object",
+		                "regionId": region_id,
+		                "locationId": location_id,
+		                "actions": ["putinobject"],
+		                "scheduleStack": []
+		            })
+		            ground_id += 1
+
+		    return grounds
+
+		"""";
+
+	private const string ObjectsInit = """"
+		# objects/__init__.py - 오브젝트 모듈 집합 (자동 생성)
+
+		import morld
+
+		from objects.containers import CONTAINERS
+		from objects.furniture import FURNITURE
+		from objects.grounds import get_ground_objects
+
+		ALL_OBJECTS = CONTAINERS + FURNITURE
+
+
+		def initialize_objects():
+		    """morld API를 사용하여 모든 오브젝트 데이터 등록 (상자 내용물 포함)"""
+		    all_obj = ALL_OBJECTS + get_ground_objects()
+		    for obj_data in all_obj:
+		        morld.add_unit(
+		            obj_data["id"], obj_data["name"],
+		            obj_data.get("regionId", 0), obj_data.get("locationId", 0),
+		            obj_data.get("type", "object"), obj_data.get("actions"),
+		            obj_data.get("appearance"), None
+		        )
+		        for item_id, count in obj_data.get("inventory", []):
+		            morld.give_item(obj_data["id"], item_id, count)
+		    print(f"[objects] {len(all_obj)} objects initialized via morld API")
+
+
+		def get_all_objects():
+		    return ALL_OBJECTS + get_ground_objects()
+
+
+		def get_static_objects():
+		    return ALL_OBJECTS
+
+		"""";
+}
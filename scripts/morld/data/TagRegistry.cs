@@ -0,0 +1,74 @@
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
+
+namespace Morld;
+
+/// <summary>
+/// 전역 태그 이름 레지스트리
+/// - 태그 이름("방어", "공격", 플래그 이름 등)을 0부터 시작하는 정수 ID로 인턴
+/// - TagVector/TagMap은 이 ID를 인덱스로 사용
+/// - ID는 프로세스 동안 유지 (세이브 파일에는 항상 이름으로 기록)
+/// - 파서 워커 스레드에서도 호출 가능
+/// </summary>
+public static class TagRegistry
+{
+	private static readonly object _lock = new();
+	private static readonly ConcurrentDictionary<string, int> _ids = new();
+	private static string[] _names = new string[32];
+	private static int _count;
+
+	/// <summary>
+	/// 등록된 태그 수 (= 다음에 발급될 ID)
+	/// </summary>
+	public static int Count => Volatile.Read(ref _count);
+
+	/// <summary>
+	/// 태그 ID 가져오기 (없으면 새로 등록)
+	/// </summary>
+	public static int Intern(string name)
+	{
+		if (name == null) throw new ArgumentNullException(nameof(name));
+
+		if (_ids.TryGetValue(name, out var id))
+			return id;
+
+		lock (_lock)
+		{
+			if (_ids.TryGetValue(name, out id))
+				return id;
+
+			id = _count;
+			if (id == _names.Length)
+			{
+				var grown = new string[_names.Length * 2];
+				Array.Copy(_names, grown, _names.Length);
+				_names = grown;
+			}
+			_names[id] = name;
+			Volatile.Write(ref _count, id + 1);
+
+			// 이름 배열을 채운 뒤에 공개 (다른 스레드가 ID를 얻으면 이름도 보이도록)
+			_ids[name] = id;
+			return id;
+		}
+	}
+
+	/// <summary>
+	/// 등록된 태그 ID 조회 (등록하지 않음)
+	/// </summary>
+	public static bool TryGetId(string name, out int id)
+	{
+		return _ids.TryGetValue(name, out id);
+	}
+
+	/// <summary>
+	/// 태그 이름 조회
+	/// </summary>
+	public static string GetName(int id)
+	{
+		if ((uint)id >= (uint)Count)
+			throw new ArgumentOutOfRangeException(nameof(id), $"Unknown tag id {id}");
+		return Volatile.Read(ref _names)[id];
+	}
+}
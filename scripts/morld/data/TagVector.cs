@@ -0,0 +1,367 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+
+namespace Morld;
+
+/// <summary>
+/// 밀집 태그 벡터 (TagRegistry ID를 인덱스로 하는 int 배열)
+/// - 유닛 기본 태그, 아이템 효과가 합산된 최종 태그에 사용
+/// - 합산은 벡터 덧셈, 조건 확인은 TagMap과의 원소별 비교
+/// - 값이 0인 태그는 없는 것과 동일 (읽기 전용 딕셔너리로 볼 때 0이 아닌 항목만 노출)
+/// </summary>
+public sealed class TagVector : IReadOnlyDictionary<string, int>
+{
+	private int[] _values = Array.Empty<int>();
+
+	/// <summary>
+	/// 벡터 길이 (할당된 태그 ID 범위, 0이 아닌 태그 수와 다름)
+	/// </summary>
+	public int Length => _values.Length;
+
+	public int Get(int tagId)
+	{
+		return (uint)tagId < (uint)_values.Length ? _values[tagId] : 0;
+	}
+
+	public void Set(int tagId, int value)
+	{
+		if (tagId >= _values.Length)
+		{
+			if (value == 0) return;
+			Grow(tagId + 1);
+		}
+		_values[tagId] = value;
+	}
+
+	public void Add(int tagId, int delta)
+	{
+		if (delta == 0) return;
+		if (tagId >= _values.Length)
+			Grow(tagId + 1);
+		_values[tagId] += delta;
+	}
+
+	/// <summary>
+	/// 희소 태그 더하기 (아이템 PassiveTags/EquipTags 합산)
+	/// </summary>
+	public void Add(TagMap tags)
+	{
+		var ids = tags.Ids;
+		var values = tags.Values;
+		for (int i = 0; i < ids.Length; i++)
+		{
+			Add(ids[i], values[i]);
+		}
+	}
+
+	/// <summary>
+	/// 밀집 벡터 더하기
+	/// </summary>
+	public void Add(TagVector other)
+	{
+		if (other._values.Length > _values.Length)
+			Grow(other._values.Length);
+		for (int i = 0; i < other._values.Length; i++)
+		{
+			_values[i] += other._values[i];
+		}
+	}
+
+	/// <summary>
+	/// 다른 벡터 내용으로 덮어쓰기 (배열은 재사용)
+	/// </summary>
+	public void CopyFrom(TagVector other)
+	{
+		if (other._values.Length > _values.Length)
+			Grow(other._values.Length);
+		Array.Copy(other._values, _values, other._values.Length);
+		Array.Clear(_values, other._values.Length, _values.Length - other._values.Length);
+	}
+
+	public TagVector Clone()
+	{
+		var clone = new TagVector();
+		clone.CopyFrom(this);
+		return clone;
+	}
+
+	public void Clear()
+	{
+		Array.Clear(_values);
+	}
+
+	/// <summary>
+	/// 조건을 모두 충족하는지 확인 (각 조건 태그 값 이상)
+	/// </summary>
+	public bool Satisfies(TagMap requirements)
+	{
+		return FindUnsatisfied(requirements) < 0;
+	}
+
+	/// <summary>
+	/// 충족하지 못한 첫 조건의 태그 ID (모두 충족하면 -1)
+	/// </summary>
+	public int FindUnsatisfied(TagMap requirements)
+	{
+		var ids = requirements.Ids;
+		var values = requirements.Values;
+		for (int i = 0; i < ids.Length; i++)
+		{
+			if (Get(ids[i]) < values[i])
+				return ids[i];
+		}
+		return -1;
+	}
+
+	/// <summary>
+	/// 태그 값이 모두 같은지 확인 (길이가 달라도 넘치는 부분이 0이면 같음)
+	/// </summary>
+	public bool ValueEquals(TagVector other)
+	{
+		var length = Math.Max(_values.Length, other._values.Length);
+		for (int i = 0; i < length; i++)
+		{
+			if (Get(i) != other.Get(i)) return false;
+		}
+		return true;
+	}
+
+	/// <summary>
+	/// 태그 구성 지문 (값이 0인 태그는 무시, 캐시 키용)
+	/// </summary>
+	public int GetFingerprint()
+	{
+		int fingerprint = 0;
+		for (int i = 0; i < _values.Length; i++)
+		{
+			if (_values[i] == 0) continue;
+			fingerprint ^= HashCode.Combine(i, _values[i]);
+		}
+		return fingerprint;
+	}
+
+	private void Grow(int minLength)
+	{
+		var length = Math.Max(minLength, Math.Max(TagRegistry.Count, _values.Length * 2));
+		Array.Resize(ref _values, length);
+	}
+
+	#region IReadOnlyDictionary (이름 기반 조회, 0이 아닌 태그만)
+
+	public int this[string key] =>
+		TryGetValue(key, out var value) ? value : throw new KeyNotFoundException(key);
+
+	public IEnumerable<string> Keys
+	{
+		get
+		{
+			for (int i = 0; i < _values.Length; i++)
+			{
+				if (_values[i] != 0) yield return TagRegistry.GetName(i);
+			}
+		}
+	}
+
+	public IEnumerable<int> Values
+	{
+		get
+		{
+			for (int i = 0; i < _values.Length; i++)
+			{
+				if (_values[i] != 0) yield return _values[i];
+			}
+		}
+	}
+
+	public int Count
+	{
+		get
+		{
+			int count = 0;
+			for (int i = 0; i < _values.Length; i++)
+			{
+				if (_values[i] != 0) count++;
+			}
+			return count;
+		}
+	}
+
+	public bool ContainsKey(string key) => TryGetValue(key, out _);
+
+	public bool TryGetValue(string key, out int value)
+	{
+		value = TagRegistry.TryGetId(key, out var id) ? Get(id) : 0;
+		return value != 0;
+	}
+
+	public IEnumerator<KeyValuePair<string, int>> GetEnumerator()
+	{
+		for (int i = 0; i < _values.Length; i++)
+		{
+			if (_values[i] != 0)
+				yield return new KeyValuePair<string, int>(TagRegistry.GetName(i), _values[i]);
+		}
+	}
+
+	IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+	#endregion
+}
+
+/// <summary>
+/// 희소 태그 맵 (태그 ID, 값 쌍 배열)
+/// - 아이템 PassiveTags/EquipTags, Edge 이동 조건처럼 태그 몇 개만 가진 곳에 사용
+/// - 문자열 키 딕셔너리 인터페이스를 그대로 제공 (JSON 입출력/스크립트 호환), 내부는 ID 배열
+/// </summary>
+public sealed class TagMap : IDictionary<string, int>, IReadOnlyDictionary<string, int>
+{
+	private int[] _ids = Array.Empty<int>();
+	private int[] _values = Array.Empty<int>();
+	private int _count;
+
+	/// <summary>
+	/// 태그 ID 목록 (Values와 같은 순서)
+	/// </summary>
+	public ReadOnlySpan<int> Ids => _ids.AsSpan(0, _count);
+
+	/// <summary>
+	/// 태그 값 목록 (Ids와 같은 순서)
+	/// </summary>
+	public ReadOnlySpan<int> Values => _values.AsSpan(0, _count);
+
+	public int Count => _count;
+
+	public bool IsReadOnly => false;
+
+	public int Get(int tagId)
+	{
+		var index = IndexOf(tagId);
+		return index >= 0 ? _values[index] : 0;
+	}
+
+	public void Set(int tagId, int value)
+	{
+		var index = IndexOf(tagId);
+		if (index >= 0)
+		{
+			_values[index] = value;
+			return;
+		}
+
+		if (_count == _ids.Length)
+		{
+			var capacity = Math.Max(4, _count * 2);
+			Array.Resize(ref _ids, capacity);
+			Array.Resize(ref _values, capacity);
+		}
+		_ids[_count] = tagId;
+		_values[_count] = value;
+		_count++;
+	}
+
+	public bool RemoveId(int tagId)
+	{
+		var index = IndexOf(tagId);
+		if (index < 0)
+			return false;
+
+		// 순서 유지 (직렬화 결과가 입력 순서와 같도록)
+		_count--;
+		Array.Copy(_ids, index + 1, _ids, index, _count - index);
+		Array.Copy(_values, index + 1, _values, index, _count - index);
+		return true;
+	}
+
+	private int IndexOf(int tagId)
+	{
+		for (int i = 0; i < _count; i++)
+		{
+			if (_ids[i] == tagId) return i;
+		}
+		return -1;
+	}
+
+	#region IDictionary (이름 기반 접근)
+
+	public int this[string key]
+	{
+		get => TryGetValue(key, out var value) ? value : throw new KeyNotFoundException(key);
+		set => Set(TagRegistry.Intern(key), value);
+	}
+
+	public ICollection<string> Keys
+	{
+		get
+		{
+			var keys = new List<string>(_count);
+			for (int i = 0; i < _count; i++)
+				keys.Add(TagRegistry.GetName(_ids[i]));
+			return keys;
+		}
+	}
+
+	ICollection<int> IDictionary<string, int>.Values => Values.ToArray();
+
+	IEnumerable<string> IReadOnlyDictionary<string, int>.Keys => Keys;
+
+	IEnumerable<int> IReadOnlyDictionary<string, int>.Values => Values.ToArray();
+
+	public void Add(string key, int value)
+	{
+		var id = TagRegistry.Intern(key);
+		if (IndexOf(id) >= 0)
+			throw new ArgumentException($"Tag '{key}' already exists", nameof(key));
+		Set(id, value);
+	}
+
+	public bool ContainsKey(string key) =>
+		TagRegistry.TryGetId(key, out var id) && IndexOf(id) >= 0;
+
+	public bool Remove(string key) =>
+		TagRegistry.TryGetId(key, out var id) && RemoveId(id);
+
+	public bool TryGetValue(string key, out int value)
+	{
+		if (TagRegistry.TryGetId(key, out var id))
+		{
+			var index = IndexOf(id);
+			if (index >= 0)
+			{
+				value = _values[index];
+				return true;
+			}
+		}
+		value = 0;
+		return false;
+	}
+
+	public void Clear()
+	{
+		_count = 0;
+	}
+
+	void ICollection<KeyValuePair<string, int>>.Add(KeyValuePair<string, int> item) => Add(item.Key, item.Value);
+
+	bool ICollection<KeyValuePair<string, int>>.Contains(KeyValuePair<string, int> item) =>
+		TryGetValue(item.Key, out var value) && value == item.Value;
+
+	void ICollection<KeyValuePair<string, int>>.CopyTo(KeyValuePair<string, int>[] array, int arrayIndex)
+	{
+		for (int i = 0; i < _count; i++)
+			array[arrayIndex + i] = new KeyValuePair<string, int>(TagRegistry.GetName(_ids[i]), _values[i]);
+	}
+
+	bool ICollection<KeyValuePair<string, int>>.Remove(KeyValuePair<string, int> item) =>
+		((ICollection<KeyValuePair<string, int>>)this).Contains(item) && Remove(item.Key);
+
+	public IEnumerator<KeyValuePair<string, int>> GetEnumerator()
+	{
+		for (int i = 0; i < _count; i++)
+			yield return new KeyValuePair<string, int>(TagRegistry.GetName(_ids[i]), _values[i]);
+	}
+
+	IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+	#endregion
+}
@@ -0,0 +1,246 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text;
+using System.Text.Json;
+
+namespace Morld;
+
+/// <summary>
+/// Chrome/Perfetto trace 기록기 (시작 구간 타임라인용)
+/// - Start()로 활성화한 동안 Span()이 중첩 구간을 "X"(complete) 이벤트로 기록
+/// - 비활성 상태에서 Span()은 아무것도 하지 않는 빈 구조체를 반환
+/// - 같은 이름이 연속으로 들어오는 짧은 호출(morld.add_* 등)은 RecordBatch로 한 구간에 묶음
+/// - 결과는 chrome://tracing, ui.perfetto.dev 에서 열 수 있는 JSON
+/// </summary>
+public sealed class TraceRecorder
+{
+	private readonly struct TraceEvent
+	{
+		public readonly string Name;
+		public readonly string Category;
+		public readonly long Start;
+		public readonly long Duration;
+		public readonly int ThreadId;
+		public readonly int Count;
+
+		public TraceEvent(string name, string category, long start, long duration, int threadId, int count)
+		{
+			Name = name;
+			Category = category;
+			Start = start;
+			Duration = duration;
+			ThreadId = threadId;
+			Count = count;
+		}
+	}
+
+	/// <summary>
+	/// 현재 기록 중인 기록기 (없으면 null)
+	/// </summary>
+	public static TraceRecorder? Active { get; private set; }
+
+	private readonly long _origin = Stopwatch.GetTimestamp();
+	private readonly int _mainThreadId = Environment.CurrentManagedThreadId;
+	private readonly List<TraceEvent> _events = new();
+	private readonly object _lock = new();
+
+	// 진행 중인 묶음 (호출 스레드 기준 하나)
+	private string? _batchName;
+	private long _batchStart;
+	private long _batchEnd;
+	private int _batchCount;
+	private int _batchThreadId;
+
+	/// <summary>
+	/// 기록된 이벤트 수
+	/// </summary>
+	public int EventCount
+	{
+		get { lock (_lock) return _events.Count; }
+	}
+
+	/// <summary>
+	/// 새 기록기를 만들어 활성화 (이미 기록 중이면 기존 기록기 반환)
+	/// </summary>
+	public static TraceRecorder Start()
+	{
+		return Active ??= new TraceRecorder();
+	}
+
+	/// <summary>
+	/// 기록 종료 (남은 묶음을 정리하고 비활성화)
+	/// </summary>
+	public void Stop()
+	{
+		FlushBatch();
+		if (Active == this)
+			Active = null;
+	}
+
+	/// <summary>
+	/// 중첩 구간 시작 - using으로 감싸서 사용
+	/// </summary>
+	public static TraceSpan Span(string name, string category = "startup")
+	{
+		var recorder = Active;
+		if (recorder == null)
+			return default;
+
+		recorder.FlushBatch();
+		return new TraceSpan(recorder, name, category, Stopwatch.GetTimestamp());
+	}
+
+	/// <summary>
+	/// 짧은 호출 하나 기록 - 직전 호출과 이름이 같으면 한 구간으로 합침
+	/// </summary>
+	/// <param name="startTicks">호출 시작 시각 (Stopwatch.GetTimestamp)</param>
+	public static void RecordBatch(string name, long startTicks)
+	{
+		var recorder = Active;
+		if (recorder == null)
+			return;
+
+		var end = Stopwatch.GetTimestamp();
+		var threadId = Environment.CurrentManagedThreadId;
+		lock (recorder._lock)
+		{
+			if (recorder._batchName != name || recorder._batchThreadId != threadId)
+			{
+				recorder.FlushBatchLocked();
+				recorder._batchName = name;
+				recorder._batchStart = startTicks;
+				recorder._batchThreadId = threadId;
+			}
+			recorder._batchEnd = end;
+			recorder._batchCount++;
+		}
+	}
+
+	internal void EndSpan(string name, string category, long startTicks)
+	{
+		var end = Stopwatch.GetTimestamp();
+		lock (_lock)
+		{
+			FlushBatchLocked();
+			_events.Add(new TraceEvent(name, category, startTicks, end - startTicks, Environment.CurrentManagedThreadId, 0));
+		}
+	}
+
+	private void FlushBatch()
+	{
+		lock (_lock)
+			FlushBatchLocked();
+	}
+
+	private void FlushBatchLocked()
+	{
+		if (_batchName == null)
+			return;
+
+		_events.Add(new TraceEvent(_batchName, "batch", _batchStart, _batchEnd - _batchStart, _batchThreadId, _batchCount));
+		_batchName = null;
+		_batchCount = 0;
+	}
+
+	// ===== 출력 =====
+
+	/// <summary>
+	/// Chrome trace JSON ({"traceEvents": [...]}, 시각 단위 µs)
+	/// </summary>
+	public string ToJson()
+	{
+		List<TraceEvent> events;
+		lock (_lock)
+		{
+			FlushBatchLocked();
+			events = new List<TraceEvent>(_events);
+		}
+		// 같은 시각이면 긴 구간(부모)이 먼저 오도록 정렬
+		events.Sort((a, b) => a.Start != b.Start ? a.Start.CompareTo(b.Start) : b.Duration.CompareTo(a.Duration));
+
+		var threads = new SortedSet<int>();
+		foreach (var evt in events)
+			threads.Add(evt.ThreadId);
+
+		using var stream = new MemoryStream();
+		using (var writer = new Utf8JsonWriter(stream, new JsonWriterOptions { Indented = true }))
+		{
+			writer.WriteStartObject();
+			writer.WriteString("displayTimeUnit", "ms");
+			writer.WriteStartArray("traceEvents");
+
+			foreach (var threadId in threads)
+			{
+				writer.WriteStartObject();
+				writer.WriteString("name", "thread_name");
+				writer.WriteString("ph", "M");
+				writer.WriteNumber("pid", 1);
+				writer.WriteNumber("tid", threadId);
+				writer.WriteStartObject("args");
+				writer.WriteString("name", threadId == _mainThreadId ? "main" : $"worker {threadId}");
+				writer.WriteEndObject();
+				writer.WriteEndObject();
+			}
+
+			foreach (var evt in events)
+			{
+				writer.WriteStartObject();
+				writer.WriteString("name", evt.Name);
+				writer.WriteString("cat", evt.Category);
+				writer.WriteString("ph", "X");
+				writer.WriteNumber("ts", TicksToUs(evt.Start - _origin));
+				writer.WriteNumber("dur", TicksToUs(evt.Duration));
+				writer.WriteNumber("pid", 1);
+				writer.WriteNumber("tid", evt.ThreadId);
+				if (evt.Count > 0)
+				{
+					writer.WriteStartObject("args");
+					writer.WriteNumber("calls", evt.Count);
+					writer.WriteEndObject();
+				}
+				writer.WriteEndObject();
+			}
+
+			writer.WriteEndArray();
+			writer.WriteEndObject();
+		}
+		return Encoding.UTF8.GetString(stream.ToArray());
+	}
+
+	/// <summary>
+	/// trace 파일 저장 (user://, res:// 또는 일반 경로)
+	/// </summary>
+	public void Save(string path)
+	{
+		var globalPath = GamePath.Globalize(path);
+		File.WriteAllText(globalPath, ToJson());
+	}
+
+	private static double TicksToUs(long ticks) => Math.Round(ticks * 1_000_000.0 / Stopwatch.Frequency, 3);
+}
+
+/// <summary>
+/// TraceRecorder.Span()이 반환하는 구간 (Dispose 시 기록, 비활성 상태면 빈 값)
+/// </summary>
+public readonly struct TraceSpan : IDisposable
+{
+	private readonly TraceRecorder? _recorder;
+	private readonly string _name;
+	private readonly string _category;
+	private readonly long _start;
+
+	internal TraceSpan(TraceRecorder recorder, string name, string category, long start)
+	{
+		_recorder = recorder;
+		_name = name;
+		_category = category;
+		_start = start;
+	}
+
+	public void Dispose()
+	{
+		_recorder?.EndSpan(_name, _category, _start);
+	}
+}
@@ -0,0 +1,241 @@
+namespace Morld;
+
+using System;
+using System.Collections;
+using System.Collections.Generic;
+
+/// <summary>
+/// 인벤토리 한 칸 묶음 (itemId → count)
+/// 아이템 종류가 적을 때는 itemId로 정렬된 배열에 보관하고,
+/// CompactLimit를 넘으면 Dictionary로 전환
+/// </summary>
+public class ItemStacks : IReadOnlyDictionary<int, int>
+{
+	private const int CompactLimit = 16;
+
+	private int[] _itemIds = Array.Empty<int>();
+	private int[] _counts = Array.Empty<int>();
+	private int _size = 0;
+	private Dictionary<int, int>? _map;  // null이면 정렬 배열 사용 중
+
+	/// <summary>
+	/// 빈 인벤토리 (조회 실패 시 반환용, 수정하지 말 것)
+	/// </summary>
+	public static readonly ItemStacks Empty = new();
+
+	public ItemStacks()
+	{
+	}
+
+	public ItemStacks(IEnumerable<KeyValuePair<int, int>> source)
+	{
+		foreach (var (itemId, count) in source)
+		{
+			if (count > 0)
+				Add(itemId, count);
+		}
+	}
+
+	/// <summary>
+	/// 아이템 종류 수
+	/// </summary>
+	public int Count => _map?.Count ?? _size;
+
+	/// <summary>
+	/// 보유 개수 (없으면 0)
+	/// </summary>
+	public int Get(int itemId)
+	{
+		if (_map != null)
+			return _map.TryGetValue(itemId, out var count) ? count : 0;
+
+		int index = Array.BinarySearch(_itemIds, 0, _size, itemId);
+		return index >= 0 ? _counts[index] : 0;
+	}
+
+	/// <summary>
+	/// 아이템 추가 (개수 누적)
+	/// </summary>
+	internal void Add(int itemId, int count)
+	{
+		if (_map != null)
+		{
+			_map.TryGetValue(itemId, out var current);
+			_map[itemId] = current + count;
+			return;
+		}
+
+		int index = Array.BinarySearch(_itemIds, 0, _size, itemId);
+		if (index >= 0)
+		{
+			_counts[index] += count;
+			return;
+		}
+
+		// 정렬 배열 한도 초과 → Dictionary로 전환
+		if (_size >= CompactLimit)
+		{
+			_map = new Dictionary<int, int>(_size * 2);
+			for (int i = 0; i < _size; i++)
+				_map[_itemIds[i]] = _counts[i];
+			_map[itemId] = count;
+			_itemIds = Array.Empty<int>();
+			_counts = Array.Empty<int>();
+			_size = 0;
+			return;
+		}
+
+		index = ~index;
+		if (_size == _itemIds.Length)
+		{
+			int capacity = _size == 0 ? 4 : _size * 2;
+			Array.Resize(ref _itemIds, capacity);
+			Array.Resize(ref _counts, capacity);
+		}
+		Array.Copy(_itemIds, index, _itemIds, index + 1, _size - index);
+		Array.Copy(_counts, index, _counts, index + 1, _size - index);
+		_itemIds[index] = itemId;
+		_counts[index] = count;
+		_size++;
+	}
+
+	/// <summary>
+	/// 아이템 제거 (보유량이 부족하면 변경 없이 false, 0개가 되면 항목 삭제)
+	/// </summary>
+	internal bool Remove(int itemId, int count)
+	{
+		if (_map != null)
+		{
+			if (!_map.TryGetValue(itemId, out var available) || available < count)
+				return false;
+			if (available == count)
+				_map.Remove(itemId);
+			else
+				_map[itemId] = available - count;
+			return true;
+		}
+
+		int index = Array.BinarySearch(_itemIds, 0, _size, itemId);
+		if (index < 0 || _counts[index] < count)
+			return false;
+
+		_counts[index] -= count;
+		if (_counts[index] <= 0)
+		{
+			_size--;
+			Array.Copy(_itemIds, index + 1, _itemIds, index, _size - index);
+			Array.Copy(_counts, index + 1, _counts, index, _size - index);
+		}
+		return true;
+	}
+
+	/// <summary>
+	/// 전체 비우기
+	/// </summary>
+	internal void Clear()
+	{
+		_map = null;
+		_itemIds = Array.Empty<int>();
+		_counts = Array.Empty<int>();
+		_size = 0;
+	}
+
+	/// <summary>
+	/// 복사본 생성 (체크포인트용)
+	/// </summary>
+	internal ItemStacks Clone()
+	{
+		var clone = new ItemStacks
+		{
+			_itemIds = (int[])_itemIds.Clone(),
+			_counts = (int[])_counts.Clone(),
+			_size = _size,
+			_map = _map != null ? new Dictionary<int, int>(_map) : null
+		};
+		return clone;
+	}
+
+	// ===== IReadOnlyDictionary =====
+
+	public int this[int key]
+	{
+		get
+		{
+			if (!TryGetValue(key, out var count))
+				throw new KeyNotFoundException($"Item {key} not in inventory");
+			return count;
+		}
+	}
+
+	public bool ContainsKey(int key) => Get(key) > 0;
+
+	public bool TryGetValue(int key, out int value)
+	{
+		value = Get(key);
+		return value > 0;
+	}
+
+	public IEnumerable<int> Keys
+	{
+		get
+		{
+			foreach (var (itemId, _) in this)
+				yield return itemId;
+		}
+	}
+
+	public IEnumerable<int> Values
+	{
+		get
+		{
+			foreach (var (_, count) in this)
+				yield return count;
+		}
+	}
+
+	/// <summary>
+	/// 할당 없는 순회 (foreach에서 구체 타입으로 사용할 때)
+	/// </summary>
+	public Enumerator GetEnumerator() => new(this);
+
+	IEnumerator<KeyValuePair<int, int>> IEnumerable<KeyValuePair<int, int>>.GetEnumerator() => GetEnumerator();
+
+	IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+	public struct Enumerator : IEnumerator<KeyValuePair<int, int>>
+	{
+		private readonly ItemStacks _owner;
+		private Dictionary<int, int>.Enumerator _mapEnumerator;
+		private int _index;
+
+		internal Enumerator(ItemStacks owner)
+		{
+			_owner = owner;
+			_mapEnumerator = owner._map?.GetEnumerator() ?? default;
+			_index = -1;
+		}
+
+		public KeyValuePair<int, int> Current => _owner._map != null
+			? _mapEnumerator.Current
+			: new KeyValuePair<int, int>(_owner._itemIds[_index], _owner._counts[_index]);
+
+		object IEnumerator.Current => Current;
+
+		public bool MoveNext()
+		{
+			if (_owner._map != null)
+				return _mapEnumerator.MoveNext();
+			return ++_index < _owner._size;
+		}
+
+		public void Reset()
+		{
+			_mapEnumerator = _owner._map?.GetEnumerator() ?? default;
+			_index = -1;
+		}
+
+		public void Dispose()
+		{
+		}
+	}
+}
@@ -0,0 +1,131 @@
+namespace Morld;
+
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// 인벤토리 소유자 종류
+/// </summary>
+public enum OwnerKind
+{
+	Unit,       // 유닛 (캐릭터/오브젝트) - 핸들 = unitId
+	Location,   // 위치 (바닥) - "location:{regionId}:{localId}"
+	Item,       // 아이템 (가방 등) - "item:{id}"
+	Other       // 그 외 임의 키
+}
+
+/// <summary>
+/// 인벤토리 소유자 핸들 관리
+/// - 유닛: 핸들 = unitId (0 이상, 문자열 변환 없음)
+/// - 위치/아이템/기타: 처음 사용할 때 음수 핸들을 발급 (종류별로 따로 관리)
+/// - 문자열 키는 핸들 발급 시(유닛은 처음 필요할 때) 한 번만 생성
+/// </summary>
+public class OwnerRegistry
+{
+	public const string LocationPrefix = "location:";
+	public const string ItemPrefix = "item:";
+
+	private readonly Dictionary<(int RegionId, int LocalId), int> _locationHandles = new();
+	private readonly Dictionary<int, int> _itemHandles = new();
+	private readonly Dictionary<string, int> _otherHandles = new();
+
+	// 음수 핸들 정보 (인덱스 = -handle - 1)
+	private readonly List<OwnerKind> _kinds = new();
+	private readonly List<string> _keys = new();
+
+	// 유닛 키 문자열 캐시
+	private readonly Dictionary<int, string> _unitKeys = new();
+
+	/// <summary>
+	/// 유닛 핸들
+	/// </summary>
+	public static int Unit(int unitId) => unitId;
+
+	/// <summary>
+	/// 위치(바닥) 핸들
+	/// </summary>
+	public int Location(int regionId, int localId)
+	{
+		if (!_locationHandles.TryGetValue((regionId, localId), out var handle))
+		{
+			handle = Allocate(OwnerKind.Location, $"{LocationPrefix}{regionId}:{localId}");
+			_locationHandles[(regionId, localId)] = handle;
+		}
+		return handle;
+	}
+
+	/// <summary>
+	/// 아이템 컨테이너 핸들
+	/// </summary>
+	public int Item(int itemId)
+	{
+		if (!_itemHandles.TryGetValue(itemId, out var handle))
+		{
+			handle = Allocate(OwnerKind.Item, $"{ItemPrefix}{itemId}");
+			_itemHandles[itemId] = handle;
+		}
+		return handle;
+	}
+
+	/// <summary>
+	/// 문자열 키 → 핸들 (저장 데이터, 스크립트 호환용)
+	/// "10" → 유닛, "location:0:1" → 위치, "item:5" → 아이템, 그 외 → 기타
+	/// </summary>
+	public int FromKey(string ownerKey)
+	{
+		if (int.TryParse(ownerKey, out var unitId) && unitId >= 0)
+			return Unit(unitId);
+
+		if (ownerKey.StartsWith(LocationPrefix))
+		{
+			var parts = ownerKey.Substring(LocationPrefix.Length).Split(':');
+			if (parts.Length == 2 && int.TryParse(parts[0], out var regionId) && int.TryParse(parts[1], out var localId))
+				return Location(regionId, localId);
+		}
+		else if (ownerKey.StartsWith(ItemPrefix))
+		{
+			if (int.TryParse(ownerKey.AsSpan(ItemPrefix.Length), out var itemId))
+				return Item(itemId);
+		}
+
+		if (!_otherHandles.TryGetValue(ownerKey, out var handle))
+		{
+			handle = Allocate(OwnerKind.Other, ownerKey);
+			_otherHandles[ownerKey] = handle;
+		}
+		return handle;
+	}
+
+	/// <summary>
+	/// 핸들 → 문자열 키 (핸들별로 한 번만 생성)
+	/// </summary>
+	public string ToKey(int handle)
+	{
+		if (handle >= 0)
+		{
+			if (!_unitKeys.TryGetValue(handle, out var unitKey))
+			{
+				unitKey = handle.ToString();
+				_unitKeys[handle] = unitKey;
+			}
+			return unitKey;
+		}
+
+		return _keys[-handle - 1];
+	}
+
+	/// <summary>
+	/// 핸들 종류
+	/// </summary>
+	public OwnerKind KindOf(int handle)
+	{
+		return handle >= 0 ? OwnerKind.Unit : _kinds[-handle - 1];
+	}
+
+	private int Allocate(OwnerKind kind, string key)
+	{
+		_kinds.Add(kind);
+		_keys.Add(key);
+		return -_kinds.Count;
+	}
+}
@@ -22,12 +22,12 @@ public class Item
 	/// <summary>
 	/// 소유만으로 효과가 있는 태그 (예: 열쇠)
 	/// </summary>
-	public Dictionary<string, int> PassiveTags { get; set; } = new();
+	public TagMap PassiveTags { get; set; } = new();
 
 	/// <summary>
 	/// 장착해야 효과가 있는 태그 (예: 망원경 +관찰)
 	/// </summary>
-	public Dictionary<string, int> EquipTags { get; set; } = new();
+	public TagMap EquipTags { get; set; } = new();
 
 	/// <summary>
 	/// 아이템 가치 (거래용)
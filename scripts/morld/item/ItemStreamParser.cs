@@ -0,0 +1,76 @@
+namespace Morld;
+
+using System;
+using System.Collections.Generic;
+using System.Text.Json;
+
+/// <summary>
+/// item_data.json 스트리밍 파서
+/// ItemJsonData를 거치지 않고 UTF-8 바이트에서 바로 Item을 생성
+/// (워커 스레드에서 호출 가능)
+/// </summary>
+internal static class ItemStreamParser
+{
+	public static List<Item> Parse(ReadOnlySpan<byte> utf8)
+	{
+		var reader = JsonStream.CreateReader(utf8);
+		var items = new List<Item>();
+
+		JsonStream.Expect(ref reader, JsonTokenType.StartArray);
+		while (JsonStream.NextElement(ref reader))
+		{
+			items.Add(ParseItem(ref reader));
+		}
+
+		return items;
+	}
+
+	private static Item ParseItem(ref Utf8JsonReader reader)
+	{
+		Item? item = null;
+		string name = string.Empty;
+		int value = 0;
+
+		while (JsonStream.NextProperty(ref reader))
+		{
+			if (reader.ValueTextEquals("id"u8))
+			{
+				item = new Item(JsonStream.ReadInt(ref reader), string.Empty);
+			}
+			else if (reader.ValueTextEquals("name"u8))
+			{
+				name = JsonStream.ReadString(ref reader) ?? string.Empty;
+			}
+			else if (reader.ValueTextEquals("value"u8))
+			{
+				value = JsonStream.ReadInt(ref reader);
+			}
+			else if (reader.ValueTextEquals("passiveTags"u8))
+			{
+				if (item == null) throw JsonStream.MissingId("item", ref reader);
+				JsonStream.ReadStringIntMap(ref reader, item.PassiveTags);
+			}
+			else if (reader.ValueTextEquals("equipTags"u8))
+			{
+				if (item == null) throw JsonStream.MissingId("item", ref reader);
+				JsonStream.ReadStringIntMap(ref reader, item.EquipTags);
+			}
+			else if (reader.ValueTextEquals("actions"u8))
+			{
+				if (item == null) throw JsonStream.MissingId("item", ref reader);
+				JsonStream.ReadStringList(ref reader, item.Actions);
+			}
+			else
+			{
+				JsonStream.SkipValue(ref reader);
+			}
+		}
+
+		if (item == null)
+			throw new JsonException("item: missing 'id'");
+
+		item.Name = name;
+		item.Value = value;
+		return item;
+	}
+}
@@ -0,0 +1,335 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Runtime.CompilerServices;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Morld;
+
+public enum LogLevel
+{
+	Trace,
+	Debug,
+	Info,
+	Warning,
+	Error,
+	None
+}
+
+/// <summary>
+/// 레벨별 로그 함수용 표식 (LogHandler의 레벨을 컴파일 시점에 고정)
+/// </summary>
+public interface ILogLevelTag
+{
+	static abstract LogLevel Level { get; }
+}
+
+public struct TraceLevel : ILogLevelTag { public static LogLevel Level => LogLevel.Trace; }
+public struct DebugLevel : ILogLevelTag { public static LogLevel Level => LogLevel.Debug; }
+public struct InfoLevel : ILogLevelTag { public static LogLevel Level => LogLevel.Info; }
+public struct WarningLevel : ILogLevelTag { public static LogLevel Level => LogLevel.Warning; }
+public struct ErrorLevel : ILogLevelTag { public static LogLevel Level => LogLevel.Error; }
+
+/// <summary>
+/// 로그 보간 문자열 처리기
+/// 레벨이 꺼져 있으면 생성자에서 isEnabled = false를 돌려주고, 컴파일러가 모든 Append 호출을 건너뜀
+/// (보간식 평가, 문자열 조합 모두 일어나지 않음)
+/// </summary>
+[InterpolatedStringHandler]
+public ref struct LogHandler<TLevel> where TLevel : struct, ILogLevelTag
+{
+	private DefaultInterpolatedStringHandler _builder;
+
+	public bool IsEnabled { get; }
+
+	public LogHandler(int literalLength, int formattedCount, LogCategory category, out bool isEnabled)
+	{
+		IsEnabled = isEnabled = category.IsEnabled(TLevel.Level);
+		_builder = isEnabled ? new DefaultInterpolatedStringHandler(literalLength, formattedCount) : default;
+	}
+
+	public void AppendLiteral(string value) => _builder.AppendLiteral(value);
+	public void AppendFormatted<T>(T value) => _builder.AppendFormatted(value);
+	public void AppendFormatted<T>(T value, string? format) => _builder.AppendFormatted(value, format);
+	public void AppendFormatted<T>(T value, int alignment) => _builder.AppendFormatted(value, alignment);
+	public void AppendFormatted<T>(T value, int alignment, string? format) => _builder.AppendFormatted(value, alignment, format);
+	public void AppendFormatted(ReadOnlySpan<char> value) => _builder.AppendFormatted(value);
+	public void AppendFormatted(string? value) => _builder.AppendFormatted(value);
+
+	internal string ToStringAndClear() => _builder.ToStringAndClear();
+}
+
+/// <summary>
+/// 로그 분류 (시스템/모듈 단위)
+/// 파일마다 정적 필드로 한 번 만들어 두고 사용:
+///   private static readonly Morld.LogCategory _log = Morld.Log.Category("ScriptSystem");
+///   _log.Debug($"CallFunctionEx: {functionName}");
+/// </summary>
+public sealed class LogCategory
+{
+	public string Name { get; }
+
+	private volatile int _minLevel;
+
+	/// <summary>
+	/// 이 분류의 최소 레벨 (Log.MinLevel과 함께 만족해야 기록)
+	/// </summary>
+	public LogLevel MinLevel
+	{
+		get => (LogLevel)_minLevel;
+		set => _minLevel = (int)value;
+	}
+
+	internal LogCategory(string name, LogLevel minLevel)
+	{
+		Name = name;
+		_minLevel = (int)minLevel;
+	}
+
+	[MethodImpl(MethodImplOptions.AggressiveInlining)]
+	public bool IsEnabled(LogLevel level) => level >= (LogLevel)_minLevel && level >= Log.MinLevel;
+
+	public void Trace([InterpolatedStringHandlerArgument("")] ref LogHandler<TraceLevel> message)
+	{
+		if (message.IsEnabled) Log.Write(this, LogLevel.Trace, message.ToStringAndClear());
+	}
+
+	public void Debug([InterpolatedStringHandlerArgument("")] ref LogHandler<DebugLevel> message)
+	{
+		if (message.IsEnabled) Log.Write(this, LogLevel.Debug, message.ToStringAndClear());
+	}
+
+	public void Info([InterpolatedStringHandlerArgument("")] ref LogHandler<InfoLevel> message)
+	{
+		if (message.IsEnabled) Log.Write(this, LogLevel.Info, message.ToStringAndClear());
+	}
+
+	public void Warning([InterpolatedStringHandlerArgument("")] ref LogHandler<WarningLevel> message)
+	{
+		if (message.IsEnabled) Log.Write(this, LogLevel.Warning, message.ToStringAndClear());
+	}
+
+	public void Error([InterpolatedStringHandlerArgument("")] ref LogHandler<ErrorLevel> message)
+	{
+		if (message.IsEnabled) Log.Write(this, LogLevel.Error, message.ToStringAndClear());
+	}
+
+	// 보간 없는 문자열 (상수 메시지)
+	public void Trace(string message) { if (IsEnabled(LogLevel.Trace)) Log.Write(this, LogLevel.Trace, message); }
+	public void Debug(string message) { if (IsEnabled(LogLevel.Debug)) Log.Write(this, LogLevel.Debug, message); }
+	public void Info(string message) { if (IsEnabled(LogLevel.Info)) Log.Write(this, LogLevel.Info, message); }
+	public void Warning(string message) { if (IsEnabled(LogLevel.Warning)) Log.Write(this, LogLevel.Warning, message); }
+	public void Error(string message) { if (IsEnabled(LogLevel.Error)) Log.Write(this, LogLevel.Error, message); }
+}
+
+/// <summary>
+/// 레벨/분류별 로거 (GD.Print 대체)
+/// - 꺼진 레벨은 bool 비교 한 번으로 끝남 (LogHandler가 문자열 조합을 건너뜀)
+/// - 기본 레벨: DEBUG 빌드 Debug, 릴리스 빌드 Warning
+/// - EchoToGodot: 켜져 있으면 호출 스레드에서 바로 GD.Print/PrintErr (편집기 출력 창, Godot 밖에서는 표준 출력/오류)
+/// - EnableFileSink: lock-free 링 버퍼에 쌓고 백그라운드 작업이 파일에 기록
+/// </summary>
+public static class Log
+{
+	private static readonly Dictionary<string, LogCategory> _categories = new();
+	private static readonly object _categoriesLock = new();
+
+	private static volatile int _minLevel =
+#if DEBUG
+		(int)LogLevel.Debug;
+#else
+		(int)LogLevel.Warning;
+#endif
+
+	private static LogRingBuffer? _buffer;
+	private static StreamWriter? _writer;
+	private static Task? _sinkTask;
+	private static CancellationTokenSource? _sinkStop;
+	private static readonly long _origin = Stopwatch.GetTimestamp();
+
+	/// <summary>
+	/// 전체 최소 레벨
+	/// </summary>
+	public static LogLevel MinLevel
+	{
+		get => (LogLevel)_minLevel;
+		set => _minLevel = (int)value;
+	}
+
+	/// <summary>
+	/// Godot 출력 창으로도 출력 (기본 켜짐, Godot 밖에서는 Console)
+	/// </summary>
+	public static bool EchoToGodot { get; set; } = true;
+
+	/// <summary>
+	/// 파일 싱크가 켜져 있는지
+	/// </summary>
+	public static bool HasFileSink => _buffer != null;
+
+	/// <summary>
+	/// 링 버퍼가 가득 차서 버린 로그 수
+	/// </summary>
+	public static long Dropped => _buffer?.Dropped ?? 0;
+
+	/// <summary>
+	/// 분류 가져오기 (없으면 생성, 같은 이름이면 같은 인스턴스)
+	/// </summary>
+	public static LogCategory Category(string name)
+	{
+		lock (_categoriesLock)
+		{
+			if (!_categories.TryGetValue(name, out var category))
+			{
+				category = new LogCategory(name, LogLevel.Trace);
+				_categories[name] = category;
+			}
+			return category;
+		}
+	}
+
+	/// <summary>
+	/// 명령줄/설정 문자열로 레벨 지정 ("info", "ScriptSystem=debug,morld=warning")
+	/// </summary>
+	public static void Configure(string spec)
+	{
+		foreach (var part in spec.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+		{
+			var eq = part.IndexOf('=');
+			if (eq < 0)
+			{
+				if (Enum.TryParse<LogLevel>(part, true, out var level))
+					MinLevel = level;
+				continue;
+			}
+
+			if (Enum.TryParse<LogLevel>(part.Substring(eq + 1), true, out var categoryLevel))
+				Category(part.Substring(0, eq)).MinLevel = categoryLevel;
+		}
+	}
+
+	internal static void Write(LogCategory category, LogLevel level, string message)
+	{
+		if (EchoToGodot)
+		{
+#if GODOT
+			if (level >= LogLevel.Error)
+				Godot.GD.PrintErr($"[{category.Name}] {message}");
+			else
+				Godot.GD.Print($"[{category.Name}] {message}");
+#else
+			if (level >= LogLevel.Error)
+				Console.Error.WriteLine($"[{category.Name}] {message}");
+			else
+				Console.WriteLine($"[{category.Name}] {message}");
+#endif
+		}
+
+		_buffer?.TryWrite(new LogEntry(Stopwatch.GetTimestamp(), level, category.Name, message));
+	}
+
+	// ===== 파일 싱크 =====
+
+	/// <summary>
+	/// 파일 싱크 시작 (user://, res:// 또는 일반 경로, 기존 파일에 이어 씀)
+	/// </summary>
+	/// <param name="capacity">링 버퍼 크기 - 싱크가 따라가지 못하면 넘친 로그는 버림</param>
+	public static void EnableFileSink(string path, int capacity = 8192)
+	{
+		if (_buffer != null)
+			return;
+
+		var globalPath = GamePath.Globalize(path);
+		var directory = Path.GetDirectoryName(globalPath);
+		if (!string.IsNullOrEmpty(directory))
+			Directory.CreateDirectory(directory);
+
+		_writer = new StreamWriter(globalPath, append: true, new UTF8Encoding(false));
+		_sinkStop = new CancellationTokenSource();
+		_buffer = new LogRingBuffer(capacity);
+
+		var stop = _sinkStop.Token;
+		_sinkTask = Task.Run(async () =>
+		{
+			while (!stop.IsCancellationRequested)
+			{
+				if (!Drain())
+				{
+					try
+					{
+						await Task.Delay(50, stop);
+					}
+					catch (OperationCanceledException)
+					{
+						break;
+					}
+				}
+			}
+		});
+	}
+
+	/// <summary>
+	/// 파일 싱크 종료 (남은 로그를 모두 기록하고 파일 닫기)
+	/// </summary>
+	public static void DisableFileSink()
+	{
+		if (_buffer == null)
+			return;
+
+		_sinkStop!.Cancel();
+		_sinkTask!.Wait();
+		Drain();
+
+		var dropped = _buffer.Dropped;
+		if (dropped > 0)
+			_writer!.WriteLine($"[Log] {dropped} entries dropped (ring buffer full)");
+
+		_buffer = null;
+		_writer!.Dispose();
+		_writer = null;
+		_sinkStop.Dispose();
+		_sinkStop = null;
+		_sinkTask = null;
+	}
+
+	/// <summary>
+	/// 링 버퍼에 쌓인 로그를 파일로 (싱크 작업 또는 종료 시 호출)
+	/// </summary>
+	/// <returns>기록한 로그가 있으면 true</returns>
+	private static bool Drain()
+	{
+		var buffer = _buffer;
+		var writer = _writer;
+		if (buffer == null || writer == null)
+			return false;
+
+		bool any = false;
+		while (buffer.TryRead(out var entry))
+		{
+			var seconds = (entry.Timestamp - _origin) / (double)Stopwatch.Frequency;
+			writer.Write(seconds.ToString("F4", System.Globalization.CultureInfo.InvariantCulture));
+			writer.Write(' ');
+			writer.Write(LevelName(entry.Level));
+			writer.Write(" [");
+			writer.Write(entry.Category);
+			writer.Write("] ");
+			writer.WriteLine(entry.Message);
+			any = true;
+		}
+		if (any)
+			writer.Flush();
+		return any;
+	}
+
+	private static string LevelName(LogLevel level) => level switch
+	{
+		LogLevel.Trace => "TRACE",
+		LogLevel.Debug => "DEBUG",
+		LogLevel.Info => "INFO ",
+		LogLevel.Warning => "WARN ",
+		LogLevel.Error => "ERROR",
+		_ => "?????"
+	};
+}
@@ -0,0 +1,114 @@
+using System;
+using System.Threading;
+
+namespace Morld;
+
+/// <summary>
+/// 로그 한 줄
+/// </summary>
+public readonly struct LogEntry
+{
+	public readonly long Timestamp;
+	public readonly LogLevel Level;
+	public readonly string Category;
+	public readonly string Message;
+
+	public LogEntry(long timestamp, LogLevel level, string category, string message)
+	{
+		Timestamp = timestamp;
+		Level = level;
+		Category = category;
+		Message = message;
+	}
+}
+
+/// <summary>
+/// 고정 크기 lock-free 로그 큐 (여러 생산자, 소비자 하나)
+/// - 슬롯마다 순번을 두는 bounded 큐: 쓰기는 Interlocked 한 번으로 자리를 예약
+/// - 가득 차면 기다리지 않고 버림 (Dropped 증가) - 로그 때문에 게임 루프가 멈추지 않도록
+/// </summary>
+public sealed class LogRingBuffer
+{
+	private struct Slot
+	{
+		public long Sequence;
+		public LogEntry Entry;
+	}
+
+	private readonly Slot[] _slots;
+	private readonly int _mask;
+	private long _head;   // 다음 쓰기 위치
+	private long _tail;   // 다음 읽기 위치 (소비자 전용)
+	private long _dropped;
+
+	/// <param name="capacity">슬롯 수 (2의 거듭제곱으로 올림)</param>
+	public LogRingBuffer(int capacity = 4096)
+	{
+		var size = 1;
+		while (size < capacity)
+			size <<= 1;
+
+		_slots = new Slot[size];
+		_mask = size - 1;
+		for (int i = 0; i < size; i++)
+			_slots[i].Sequence = i;
+	}
+
+	public int Capacity => _slots.Length;
+
+	/// <summary>
+	/// 가득 차서 버린 로그 수
+	/// </summary>
+	public long Dropped => Interlocked.Read(ref _dropped);
+
+	/// <summary>
+	/// 로그 추가 (가득 차면 false)
+	/// </summary>
+	public bool TryWrite(in LogEntry entry)
+	{
+		while (true)
+		{
+			var position = Volatile.Read(ref _head);
+			ref var slot = ref _slots[position & _mask];
+			var sequence = Volatile.Read(ref slot.Sequence);
+
+			if (sequence == position)
+			{
+				if (Interlocked.CompareExchange(ref _head, position + 1, position) != position)
+					continue;
+
+				slot.Entry = entry;
+				Volatile.Write(ref slot.Sequence, position + 1);
+				return true;
+			}
+
+			if (sequence < position)
+			{
+				// 소비자가 아직 비우지 않은 슬롯 = 가득 참
+				Interlocked.Increment(ref _dropped);
+				return false;
+			}
+			// 다른 생산자가 먼저 예약함 - 다시 시도
+		}
+	}
+
+	/// <summary>
+	/// 로그 하나 꺼내기 (소비자 스레드 하나에서만 호출)
+	/// </summary>
+	public bool TryRead(out LogEntry entry)
+	{
+		var position = _tail;
+		ref var slot = ref _slots[position & _mask];
+		if (Volatile.Read(ref slot.Sequence) != position + 1)
+		{
+			entry = default;
+			return false;
+		}
+
+		entry = slot.Entry;
+		slot.Entry = default;
+		Volatile.Write(ref slot.Sequence, position + _slots.Length);
+		_tail = position + 1;
+		return true;
+	}
+}
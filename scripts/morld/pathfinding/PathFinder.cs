@@ -40,6 +40,12 @@ public class PathResult
     /// </summary>
     public List<int> RegionEdgesUsed { get; init; } = new();
 
+    /// <summary>
+    /// 페이징 모드에서 요약 구간을 펼치지 않아 Path가 목표 전에 끝났는지 여부
+    /// (TotalTravelTime, RegionsTraversed, RegionEdgesUsed는 전체 경로 기준)
+    /// </summary>
+    public bool IsPartial { get; init; }
+
     /// <summary>
     /// 빈 결과 (경로 없음)
     /// </summary>
@@ -53,6 +59,12 @@ public class PathFinder
 {
     private readonly Terrain _terrain;
 
+    /// <summary>
+    /// 페이징 모드에서 포털 요약으로 건너뛴 구간을 Location 단위로 펼칠지 여부 (기본: true)
+    /// false면 첫 요약 구간 전까지만 Path를 채워 경로상의 Region을 읽어오지 않음
+    /// </summary>
+    public bool ExpandSummarizedRoute { get; init; } = true;
+
     public PathFinder(Terrain terrain)
     {
         _terrain = terrain ?? throw new ArgumentNullException(nameof(terrain));
@@ -88,6 +100,8 @@ public class PathFinder
         }
 
         // 다른 Region 간 탐색
+        if (_terrain.IsPaged)
+            return FindPathAcrossPagedRegions(startLocation, goalLocation, context);
         return FindPathAcrossRegions(startLocation, goalLocation, context);
     }
 
@@ -111,6 +125,8 @@ public class PathFinder
         }
 
         // 다른 Region 간 탐색
+        if (_terrain.IsPaged)
+            return FindPathAcrossPagedRegions(startLocation, goalLocation, context);
         return FindPathAcrossRegions(startLocation, goalLocation, context);
     }
 
@@ -161,21 +177,24 @@ public class PathFinder
             };
         }
 
-        var openSet = new PriorityQueue<Location, float>();
-        var cameFrom = new Dictionary<string, Location>();
-        var travelTime = new Dictionary<string, float>();
-        var closedSet = new HashSet<string>();
+        var scratch = _regionScratch ??= new SearchScratch<Location>();
+        scratch.Clear();
+        var openSet = scratch.OpenSet;
+        var cameFrom = scratch.CameFrom;
+        var travelTime = scratch.TravelTime;
+        var closedSet = scratch.ClosedSet;
         int visitedCount = 0;
 
-        travelTime[start.GlobalId] = 0;
+        travelTime[new LocationRef(start)] = 0;
         openSet.Enqueue(start, 0);
 
         while (openSet.Count > 0)
         {
             var current = openSet.Dequeue();
+            var currentRef = new LocationRef(current);
             visitedCount++;
 
-            if (closedSet.Contains(current.GlobalId))
+            if (closedSet.Contains(currentRef))
                 continue;
 
             if (current.Equals(goal))
@@ -184,25 +203,34 @@ public class PathFinder
                 {
                     Found = true,
                     Path = ReconstructPath(cameFrom, current),
-                    TotalTravelTime = travelTime[current.GlobalId],
+                    TotalTravelTime = travelTime[currentRef],
                     VisitedNodes = visitedCount,
                     RegionsTraversed = new List<int> { start.RegionId }
                 };
             }
 
-            closedSet.Add(current.GlobalId);
+            closedSet.Add(currentRef);
+            var currentTime = travelTime[currentRef];
 
-            foreach ((Location neighbor, Edge edge, float edgeTravelTime) in region.GetTraversableNeighbors(current, context))
+            // GetTraversableNeighbors와 같은 조건 (열거자 할당 없이 직접 순회)
+            var edges = region.GetEdges(current);
+            for (int i = 0; i < edges.Count; i++)
             {
-                if (closedSet.Contains(neighbor.GlobalId))
+                var edge = edges[i];
+                if (!edge.CanTraverse(current, context))
+                    continue;
+
+                var neighbor = edge.GetOtherLocation(current);
+                var neighborRef = new LocationRef(neighbor);
+                if (closedSet.Contains(neighborRef))
                     continue;
 
-                float tentativeTime = travelTime[current.GlobalId] + edgeTravelTime;
+                float tentativeTime = currentTime + edge.GetTravelTime(current);
 
-                if (!travelTime.ContainsKey(neighbor.GlobalId) || tentativeTime < travelTime[neighbor.GlobalId])
+                if (!travelTime.TryGetValue(neighborRef, out var known) || tentativeTime < known)
                 {
-                    cameFrom[neighbor.GlobalId] = current;
-                    travelTime[neighbor.GlobalId] = tentativeTime;
+                    cameFrom[neighborRef] = current;
+                    travelTime[neighborRef] = tentativeTime;
                     openSet.Enqueue(neighbor, tentativeTime);
                 }
             }
@@ -217,70 +245,172 @@ public class PathFinder
     private PathResult FindPathAcrossRegions(Location start, Location goal, TraversalContext? context)
     {
         // 전역 탐색: Location + RegionEdge를 모두 탐색
-        var openSet = new PriorityQueue<SearchNode, float>();
-        var cameFrom = new Dictionary<string, (SearchNode node, int? regionEdgeId)>();
-        var travelTime = new Dictionary<string, float>();
-        var closedSet = new HashSet<string>();
+        var scratch = _crossRegionScratch ??= new SearchScratch<CrossRegionStep>();
+        scratch.Clear();
+        var openSet = scratch.OpenSet;
+        var cameFrom = scratch.CameFrom;
+        var travelTime = scratch.TravelTime;
+        var closedSet = scratch.ClosedSet;
         int visitedCount = 0;
 
-        var startNode = new SearchNode(start);
-        travelTime[startNode.Id] = 0;
-        openSet.Enqueue(startNode, 0);
+        travelTime[new LocationRef(start)] = 0;
+        openSet.Enqueue(start, 0);
 
         while (openSet.Count > 0)
         {
             var current = openSet.Dequeue();
+            var currentRef = new LocationRef(current);
             visitedCount++;
 
-            if (closedSet.Contains(current.Id))
+            if (closedSet.Contains(currentRef))
                 continue;
 
             // 목표 도달
-            if (current.Location.Equals(goal))
+            if (current.Equals(goal))
             {
-                return ReconstructCrossRegionPath(cameFrom, current, travelTime[current.Id], visitedCount);
+                return ReconstructCrossRegionPath(cameFrom, current, travelTime[currentRef], visitedCount);
             }
 
-            closedSet.Add(current.Id);
+            closedSet.Add(currentRef);
+            var currentTime = travelTime[currentRef];
 
-            var currentRegion = _terrain.GetRegion(current.Location.RegionId)!;
+            var currentRegion = _terrain.GetRegion(current.RegionId)!;
 
             // 1. 같은 Region 내 이동
-            foreach ((Location neighbor, Edge edge, float edgeTravelTime) in currentRegion.GetTraversableNeighbors(current.Location, context))
+            var edges = currentRegion.GetEdges(current);
+            for (int i = 0; i < edges.Count; i++)
             {
-                var neighborNode = new SearchNode(neighbor);
-                if (closedSet.Contains(neighborNode.Id))
+                var edge = edges[i];
+                if (!edge.CanTraverse(current, context))
                     continue;
 
-                float tentativeTime = travelTime[current.Id] + edgeTravelTime;
+                var neighbor = edge.GetOtherLocation(current);
+                var neighborRef = new LocationRef(neighbor);
+                if (closedSet.Contains(neighborRef))
+                    continue;
 
-                if (!travelTime.ContainsKey(neighborNode.Id) || tentativeTime < travelTime[neighborNode.Id])
+                float tentativeTime = currentTime + edge.GetTravelTime(current);
+
+                if (!travelTime.TryGetValue(neighborRef, out var known) || tentativeTime < known)
                 {
-                    cameFrom[neighborNode.Id] = (current, null);
-                    travelTime[neighborNode.Id] = tentativeTime;
-                    openSet.Enqueue(neighborNode, tentativeTime);
+                    cameFrom[neighborRef] = new CrossRegionStep(current, null);
+                    travelTime[neighborRef] = tentativeTime;
+                    openSet.Enqueue(neighbor, tentativeTime);
                 }
             }
 
-            // 2. 다른 Region으로 이동 (RegionEdge)
-            var currentRef = new LocationRef(current.Location);
-            foreach ((RegionEdge regionEdge, LocationRef destRef, float edgeTravelTime) in _terrain.GetRegionExits(currentRef, context))
+            // 2. 다른 Region으로 이동 (RegionEdge) - GetRegionExits와 같은 조건
+            var regionEdges = _terrain.GetRegionEdges(currentRef.RegionId);
+            for (int i = 0; i < regionEdges.Count; i++)
             {
+                var regionEdge = regionEdges[i];
+                var locInRegion = regionEdge.GetLocationInRegion(currentRef.RegionId);
+                if (locInRegion == null || locInRegion.Value != currentRef)
+                    continue;
+                if (!regionEdge.CanTraverse(currentRef, context))
+                    continue;
+
+                var destRef = regionEdge.GetOtherLocation(currentRef);
+                if (closedSet.Contains(destRef))
+                    continue;
+
                 var destLocation = _terrain.GetLocation(destRef);
                 if (destLocation == null)
                     continue;
 
-                var destNode = new SearchNode(destLocation);
-                if (closedSet.Contains(destNode.Id))
-                    continue;
+                float tentativeTime = currentTime + regionEdge.GetTravelTime(currentRef);
+
+                if (!travelTime.TryGetValue(destRef, out var known) || tentativeTime < known)
+                {
+                    cameFrom[destRef] = new CrossRegionStep(current, regionEdge.Id);
+                    travelTime[destRef] = tentativeTime;
+                    openSet.Enqueue(destLocation, tentativeTime);
+                }
+            }
+        }
+
+        return new PathResult { Found = false, VisitedNodes = visitedCount };
+    }
 
-                float tentativeTime = travelTime[current.Id] + edgeTravelTime;
+    /// <summary>
+    /// 페이징 모드의 다른 Region 간 경로 탐색 (Dijkstra with portal summaries)
+    /// 출발/도착 Region, 이미 상주 중인 Region, 조건부 Edge가 있는 Region은 Location 단위로 탐색하고
+    /// 나머지 Region은 읽어오지 않고 포털 간 요약 이동 시간으로 건너뜀
+    /// </summary>
+    private PathResult FindPathAcrossPagedRegions(Location start, Location goal, TraversalContext? context)
+    {
+        var startRef = new LocationRef(start);
+        var goalRef = new LocationRef(goal);
+
+        var openSet = new PriorityQueue<LocationRef, float>();
+        var cameFrom = new Dictionary<LocationRef, PagedStep>();
+        var travelTime = new Dictionary<LocationRef, float>();
+        var closedSet = new HashSet<LocationRef>();
+        // Region별 탐색 방식은 처음 방문할 때 한 번만 결정 (탐색 중 페이지 아웃되어도 일관성 유지)
+        var expandRegion = new Dictionary<int, bool>();
+        int visitedCount = 0;
+
+        travelTime[startRef] = 0;
+        openSet.Enqueue(startRef, 0);
+
+        while (openSet.Count > 0)
+        {
+            var current = openSet.Dequeue();
+            visitedCount++;
 
-                if (!travelTime.ContainsKey(destNode.Id) || tentativeTime < travelTime[destNode.Id])
+            if (!closedSet.Add(current))
+                continue;
+
+            // 목표 도달
+            if (current == goalRef)
+            {
+                return BuildPagedPath(start, cameFrom, goalRef, travelTime[current], visitedCount);
+            }
+
+            var currentTime = travelTime[current];
+
+            if (!expandRegion.TryGetValue(current.RegionId, out var expand))
+            {
+                expand = ShouldExpandRegion(current.RegionId, startRef.RegionId, goalRef.RegionId);
+                expandRegion[current.RegionId] = expand;
+            }
+
+            // 1. 같은 Region 내 이동 (Location 단위 또는 포털 요약)
+            if (expand)
+            {
+                var region = _terrain.GetRegion(current.RegionId)!;
+                var location = region.GetLocation(current.LocalId)!;
+                foreach ((Location neighbor, Edge edge, float edgeTravelTime) in region.GetTraversableNeighbors(location, context))
                 {
-                    cameFrom[destNode.Id] = (current, regionEdge.Id);
-                    travelTime[destNode.Id] = tentativeTime;
-                    openSet.Enqueue(destNode, tentativeTime);
+                    Relax(new LocationRef(neighbor), edgeTravelTime, new PagedStep(current, null, false));
+                }
+            }
+            else
+            {
+                var summary = _terrain.GetRegionSummary(current.RegionId)!;
+                foreach (var (toLocalId, hopTime) in summary.GetPortalHops(current.LocalId))
+                {
+                    Relax(new LocationRef(current.RegionId, toLocalId), hopTime, new PagedStep(current, null, true));
+                }
+            }
+
+            // 2. 다른 Region으로 이동 (RegionEdge는 항상 상주)
+            foreach ((RegionEdge regionEdge, LocationRef destRef, float edgeTravelTime) in _terrain.GetRegionExits(current, context))
+            {
+                Relax(destRef, edgeTravelTime, new PagedStep(current, regionEdge.Id, false));
+            }
+
+            void Relax(LocationRef next, float stepTime, PagedStep step)
+            {
+                if (closedSet.Contains(next))
+                    return;
+
+                float tentativeTime = currentTime + stepTime;
+                if (!travelTime.TryGetValue(next, out var known) || tentativeTime < known)
+                {
+                    cameFrom[next] = step;
+                    travelTime[next] = tentativeTime;
+                    openSet.Enqueue(next, tentativeTime);
                 }
             }
         }
@@ -288,16 +418,98 @@ public class PathFinder
         return new PathResult { Found = false, VisitedNodes = visitedCount };
     }
 
+    /// <summary>
+    /// Location 단위로 탐색할 Region인지 판단
+    /// </summary>
+    private bool ShouldExpandRegion(int regionId, int startRegionId, int goalRegionId)
+    {
+        if (regionId == startRegionId || regionId == goalRegionId)
+            return true;
+        if (_terrain.IsRegionResident(regionId))
+            return true;
+
+        // 요약이 없거나 오래되었거나, 유닛 태그에 따라 경로가 달라지는 Region은 읽어서 탐색
+        var summary = _terrain.GetRegionSummary(regionId);
+        return summary == null || summary.IsStale || summary.HasConditionalEdges;
+    }
+
+    /// <summary>
+    /// 페이징 모드 경로 재구성
+    /// 요약 구간은 ExpandSummarizedRoute일 때만 해당 Region을 읽어 Location 단위로 펼침
+    /// </summary>
+    private PathResult BuildPagedPath(
+        Location start,
+        Dictionary<LocationRef, PagedStep> cameFrom,
+        LocationRef goal,
+        float totalTime,
+        int visitedCount)
+    {
+        // 목표에서 출발점까지 역추적
+        var steps = new List<(LocationRef To, PagedStep Step)>();
+        var current = goal;
+        while (cameFrom.TryGetValue(current, out var step))
+        {
+            steps.Add((current, step));
+            current = step.From;
+        }
+        steps.Reverse();
+
+        var regions = new List<int> { start.RegionId };
+        var regionEdges = new List<int>();
+        foreach (var (to, step) in steps)
+        {
+            if (step.RegionEdgeId.HasValue)
+                regionEdges.Add(step.RegionEdgeId.Value);
+            if (regions[^1] != to.RegionId)
+                regions.Add(to.RegionId);
+        }
+
+        var path = new List<Location> { start };
+        bool isPartial = false;
+        foreach (var (to, step) in steps)
+        {
+            // 첫 이동은 항상 채움 (바로 다음 위치는 호출자가 곧 필요로 함)
+            if (!ExpandSummarizedRoute && path.Count >= 2 &&
+                (step.Summarized || !_terrain.IsRegionResident(to.RegionId)))
+            {
+                isPartial = true;
+                break;
+            }
+
+            if (step.Summarized)
+            {
+                var region = _terrain.GetRegion(to.RegionId)!;
+                var leg = FindPathInRegion(region.GetLocation(step.From.LocalId)!, region.GetLocation(to.LocalId)!, null);
+                path.AddRange(leg.Path.Skip(1));
+            }
+            else
+            {
+                path.Add(_terrain.GetLocation(to)!);
+            }
+        }
+
+        return new PathResult
+        {
+            Found = true,
+            Path = path,
+            TotalTravelTime = totalTime,
+            VisitedNodes = visitedCount,
+            RegionsTraversed = regions.Distinct().ToList(),
+            RegionEdgesUsed = regionEdges,
+            IsPartial = isPartial
+        };
+    }
+
     /// <summary>
     /// Region 내 경로 재구성
     /// </summary>
-    private List<Location> ReconstructPath(Dictionary<string, Location> cameFrom, Location current)
+    private List<Location> ReconstructPath(Dictionary<LocationRef, Location> cameFrom, Location current)
     {
         var path = new List<Location> { current };
 
-        while (cameFrom.ContainsKey(current.GlobalId))
+        while (cameFrom.TryGetValue(new LocationRef(current), out var previous))
         {
-            current = cameFrom[current.GlobalId];
+            current = previous;
             path.Add(current);
         }
 
@@ -309,25 +521,23 @@ public class PathFinder
     /// Region 간 경로 재구성
     /// </summary>
     private PathResult ReconstructCrossRegionPath(
-        Dictionary<string, (SearchNode node, int? regionEdgeId)> cameFrom,
-        SearchNode current,
+        Dictionary<LocationRef, CrossRegionStep> cameFrom,
+        Location current,
         float totalTime,
         int visitedCount)
     {
-        var path = new List<Location> { current.Location };
-        var regions = new HashSet<int> { current.Location.RegionId };
+        var path = new List<Location> { current };
+        var regions = new HashSet<int> { current.RegionId };
         var regionEdges = new List<int>();
 
-        while (cameFrom.ContainsKey(current.Id))
+        while (cameFrom.TryGetValue(new LocationRef(current), out var step))
         {
-            var (prevNode, regionEdgeId) = cameFrom[current.Id];
-            
-            if (regionEdgeId.HasValue)
-                regionEdges.Add(regionEdgeId.Value);
-
-            current = prevNode;
-            path.Add(current.Location);
-            regions.Add(current.Location.RegionId);
+            if (step.RegionEdgeId.HasValue)
+                regionEdges.Add(step.RegionEdgeId.Value);
+
+            current = step.From;
+            path.Add(current);
+            regions.Add(current.RegionId);
         }
 
         path.Reverse();
@@ -345,16 +555,34 @@ public class PathFinder
     }
 
     /// <summary>
-    /// 탐색용 내부 노드
+    /// 페이징 모드 탐색의 이전 단계 (RegionEdgeId가 있으면 Region 간 이동, Summarized면 포털 요약 이동)
     /// </summary>
-    private class SearchNode
+    private readonly record struct PagedStep(LocationRef From, int? RegionEdgeId, bool Summarized);
+
+    /// <summary>
+    /// Region 간 탐색의 이전 단계 (RegionEdgeId가 있으면 Region 간 이동)
+    /// </summary>
+    private readonly record struct CrossRegionStep(Location From, int? RegionEdgeId);
+
+    /// <summary>
+    /// 탐색용 작업 컬렉션 (스레드별로 하나씩 두고 탐색마다 비워서 재사용)
+    /// </summary>
+    private sealed class SearchScratch<TStep>
     {
-        public Location Location { get; }
-        public string Id => Location.GlobalId;
+        public readonly PriorityQueue<Location, float> OpenSet = new();
+        public readonly Dictionary<LocationRef, TStep> CameFrom = new();
+        public readonly Dictionary<LocationRef, float> TravelTime = new();
+        public readonly HashSet<LocationRef> ClosedSet = new();
 
-        public SearchNode(Location location)
+        public void Clear()
         {
-            Location = location;
+            OpenSet.Clear();
+            CameFrom.Clear();
+            TravelTime.Clear();
+            ClosedSet.Clear();
         }
     }
+
+    [ThreadStatic] private static SearchScratch<Location>? _regionScratch;
+    [ThreadStatic] private static SearchScratch<CrossRegionStep>? _crossRegionScratch;
 }
@@ -0,0 +1,149 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using SE;
+
+namespace Morld;
+
+/// <summary>
+/// 체크포인트 참여자
+/// 체크포인트는 스택으로 관리되며, 참여자는 최상위 레이어 기준으로 동작
+/// </summary>
+public interface ICheckpointable
+{
+	/// <summary>
+	/// 새 체크포인트 레이어 시작 (복사 없이 시작, 이후 처음 수정되는 부분만 보관)
+	/// </summary>
+	void BeginCheckpoint();
+
+	/// <summary>
+	/// 최상위 레이어 시점으로 되돌리고 레이어 제거
+	/// </summary>
+	void RollbackCheckpoint();
+
+	/// <summary>
+	/// 최상위 레이어를 아래 레이어에 합치고 제거 (되돌리지 않음)
+	/// </summary>
+	void ReleaseCheckpoint();
+}
+
+/// <summary>
+/// 인메모리 체크포인트 관리 (새 게임, 마지막 행동 되돌리기, 분기 비교 테스트)
+/// - Take: 모든 참여자에 레이어 시작 (변경 전 값은 수정 시점에 복사)
+/// - Restore: 해당 체크포인트 이후 레이어를 모두 되돌림 (수정된 부분만 교체)
+/// - Release: 체크포인트 해제 (변경 기록을 아래 체크포인트로 합침)
+/// </summary>
+public class CheckpointManager
+{
+	private static readonly LogCategory _log = Log.Category("CheckpointManager");
+
+	private readonly List<ICheckpointable> _participants = new();
+	private int _depth = 0;
+
+	/// <summary>
+	/// 활성 체크포인트 수 (체크포인트 id = 1부터 시작하는 스택 깊이)
+	/// </summary>
+	public int Depth => _depth;
+
+	/// <summary>
+	/// 복원 후 호출 (캐시 무효화, 화면 갱신 등)
+	/// </summary>
+	public Action? OnRestored { get; set; }
+
+	/// <summary>
+	/// 참여자 등록 (활성 체크포인트가 없을 때만)
+	/// </summary>
+	public void Register(ICheckpointable participant)
+	{
+		if (_depth > 0)
+			throw new InvalidOperationException("Cannot register checkpoint participants while checkpoints are active");
+
+		_participants.Add(participant);
+	}
+
+	/// <summary>
+	/// 게임 월드의 표준 참여자 등록
+	/// (유닛, 인벤토리, 게임 시간, 지형 변경 상태, 행동 로그, 스크립트 플래그)
+	/// </summary>
+	public static CheckpointManager ForWorld(World world)
+	{
+		var manager = new CheckpointManager();
+
+		if (world.FindSystem("worldSystem") is WorldSystem worldSystem)
+		{
+			manager.Register(worldSystem.GetTime());
+			manager.Register(worldSystem.GetTerrain());
+		}
+		if (world.FindSystem("unitSystem") is UnitSystem unitSystem)
+			manager.Register(unitSystem);
+		if (world.FindSystem("inventorySystem") is InventorySystem inventorySystem)
+			manager.Register(inventorySystem);
+		if (world.FindSystem("textUISystem") is TextUISystem textUISystem)
+			manager.Register(textUISystem);
+		if (world.FindSystem("scriptSystem") is ScriptSystem scriptSystem)
+			manager.Register(scriptSystem.Flags);
+
+		if (world.FindSystem("playerSystem") is PlayerSystem playerSystem)
+			manager.OnRestored += playerSystem.InvalidateRouteCache;
+
+		return manager;
+	}
+
+	/// <summary>
+	/// 체크포인트 생성
+	/// </summary>
+	/// <returns>체크포인트 id (Restore/Release에 사용)</returns>
+	public int Take()
+	{
+		foreach (var participant in _participants)
+			participant.BeginCheckpoint();
+
+		return ++_depth;
+	}
+
+	/// <summary>
+	/// 체크포인트 시점으로 복원
+	/// </summary>
+	/// <param name="checkpointId">Take가 반환한 id</param>
+	/// <param name="keep">true면 복원 후 같은 id로 체크포인트 유지 (반복 복원 가능)</param>
+	public void Restore(int checkpointId, bool keep = true)
+	{
+		Validate(checkpointId);
+
+		var stopwatch = Stopwatch.StartNew();
+		while (_depth >= checkpointId)
+		{
+			// 역순으로 되돌림 (등록 순서의 반대)
+			for (int i = _participants.Count - 1; i >= 0; i--)
+				_participants[i].RollbackCheckpoint();
+			_depth--;
+		}
+
+		if (keep)
+			Take();
+
+		OnRestored?.Invoke();
+		_log.Debug($"체크포인트 {checkpointId} 복원 ({stopwatch.Elapsed.TotalMilliseconds:F3} ms)");
+	}
+
+	/// <summary>
+	/// 체크포인트 해제 (그 위의 체크포인트도 함께 해제, 현재 상태 유지)
+	/// </summary>
+	public void Release(int checkpointId)
+	{
+		Validate(checkpointId);
+
+		while (_depth >= checkpointId)
+		{
+			foreach (var participant in _participants)
+				participant.ReleaseCheckpoint();
+			_depth--;
+		}
+	}
+
+	private void Validate(int checkpointId)
+	{
+		if (checkpointId < 1 || checkpointId > _depth)
+			throw new ArgumentOutOfRangeException(nameof(checkpointId), $"No active checkpoint {checkpointId} (depth {_depth})");
+	}
+}
@@ -0,0 +1,72 @@
+using System.Collections.Generic;
+
+namespace Morld;
+
+/// <summary>
+/// 체크포인트별 변경 전 값(pre-image) 보관 (copy-on-write)
+/// - Push: 새 체크포인트 레이어 시작 (O(1), 복사 없음)
+/// - Capture: 체크포인트 이후 처음 수정되는 키의 원래 값만 저장
+/// - Pop: 최상위 레이어를 꺼내 복원에 사용 (수정된 키만 되돌림)
+/// - Merge: 최상위 레이어를 아래 레이어에 합침 (체크포인트 해제)
+/// </summary>
+public class UndoLayers<TKey, TValue> where TKey : notnull
+{
+	private readonly List<Dictionary<TKey, (bool Present, TValue? Value)>> _layers = new();
+
+	/// <summary>
+	/// 활성 체크포인트 수
+	/// </summary>
+	public int Depth => _layers.Count;
+
+	/// <summary>
+	/// 이 키의 원래 값을 저장해야 하는지 (활성 체크포인트가 있고 아직 저장 전)
+	/// </summary>
+	public bool NeedsCapture(TKey key)
+	{
+		return _layers.Count > 0 && !_layers[^1].ContainsKey(key);
+	}
+
+	/// <summary>
+	/// 원래 값 저장 (present = false면 체크포인트 시점에 키가 없었음)
+	/// </summary>
+	public void Capture(TKey key, bool present, TValue? value)
+	{
+		_layers[^1][key] = (present, value);
+	}
+
+	public void Push()
+	{
+		_layers.Add(new Dictionary<TKey, (bool Present, TValue? Value)>());
+	}
+
+	/// <summary>
+	/// 최상위 레이어 꺼내기 (복원용)
+	/// </summary>
+	public Dictionary<TKey, (bool Present, TValue? Value)> Pop()
+	{
+		var top = _layers[^1];
+		_layers.RemoveAt(_layers.Count - 1);
+		return top;
+	}
+
+	/// <summary>
+	/// 최상위 레이어를 아래 레이어에 합침 (아래 레이어에 이미 있는 키는 더 오래된 값이므로 유지)
+	/// </summary>
+	public void Merge()
+	{
+		var top = Pop();
+		if (_layers.Count == 0)
+			return;
+
+		var below = _layers[^1];
+		foreach (var (key, preImage) in top)
+		{
+			below.TryAdd(key, preImage);
+		}
+	}
+
+	public void Clear()
+	{
+		_layers.Clear();
+	}
+}
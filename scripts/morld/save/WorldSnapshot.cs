@@ -0,0 +1,201 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using SE;
+
+namespace Morld;
+
+/// <summary>
+/// 월드 전체 스냅샷 (퀵세이브/퀵로드)
+/// 지형, 유닛(스케줄 스택 포함), 아이템, 인벤토리, 게임 시간, 플래그, 플레이어를
+/// 하나의 버전 있는 바이너리 파일로 저장 (포맷은 WorldSnapshotFormat 참고)
+///
+/// 각 시스템의 ExportToData / UpdateFromData를 그대로 사용하므로
+/// JSON 저장과 같은 내용을 담고, 디버깅용 JSON 내보내기도 지원
+/// </summary>
+public static class WorldSnapshot
+{
+	private static readonly LogCategory _log = Log.Category("WorldSnapshot");
+
+	/// <summary>
+	/// 월드 상태를 바이너리 스냅샷으로 저장
+	/// </summary>
+	/// <param name="path">저장 경로 (user:// 경로 가능)</param>
+	public static void Save(World world, string path)
+	{
+		var stopwatch = Stopwatch.StartNew();
+		var writer = new WorldSnapshotWriter();
+
+		var worldSystem = world.FindSystem("worldSystem") as WorldSystem;
+		var unitSystem = world.FindSystem("unitSystem") as UnitSystem;
+		var itemSystem = world.FindSystem("itemSystem") as ItemSystem;
+		var inventorySystem = world.FindSystem("inventorySystem") as InventorySystem;
+		var playerSystem = world.FindSystem("playerSystem") as PlayerSystem;
+		var scriptSystem = world.FindSystem("scriptSystem") as ScriptSystem;
+
+		if (worldSystem != null)
+		{
+			writer.AddTerrain(worldSystem.GetTerrain().ExportToData());
+			writer.AddTime(worldSystem.GetTime().ExportToData());
+		}
+		if (unitSystem != null)
+			writer.AddUnits(unitSystem.ExportToData());
+		if (itemSystem != null)
+			writer.AddItems(itemSystem.ExportToData());
+		if (inventorySystem != null)
+			writer.AddInventory(inventorySystem.ExportToData());
+		if (scriptSystem != null)
+			writer.AddFlags(scriptSystem.Flags.Flags);
+		if (playerSystem != null)
+			writer.AddPlayer(playerSystem.PlayerId);
+
+		// 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 스냅샷 유지)
+		var fullPath = GamePath.Globalize(path);
+		var tempPath = fullPath + ".tmp";
+		using (var stream = new FileStream(tempPath, FileMode.Create, System.IO.FileAccess.Write, FileShare.None, 1 << 16))
+		{
+			writer.WriteTo(stream);
+		}
+		File.Move(tempPath, fullPath, overwrite: true);
+
+		_log.Info($"저장됨: {path} ({stopwatch.Elapsed.TotalMilliseconds:F2} ms)");
+	}
+
+	/// <summary>
+	/// 바이너리 스냅샷에서 월드 상태 복원
+	/// 스냅샷에 없는 섹션은 현재 상태 유지
+	/// </summary>
+	/// <returns>로드 성공 여부</returns>
+	public static bool Load(World world, string path)
+	{
+		var fullPath = GamePath.Globalize(path);
+		if (!File.Exists(fullPath))
+		{
+			_log.Error($"파일 없음: {path}");
+			return false;
+		}
+
+		var stopwatch = Stopwatch.StartNew();
+		try
+		{
+			using var reader = new WorldSnapshotReader(fullPath);
+
+			var worldSystem = world.FindSystem("worldSystem") as WorldSystem;
+			var unitSystem = world.FindSystem("unitSystem") as UnitSystem;
+			var itemSystem = world.FindSystem("itemSystem") as ItemSystem;
+			var inventorySystem = world.FindSystem("inventorySystem") as InventorySystem;
+			var playerSystem = world.FindSystem("playerSystem") as PlayerSystem;
+			var scriptSystem = world.FindSystem("scriptSystem") as ScriptSystem;
+
+			if (worldSystem != null)
+			{
+				var terrain = reader.ReadTerrain();
+				if (terrain != null)
+					worldSystem.GetTerrain().UpdateFromData(terrain);
+
+				var time = reader.ReadTime();
+				if (time != null)
+					worldSystem.GetTime().UpdateFromData(time);
+			}
+
+			var units = reader.ReadUnits();
+			if (unitSystem != null && units != null)
+				unitSystem.UpdateFromData(units);
+
+			var items = reader.ReadItems();
+			if (itemSystem != null && items != null)
+				itemSystem.UpdateFromData(items);
+
+			var inventory = reader.ReadInventory();
+			if (inventorySystem != null && inventory != null)
+				inventorySystem.UpdateFromData(inventory);
+
+			var flags = reader.ReadFlags();
+			if (scriptSystem != null && flags != null)
+				scriptSystem.Flags.ReplaceAll(flags);
+
+			var playerId = reader.ReadPlayerId();
+			if (playerSystem != null && playerId != null)
+				playerSystem.PlayerId = playerId.Value;
+
+			// 유닛 태그에 이미 포함되어 있지만, 플래그 저장소 기준으로 다시 맞춤
+			if (scriptSystem != null && playerSystem != null)
+			{
+				var player = unitSystem?.GetUnit(playerSystem.PlayerId);
+				if (player != null)
+					scriptSystem.Flags.ApplyTo(player.TraversalContext);
+			}
+
+			playerSystem?.InvalidateRouteCache();
+		}
+		catch (Exception ex)
+		{
+			_log.Error($"로드 실패: {path} - {ex.Message}");
+			return false;
+		}
+
+		_log.Info($"로드됨: {path} ({stopwatch.Elapsed.TotalMilliseconds:F2} ms)");
+		return true;
+	}
+
+	/// <summary>
+	/// 바이너리 스냅샷을 사람이 읽을 수 있는 JSON으로 내보내기 (디버깅용)
+	/// </summary>
+	public static void ExportJson(string snapshotPath, string jsonPath)
+	{
+		using var reader = new WorldSnapshotReader(GamePath.Globalize(snapshotPath));
+
+		var data = new WorldSnapshotJsonData
+		{
+			Version = reader.Version,
+			Terrain = reader.ReadTerrain(),
+			Time = reader.ReadTime(),
+			Units = reader.ReadUnits(),
+			Items = reader.ReadItems(),
+			Inventory = reader.ReadInventory(),
+			Flags = reader.ReadFlags(),
+			PlayerId = reader.ReadPlayerId()
+		};
+
+		var options = new JsonSerializerOptions
+		{
+			WriteIndented = true,
+			DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
+		};
+
+		File.WriteAllText(GamePath.Globalize(jsonPath), JsonSerializer.Serialize(data, options));
+	}
+
+	/// <summary>
+	/// JSON 내보내기 포맷
+	/// </summary>
+	private class WorldSnapshotJsonData
+	{
+		[JsonPropertyName("version")]
+		public int Version { get; set; }
+
+		[JsonPropertyName("terrain")]
+		public TerrainJsonData? Terrain { get; set; }
+
+		[JsonPropertyName("time")]
+		public GameTimeJsonData? Time { get; set; }
+
+		[JsonPropertyName("units")]
+		public UnitJsonData[]? Units { get; set; }
+
+		[JsonPropertyName("items")]
+		public ItemJsonData[]? Items { get; set; }
+
+		[JsonPropertyName("inventory")]
+		public InventoryDataJson? Inventory { get; set; }
+
+		[JsonPropertyName("flags")]
+		public Dictionary<string, int>? Flags { get; set; }
+
+		[JsonPropertyName("playerId")]
+		public int? PlayerId { get; set; }
+	}
+}
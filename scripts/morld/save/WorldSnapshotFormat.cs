@@ -0,0 +1,59 @@
+namespace Morld;
+
+/// <summary>
+/// 월드 스냅샷 섹션 종류
+/// </summary>
+public enum SnapshotSectionId
+{
+	Terrain = 1,
+	Units = 2,
+	Items = 3,
+	Inventory = 4,
+	Time = 5,
+	Flags = 6,
+	Player = 7
+}
+
+/// <summary>
+/// 월드 스냅샷 바이너리 포맷 (리틀 엔디언)
+///
+/// [헤더 32바이트]
+///   magic "MRLD" | version i32 | sectionCount i32 | stringTableOffset i64 | stringCount i32 | reserved i64
+/// [섹션 디렉터리] sectionCount × 24바이트
+///   id i32 | tableCount i32 | offset i64 | length i64
+/// [섹션] 고정 폭 테이블의 나열, 마지막 테이블은 가변 데이터용 tail (폭 1)
+///   테이블 = count i32 | width i32 | cells i32[count × width]
+/// [문자열 테이블]
+///   offsets i32[stringCount + 1] (blob 기준 바이트 위치) | UTF-8 blob
+///
+/// 문자열은 모두 문자열 테이블 인덱스로 저장 (-1 = null)
+/// 가변 길이 값(태그, 외형, 스케줄 등)은 tail 위치로 저장 (-1 = 없음)
+/// </summary>
+public static class WorldSnapshotFormat
+{
+	public const uint Magic = 0x444C524D;  // "MRLD"
+	public const int Version = 1;
+
+	public const int HeaderSize = 32;
+	public const int DirectoryEntrySize = 24;
+
+	public const int NullRef = -1;
+
+	// 섹션별 테이블 인덱스/폭
+	public const int TerrainMetaTable = 0, TerrainMetaWidth = 1;
+	public const int TerrainRegionTable = 1, TerrainRegionWidth = 7;
+	public const int TerrainLocationTable = 2, TerrainLocationWidth = 3;
+	public const int TerrainEdgeTable = 3, TerrainEdgeWidth = 7;
+	public const int TerrainRegionEdgeTable = 4, TerrainRegionEdgeWidth = 11;
+
+	public const int UnitTable = 0, UnitWidth = 20;
+	public const int ItemTable = 0, ItemWidth = 7;
+	public const int InventoryOwnerTable = 0, InventoryOwnerWidth = 4;
+
+	public const int TimeCurrentTable = 0, TimeCurrentWidth = 5;
+	public const int TimeHolidayTable = 1, TimeHolidayWidth = 4;
+	public const int TimeCalendarTable = 2, TimeCalendarWidth = 2;
+
+	public const int FlagTable = 0, FlagWidth = 2;
+	public const int PlayerTable = 0, PlayerWidth = 1;
+}
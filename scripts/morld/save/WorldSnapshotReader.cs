@@ -0,0 +1,539 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Text;
+using SE;
+
+namespace Morld;
+
+/// <summary>
+/// 월드 스냅샷 바이너리 로더
+/// - 파일을 메모리 매핑하고 헤더/섹션 디렉터리만 먼저 읽음
+/// - 섹션은 요청될 때 JSON 데이터 객체로 변환 (지연 구체화)
+/// - 문자열은 처음 참조될 때 디코딩 후 캐시
+/// </summary>
+internal sealed class WorldSnapshotReader : IDisposable
+{
+	/// <summary>
+	/// 매핑된 고정 폭 테이블 뷰
+	/// </summary>
+	private readonly struct TableView
+	{
+		private readonly MemoryMappedViewAccessor _view;
+		private readonly long _start;
+		public readonly int Count;
+		public readonly int Width;
+
+		public TableView(MemoryMappedViewAccessor view, long start, int count, int width)
+		{
+			_view = view;
+			_start = start;
+			Count = count;
+			Width = width;
+		}
+
+		public int this[int row, int column] => _view.ReadInt32(_start + ((long)row * Width + column) * 4);
+
+		public int this[int index] => _view.ReadInt32(_start + (long)index * 4);
+
+		/// <summary>
+		/// 이 테이블 다음 위치 (count/width 헤더 포함)
+		/// </summary>
+		public long End => _start + (long)Count * Width * 4;
+	}
+
+	/// <summary>
+	/// 섹션 뷰 (테이블들 + tail)
+	/// </summary>
+	private readonly struct SectionView
+	{
+		private readonly TableView[] _tables;
+
+		public SectionView(TableView[] tables)
+		{
+			_tables = tables;
+		}
+
+		public TableView Table(int index) => _tables[index];
+
+		public TableView Tail => _tables[^1];
+	}
+
+	private readonly MemoryMappedFile _file;
+	private readonly MemoryMappedViewAccessor _view;
+	private readonly Dictionary<SnapshotSectionId, (int TableCount, long Offset)> _directory = new();
+	private readonly Dictionary<SnapshotSectionId, SectionView> _sections = new();
+
+	private readonly long _stringTableOffset;
+	private readonly int _stringCount;
+	private readonly string?[] _strings;
+
+	public int Version { get; }
+
+	public WorldSnapshotReader(string path)
+	{
+		var fileLength = new FileInfo(path).Length;
+		if (fileLength < WorldSnapshotFormat.HeaderSize)
+			throw new InvalidDataException($"Snapshot file too small: {path}");
+
+		_file = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+		_view = _file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+
+		try
+		{
+			if (_view.ReadUInt32(0) != WorldSnapshotFormat.Magic)
+				throw new InvalidDataException($"Not a world snapshot: {path}");
+
+			Version = _view.ReadInt32(4);
+			if (Version > WorldSnapshotFormat.Version)
+				throw new InvalidDataException($"Unsupported snapshot version {Version} (max {WorldSnapshotFormat.Version})");
+
+			int sectionCount = _view.ReadInt32(8);
+			_stringTableOffset = _view.ReadInt64(12);
+			_stringCount = _view.ReadInt32(20);
+			_strings = new string?[_stringCount];
+
+			for (int i = 0; i < sectionCount; i++)
+			{
+				long entry = WorldSnapshotFormat.HeaderSize + (long)i * WorldSnapshotFormat.DirectoryEntrySize;
+				var id = (SnapshotSectionId)_view.ReadInt32(entry);
+				int tableCount = _view.ReadInt32(entry + 4);
+				long offset = _view.ReadInt64(entry + 8);
+				_directory[id] = (tableCount, offset);
+			}
+		}
+		catch
+		{
+			Dispose();
+			throw;
+		}
+	}
+
+	public void Dispose()
+	{
+		_view.Dispose();
+		_file.Dispose();
+	}
+
+	public bool HasSection(SnapshotSectionId id) => _directory.ContainsKey(id);
+
+	// ===== 저수준 접근 =====
+
+	private bool TryGetSection(SnapshotSectionId id, out SectionView section)
+	{
+		if (_sections.TryGetValue(id, out section))
+			return true;
+
+		if (!_directory.TryGetValue(id, out var entry))
+			return false;
+
+		var tables = new TableView[entry.TableCount];
+		long position = entry.Offset;
+		for (int i = 0; i < tables.Length; i++)
+		{
+			int count = _view.ReadInt32(position);
+			int width = _view.ReadInt32(position + 4);
+			tables[i] = new TableView(_view, position + 8, count, width);
+			position = tables[i].End;
+		}
+
+		section = new SectionView(tables);
+		_sections[id] = section;
+		return true;
+	}
+
+	private string? Str(int index)
+	{
+		if (index < 0)
+			return null;
+		if (index >= _stringCount)
+			throw new InvalidDataException($"String index out of range: {index}");
+
+		var cached = _strings[index];
+		if (cached != null)
+			return cached;
+
+		long offsetTable = _stringTableOffset;
+		long blob = offsetTable + ((long)_stringCount + 1) * 4;
+		int start = _view.ReadInt32(offsetTable + (long)index * 4);
+		int end = _view.ReadInt32(offsetTable + ((long)index + 1) * 4);
+
+		var bytes = new byte[end - start];
+		_view.ReadArray(blob + start, bytes, 0, bytes.Length);
+		var value = Encoding.UTF8.GetString(bytes);
+		_strings[index] = value;
+		return value;
+	}
+
+	private Dictionary<string, int>? StrIntMap(TableView tail, int at)
+	{
+		if (at < 0)
+			return null;
+
+		int count = tail[at];
+		var map = new Dictionary<string, int>(count);
+		for (int i = 0; i < count; i++)
+			map[Str(tail[at + 1 + i * 2])!] = tail[at + 2 + i * 2];
+		return map;
+	}
+
+	private Dictionary<string, string>? StrStrMap(TableView tail, int at)
+	{
+		if (at < 0)
+			return null;
+
+		int count = tail[at];
+		var map = new Dictionary<string, string>(count);
+		for (int i = 0; i < count; i++)
+			map[Str(tail[at + 1 + i * 2])!] = Str(tail[at + 2 + i * 2]) ?? "";
+		return map;
+	}
+
+	private static Dictionary<int, int>? IntIntMap(TableView tail, int at)
+	{
+		if (at < 0)
+			return null;
+
+		int count = tail[at];
+		var map = new Dictionary<int, int>(count);
+		for (int i = 0; i < count; i++)
+			map[tail[at + 1 + i * 2]] = tail[at + 2 + i * 2];
+		return map;
+	}
+
+	private List<string>? StrList(TableView tail, int at)
+	{
+		if (at < 0)
+			return null;
+
+		int count = tail[at];
+		var list = new List<string>(count);
+		for (int i = 0; i < count; i++)
+			list.Add(Str(tail[at + 1 + i])!);
+		return list;
+	}
+
+	private static List<int>? IntList(TableView tail, int at)
+	{
+		if (at < 0)
+			return null;
+
+		int count = tail[at];
+		var list = new List<int>(count);
+		for (int i = 0; i < count; i++)
+			list.Add(tail[at + 1 + i]);
+		return list;
+	}
+
+	// ===== 섹션 구체화 =====
+
+	public TerrainJsonData? ReadTerrain()
+	{
+		if (!TryGetSection(SnapshotSectionId.Terrain, out var section))
+			return null;
+
+		var tail = section.Tail;
+		var meta = section.Table(WorldSnapshotFormat.TerrainMetaTable);
+		var regions = section.Table(WorldSnapshotFormat.TerrainRegionTable);
+		var locations = section.Table(WorldSnapshotFormat.TerrainLocationTable);
+		var edges = section.Table(WorldSnapshotFormat.TerrainEdgeTable);
+		var regionEdges = section.Table(WorldSnapshotFormat.TerrainRegionEdgeTable);
+
+		var data = new TerrainJsonData { Name = Str(meta[0, 0]) ?? "unknown" };
+
+		for (int r = 0; r < regions.Count; r++)
+		{
+			var region = new RegionJsonData
+			{
+				Id = regions[r, 0],
+				Name = Str(regions[r, 1]) ?? "unknown",
+				Appearance = StrStrMap(tail, regions[r, 2])
+			};
+
+			int locationStart = regions[r, 3];
+			int locationCount = regions[r, 4];
+			region.Locations.Capacity = locationCount;
+			for (int l = locationStart; l < locationStart + locationCount; l++)
+			{
+				region.Locations.Add(new LocationJsonData
+				{
+					Id = locations[l, 0],
+					Name = Str(locations[l, 1]) ?? "unknown",
+					Appearance = StrStrMap(tail, locations[l, 2])
+				});
+			}
+
+			int edgeStart = regions[r, 5];
+			int edgeCount = regions[r, 6];
+			region.Edges.Capacity = edgeCount;
+			for (int e = edgeStart; e < edgeStart + edgeCount; e++)
+			{
+				region.Edges.Add(new EdgeJsonData
+				{
+					A = edges[e, 0],
+					B = edges[e, 1],
+					TimeAtoB = edges[e, 2],
+					TimeBtoA = edges[e, 3],
+					ConditionsAtoB = StrIntMap(tail, edges[e, 4]),
+					ConditionsBtoA = StrIntMap(tail, edges[e, 5]),
+					IsBlocked = edges[e, 6] != 0
+				});
+			}
+
+			data.Regions.Add(region);
+		}
+
+		for (int e = 0; e < regionEdges.Count; e++)
+		{
+			data.RegionEdges.Add(new RegionEdgeJsonData
+			{
+				Id = regionEdges[e, 0],
+				Name = Str(regionEdges[e, 1]) ?? "unknown",
+				RegionA = regionEdges[e, 2],
+				LocalA = regionEdges[e, 3],
+				RegionB = regionEdges[e, 4],
+				LocalB = regionEdges[e, 5],
+				TimeAtoB = regionEdges[e, 6],
+				TimeBtoA = regionEdges[e, 7],
+				ConditionsAtoB = StrIntMap(tail, regionEdges[e, 8]),
+				ConditionsBtoA = StrIntMap(tail, regionEdges[e, 9]),
+				IsBlocked = regionEdges[e, 10] != 0
+			});
+		}
+
+		return data;
+	}
+
+	public int UnitCount =>
+		TryGetSection(SnapshotSectionId.Units, out var section) ? section.Table(WorldSnapshotFormat.UnitTable).Count : 0;
+
+	public UnitJsonData[]? ReadUnits()
+	{
+		if (!TryGetSection(SnapshotSectionId.Units, out var section))
+			return null;
+
+		var rows = section.Table(WorldSnapshotFormat.UnitTable);
+		var result = new UnitJsonData[rows.Count];
+		for (int i = 0; i < rows.Count; i++)
+			result[i] = ReadUnitRow(rows, section.Tail, i);
+		return result;
+	}
+
+	/// <summary>
+	/// 유닛 하나만 읽기 (id 순 정렬된 레코드에서 이진 탐색)
+	/// </summary>
+	public UnitJsonData? ReadUnit(int unitId)
+	{
+		if (!TryGetSection(SnapshotSectionId.Units, out var section))
+			return null;
+
+		var rows = section.Table(WorldSnapshotFormat.UnitTable);
+		int lo = 0, hi = rows.Count - 1;
+		while (lo <= hi)
+		{
+			int mid = (lo + hi) >> 1;
+			int id = rows[mid, 0];
+			if (id == unitId)
+				return ReadUnitRow(rows, section.Tail, mid);
+			if (id < unitId)
+				lo = mid + 1;
+			else
+				hi = mid - 1;
+		}
+		return null;
+	}
+
+	private UnitJsonData ReadUnitRow(TableView rows, TableView tail, int row)
+	{
+		var unit = new UnitJsonData
+		{
+			Id = rows[row, 0],
+			Name = Str(rows[row, 1]) ?? string.Empty,
+			Comment = Str(rows[row, 2]),
+			RegionId = rows[row, 3],
+			LocationId = rows[row, 4],
+			Type = Str(rows[row, 5]) ?? "male",
+			Tags = StrIntMap(tail, rows[row, 6]),
+			Inventory = IntIntMap(tail, rows[row, 7]),
+			EquippedItems = IntList(tail, rows[row, 8]),
+			Actions = StrList(tail, rows[row, 9]),
+			Appearance = StrStrMap(tail, rows[row, 10]),
+			Mood = StrList(tail, rows[row, 11]),
+			ScheduleStack = ReadScheduleStack(tail, rows[row, 12])
+		};
+
+		if (rows[row, 13] != 0)
+		{
+			unit.CurrentEdge = new EdgeProgressJsonData
+			{
+				FromRegionId = rows[row, 14],
+				FromLocalId = rows[row, 15],
+				ToRegionId = rows[row, 16],
+				ToLocalId = rows[row, 17],
+				TotalTime = rows[row, 18],
+				ElapsedTime = rows[row, 19]
+			};
+		}
+
+		return unit;
+	}
+
+	private ScheduleLayerJsonData[] ReadScheduleStack(TableView tail, int at)
+	{
+		if (at < 0)
+			return [];
+
+		int layerCount = tail[at++];
+		var layers = new ScheduleLayerJsonData[layerCount];
+		for (int i = 0; i < layerCount; i++)
+		{
+			var layer = new ScheduleLayerJsonData
+			{
+				Name = Str(tail[at]) ?? string.Empty,
+				EndConditionType = Str(tail[at + 1]),
+				EndConditionParam = Str(tail[at + 2])
+			};
+			int entryCount = tail[at + 3];
+			at += 4;
+
+			if (entryCount >= 0)
+			{
+				layer.Schedule = new ScheduleEntryJsonData[entryCount];
+				for (int e = 0; e < entryCount; e++)
+				{
+					layer.Schedule[e] = new ScheduleEntryJsonData
+					{
+						Name = Str(tail[at]) ?? string.Empty,
+						RegionId = tail[at + 1],
+						LocationId = tail[at + 2],
+						Start = tail[at + 3],
+						End = tail[at + 4],
+						Activity = Str(tail[at + 5])
+					};
+					at += 6;
+				}
+			}
+
+			layers[i] = layer;
+		}
+		return layers;
+	}
+
+	public ItemJsonData[]? ReadItems()
+	{
+		if (!TryGetSection(SnapshotSectionId.Items, out var section))
+			return null;
+
+		var rows = section.Table(WorldSnapshotFormat.ItemTable);
+		var tail = section.Tail;
+		var result = new ItemJsonData[rows.Count];
+		for (int i = 0; i < rows.Count; i++)
+		{
+			result[i] = new ItemJsonData
+			{
+				Id = rows[i, 0],
+				Name = Str(rows[i, 1]) ?? string.Empty,
+				Comment = Str(rows[i, 2]),
+				PassiveTags = StrIntMap(tail, rows[i, 3]),
+				EquipTags = StrIntMap(tail, rows[i, 4]),
+				Value = rows[i, 5],
+				Actions = StrList(tail, rows[i, 6])
+			};
+		}
+		return result;
+	}
+
+	public InventoryDataJson? ReadInventory()
+	{
+		if (!TryGetSection(SnapshotSectionId.Inventory, out var section))
+			return null;
+
+		var rows = section.Table(WorldSnapshotFormat.InventoryOwnerTable);
+		var tail = section.Tail;
+		var data = new InventoryDataJson
+		{
+			Inventories = new Dictionary<string, Dictionary<int, int>>(),
+			EquippedItems = new Dictionary<string, List<int>>(),
+			Visibility = new Dictionary<string, bool>()
+		};
+
+		for (int i = 0; i < rows.Count; i++)
+		{
+			var owner = Str(rows[i, 0])!;
+
+			var inventory = IntIntMap(tail, rows[i, 1]);
+			if (inventory != null)
+				data.Inventories[owner] = inventory;
+
+			var equipped = IntList(tail, rows[i, 2]);
+			if (equipped != null)
+				data.EquippedItems[owner] = equipped;
+
+			if (rows[i, 3] != 0)
+				data.Visibility[owner] = true;
+		}
+		return data;
+	}
+
+	public GameTimeJsonData? ReadTime()
+	{
+		if (!TryGetSection(SnapshotSectionId.Time, out var section))
+			return null;
+
+		var tail = section.Tail;
+		var current = section.Table(WorldSnapshotFormat.TimeCurrentTable);
+		var holidays = section.Table(WorldSnapshotFormat.TimeHolidayTable);
+		var calendar = section.Table(WorldSnapshotFormat.TimeCalendarTable);
+
+		var data = new GameTimeJsonData
+		{
+			Calendar = new CalendarConfig
+			{
+				DaysPerMonth = IntList(tail, calendar[0, 0])?.ToArray() ?? [],
+				WeekdayNames = StrList(tail, calendar[0, 1])?.ToArray() ?? []
+			},
+			CurrentTime = new CurrentTimeData
+			{
+				Year = current[0, 0],
+				Month = current[0, 1],
+				Day = current[0, 2],
+				Hour = current[0, 3],
+				Minute = current[0, 4]
+			},
+			Holidays = new HolidayData[holidays.Count]
+		};
+
+		for (int i = 0; i < holidays.Count; i++)
+		{
+			data.Holidays[i] = new HolidayData
+			{
+				Name = Str(holidays[i, 0]) ?? string.Empty,
+				Month = holidays[i, 1],
+				StartDay = holidays[i, 2],
+				EndDay = holidays[i, 3]
+			};
+		}
+		return data;
+	}
+
+	public Dictionary<string, int>? ReadFlags()
+	{
+		if (!TryGetSection(SnapshotSectionId.Flags, out var section))
+			return null;
+
+		var rows = section.Table(WorldSnapshotFormat.FlagTable);
+		var flags = new Dictionary<string, int>(rows.Count);
+		for (int i = 0; i < rows.Count; i++)
+			flags[Str(rows[i, 0])!] = rows[i, 1];
+		return flags;
+	}
+
+	public int? ReadPlayerId()
+	{
+		if (!TryGetSection(SnapshotSectionId.Player, out var section))
+			return null;
+
+		return section.Table(WorldSnapshotFormat.PlayerTable)[0, 0];
+	}
+}
@@ -0,0 +1,450 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Runtime.InteropServices;
+using System.Text;
+using SE;
+
+namespace Morld;
+
+/// <summary>
+/// 월드 스냅샷 바이너리 작성기
+/// 시스템별 JSON 데이터 객체(ExportToData 결과)를 고정 폭 레코드로 기록
+/// 포맷은 WorldSnapshotFormat 참고
+/// </summary>
+internal class WorldSnapshotWriter
+{
+	/// <summary>
+	/// 고정 폭 테이블 (셀은 모두 i32)
+	/// </summary>
+	private class Table
+	{
+		public readonly int Width;
+		public readonly List<int> Cells = new();
+
+		public Table(int width)
+		{
+			Width = width;
+		}
+
+		public int Count => Cells.Count / Width;
+	}
+
+	/// <summary>
+	/// 섹션 = 고정 폭 테이블들 + 가변 데이터 tail
+	/// </summary>
+	private class Section
+	{
+		public readonly SnapshotSectionId Id;
+		public readonly List<Table> Tables = new();
+		public readonly List<int> Tail = new();
+
+		public Section(SnapshotSectionId id, params int[] widths)
+		{
+			Id = id;
+			foreach (var width in widths)
+				Tables.Add(new Table(width));
+		}
+
+		public List<int> this[int table] => Tables[table].Cells;
+	}
+
+	private readonly List<Section> _sections = new();
+	private readonly Dictionary<string, int> _stringIndex = new();
+	private readonly List<string> _strings = new();
+
+	// ===== 문자열 / tail 인코딩 =====
+
+	private int Str(string? value)
+	{
+		if (value == null)
+			return WorldSnapshotFormat.NullRef;
+
+		if (!_stringIndex.TryGetValue(value, out var index))
+		{
+			index = _strings.Count;
+			_strings.Add(value);
+			_stringIndex[value] = index;
+		}
+		return index;
+	}
+
+	private int StrIntMap(Section section, IReadOnlyDictionary<string, int>? map)
+	{
+		if (map == null)
+			return WorldSnapshotFormat.NullRef;
+
+		var tail = section.Tail;
+		int start = tail.Count;
+		tail.Add(map.Count);
+		foreach (var (key, value) in map)
+		{
+			tail.Add(Str(key));
+			tail.Add(value);
+		}
+		return start;
+	}
+
+	private int StrStrMap(Section section, IReadOnlyDictionary<string, string>? map)
+	{
+		if (map == null)
+			return WorldSnapshotFormat.NullRef;
+
+		var tail = section.Tail;
+		int start = tail.Count;
+		tail.Add(map.Count);
+		foreach (var (key, value) in map)
+		{
+			tail.Add(Str(key));
+			tail.Add(Str(value));
+		}
+		return start;
+	}
+
+	private static int IntIntMap(Section section, IReadOnlyDictionary<int, int>? map)
+	{
+		if (map == null)
+			return WorldSnapshotFormat.NullRef;
+
+		var tail = section.Tail;
+		int start = tail.Count;
+		tail.Add(map.Count);
+		foreach (var (key, value) in map)
+		{
+			tail.Add(key);
+			tail.Add(value);
+		}
+		return start;
+	}
+
+	private int StrList(Section section, IReadOnlyCollection<string>? list)
+	{
+		if (list == null)
+			return WorldSnapshotFormat.NullRef;
+
+		var tail = section.Tail;
+		int start = tail.Count;
+		tail.Add(list.Count);
+		foreach (var value in list)
+			tail.Add(Str(value));
+		return start;
+	}
+
+	private static int IntList(Section section, IReadOnlyCollection<int>? list)
+	{
+		if (list == null)
+			return WorldSnapshotFormat.NullRef;
+
+		var tail = section.Tail;
+		int start = tail.Count;
+		tail.Add(list.Count);
+		tail.AddRange(list);
+		return start;
+	}
+
+	// ===== 섹션 작성 =====
+
+	public void AddTerrain(TerrainJsonData data)
+	{
+		var section = new Section(SnapshotSectionId.Terrain,
+			WorldSnapshotFormat.TerrainMetaWidth,
+			WorldSnapshotFormat.TerrainRegionWidth,
+			WorldSnapshotFormat.TerrainLocationWidth,
+			WorldSnapshotFormat.TerrainEdgeWidth,
+			WorldSnapshotFormat.TerrainRegionEdgeWidth);
+
+		section[WorldSnapshotFormat.TerrainMetaTable].Add(Str(data.Name));
+
+		var regions = section[WorldSnapshotFormat.TerrainRegionTable];
+		var locations = section[WorldSnapshotFormat.TerrainLocationTable];
+		var edges = section[WorldSnapshotFormat.TerrainEdgeTable];
+
+		foreach (var region in data.Regions)
+		{
+			int locationStart = locations.Count / WorldSnapshotFormat.TerrainLocationWidth;
+			foreach (var location in region.Locations)
+			{
+				locations.Add(location.Id);
+				locations.Add(Str(location.Name));
+				locations.Add(StrStrMap(section, location.Appearance));
+			}
+
+			int edgeStart = edges.Count / WorldSnapshotFormat.TerrainEdgeWidth;
+			foreach (var edge in region.Edges)
+			{
+				edges.Add(edge.A);
+				edges.Add(edge.B);
+				edges.Add(edge.TimeAtoB);
+				edges.Add(edge.TimeBtoA);
+				edges.Add(StrIntMap(section, edge.ConditionsAtoB));
+				edges.Add(StrIntMap(section, edge.ConditionsBtoA));
+				edges.Add(edge.IsBlocked ? 1 : 0);
+			}
+
+			regions.Add(region.Id);
+			regions.Add(Str(region.Name));
+			regions.Add(StrStrMap(section, region.Appearance));
+			regions.Add(locationStart);
+			regions.Add(region.Locations.Count);
+			regions.Add(edgeStart);
+			regions.Add(region.Edges.Count);
+		}
+
+		var regionEdges = section[WorldSnapshotFormat.TerrainRegionEdgeTable];
+		foreach (var edge in data.RegionEdges)
+		{
+			regionEdges.Add(edge.Id);
+			regionEdges.Add(Str(edge.Name));
+			regionEdges.Add(edge.RegionA);
+			regionEdges.Add(edge.LocalA);
+			regionEdges.Add(edge.RegionB);
+			regionEdges.Add(edge.LocalB);
+			regionEdges.Add(edge.TimeAtoB);
+			regionEdges.Add(edge.TimeBtoA);
+			regionEdges.Add(StrIntMap(section, edge.ConditionsAtoB));
+			regionEdges.Add(StrIntMap(section, edge.ConditionsBtoA));
+			regionEdges.Add(edge.IsBlocked ? 1 : 0);
+		}
+
+		_sections.Add(section);
+	}
+
+	/// <summary>
+	/// 유닛 섹션 (id 순 정렬 - 로더가 이진 탐색으로 개별 유닛을 읽을 수 있음)
+	/// </summary>
+	public void AddUnits(UnitJsonData[] units)
+	{
+		var section = new Section(SnapshotSectionId.Units, WorldSnapshotFormat.UnitWidth);
+		var rows = section[WorldSnapshotFormat.UnitTable];
+
+		foreach (var unit in units.OrderBy(u => u.Id))
+		{
+			rows.Add(unit.Id);
+			rows.Add(Str(unit.Name));
+			rows.Add(Str(unit.Comment));
+			rows.Add(unit.RegionId);
+			rows.Add(unit.LocationId);
+			rows.Add(Str(unit.Type));
+			rows.Add(StrIntMap(section, unit.Tags));
+			rows.Add(IntIntMap(section, unit.Inventory));
+			rows.Add(IntList(section, unit.EquippedItems));
+			rows.Add(StrList(section, unit.Actions));
+			rows.Add(StrStrMap(section, unit.Appearance));
+			rows.Add(StrList(section, unit.Mood));
+			rows.Add(ScheduleStack(section, unit.ScheduleStack));
+
+			var edge = unit.CurrentEdge;
+			rows.Add(edge != null ? 1 : 0);
+			rows.Add(edge?.FromRegionId ?? 0);
+			rows.Add(edge?.FromLocalId ?? 0);
+			rows.Add(edge?.ToRegionId ?? 0);
+			rows.Add(edge?.ToLocalId ?? 0);
+			rows.Add(edge?.TotalTime ?? 0);
+			rows.Add(edge?.ElapsedTime ?? 0);
+		}
+
+		_sections.Add(section);
+	}
+
+	/// <summary>
+	/// 스케줄 스택: [layerCount, (name, endType, endParam, entryCount, (name, region, local, start, end, activity)*)*]
+	/// entryCount -1 = 시간 기반 스케줄 없음
+	/// </summary>
+	private int ScheduleStack(Section section, ScheduleLayerJsonData[] layers)
+	{
+		var tail = section.Tail;
+		int start = tail.Count;
+		tail.Add(layers.Length);
+		foreach (var layer in layers)
+		{
+			tail.Add(Str(layer.Name));
+			tail.Add(Str(layer.EndConditionType));
+			tail.Add(Str(layer.EndConditionParam));
+
+			if (layer.Schedule == null)
+			{
+				tail.Add(WorldSnapshotFormat.NullRef);
+				continue;
+			}
+
+			tail.Add(layer.Schedule.Length);
+			foreach (var entry in layer.Schedule)
+			{
+				tail.Add(Str(entry.Name));
+				tail.Add(entry.RegionId);
+				tail.Add(entry.LocationId);
+				tail.Add(entry.Start);
+				tail.Add(entry.End);
+				tail.Add(Str(entry.Activity));
+			}
+		}
+		return start;
+	}
+
+	public void AddItems(ItemJsonData[] items)
+	{
+		var section = new Section(SnapshotSectionId.Items, WorldSnapshotFormat.ItemWidth);
+		var rows = section[WorldSnapshotFormat.ItemTable];
+
+		foreach (var item in items.OrderBy(i => i.Id))
+		{
+			rows.Add(item.Id);
+			rows.Add(Str(item.Name));
+			rows.Add(Str(item.Comment));
+			rows.Add(StrIntMap(section, item.PassiveTags));
+			rows.Add(StrIntMap(section, item.EquipTags));
+			rows.Add(item.Value);
+			rows.Add(StrList(section, item.Actions));
+		}
+
+		_sections.Add(section);
+	}
+
+	internal void AddInventory(InventoryDataJson data)
+	{
+		var section = new Section(SnapshotSectionId.Inventory, WorldSnapshotFormat.InventoryOwnerWidth);
+		var rows = section[WorldSnapshotFormat.InventoryOwnerTable];
+
+		var owners = new SortedSet<string>(StringComparer.Ordinal);
+		if (data.Inventories != null) owners.UnionWith(data.Inventories.Keys);
+		if (data.EquippedItems != null) owners.UnionWith(data.EquippedItems.Keys);
+		if (data.Visibility != null) owners.UnionWith(data.Visibility.Keys);
+
+		foreach (var owner in owners)
+		{
+			Dictionary<int, int>? inventory = null;
+			List<int>? equipped = null;
+			bool visible = false;
+			data.Inventories?.TryGetValue(owner, out inventory);
+			data.EquippedItems?.TryGetValue(owner, out equipped);
+			data.Visibility?.TryGetValue(owner, out visible);
+
+			rows.Add(Str(owner));
+			rows.Add(IntIntMap(section, inventory));
+			rows.Add(IntList(section, equipped));
+			rows.Add(visible ? 1 : 0);
+		}
+
+		_sections.Add(section);
+	}
+
+	internal void AddTime(GameTimeJsonData data)
+	{
+		var section = new Section(SnapshotSectionId.Time,
+			WorldSnapshotFormat.TimeCurrentWidth,
+			WorldSnapshotFormat.TimeHolidayWidth,
+			WorldSnapshotFormat.TimeCalendarWidth);
+
+		var current = section[WorldSnapshotFormat.TimeCurrentTable];
+		current.Add(data.CurrentTime.Year);
+		current.Add(data.CurrentTime.Month);
+		current.Add(data.CurrentTime.Day);
+		current.Add(data.CurrentTime.Hour);
+		current.Add(data.CurrentTime.Minute);
+
+		var holidays = section[WorldSnapshotFormat.TimeHolidayTable];
+		foreach (var holiday in data.Holidays)
+		{
+			holidays.Add(Str(holiday.Name));
+			holidays.Add(holiday.Month);
+			holidays.Add(holiday.StartDay);
+			holidays.Add(holiday.EndDay);
+		}
+
+		var calendar = section[WorldSnapshotFormat.TimeCalendarTable];
+		calendar.Add(IntList(section, data.Calendar.DaysPerMonth));
+		calendar.Add(StrList(section, data.Calendar.WeekdayNames));
+
+		_sections.Add(section);
+	}
+
+	public void AddFlags(IReadOnlyDictionary<string, int> flags)
+	{
+		var section = new Section(SnapshotSectionId.Flags, WorldSnapshotFormat.FlagWidth);
+		var rows = section[WorldSnapshotFormat.FlagTable];
+
+		foreach (var (name, value) in flags)
+		{
+			rows.Add(Str(name));
+			rows.Add(value);
+		}
+
+		_sections.Add(section);
+	}
+
+	public void AddPlayer(int playerId)
+	{
+		var section = new Section(SnapshotSectionId.Player, WorldSnapshotFormat.PlayerWidth);
+		section[WorldSnapshotFormat.PlayerTable].Add(playerId);
+		_sections.Add(section);
+	}
+
+	// ===== 파일 기록 =====
+
+	public void WriteTo(Stream stream)
+	{
+		using var writer = new BinaryWriter(stream, Encoding.UTF8, leaveOpen: true);
+
+		// 섹션 위치 계산 (테이블마다 count/width 헤더 8바이트 + 셀)
+		long offset = WorldSnapshotFormat.HeaderSize + (long)_sections.Count * WorldSnapshotFormat.DirectoryEntrySize;
+		var offsets = new long[_sections.Count];
+		var lengths = new long[_sections.Count];
+		for (int i = 0; i < _sections.Count; i++)
+		{
+			long length = 0;
+			foreach (var table in _sections[i].Tables)
+				length += 8 + (long)table.Cells.Count * 4;
+			length += 8 + (long)_sections[i].Tail.Count * 4;
+
+			offsets[i] = offset;
+			lengths[i] = length;
+			offset += length;
+		}
+
+		// 헤더
+		writer.Write(WorldSnapshotFormat.Magic);
+		writer.Write(WorldSnapshotFormat.Version);
+		writer.Write(_sections.Count);
+		writer.Write(offset);           // 문자열 테이블 위치
+		writer.Write(_strings.Count);
+		writer.Write(0L);               // reserved
+
+		// 섹션 디렉터리
+		for (int i = 0; i < _sections.Count; i++)
+		{
+			writer.Write((int)_sections[i].Id);
+			writer.Write(_sections[i].Tables.Count + 1);  // tail 포함
+			writer.Write(offsets[i]);
+			writer.Write(lengths[i]);
+		}
+
+		// 섹션 본문
+		foreach (var section in _sections)
+		{
+			foreach (var table in section.Tables)
+				WriteTable(writer, table.Count, table.Width, table.Cells);
+			WriteTable(writer, section.Tail.Count, 1, section.Tail);
+		}
+
+		// 문자열 테이블
+		var encoded = new byte[_strings.Count][];
+		int blobOffset = 0;
+		for (int i = 0; i < _strings.Count; i++)
+		{
+			encoded[i] = Encoding.UTF8.GetBytes(_strings[i]);
+			writer.Write(blobOffset);
+			blobOffset += encoded[i].Length;
+		}
+		writer.Write(blobOffset);
+		foreach (var bytes in encoded)
+			writer.Write(bytes);
+	}
+
+	private static void WriteTable(BinaryWriter writer, int count, int width, List<int> cells)
+	{
+		writer.Write(count);
+		writer.Write(width);
+		writer.Write(MemoryMarshal.AsBytes(CollectionsMarshal.AsSpan(cells)));
+	}
+}
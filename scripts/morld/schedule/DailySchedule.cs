@@ -55,7 +55,12 @@ public class DailySchedule
 	/// </summary>
 	public ScheduleEntry? GetCurrentEntry(GameTime time)
 	{
-		return _entries.FirstOrDefault(e => e.IsActive(time));
+		foreach (var entry in _entries)
+		{
+			if (entry.IsActive(time))
+				return entry;
+		}
+		return null;
 	}
 
 	/// <summary>
@@ -63,7 +68,13 @@ public class DailySchedule
 	/// </summary>
 	public ScheduleEntry? GetEntryAt(int minuteOfDay)
 	{
-		return _entries.FirstOrDefault(e => e.TimeRange.Contains(minuteOfDay));
+		// 매 Step 유닛마다 호출되므로 람다 캡처 없이 순회 (할당 없음)
+		foreach (var entry in _entries)
+		{
+			if (entry.TimeRange.Contains(minuteOfDay))
+				return entry;
+		}
+		return null;
 	}
 
 	/// <summary>
@@ -71,7 +82,12 @@ public class DailySchedule
 	/// </summary>
 	public ScheduleEntry? GetStartingEntry(GameTime time)
 	{
-		return _entries.FirstOrDefault(e => e.IsStartTime(time));
+		foreach (var entry in _entries)
+		{
+			if (entry.IsStartTime(time))
+				return entry;
+		}
+		return null;
 	}
 
 	/// <summary>
@@ -4,7 +4,6 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Text.Json;
-using Godot;
 
 /// <summary>
 /// 게임 시간 시스템 (설정 가능한 달력 지원)
@@ -12,8 +11,10 @@ using Godot;
 /// - 기념일 시스템
 /// - 시간 조작: 년/월/일/시간/분
 /// </summary>
-public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
+public class GameTime : IComparable<GameTime>, IEquatable<GameTime>, ICheckpointable
 {
+    private static readonly LogCategory _log = Log.Category("GameTime");
+
     public const int MinutesPerHour = 60;
     public const int HoursPerDay = 24;
     public const int MinutesPerDay = MinutesPerHour * HoursPerDay; // 1440분
@@ -23,12 +24,31 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     private static string[] _weekdayNames = ["일", "월", "화", "수", "목", "금", "토"];
     private static List<Holiday> _holidays = new();
 
+    // 달력 캐시 (달력/기념일 변경 시 RebuildCalendarCache()로 재생성)
+    private static int _daysPerYear;
+    private static int[] _cumulativeDays = [];          // [m] = m월 이전까지의 일 수 (0 ~ MonthsPerYear)
+    private static int[] _monthByDayOfYear = [];        // [dayOfYear] = 월 (1부터)
+    private static Holiday[][] _holidaysByDayOfYear = [];  // [dayOfYear] = 해당 날짜의 기념일
+
+    static GameTime()
+    {
+        RebuildCalendarCache();
+    }
+
     // 현재 시간 상태
+    // _absoluteMinute이 기준 값이고, 나머지는 조회용으로 미리 계산해둔 값
+    private long _absoluteMinute;  // 1년 1월 1일 00:00부터 경과 분
     private int _year;
     private int _month;
     private int _day;
     private int _minuteOfDay;  // 하루 중 경과 분 (0~1439), hour/minute 통합
 
+    // GetCurrentTags 캐시 (시간대/월/기념일 배열이 같으면 재사용)
+    private HashSet<string>? _currentTags;
+    private int _currentTagsBand;
+    private int _currentTagsMonth;
+    private Holiday[]? _currentTagsHolidays;
+
     /// <summary>
     /// 년 (1부터 시작)
     /// </summary>
@@ -62,8 +82,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
         get
         {
             // 1년 1월 1일을 기준 요일로 계산
-            int totalDays = GetTotalDays(_year, _month, Day);
-            return totalDays % _weekdayNames.Length;
+            return (int)(_absoluteMinute / MinutesPerDay % _weekdayNames.Length);
         }
     }
 
@@ -77,6 +96,11 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public int MinuteOfDay => _minuteOfDay;
 
+    /// <summary>
+    /// 1년 1월 1일 00:00부터 경과 분 (세이브/시간 계산용)
+    /// </summary>
+    public long AbsoluteMinute => _absoluteMinute;
+
     /// <summary>
     /// 1년의 개월 수
     /// </summary>
@@ -97,10 +121,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public GameTime()
     {
-        _year = 1;
-        _month = 1;
-        _day = 1;
-        _minuteOfDay = 0;  // 00:00
+        SetAbsoluteMinute(0);  // 1년 1월 1일 00:00
     }
 
     /// <summary>
@@ -124,37 +145,45 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
         if (hour < 0 || hour > 23) throw new ArgumentException("Hour must be 0-23");
         if (minute < 0 || minute > 59) throw new ArgumentException("Minute must be 0-59");
 
-        _year = year;
-        _month = month;
-        _day = day;
-        _minuteOfDay = hour * MinutesPerHour + minute;
+        SetAbsoluteMinute(ToAbsoluteMinute(year, month, day, hour * MinutesPerHour + minute));
     }
 
     /// <summary>
-    /// 분 추가 (O(1) 구현 - _minuteOfDay 기반)
+    /// 절대 분으로 시간 설정 (O(1))
     /// </summary>
-    public void AddMinutes(int minutes)
+    public void SetAbsoluteMinute(long absoluteMinute)
     {
-        if (minutes == 0) return;
+        if (absoluteMinute < 0) throw new InvalidOperationException("Year cannot be less than 1");
 
-        _minuteOfDay += minutes;
+        _absoluteMinute = absoluteMinute;
+        DecomposeAbsoluteMinute(absoluteMinute, out _year, out _month, out _day, out _minuteOfDay);
+    }
 
-        // 날짜 경계 처리 (하루 이상 증가)
-        if (_minuteOfDay >= MinutesPerDay)
-        {
-            int days = _minuteOfDay / MinutesPerDay;
-            _minuteOfDay = _minuteOfDay % MinutesPerDay;
-            AddDays(days);
-        }
-        // 날짜 역행 (음수)
-        else if (_minuteOfDay < 0)
-        {
-            int days = (_minuteOfDay / MinutesPerDay) - 1;  // 음수 나누기는 내림이 아니므로 -1
-            _minuteOfDay = _minuteOfDay % MinutesPerDay;
-            if (_minuteOfDay < 0)
-                _minuteOfDay += MinutesPerDay;
-            AddDays(days);
-        }
+    /// <summary>
+    /// 절대 분으로 GameTime 생성
+    /// </summary>
+    public static GameTime FromAbsoluteMinute(long absoluteMinute)
+    {
+        var time = new GameTime();
+        time.SetAbsoluteMinute(absoluteMinute);
+        return time;
+    }
+
+    /// <summary>
+    /// 분 추가 (O(1) 구현 - 절대 분 기반)
+    /// </summary>
+    public void AddMinutes(int minutes)
+    {
+        AddMinutes((long)minutes);
+    }
+
+    /// <summary>
+    /// 분 추가 (장기간 빨리감기용)
+    /// </summary>
+    public void AddMinutes(long minutes)
+    {
+        if (minutes == 0) return;
+        SetAbsoluteMinute(_absoluteMinute + minutes);
     }
 
     /// <summary>
@@ -171,31 +200,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     public void AddDays(int days)
     {
         if (days == 0) return;
-
-        _day += days;
-
-        // 날짜 정규화
-        while (_day > GetDaysInMonth(_year, _month))
-        {
-            _day -= GetDaysInMonth(_year, _month);
-            _month++;
-            if (_month > MonthsPerYear)
-            {
-                _month = 1;
-                _year++;
-            }
-        }
-        while (_day < 1)
-        {
-            _month--;
-            if (_month < 1)
-            {
-                _month = MonthsPerYear;
-                _year--;
-                if (_year < 1) throw new InvalidOperationException("Year cannot be less than 1");
-            }
-            _day += GetDaysInMonth(_year, _month);
-        }
+        SetAbsoluteMinute(_absoluteMinute + (long)days * MinutesPerDay);
     }
 
     /// <summary>
@@ -205,26 +210,16 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     {
         if (months == 0) return;
 
-        _month += months;
+        // 0부터 시작하는 월 인덱스로 변환 후 내림 나눗셈
+        long monthIndex = (long)(_year - 1) * MonthsPerYear + (_month - 1) + months;
+        if (monthIndex < 0) throw new InvalidOperationException("Year cannot be less than 1");
 
-        while (_month > MonthsPerYear)
-        {
-            _month -= MonthsPerYear;
-            _year++;
-        }
-        while (_month < 1)
-        {
-            _month += MonthsPerYear;
-            _year--;
-            if (_year < 1) throw new InvalidOperationException("Year cannot be less than 1");
-        }
+        int year = (int)(monthIndex / MonthsPerYear) + 1;
+        int month = (int)(monthIndex % MonthsPerYear) + 1;
 
         // 일자가 새 월의 범위를 벗어나면 조정
-        int daysInMonth = GetDaysInMonth(_year, _month);
-        if (_day > daysInMonth)
-        {
-            _day = daysInMonth;
-        }
+        int day = Math.Min(_day, GetDaysInMonth(year, month));
+        SetAbsoluteMinute(ToAbsoluteMinute(year, month, day, _minuteOfDay));
     }
 
     /// <summary>
@@ -234,15 +229,12 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     {
         if (years == 0) return;
 
-        _year += years;
-        if (_year < 1) throw new InvalidOperationException("Year cannot be less than 1");
+        int year = _year + years;
+        if (year < 1) throw new InvalidOperationException("Year cannot be less than 1");
 
         // 일자가 새 년의 해당 월 범위를 벗어나면 조정
-        int daysInMonth = GetDaysInMonth(_year, _month);
-        if (_day > daysInMonth)
-        {
-            _day = daysInMonth;
-        }
+        int day = Math.Min(_day, GetDaysInMonth(year, _month));
+        SetAbsoluteMinute(ToAbsoluteMinute(year, _month, day, _minuteOfDay));
     }
 
     /// <summary>
@@ -250,21 +242,15 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public GameTime Clone()
     {
-        return new GameTime(_year, _month, _day, Hour, Minute);
+        return FromAbsoluteMinute(_absoluteMinute);
     }
 
     /// <summary>
-    /// 시간 차이 (분) - 근사값
+    /// 시간 차이 (분)
     /// </summary>
     public int DifferenceInMinutes(GameTime other)
     {
-        int thisTotalDays = GetTotalDays(_year, _month, _day);
-        int otherTotalDays = GetTotalDays(other._year, other._month, other._day);
-
-        int dayDiff = thisTotalDays - otherTotalDays;
-        int minuteDiff = MinuteOfDay - other.MinuteOfDay;
-
-        return dayDiff * MinutesPerDay + minuteDiff;
+        return (int)(_absoluteMinute - other._absoluteMinute);
     }
 
     /// <summary>
@@ -272,10 +258,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public bool IsAfter(GameTime other)
     {
-        if (_year != other._year) return _year > other._year;
-        if (_month != other._month) return _month > other._month;
-        if (_day != other._day) return _day > other._day;
-        return _minuteOfDay > other._minuteOfDay;
+        return _absoluteMinute > other._absoluteMinute;
     }
 
     /// <summary>
@@ -283,10 +266,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public bool IsBefore(GameTime other)
     {
-        if (_year != other._year) return _year < other._year;
-        if (_month != other._month) return _month < other._month;
-        if (_day != other._day) return _day < other._day;
-        return _minuteOfDay < other._minuteOfDay;
+        return _absoluteMinute < other._absoluteMinute;
     }
 
     /// <summary>
@@ -294,7 +274,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public bool IsSameDay(GameTime other)
     {
-        return _year == other._year && _month == other._month && _day == other._day;
+        return _absoluteMinute / MinutesPerDay == other._absoluteMinute / MinutesPerDay;
     }
 
     /// <summary>
@@ -331,21 +311,38 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public List<Holiday> GetHolidays()
     {
-        return _holidays.Where(h => h.IsInRange(_month, _day)).ToList();
+        return new List<Holiday>(_holidaysByDayOfYear[DayOfYear]);
     }
 
+    /// <summary>
+    /// 올해 1월 1일부터 경과 일수 (0부터)
+    /// </summary>
+    private int DayOfYear => _cumulativeDays[_month - 1] + _day - 1;
+
     /// <summary>
     /// 현재 시간에 해당하는 모든 태그 반환 (Description 키 선택용)
+    /// 시간대/월/기념일이 바뀔 때만 새로 만들고 그 외에는 캐시된 집합을 반환 (수정 금지)
     /// </summary>
-    public HashSet<string> GetCurrentTags()
+    public IReadOnlySet<string> GetCurrentTags()
     {
+        var band = TimeBand();
+        var holidays = _holidaysByDayOfYear[DayOfYear];
+
+        // 달력 재생성 시 기념일 배열도 새로 만들어지므로 참조 비교로 충분
+        if (_currentTags != null && _currentTagsBand == band && _currentTagsMonth == _month
+            && ReferenceEquals(_currentTagsHolidays, holidays))
+            return _currentTags;
+
         var tags = new HashSet<string>();
 
         // 시간대
-        if (Hour >= 6 && Hour < 12) tags.Add("아침");
-        else if (Hour >= 12 && Hour < 18) tags.Add("낮");
-        else if (Hour >= 18 && Hour < 21) tags.Add("저녁");
-        else tags.Add("밤");
+        tags.Add(band switch
+        {
+            0 => "아침",
+            1 => "낮",
+            2 => "저녁",
+            _ => "밤"
+        });
 
         // 계절 (월 기반)
         if (_month >= 3 && _month <= 5) tags.Add("봄");
@@ -354,44 +351,55 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
         else tags.Add("겨울");
 
         // 현재 활성화된 기념일들
-        foreach (var holiday in GetHolidays())
+        foreach (var holiday in holidays)
         {
             tags.Add(holiday.Name);
         }
 
+        _currentTags = tags;
+        _currentTagsBand = band;
+        _currentTagsMonth = _month;
+        _currentTagsHolidays = holidays;
         return tags;
     }
 
+    /// <summary>
+    /// 시간대 구분 (0: 아침, 1: 낮, 2: 저녁, 3: 밤)
+    /// </summary>
+    private int TimeBand()
+    {
+        var hour = Hour;
+        if (hour >= 6 && hour < 12) return 0;
+        if (hour >= 12 && hour < 18) return 1;
+        if (hour >= 18 && hour < 21) return 2;
+        return 3;
+    }
+
     /// <summary>
     /// 현재 날짜가 기념일인지 확인
     /// </summary>
     public bool IsHoliday()
     {
-        return _holidays.Any(h => h.IsInRange(_month, _day));
+        return _holidaysByDayOfYear[DayOfYear].Length > 0;
     }
 
     public int CompareTo(GameTime? other)
     {
         if (other == null) return 1;
-
-        if (_year != other._year) return _year.CompareTo(other._year);
-        if (_month != other._month) return _month.CompareTo(other._month);
-        if (_day != other._day) return _day.CompareTo(other._day);
-        return _minuteOfDay.CompareTo(other._minuteOfDay);
+        return _absoluteMinute.CompareTo(other._absoluteMinute);
     }
 
     public bool Equals(GameTime? other)
     {
         if (other == null) return false;
-        return _year == other._year && _month == other._month && _day == other._day &&
-               _minuteOfDay == other._minuteOfDay;
+        return _absoluteMinute == other._absoluteMinute;
     }
 
     public override bool Equals(object? obj) => Equals(obj as GameTime);
 
     public override int GetHashCode()
     {
-        return HashCode.Combine(_year, _month, _day, _minuteOfDay);
+        return _absoluteMinute.GetHashCode();
     }
 
     public static bool operator ==(GameTime? a, GameTime? b)
@@ -438,10 +446,10 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
             ? string.Join(", ", holidays.Select(h => h.Name))
             : "없음";
 
-        GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-        GD.Print($"  현재 시간: {_year}년 {_month}월 {_day}일 ({WeekdayName}) {Hour:D2}:{Minute:D2}");
-        GD.Print($"  기념일: {holidayStr}");
-        GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+        _log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+        _log.Debug($"  현재 시간: {_year}년 {_month}월 {_day}일 ({WeekdayName}) {Hour:D2}:{Minute:D2}");
+        _log.Debug($"  기념일: {holidayStr}");
+        _log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
     }
 
     #region Static Calendar Methods
@@ -458,36 +466,161 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     }
 
     /// <summary>
-    /// 1년 1월 1일부터의 총 일수 계산
+    /// 1년의 총 일수
+    /// </summary>
+    public static int DaysPerYear => _daysPerYear;
+
+    /// <summary>
+    /// 날짜/시각을 절대 분으로 변환 (O(1))
+    /// </summary>
+    public static long ToAbsoluteMinute(int year, int month, int day, int minuteOfDay)
+    {
+        long totalDays = (long)(year - 1) * _daysPerYear + _cumulativeDays[month - 1] + (day - 1);
+        return totalDays * MinutesPerDay + minuteOfDay;
+    }
+
+    /// <summary>
+    /// 절대 분을 년/월/일/하루 중 분으로 분해 (O(1))
     /// </summary>
-    private static int GetTotalDays(int year, int month, int day)
+    public static void DecomposeAbsoluteMinute(long absoluteMinute, out int year, out int month, out int day, out int minuteOfDay)
     {
-        int totalDays = 0;
+        long totalDays = absoluteMinute / MinutesPerDay;
+        minuteOfDay = (int)(absoluteMinute - totalDays * MinutesPerDay);
 
-        // 년 계산
-        for (int y = 1; y < year; y++)
-        {
-            totalDays += GetDaysInYear();
-        }
+        year = (int)(totalDays / _daysPerYear) + 1;
+        int dayOfYear = (int)(totalDays % _daysPerYear);
+        month = _monthByDayOfYear[dayOfYear];
+        day = dayOfYear - _cumulativeDays[month - 1] + 1;
+    }
+
+    /// <summary>
+    /// 여러 절대 분을 한 번에 달력 필드로 변환 (장기 시뮬레이션, 세이브 타임스탬프 처리용)
+    /// 출력 span은 입력과 길이가 같거나 길어야 함
+    /// </summary>
+    public static void DecomposeAbsoluteMinutes(
+        ReadOnlySpan<long> absoluteMinutes,
+        Span<int> years,
+        Span<int> months,
+        Span<int> days,
+        Span<int> minutesOfDay)
+    {
+        int count = absoluteMinutes.Length;
+        if (years.Length < count || months.Length < count || days.Length < count || minutesOfDay.Length < count)
+            throw new ArgumentException("Output spans must be at least as long as the input");
+
+        // 달력 캐시를 지역 변수로 고정 (루프 내 정적 필드 접근 제거)
+        int daysPerYear = _daysPerYear;
+        var cumulativeDays = _cumulativeDays;
+        var monthByDayOfYear = _monthByDayOfYear;
 
-        // 월 계산
-        for (int m = 1; m < month; m++)
+        for (int i = 0; i < count; i++)
         {
-            totalDays += GetDaysInMonth(year, m);
+            long absoluteMinute = absoluteMinutes[i];
+            if (absoluteMinute < 0)
+                throw new ArgumentException($"Absolute minute must be >= 0 (index {i})");
+
+            long totalDays = absoluteMinute / MinutesPerDay;
+            int dayOfYear = (int)(totalDays % daysPerYear);
+            int month = monthByDayOfYear[dayOfYear];
+
+            years[i] = (int)(totalDays / daysPerYear) + 1;
+            months[i] = month;
+            days[i] = dayOfYear - cumulativeDays[month - 1] + 1;
+            minutesOfDay[i] = (int)(absoluteMinute - totalDays * MinutesPerDay);
         }
+    }
 
-        // 일 계산
-        totalDays += day - 1; // 1일은 0일째
+    /// <summary>
+    /// 여러 날짜/시각을 한 번에 절대 분으로 변환
+    /// </summary>
+    public static void ToAbsoluteMinutes(
+        ReadOnlySpan<int> years,
+        ReadOnlySpan<int> months,
+        ReadOnlySpan<int> days,
+        ReadOnlySpan<int> minutesOfDay,
+        Span<long> absoluteMinutes)
+    {
+        int count = years.Length;
+        if (months.Length < count || days.Length < count || minutesOfDay.Length < count || absoluteMinutes.Length < count)
+            throw new ArgumentException("All spans must be at least as long as years");
 
-        return totalDays;
+        int daysPerYear = _daysPerYear;
+        var cumulativeDays = _cumulativeDays;
+
+        for (int i = 0; i < count; i++)
+        {
+            long totalDays = (long)(years[i] - 1) * daysPerYear + cumulativeDays[months[i] - 1] + (days[i] - 1);
+            absoluteMinutes[i] = totalDays * MinutesPerDay + minutesOfDay[i];
+        }
     }
 
     /// <summary>
-    /// 1년의 총 일수
+    /// 달력 캐시 재생성 (누적 일수, 일→월 테이블, 날짜별 기념일)
     /// </summary>
-    private static int GetDaysInYear()
+    private static void RebuildCalendarCache()
     {
-        return _daysPerMonth.Sum();
+        int months = _daysPerMonth.Length;
+
+        _cumulativeDays = new int[months + 1];
+        for (int m = 0; m < months; m++)
+        {
+            _cumulativeDays[m + 1] = _cumulativeDays[m] + _daysPerMonth[m];
+        }
+        _daysPerYear = _cumulativeDays[months];
+
+        _monthByDayOfYear = new int[_daysPerYear];
+        var holidaysByDay = new List<Holiday>?[_daysPerYear];
+        for (int m = 0; m < months; m++)
+        {
+            for (int d = _cumulativeDays[m]; d < _cumulativeDays[m + 1]; d++)
+            {
+                _monthByDayOfYear[d] = m + 1;
+            }
+        }
+
+        foreach (var holiday in _holidays)
+        {
+            if (holiday.Month < 1 || holiday.Month > months) continue;
+
+            int startDay = Math.Max(holiday.StartDay, 1);
+            int endDay = Math.Min(holiday.EndDay, _daysPerMonth[holiday.Month - 1]);
+            for (int day = startDay; day <= endDay; day++)
+            {
+                int dayOfYear = _cumulativeDays[holiday.Month - 1] + day - 1;
+                (holidaysByDay[dayOfYear] ??= new List<Holiday>()).Add(holiday);
+            }
+        }
+
+        _holidaysByDayOfYear = new Holiday[_daysPerYear][];
+        for (int d = 0; d < _daysPerYear; d++)
+        {
+            _holidaysByDayOfYear[d] = holidaysByDay[d]?.ToArray() ?? Array.Empty<Holiday>();
+        }
+    }
+
+    #endregion
+
+    #region Checkpoint
+
+    // 체크포인트별 시각 (값 하나이므로 시작 시 바로 저장)
+    private List<long>? _checkpointMinutes;
+
+    public void BeginCheckpoint()
+    {
+        (_checkpointMinutes ??= new()).Add(_absoluteMinute);
+    }
+
+    public void RollbackCheckpoint()
+    {
+        var minute = _checkpointMinutes![^1];
+        _checkpointMinutes.RemoveAt(_checkpointMinutes.Count - 1);
+        if (minute != _absoluteMinute)
+            SetAbsoluteMinute(minute);
+    }
+
+    public void ReleaseCheckpoint()
+    {
+        _checkpointMinutes!.RemoveAt(_checkpointMinutes.Count - 1);
     }
 
     #endregion
@@ -504,9 +637,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// </summary>
     public void UpdateFromFile(string filePath)
     {
-        using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read)
-            ?? throw new InvalidOperationException($"Failed to open file for reading: {filePath}");
-        var json = file.GetAsText();
+        var json = GamePath.ReadAllText(filePath);
         UpdateFromJson(json);
     }
 
@@ -519,6 +650,23 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
         if (data is null)
             throw new InvalidOperationException("Failed to parse GameTime JSON data");
 
+        UpdateFromData(data);
+    }
+
+    /// <summary>
+    /// UTF-8 JSON 바이트에서 GameTimeJsonData 파싱 (워커 스레드에서 호출 가능)
+    /// </summary>
+    internal static GameTimeJsonData ParseJson(ReadOnlySpan<byte> utf8)
+    {
+        return JsonSerializer.Deserialize<GameTimeJsonData>(utf8, _jsonOptions)
+            ?? throw new InvalidOperationException("Failed to parse GameTime JSON data");
+    }
+
+    /// <summary>
+    /// GameTimeJsonData로 시간 및 달력 설정 업데이트
+    /// </summary>
+    internal void UpdateFromData(GameTimeJsonData data)
+    {
         // 달력 설정 업데이트 (정적)
         if (data.Calendar.DaysPerMonth.Length > 0)
         {
@@ -540,6 +688,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
                 holidayData.EndDay
             ));
         }
+        RebuildCalendarCache();
 
         // 현재 시간 설정
         SetTime(
@@ -562,12 +711,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     {
         var json = ToJson();
 
-        using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Write);
-        if (file == null)
-        {
-            throw new InvalidOperationException($"Failed to open file for writing: {filePath}");
-        }
-        file.StoreString(json);
+        GamePath.WriteAllText(filePath, json);
     }
 
     /// <summary>
@@ -589,7 +733,7 @@ public class GameTime : IComparable<GameTime>, IEquatable<GameTime>
     /// <summary>
     /// GameTimeJsonData로 변환
     /// </summary>
-    private GameTimeJsonData ExportToData()
+    internal GameTimeJsonData ExportToData()
     {
         return new GameTimeJsonData
         {
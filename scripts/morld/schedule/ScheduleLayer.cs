@@ -1,5 +1,6 @@
 namespace Morld;
 
+using System;
 using SE;
 
 /// <summary>
@@ -75,10 +76,18 @@ public class ScheduleLayer
 	{
 		if (string.IsNullOrEmpty(param)) return null;
 
-		var parts = param.Split(':');
-		if (parts.Length >= 2 &&
-			int.TryParse(parts[0], out int regionId) &&
-			int.TryParse(parts[1], out int localId))
+		// "이동" 레이어는 매 Step 파싱되므로 Split 없이 span으로 (할당 없음)
+		var span = param.AsSpan();
+		var colon = span.IndexOf(':');
+		if (colon < 0) return null;
+
+		var rest = span.Slice(colon + 1);
+		var nextColon = rest.IndexOf(':');
+		if (nextColon >= 0)
+			rest = rest.Slice(0, nextColon);
+
+		if (int.TryParse(span.Slice(0, colon), out int regionId) &&
+			int.TryParse(rest, out int localId))
 		{
 			return new LocationRef(regionId, localId);
 		}
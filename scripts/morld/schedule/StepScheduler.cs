@@ -0,0 +1,210 @@
+namespace Morld;
+
+using System;
+using System.Diagnostics;
+using System.Threading.Tasks;
+using SE;
+
+/// <summary>
+/// 프레임 예산 기반 시간 진행 스케줄러
+/// - 대기 시간(PlayerSystem.HasPendingTime)을 프레임마다 BudgetMs 안에서만 World.Step으로 소비
+/// - Step 하나가 예산을 넘으면 다음 Step의 진행 시간(PlayerSystem.MaxStepMinutes)을 줄여 잘게 나눔
+/// - 시간 소비가 끝나면 이벤트 감지 → 이벤트 처리(Python), 예산이 모자라면 다음 프레임으로 넘김
+/// - 이벤트 처리가 비동기(ScriptSystem.EnableAsyncExecution)면 완료될 때까지 프레임마다 확인만 함
+/// - Python 인터프리터와 시스템 상태가 단일 스레드 전제라 작업 스레드 대신 메인 스레드 시분할 사용
+/// </summary>
+public sealed class StepScheduler
+{
+	public enum Phase
+	{
+		Idle,
+		Stepping,
+		Detecting,
+		FlushingEvents,
+		WaitingEvents
+	}
+
+	private readonly World _world;
+	private readonly PlayerSystem _playerSystem;
+	private readonly EventSystem? _eventSystem;
+
+	private int _totalMinutes;
+	private Task<bool>? _flushTask;
+
+	/// <summary>
+	/// 프레임당 시뮬레이션 예산 (ms)
+	/// </summary>
+	public double BudgetMs { get; set; } = 8.0;
+
+	/// <summary>
+	/// Step 하나의 최소 진행 시간 (분) - 예산을 넘어도 이보다 잘게 나누지 않음
+	/// </summary>
+	public int MinStepMinutes { get; set; } = 1;
+
+	public Phase Current { get; private set; } = Phase.Idle;
+
+	/// <summary>
+	/// 진행 중인지 (시간 소비 또는 이벤트 처리 대기)
+	/// </summary>
+	public bool IsBusy => Current != Phase.Idle;
+
+	/// <summary>
+	/// 진행률 (0~1, 시간 소비 기준)
+	/// </summary>
+	public double Progress => _totalMinutes > 0
+		? Math.Clamp(1.0 - (double)_playerSystem.RemainingMinutes / _totalMinutes, 0, 1)
+		: 1;
+
+	/// <summary>
+	/// 마지막 프레임에서 실행한 Step 수 / 소요 시간 (ms)
+	/// </summary>
+	public int LastFrameSteps { get; private set; }
+	public double LastFrameMs { get; private set; }
+
+	/// <summary>
+	/// 시간 소비 중 프레임마다 호출 (진행률)
+	/// </summary>
+	public event Action<double>? OnProgress;
+
+	/// <summary>
+	/// 시간 진행과 이벤트 처리가 모두 끝났을 때 호출 (인자: 이벤트가 화면을 처리했는지 - 모놀로그 표시 등)
+	/// </summary>
+	public event Action<bool>? OnCompleted;
+
+	public StepScheduler(World world, PlayerSystem playerSystem, EventSystem? eventSystem)
+	{
+		_world = world;
+		_playerSystem = playerSystem;
+		_eventSystem = eventSystem;
+	}
+
+	/// <summary>
+	/// 프레임마다 호출 (GameEngine._Process)
+	/// </summary>
+	/// <param name="deltaMs">프레임 시간 (World.Step에 그대로 전달)</param>
+	public void Tick(int deltaMs)
+	{
+		var start = Stopwatch.GetTimestamp();
+		LastFrameSteps = 0;
+
+		if (Current == Phase.Idle)
+		{
+			if (!_playerSystem.HasPendingTime)
+			{
+				LastFrameMs = 0;
+				return;
+			}
+			_totalMinutes = _playerSystem.RemainingMinutes;
+			Current = Phase.Stepping;
+		}
+
+		if (Current == Phase.Stepping)
+		{
+			RunSteps(deltaMs, start);
+			if (_playerSystem.HasPendingTime)
+			{
+				LastFrameMs = ElapsedMs(start);
+				OnProgress?.Invoke(Progress);
+				return;
+			}
+
+			// 다음 행동은 다시 한 번에 진행 (작은 월드는 기존과 같은 Step 크기)
+			_playerSystem.MaxStepMinutes = int.MaxValue;
+			Current = Phase.Detecting;
+			if (ElapsedMs(start) >= BudgetMs)
+			{
+				LastFrameMs = ElapsedMs(start);
+				return;
+			}
+		}
+
+		if (Current == Phase.Detecting)
+		{
+			// 위치 변경 및 만남 이벤트 감지
+			_eventSystem?.DetectLocationChanges();
+			_eventSystem?.DetectMeetings();
+			Current = Phase.FlushingEvents;
+
+			// 예산을 다 썼으면 이벤트 처리(Python)는 다음 프레임으로
+			if (ElapsedMs(start) >= BudgetMs)
+			{
+				LastFrameMs = ElapsedMs(start);
+				return;
+			}
+		}
+
+		if (Current == Phase.FlushingEvents)
+		{
+			// 비동기 스크립트 모드면 Python 실행이 끝날 때까지 WaitingEvents에 머묾
+			_flushTask = _eventSystem?.FlushEventsAsync() ?? Task.FromResult(false);
+			Current = Phase.WaitingEvents;
+		}
+
+		if (Current == Phase.WaitingEvents)
+		{
+			LastFrameMs = ElapsedMs(start);
+			if (!_flushTask!.IsCompleted)
+				return;
+
+			var eventHandled = _flushTask.IsCompletedSuccessfully && _flushTask.Result;
+			_flushTask = null;
+			Current = Phase.Idle;
+			_totalMinutes = 0;
+			OnCompleted?.Invoke(eventHandled);
+		}
+	}
+
+	/// <summary>
+	/// 남은 작업을 예산 없이 모두 처리 (헤드리스 실행, 테스트용 - 동기 스크립트 모드 전용)
+	/// </summary>
+	public void RunToCompletion(int deltaMs)
+	{
+		var budget = BudgetMs;
+		BudgetMs = double.MaxValue;
+		try
+		{
+			do
+			{
+				Tick(deltaMs);
+			}
+			while (IsBusy);
+		}
+		finally
+		{
+			BudgetMs = budget;
+		}
+	}
+
+	private void RunSteps(int deltaMs, long frameStart)
+	{
+		while (_playerSystem.HasPendingTime)
+		{
+			var stepStart = Stopwatch.GetTimestamp();
+
+			_world.Step(deltaMs);
+			LastFrameSteps++;
+
+			// NextStepDuration = 이번 Step에서 진행한 시간
+			AdaptStepSize(ElapsedMs(stepStart), _playerSystem.NextStepDuration);
+
+			// 최소 한 Step은 진행 (예산이 작아도 멈추지 않도록)
+			if (ElapsedMs(frameStart) >= BudgetMs)
+				break;
+		}
+	}
+
+	/// <summary>
+	/// Step 비용이 예산을 넘으면 다음 Step의 진행 시간을 분당 비용에 맞춰 줄임
+	/// </summary>
+	private void AdaptStepSize(double stepMs, int stepMinutes)
+	{
+		if (stepMs <= BudgetMs || stepMinutes <= 0)
+			return;
+
+		var msPerMinute = stepMs / stepMinutes;
+		var minutes = (int)Math.Floor(BudgetMs / msPerMinute);
+		_playerSystem.MaxStepMinutes = Math.Max(MinStepMinutes, minutes);
+	}
+
+	private static double ElapsedMs(long start) => Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+}
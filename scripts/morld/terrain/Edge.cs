@@ -63,12 +63,12 @@ public class Edge
     /// <summary>
     /// A → B 방향 이동 조건 (태그:필요값)
     /// </summary>
-    public Dictionary<string, int> ConditionsAtoB { get; } = new();
+    public TagMap ConditionsAtoB { get; } = new();
 
     /// <summary>
     /// B → A 방향 이동 조건 (태그:필요값)
     /// </summary>
-    public Dictionary<string, int> ConditionsBtoA { get; } = new();
+    public TagMap ConditionsBtoA { get; } = new();
 
     /// <summary>
     /// 엣지 완전 차단 여부
@@ -219,24 +219,19 @@ public class Edge
     /// <summary>
     /// 주어진 방향의 조건 반환
     /// </summary>
-    public Dictionary<string, int> GetConditions(Location from)
+    public TagMap GetConditions(Location from)
     {
         if (from.Equals(LocationA)) return ConditionsAtoB;
         if (from.Equals(LocationB)) return ConditionsBtoA;
-        return new Dictionary<string, int>();
+        return new TagMap();
     }
 
-    private bool CheckConditions(Dictionary<string, int> conditions, TraversalContext? context)
+    private bool CheckConditions(TagMap conditions, TraversalContext? context)
     {
         if (conditions.Count == 0) return true;
         if (context == null) return false;
 
-        foreach (var (tag, requiredValue) in conditions)
-        {
-            if (!context.HasTag(tag, requiredValue))
-                return false;
-        }
-        return true;
+        return context.Satisfies(conditions);
     }
 
     public override string ToString()
@@ -249,36 +244,78 @@ public class Edge
 
 /// <summary>
 /// 경로 탐색 시 사용되는 컨텍스트 (현재 보유 태그)
+/// 태그는 TagRegistry ID로 인덱싱한 TagVector에 저장 (값이 0인 태그는 없는 것과 동일)
 /// </summary>
 public class TraversalContext
 {
-    private readonly Dictionary<string, int> _tags = new();
+    private readonly TagVector _tags = new();
 
     public static TraversalContext Empty { get; } = new();
 
+    /// <summary>
+    /// 0이 아닌 태그 (이름 기반 읽기 전용 뷰)
+    /// </summary>
     public IReadOnlyDictionary<string, int> Tags => _tags;
 
+    /// <summary>
+    /// 태그 벡터 (ID 기반 합산/비교용)
+    /// </summary>
+    public TagVector Vector => _tags;
+
     public TraversalContext SetTag(string tag, int value)
     {
-        _tags[tag] = value;
+        _tags.Set(TagRegistry.Intern(tag), value);
         return this;
     }
 
     public TraversalContext SetTags(Dictionary<string, int> tags)
     {
         foreach (var (tag, value) in tags)
-            _tags[tag] = value;
+            _tags.Set(TagRegistry.Intern(tag), value);
         return this;
     }
 
+    /// <summary>
+    /// 전체 태그 교체 (체크포인트 복원용)
+    /// </summary>
+    internal void ReplaceTags(TagVector tags)
+    {
+        _tags.CopyFrom(tags);
+    }
+
     public int GetTagValue(string tag) =>
-        _tags.TryGetValue(tag, out var value) ? value : 0;
+        TagRegistry.TryGetId(tag, out var id) ? _tags.Get(id) : 0;
 
     public bool HasTag(string tag, int requiredValue) =>
         GetTagValue(tag) >= requiredValue;
 
     public bool HasTag(string tag) =>
-        _tags.ContainsKey(tag) && _tags[tag] > 0;
+        GetTagValue(tag) > 0;
+
+    /// <summary>
+    /// 조건(태그:필요값)을 모두 충족하는지 확인
+    /// </summary>
+    public bool Satisfies(TagMap conditions) => _tags.Satisfies(conditions);
+
+    /// <summary>
+    /// 충족하지 못한 첫 조건의 태그 이름 (모두 충족하면 null)
+    /// </summary>
+    public string? FindMissingTag(TagMap conditions)
+    {
+        var tagId = _tags.FindUnsatisfied(conditions);
+        return tagId >= 0 ? TagRegistry.GetName(tagId) : null;
+    }
+
+    /// <summary>
+    /// 태그 구성 지문 (순서 무관, 값이 0인 태그는 없는 것과 동일하게 취급)
+    /// 캐시 키용 - 충돌 가능성이 있으므로 일치 여부는 HasSameTags로 확인
+    /// </summary>
+    public int GetFingerprint() => _tags.GetFingerprint();
+
+    /// <summary>
+    /// 다른 컨텍스트와 태그 값이 모두 같은지 확인 (값이 0인 태그는 무시)
+    /// </summary>
+    public bool HasSameTags(TraversalContext other) => _tags.ValueEquals(other._tags);
 
     public override string ToString()
     {
@@ -99,6 +99,7 @@ public class Region : IDescribable
     /// <param name="throwOnDuplicate">중복 시 예외 발생 여부 (기본: false)</param>
     public Location AddLocation(int localId, string name = "unknown", bool throwOnDuplicate = false)
     {
+        OwnerWorld?.BeforeStructuralChange();
         if (localId < 0)
             throw new ArgumentException("Local ID cannot be negative", nameof(localId));
 
@@ -122,6 +123,7 @@ public class Region : IDescribable
     /// <param name="throwOnDuplicate">중복 시 예외 발생 여부 (기본: false)</param>
     public void AddLocation(Location location, bool throwOnDuplicate = false)
     {
+        OwnerWorld?.BeforeStructuralChange();
         if (location == null) throw new ArgumentNullException(nameof(location));
         if (location.RegionId != Id)
             throw new ArgumentException($"Location belongs to region '{location.RegionId}', not '{Id}'");
@@ -142,6 +144,7 @@ public class Region : IDescribable
     /// </summary>
     public Edge AddEdge(int localIdA, int localIdB, int travelTime)
     {
+        OwnerWorld?.BeforeStructuralChange();
         var locationA = GetOrCreateLocation(localIdA);
         var locationB = GetOrCreateLocation(localIdB);
 
@@ -162,6 +165,7 @@ public class Region : IDescribable
     /// </summary>
     public Edge AddEdge(int localIdA, int localIdB, int travelTimeAtoB, int travelTimeBtoA)
     {
+        OwnerWorld?.BeforeStructuralChange();
         var locationA = GetOrCreateLocation(localIdA);
         var locationB = GetOrCreateLocation(localIdB);
 
@@ -186,6 +190,8 @@ public class Region : IDescribable
         if (edge == null)
             return false;
 
+        OwnerWorld?.BeforeStructuralChange();
+
         _adjacencyList[localIdA].Remove(edge);
         _adjacencyList[localIdB].Remove(edge);
         _allEdges.Remove(edge);
@@ -288,9 +294,13 @@ public class Region : IDescribable
         if (!_adjacencyList.TryGetValue(localIdA, out var edges))
             return null;
 
-        return edges.FirstOrDefault(e =>
-            (e.LocationA.LocalId == localIdA && e.LocationB.LocalId == localIdB) ||
-            (e.LocationA.LocalId == localIdB && e.LocationB.LocalId == localIdA));
+        foreach (var e in edges)
+        {
+            if ((e.LocationA.LocalId == localIdA && e.LocationB.LocalId == localIdB) ||
+                (e.LocationA.LocalId == localIdB && e.LocationB.LocalId == localIdA))
+                return e;
+        }
+        return null;
     }
 
     /// <summary>
@@ -298,6 +308,7 @@ public class Region : IDescribable
     /// </summary>
     public void Clear()
     {
+        OwnerWorld?.BeforeStructuralChange();
         _locations.Clear();
         _adjacencyList.Clear();
         _allEdges.Clear();
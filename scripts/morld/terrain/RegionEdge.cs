@@ -67,12 +67,12 @@ public class RegionEdge
     /// <summary>
     /// A → B 방향 이동 조건
     /// </summary>
-    public Dictionary<string, int> ConditionsAtoB { get; } = new();
+    public TagMap ConditionsAtoB { get; } = new();
 
     /// <summary>
     /// B → A 방향 이동 조건
     /// </summary>
-    public Dictionary<string, int> ConditionsBtoA { get; } = new();
+    public TagMap ConditionsBtoA { get; } = new();
 
     /// <summary>
     /// 연결 차단 여부
@@ -202,24 +202,19 @@ public class RegionEdge
     /// <summary>
     /// 주어진 방향의 조건 반환
     /// </summary>
-    public Dictionary<string, int> GetConditions(LocationRef from)
+    public TagMap GetConditions(LocationRef from)
     {
         if (from == LocationA) return ConditionsAtoB;
         if (from == LocationB) return ConditionsBtoA;
-        return new Dictionary<string, int>();
+        return new TagMap();
     }
 
-    private bool CheckConditions(Dictionary<string, int> conditions, TraversalContext? context)
+    private bool CheckConditions(TagMap conditions, TraversalContext? context)
     {
         if (conditions.Count == 0) return true;
         if (context == null) return false;
 
-        foreach (var (tag, requiredValue) in conditions)
-        {
-            if (!context.HasTag(tag, requiredValue))
-                return false;
-        }
-        return true;
+        return context.Satisfies(conditions);
     }
 
     /// <summary>
@@ -0,0 +1,109 @@
+namespace Morld;
+
+using System;
+using System.IO;
+using System.Text.Json;
+
+/// <summary>
+/// Region 단위 파일 저장소 (페이징 모드, 청크 저장 공용)
+/// Region 하나당 파일 하나 (region_{id}.json, RegionJsonData 형식)
+/// 같은 폴더에 인덱스/RegionEdge 테이블 같은 보조 파일도 둘 수 있음
+/// </summary>
+public class RegionFileStore
+{
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        PropertyNameCaseInsensitive = true
+    };
+
+    private readonly string _directory;
+
+    /// <summary>
+    /// 저장 폴더 (예: "user://region_cache/")
+    /// </summary>
+    public string Directory => _directory;
+
+    public RegionFileStore(string directory)
+    {
+        if (string.IsNullOrEmpty(directory))
+            throw new ArgumentException("Directory cannot be empty", nameof(directory));
+
+        _directory = directory.EndsWith("/") ? directory : directory + "/";
+        System.IO.Directory.CreateDirectory(GamePath.Globalize(_directory));
+    }
+
+    /// <summary>
+    /// Region 파일 경로
+    /// </summary>
+    public string GetPath(int regionId) => _directory + GetFileName(regionId);
+
+    private static string GetFileName(int regionId) => $"region_{regionId}.json";
+
+    /// <summary>
+    /// Region 파일 존재 여부
+    /// </summary>
+    public bool Contains(int regionId) => File.Exists(GamePath.Globalize(GetPath(regionId)));
+
+    /// <summary>
+    /// Region 파일을 바이트로 읽기 (TerrainStreamParser.ParseRegion 입력)
+    /// </summary>
+    internal byte[] Read(int regionId)
+    {
+        var path = GamePath.Globalize(GetPath(regionId));
+        if (!File.Exists(path))
+            throw new InvalidOperationException($"Failed to open file for reading: {GetPath(regionId)}");
+
+        return File.ReadAllBytes(path);
+    }
+
+    /// <summary>
+    /// Region 파일을 RegionJsonData로 읽기 (상주시키지 않고 내보낼 때)
+    /// </summary>
+    internal RegionJsonData ReadData(int regionId)
+    {
+        return JsonSerializer.Deserialize<RegionJsonData>(Read(regionId), JsonOptions)
+            ?? throw new InvalidOperationException($"Failed to parse region file: {GetPath(regionId)}");
+    }
+
+    /// <summary>
+    /// Region 파일 기록 (임시 파일에 쓴 뒤 교체)
+    /// </summary>
+    internal void Write(RegionJsonData data)
+    {
+        WriteFile(GetFileName(data.Id), data);
+    }
+
+    /// <summary>
+    /// 보조 파일 기록 (임시 파일에 쓴 뒤 교체)
+    /// </summary>
+    internal void WriteFile<T>(string fileName, T data)
+    {
+        var path = GamePath.Globalize(_directory + fileName);
+        var tempPath = path + ".tmp";
+
+        File.WriteAllBytes(tempPath, JsonSerializer.SerializeToUtf8Bytes(data, JsonOptions));
+        File.Move(tempPath, path, overwrite: true);
+    }
+
+    /// <summary>
+    /// 보조 파일 읽기 (파일이 없으면 null)
+    /// </summary>
+    internal T? ReadFile<T>(string fileName) where T : class
+    {
+        var path = GamePath.Globalize(_directory + fileName);
+        if (!File.Exists(path))
+            return null;
+
+        return JsonSerializer.Deserialize<T>(File.ReadAllBytes(path), JsonOptions);
+    }
+
+    /// <summary>
+    /// Region 파일 삭제
+    /// </summary>
+    internal void Delete(int regionId)
+    {
+        var path = GamePath.Globalize(GetPath(regionId));
+        if (File.Exists(path))
+            File.Delete(path);
+    }
+}
@@ -0,0 +1,133 @@
+namespace Morld;
+
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// 페이징 모드에서 항상 상주하는 Region 메타데이터 + 포털 요약
+/// 포털 = RegionEdge가 연결된 Location
+/// 포털 간 최단 이동 시간은 조건 없고 차단되지 않은 Edge만으로 계산 (Region을 읽지 않고 경로 탐색에 사용)
+/// </summary>
+public class RegionSummary
+{
+    private static readonly IReadOnlyList<(int ToLocalId, int TravelTime)> NoHops = Array.Empty<(int, int)>();
+
+    /// <summary>
+    /// 포털 LocalId → 같은 Region 내 다른 포털까지의 최단 이동 시간
+    /// </summary>
+    private readonly Dictionary<int, List<(int ToLocalId, int TravelTime)>> _portalHops = new();
+
+    /// <summary>
+    /// Region ID
+    /// </summary>
+    public int Id { get; }
+
+    /// <summary>
+    /// Region 이름
+    /// </summary>
+    public string Name { get; internal set; } = "unknown";
+
+    /// <summary>
+    /// Location 수
+    /// </summary>
+    public int LocationCount { get; private set; }
+
+    /// <summary>
+    /// 포털 수
+    /// </summary>
+    public int PortalCount => _portalHops.Count;
+
+    /// <summary>
+    /// 조건부 Edge 포함 여부
+    /// true면 유닛 태그에 따라 Region 내 경로가 달라지므로 요약 대신 Region을 읽어 탐색
+    /// </summary>
+    public bool HasConditionalEdges { get; private set; }
+
+    /// <summary>
+    /// 요약이 현재 Region/RegionEdge 구성과 맞지 않음 (다음 페이지 아웃 때 다시 계산)
+    /// </summary>
+    public bool IsStale { get; internal set; } = true;
+
+    public RegionSummary(int id)
+    {
+        Id = id;
+    }
+
+    /// <summary>
+    /// 포털에서 같은 Region 내 다른 포털로의 요약 이동 목록
+    /// </summary>
+    public IReadOnlyList<(int ToLocalId, int TravelTime)> GetPortalHops(int localId)
+    {
+        return _portalHops.TryGetValue(localId, out var hops) ? hops : NoHops;
+    }
+
+    /// <summary>
+    /// 상주 중인 Region으로 요약 다시 계산
+    /// </summary>
+    /// <param name="region">요약할 Region</param>
+    /// <param name="regionEdges">Region에 연결된 RegionEdge 목록 (포털 결정용)</param>
+    internal void Rebuild(Region region, IReadOnlyList<RegionEdge> regionEdges)
+    {
+        Name = region.Name;
+        LocationCount = region.LocationCount;
+        HasConditionalEdges = false;
+        foreach (var edge in region.Edges)
+        {
+            if (edge.ConditionsAtoB.Count > 0 || edge.ConditionsBtoA.Count > 0)
+            {
+                HasConditionalEdges = true;
+                break;
+            }
+        }
+
+        _portalHops.Clear();
+        foreach (var edge in regionEdges)
+        {
+            var portal = edge.GetLocationInRegion(region.Id);
+            if (portal.HasValue && region.GetLocation(portal.Value.LocalId) != null)
+                _portalHops[portal.Value.LocalId] = new List<(int, int)>();
+        }
+
+        foreach (var (portalId, hops) in _portalHops)
+        {
+            CollectPortalHops(region, region.GetLocation(portalId)!, hops);
+        }
+
+        IsStale = false;
+    }
+
+    /// <summary>
+    /// 포털 하나에서 Dijkstra로 다른 포털까지의 최단 시간 수집
+    /// </summary>
+    private void CollectPortalHops(Region region, Location portal, List<(int ToLocalId, int TravelTime)> hops)
+    {
+        var openSet = new PriorityQueue<Location, int>();
+        var travelTime = new Dictionary<int, int> { [portal.LocalId] = 0 };
+        var closedSet = new HashSet<int>();
+
+        openSet.Enqueue(portal, 0);
+        while (openSet.Count > 0)
+        {
+            var current = openSet.Dequeue();
+            if (!closedSet.Add(current.LocalId))
+                continue;
+
+            var currentTime = travelTime[current.LocalId];
+            if (current.LocalId != portal.LocalId && _portalHops.ContainsKey(current.LocalId))
+                hops.Add((current.LocalId, currentTime));
+
+            foreach (var (neighbor, _, edgeTravelTime) in region.GetTraversableNeighbors(current, null))
+            {
+                if (closedSet.Contains(neighbor.LocalId))
+                    continue;
+
+                var tentativeTime = currentTime + edgeTravelTime;
+                if (!travelTime.TryGetValue(neighbor.LocalId, out var known) || tentativeTime < known)
+                {
+                    travelTime[neighbor.LocalId] = tentativeTime;
+                    openSet.Enqueue(neighbor, tentativeTime);
+                }
+            }
+        }
+    }
+}
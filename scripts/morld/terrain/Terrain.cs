@@ -5,14 +5,15 @@ using System.Collections.Generic;
 using System.Linq;
 using System.Text.Json;
 using System.Text.Json.Serialization;
-using Godot;
 using SE;
 
 /// <summary>
 /// Terrain - 여러 Region과 Region 간 연결을 관리
 /// </summary>
-public class Terrain
+public class Terrain : ICheckpointable
 {
+    private static readonly LogCategory _log = Log.Category("Terrain");
+
     private readonly Dictionary<int, Region> _regions = new();
     private readonly Dictionary<int, RegionEdge> _regionEdges = new();
     /// <summary>
@@ -23,6 +24,11 @@ public class Terrain
     private readonly HashSet<int> _changedRegions = new();
     private bool _isRegionEdgeChanged;
     /// <summary>
+    /// 구조 변경 카운터 (변경 표시 때마다 증가, 변경 플래그 초기화와 무관)
+    /// 경로 캐시 등 파생 데이터의 무효화 판단용
+    /// </summary>
+    private long _version;
+    /// <summary>
     /// RegionEdge ID 자동 생성을 위한 카운터 (중복 방지)
     /// </summary>
     private int _nextRegionEdgeId = 0;
@@ -34,8 +40,10 @@ public class Terrain
 
     /// <summary>
     /// 모든 Region
+    /// 페이징 모드에서는 열거하는 동안 ID 순으로 하나씩 읽어오며, 상주 한도를 넘으면 앞서 열거한 Region은 내려감
+    /// (내려간 Region 객체를 나중에 수정해도 반영되지 않으므로 열거 중에만 사용)
     /// </summary>
-    public IReadOnlyCollection<Region> Regions => _regions.Values;
+    public IReadOnlyCollection<Region> Regions => _pageStore != null ? new PagedRegionCollection(this) : _regions.Values;
 
     /// <summary>
     /// 모든 Region 간 연결
@@ -43,9 +51,9 @@ public class Terrain
     public IReadOnlyCollection<RegionEdge> RegionEdges => _regionEdges.Values;
 
     /// <summary>
-    /// Region 수
+    /// Region 수 (페이징 모드에서는 상주하지 않는 Region 포함)
     /// </summary>
-    public int RegionCount => _regions.Count;
+    public int RegionCount => _pageStore != null ? _summaries.Count : _regions.Count;
 
     /// <summary>
     /// Region 간 연결 수
@@ -59,6 +67,11 @@ public class Terrain
 
     #region Change Tracking
 
+    /// <summary>
+    /// 구조 변경 카운터 (값이 달라졌으면 Region/Edge/RegionEdge가 변경된 것)
+    /// </summary>
+    public long Version => _version;
+
     /// <summary>
     /// 변경된 Region이 있는지 여부
     /// </summary>
@@ -85,6 +98,9 @@ public class Terrain
     internal void MarkRegionAsChanged(int regionId)
     {
         _changedRegions.Add(regionId);
+        if (_pageStore != null)
+            _dirtyRegions.Add(regionId);
+        _version++;
     }
 
     /// <summary>
@@ -93,10 +109,13 @@ public class Terrain
     internal void MarkRegionEdgeAsChanged()
     {
         _isRegionEdgeChanged = true;
+        _version++;
     }
 
     /// <summary>
     /// 모든 변경 플래그 초기화
+    /// 페이징 모드에서 상주하지 않는 Region은 다시 읽어올 때 _changedRegions 기준으로 플래그가 맞춰짐
+    /// (파일 기록 대기 표시는 변경 플래그와 별개이므로 유지)
     /// </summary>
     public void ClearAllChangedFlags()
     {
@@ -129,17 +148,22 @@ public class Terrain
     /// <param name="throwOnDuplicate">중복 시 예외 발생 여부 (기본: false)</param>
     public Region AddRegion(int regionId, string name = "unknown", bool throwOnDuplicate = false)
     {
-        if (_regions.ContainsKey(regionId))
+        if (HasRegion(regionId))
         {
             if (throwOnDuplicate)
                 throw new InvalidOperationException($"Region with ID '{regionId}' already exists");
-            return _regions[regionId];
+            return GetRegion(regionId)!;
         }
 
+        BeforeStructuralChange();
+
         var region = new Region(regionId, name);
         region.OwnerWorld = this;
         _regions[regionId] = region;
         _regionEdgeIndex[regionId] = new List<RegionEdge>();
+        _version++;
+        if (_pageStore != null)
+            OnPagedRegionAdded(region);
         return region;
     }
 
@@ -152,24 +176,36 @@ public class Terrain
     {
         if (region == null) throw new ArgumentNullException(nameof(region));
 
-        if (_regions.ContainsKey(region.Id))
+        if (HasRegion(region.Id))
         {
             if (throwOnDuplicate)
                 throw new InvalidOperationException($"Region with ID '{region.Id}' already exists");
             return;
         }
 
+        BeforeStructuralChange();
+
         region.OwnerWorld = this;
         _regions[region.Id] = region;
         _regionEdgeIndex[region.Id] = new List<RegionEdge>();
+        _version++;
+        if (_pageStore != null)
+            OnPagedRegionAdded(region);
     }
 
     /// <summary>
-    /// Region 가져오기
+    /// Region 가져오기 (페이징 모드에서는 상주하지 않으면 파일에서 읽어옴)
     /// </summary>
     public Region? GetRegion(int regionId)
     {
-        return _regions.TryGetValue(regionId, out var region) ? region : null;
+        if (_regions.TryGetValue(regionId, out var region))
+        {
+            if (_pageStore != null)
+                TouchResident(regionId);
+            return region;
+        }
+
+        return _pageStore != null && _summaries.ContainsKey(regionId) ? PageIn(regionId) : null;
     }
 
     /// <summary>
@@ -177,9 +213,15 @@ public class Terrain
     /// </summary>
     public bool RemoveRegion(int regionId)
     {
-        if (!_regions.Remove(regionId))
+        if (!HasRegion(regionId))
             return false;
 
+        BeforeStructuralChange();
+        if (_regions.Remove(regionId, out var removed))
+            removed.OwnerWorld = null;
+        if (_pageStore != null)
+            OnPagedRegionRemoved(regionId);
+
         // 해당 Region과 연결된 모든 RegionEdge도 제거
         if (_regionEdgeIndex.TryGetValue(regionId, out var edges))
         {
@@ -191,6 +233,7 @@ public class Terrain
         }
 
         _regionEdgeIndex.Remove(regionId);
+        _version++;
         return true;
     }
 
@@ -235,7 +278,7 @@ public class Terrain
         }
         else
         {
-            regionsToSearch = _regions.Values;
+            regionsToSearch = AllRegions();
         }
 
         foreach (var region in regionsToSearch)
@@ -290,6 +333,8 @@ public class Terrain
         ValidateRegionAndLocation(regionIdA, localIdA);
         ValidateRegionAndLocation(regionIdB, localIdB);
 
+        BeforeStructuralChange();
+
         var edge = new RegionEdge(edgeId, regionIdA, localIdA, regionIdB, localIdB);
         edge.OwnerWorld = this;
         edge.SetTravelTime(travelTime);
@@ -297,6 +342,7 @@ public class Terrain
         _regionEdges[edgeId] = edge;
         _regionEdgeIndex[regionIdA].Add(edge);
         _regionEdgeIndex[regionIdB].Add(edge);
+        InvalidatePortalSummaries(edge);
 
         if (edgeId >= _nextRegionEdgeId)
             _nextRegionEdgeId = edgeId + 1;
@@ -326,6 +372,8 @@ public class Terrain
         ValidateRegionAndLocation(regionIdA, localIdA);
         ValidateRegionAndLocation(regionIdB, localIdB);
 
+        BeforeStructuralChange();
+
         var edge = new RegionEdge(edgeId, regionIdA, localIdA, regionIdB, localIdB);
         edge.OwnerWorld = this;
         edge.SetTravelTime(travelTimeAtoB, travelTimeBtoA);
@@ -333,6 +381,7 @@ public class Terrain
         _regionEdges[edgeId] = edge;
         _regionEdgeIndex[regionIdA].Add(edge);
         _regionEdgeIndex[regionIdB].Add(edge);
+        InvalidatePortalSummaries(edge);
 
         if (edgeId >= _nextRegionEdgeId)
             _nextRegionEdgeId = edgeId + 1;
@@ -370,10 +419,13 @@ public class Terrain
         ValidateRegionAndLocation(edge.LocationA.RegionId, edge.LocationA.LocalId);
         ValidateRegionAndLocation(edge.LocationB.RegionId, edge.LocationB.LocalId);
 
+        BeforeStructuralChange();
+
         edge.OwnerWorld = this;
         _regionEdges[edge.Id] = edge;
         _regionEdgeIndex[edge.LocationA.RegionId].Add(edge);
         _regionEdgeIndex[edge.LocationB.RegionId].Add(edge);
+        InvalidatePortalSummaries(edge);
 
         if (edge.Id >= _nextRegionEdgeId)
             _nextRegionEdgeId = edge.Id + 1;
@@ -397,12 +449,16 @@ public class Terrain
         if (!_regionEdges.TryGetValue(edgeId, out var edge))
             return false;
 
+        BeforeStructuralChange();
+
         _regionEdges.Remove(edgeId);
         if (_regionEdgeIndex.TryGetValue(edge.LocationA.RegionId, out var edgesA))
             edgesA.Remove(edge);
         if (_regionEdgeIndex.TryGetValue(edge.LocationB.RegionId, out var edgesB))
             edgesB.Remove(edge);
+        InvalidatePortalSummaries(edge);
 
+        MarkRegionEdgeAsChanged();
         return true;
     }
 
@@ -462,10 +518,11 @@ public class Terrain
     /// </summary>
     private void ValidateRegionAndLocation(int regionId, int localId)
     {
-        if (!_regions.ContainsKey(regionId))
+        var region = GetRegion(regionId);
+        if (region == null)
             throw new ArgumentException($"Region '{regionId}' not found");
 
-        if (_regions[regionId].GetLocation(localId) == null)
+        if (region.GetLocation(localId) == null)
             throw new ArgumentException($"Location {localId} not found in Region '{regionId}'");
     }
 
@@ -481,8 +538,8 @@ public class Terrain
             bool isValid = true;
 
             // Region 존재 확인
-            if (!_regions.ContainsKey(edge.LocationA.RegionId) ||
-                !_regions.ContainsKey(edge.LocationB.RegionId))
+            if (!HasRegion(edge.LocationA.RegionId) ||
+                !HasRegion(edge.LocationB.RegionId))
             {
                 isValid = false;
             }
@@ -514,6 +571,16 @@ public class Terrain
         return pathFinder.FindPath(from, to, context);
     }
 
+    /// <summary>
+    /// 경로 탐색 (PathFinder 래퍼) - 페이징 모드에서 요약 구간 펼침 여부 지정
+    /// </summary>
+    /// <param name="expandRoute">false면 다음 이동에 필요한 앞부분만 Path로 채움 (PathResult.IsPartial)</param>
+    public PathResult FindPath(LocationRef from, LocationRef to, TraversalContext? context, bool expandRoute)
+    {
+        var pathFinder = new PathFinder(this) { ExpandSummarizedRoute = expandRoute };
+        return pathFinder.FindPath(from, to, context);
+    }
+
     /// <summary>
     /// 경로 탐색 (PathFinder 래퍼) - Unit 기반 (하위 호환용)
     /// </summary>
@@ -526,7 +593,8 @@ public class Terrain
     /// <summary>
     /// Region ID 존재 여부 확인
     /// </summary>
-    public bool HasRegion(int regionId) => _regions.ContainsKey(regionId);
+    public bool HasRegion(int regionId) =>
+        _regions.ContainsKey(regionId) || (_pageStore != null && _summaries.ContainsKey(regionId));
 
     /// <summary>
     /// RegionEdge ID 존재 여부 확인
@@ -536,7 +604,7 @@ public class Terrain
     /// <summary>
     /// 다음 사용 가능한 Region ID
     /// </summary>
-    public int GetNextRegionId() => _regions.Count > 0 ? _regions.Keys.Max() + 1 : 0;
+    public int GetNextRegionId() => RegionCount > 0 ? AllRegionIds.Max() + 1 : 0;
 
     /// <summary>
     /// 다음 사용 가능한 RegionEdge ID
@@ -557,7 +625,7 @@ public class Terrain
         result.Merge(regionValidation);
 
         // 2. 각 Region 내 Location ID 검사
-        foreach (var region in _regions.Values)
+        foreach (var region in AllRegions())
         {
             var locationValidation = region.ValidateLocationIds();
             result.Merge(locationValidation);
@@ -589,7 +657,7 @@ public class Terrain
         var result = new ValidationResult();
 
         // Dictionary 특성상 중복 불가하지만 명시적 확인
-        var ids = _regions.Keys.ToList();
+        var ids = AllRegionIds.ToList();
         var duplicates = ids.GroupBy(x => x)
             .Where(g => g.Count() > 1)
             .Select(g => g.Key)
@@ -634,21 +702,21 @@ public class Terrain
         foreach (var edge in _regionEdges.Values)
         {
             // Region A 존재 확인
-            if (!_regions.ContainsKey(edge.LocationA.RegionId))
+            if (!HasRegion(edge.LocationA.RegionId))
             {
                 result.AddError($"RegionEdge '{edge.Id}' references non-existent Region: '{edge.LocationA.RegionId}'");
             }
-            else if (_regions[edge.LocationA.RegionId].GetLocation(edge.LocationA.LocalId) == null)
+            else if (GetLocation(edge.LocationA) == null)
             {
                 result.AddError($"RegionEdge '{edge.Id}' references non-existent Location: {edge.LocationA}");
             }
 
             // Region B 존재 확인
-            if (!_regions.ContainsKey(edge.LocationB.RegionId))
+            if (!HasRegion(edge.LocationB.RegionId))
             {
                 result.AddError($"RegionEdge '{edge.Id}' references non-existent Region: '{edge.LocationB.RegionId}'");
             }
-            else if (_regions[edge.LocationB.RegionId].GetLocation(edge.LocationB.LocalId) == null)
+            else if (GetLocation(edge.LocationB) == null)
             {
                 result.AddError($"RegionEdge '{edge.Id}' references non-existent Location: {edge.LocationB}");
             }
@@ -664,7 +732,7 @@ public class Terrain
     {
         var result = new ValidationResult();
 
-        foreach (var region in _regions.Values)
+        foreach (var region in AllRegions())
         {
             var emptySlots = region.FindEmptyLocationIds();
             if (emptySlots.Count > 0)
@@ -683,7 +751,7 @@ public class Terrain
     {
         var result = new Dictionary<int, List<int>>();
 
-        foreach (var region in _regions.Values)
+        foreach (var region in AllRegions())
         {
             var emptySlots = region.FindEmptyLocationIds();
             if (emptySlots.Count > 0)
@@ -700,6 +768,352 @@ public class Terrain
         return $"Terrain[{Name ?? "Unnamed"}]: {RegionCount} regions, {RegionEdgeCount} connections";
     }
 
+    #region Paging
+
+    private RegionFileStore? _pageStore;
+    private int _maxResidentRegions;
+    /// <summary>
+    /// 페이징 모드의 전체 Region 메타데이터 (상주 여부와 무관하게 항상 유지)
+    /// </summary>
+    private readonly Dictionary<int, RegionSummary> _summaries = new();
+    /// <summary>
+    /// 상주 Region LRU 순서 (First가 가장 오래전에 사용된 Region)
+    /// </summary>
+    private readonly LinkedList<int> _residentLru = new();
+    private readonly Dictionary<int, LinkedListNode<int>> _residentNodes = new();
+    /// <summary>
+    /// 파일에 마지막으로 기록한 뒤 변경된 Region (페이지 아웃 시 다시 기록)
+    /// </summary>
+    private readonly HashSet<int> _dirtyRegions = new();
+
+    /// <summary>
+    /// 페이징 모드 여부
+    /// </summary>
+    public bool IsPaged => _pageStore != null;
+
+    /// <summary>
+    /// 메모리에 상주 중인 Region 수
+    /// </summary>
+    public int ResidentRegionCount => _regions.Count;
+
+    /// <summary>
+    /// 상주 Region 최대 수 (페이징 모드가 아니면 0)
+    /// </summary>
+    public int MaxResidentRegions => _maxResidentRegions;
+
+    /// <summary>
+    /// 파일에서 Region을 읽어온 횟수
+    /// </summary>
+    public long PageInCount { get; private set; }
+
+    /// <summary>
+    /// Region을 메모리에서 내린 횟수
+    /// </summary>
+    public long PageOutCount { get; private set; }
+
+    /// <summary>
+    /// 전체 Region ID (페이징 모드에서는 상주하지 않는 Region 포함)
+    /// </summary>
+    private IEnumerable<int> AllRegionIds => _pageStore != null ? _summaries.Keys : _regions.Keys;
+
+    /// <summary>
+    /// 전체 Region 열거 (페이징 모드에서는 ID 순으로 하나씩 읽어옴)
+    /// </summary>
+    private IEnumerable<Region> AllRegions()
+    {
+        if (_pageStore == null)
+        {
+            foreach (var region in _regions.Values)
+                yield return region;
+            yield break;
+        }
+
+        // 읽어오는 동안 _regions가 바뀌므로 ID 목록을 먼저 복사
+        foreach (var regionId in _summaries.Keys.OrderBy(id => id).ToList())
+        {
+            var region = GetRegion(regionId);
+            if (region != null)
+                yield return region;
+        }
+    }
+
+    /// <summary>
+    /// 페이징 모드의 Regions (Count는 상주 여부와 무관한 전체 수)
+    /// </summary>
+    private sealed class PagedRegionCollection : IReadOnlyCollection<Region>
+    {
+        private readonly Terrain _terrain;
+
+        public PagedRegionCollection(Terrain terrain)
+        {
+            _terrain = terrain;
+        }
+
+        public int Count => _terrain._summaries.Count;
+
+        public IEnumerator<Region> GetEnumerator() => _terrain.AllRegions().GetEnumerator();
+
+        System.Collections.IEnumerator System.Collections.IEnumerable.GetEnumerator() => GetEnumerator();
+    }
+
+    /// <summary>
+    /// 페이징 모드 시작
+    /// 현재 Region을 모두 파일로 기록하고, 이후에는 최근 사용한 Region만 maxResidentRegions개까지 메모리에 유지
+    /// Region 메타데이터와 RegionEdge는 항상 상주하며, 나머지는 GetRegion 호출 시 파일에서 읽어옴
+    /// </summary>
+    /// <param name="store">Region 파일 저장소</param>
+    /// <param name="maxResidentRegions">상주 Region 최대 수 (경로 탐색 중 출발/도착 Region을 함께 유지하도록 2 이상 권장)</param>
+    public void EnablePaging(RegionFileStore store, int maxResidentRegions)
+    {
+        if (store == null) throw new ArgumentNullException(nameof(store));
+        if (maxResidentRegions < 1)
+            throw new ArgumentOutOfRangeException(nameof(maxResidentRegions), "At least one resident region is required");
+        if (_pageStore != null)
+            throw new InvalidOperationException("Paging is already enabled");
+
+        _pageStore = store;
+        _maxResidentRegions = maxResidentRegions;
+
+        foreach (var region in _regions.Values.OrderBy(r => r.Id))
+        {
+            _pageStore.Write(ExportRegion(region));
+            var summary = new RegionSummary(region.Id);
+            summary.Rebuild(region, GetRegionEdges(region.Id));
+            _summaries[region.Id] = summary;
+            TouchResident(region.Id);
+        }
+
+        TrimResidentRegions();
+    }
+
+    /// <summary>
+    /// Region 메타데이터/포털 요약 가져오기 (페이징 모드가 아니면 null, Region을 읽어오지 않음)
+    /// </summary>
+    public RegionSummary? GetRegionSummary(int regionId)
+    {
+        return _summaries.TryGetValue(regionId, out var summary) ? summary : null;
+    }
+
+    /// <summary>
+    /// Region이 메모리에 상주 중인지 여부 (Region을 읽어오지 않음)
+    /// </summary>
+    public bool IsRegionResident(int regionId) => _regions.ContainsKey(regionId);
+
+    /// <summary>
+    /// 변경된 상주 Region을 모두 파일에 기록 (저장 직전 등)
+    /// </summary>
+    public void FlushResidentRegions()
+    {
+        if (_pageStore == null)
+            return;
+
+        foreach (var regionId in _dirtyRegions.ToList())
+        {
+            if (_regions.TryGetValue(regionId, out var region))
+                WriteBack(region);
+        }
+    }
+
+    /// <summary>
+    /// 최근 사용 표시
+    /// </summary>
+    private void TouchResident(int regionId)
+    {
+        if (_residentNodes.TryGetValue(regionId, out var node))
+        {
+            if (node != _residentLru.Last)
+            {
+                _residentLru.Remove(node);
+                _residentLru.AddLast(node);
+            }
+            return;
+        }
+
+        _residentNodes[regionId] = _residentLru.AddLast(regionId);
+    }
+
+    /// <summary>
+    /// 파일에서 Region 읽어와 상주시키기
+    /// </summary>
+    private Region PageIn(int regionId)
+    {
+        var region = TerrainStreamParser.ParseRegion(_pageStore!.Read(regionId));
+
+        // 변경 플래그는 파일에 없으므로 Terrain 기준으로 맞춤 (OwnerWorld 연결 전이라 다시 표시되지 않음)
+        if (_changedRegions.Contains(regionId))
+            region.MarkAsChanged();
+        else
+            region.ClearChangedFlag();
+        region.OwnerWorld = this;
+        _regions[regionId] = region;
+        PageInCount++;
+
+        TouchResident(regionId);
+        TrimResidentRegions();
+        return region;
+    }
+
+    /// <summary>
+    /// 상주 한도를 넘는 만큼 가장 오래전에 사용한 Region부터 내리기
+    /// </summary>
+    private void TrimResidentRegions()
+    {
+        while (_regions.Count > _maxResidentRegions && _residentLru.First != null)
+        {
+            PageOut(_residentLru.First.Value);
+        }
+    }
+
+    /// <summary>
+    /// Region을 메모리에서 내리기 (변경되었으면 먼저 파일에 기록)
+    /// 내린 Region 객체는 Terrain에서 분리되므로 이후 수정해도 반영되지 않음
+    /// </summary>
+    private void PageOut(int regionId)
+    {
+        if (_residentNodes.Remove(regionId, out var node))
+            _residentLru.Remove(node);
+
+        if (!_regions.Remove(regionId, out var region))
+            return;
+
+        if (_dirtyRegions.Contains(regionId))
+            WriteBack(region);
+        else if (_summaries[regionId].IsStale)
+            _summaries[regionId].Rebuild(region, GetRegionEdges(regionId));
+
+        region.OwnerWorld = null;
+        PageOutCount++;
+    }
+
+    /// <summary>
+    /// Region 파일 기록 + 포털 요약 갱신
+    /// </summary>
+    private void WriteBack(Region region)
+    {
+        _pageStore!.Write(ExportRegion(region));
+        _summaries[region.Id].Rebuild(region, GetRegionEdges(region.Id));
+        _dirtyRegions.Remove(region.Id);
+    }
+
+    /// <summary>
+    /// 페이징 모드에서 새 Region 추가 시 (아직 파일이 없으므로 변경된 것으로 표시)
+    /// </summary>
+    private void OnPagedRegionAdded(Region region)
+    {
+        _summaries[region.Id] = new RegionSummary(region.Id) { Name = region.Name };
+        _dirtyRegions.Add(region.Id);
+        TouchResident(region.Id);
+        TrimResidentRegions();
+    }
+
+    /// <summary>
+    /// 페이징 모드에서 Region 제거 시
+    /// </summary>
+    private void OnPagedRegionRemoved(int regionId)
+    {
+        if (_residentNodes.Remove(regionId, out var node))
+            _residentLru.Remove(node);
+
+        _summaries.Remove(regionId);
+        _dirtyRegions.Remove(regionId);
+        _pageStore!.Delete(regionId);
+    }
+
+    /// <summary>
+    /// RegionEdge 추가/제거로 포털이 바뀐 양쪽 Region의 요약 무효화
+    /// </summary>
+    private void InvalidatePortalSummaries(RegionEdge edge)
+    {
+        if (_pageStore == null)
+            return;
+
+        if (_summaries.TryGetValue(edge.LocationA.RegionId, out var summaryA))
+            summaryA.IsStale = true;
+        if (_summaries.TryGetValue(edge.LocationB.RegionId, out var summaryB))
+            summaryB.IsStale = true;
+    }
+
+    #endregion
+
+    #region Checkpoint
+
+    /// <summary>
+    /// 체크포인트 레이어
+    /// 변경 플래그는 시작 시 저장하고, 구조(Region/Edge)는 처음 변경될 때만 복사
+    /// </summary>
+    private class TerrainCheckpoint
+    {
+        public int[] ChangedRegions = Array.Empty<int>();
+        public bool RegionEdgeChanged;
+        public TerrainJsonData? Structure;
+    }
+
+    private readonly List<TerrainCheckpoint> _checkpoints = new();
+    private bool _restoringCheckpoint = false;
+
+    /// <summary>
+    /// 구조 변경 직전 호출 (활성 체크포인트가 있으면 변경 전 구조를 한 번만 복사)
+    /// </summary>
+    internal void BeforeStructuralChange()
+    {
+        if (_checkpoints.Count == 0 || _restoringCheckpoint)
+            return;
+
+        _checkpoints[^1].Structure ??= ExportToData();
+    }
+
+    public void BeginCheckpoint()
+    {
+        _checkpoints.Add(new TerrainCheckpoint
+        {
+            ChangedRegions = _changedRegions.ToArray(),
+            RegionEdgeChanged = _isRegionEdgeChanged
+        });
+    }
+
+    public void RollbackCheckpoint()
+    {
+        var top = _checkpoints[^1];
+        _checkpoints.RemoveAt(_checkpoints.Count - 1);
+
+        if (top.Structure != null)
+        {
+            _restoringCheckpoint = true;
+            try
+            {
+                UpdateFromData(top.Structure);
+            }
+            finally
+            {
+                _restoringCheckpoint = false;
+            }
+        }
+
+        // 변경 플래그 복원
+        ClearAllChangedFlags();
+        foreach (var regionId in top.ChangedRegions)
+        {
+            if (_regions.TryGetValue(regionId, out var region))
+                region.MarkAsChanged();
+            else if (HasRegion(regionId))
+                MarkRegionAsChanged(regionId);
+        }
+        if (top.RegionEdgeChanged)
+            MarkRegionEdgeAsChanged();
+    }
+
+    public void ReleaseCheckpoint()
+    {
+        var top = _checkpoints[^1];
+        _checkpoints.RemoveAt(_checkpoints.Count - 1);
+
+        // 아래 레이어에 구조 복사본이 없으면 그 사이에 구조 변경이 없었으므로 위 레이어 복사본이 그대로 유효
+        if (_checkpoints.Count > 0 && top.Structure != null)
+            _checkpoints[^1].Structure ??= top.Structure;
+    }
+
+    #endregion
+
     #region JSON Serialization
 
     /// <summary>
@@ -707,12 +1121,7 @@ public class Terrain
     /// </summary>
     public static Terrain LoadFromFile(string filePath)
     {
-        using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-        if (file == null)
-        {
-            throw new InvalidOperationException($"Failed to open file for reading: {filePath}");
-        }
-        var json = file.GetAsText();
+        var json = GamePath.ReadAllText(filePath);
         return LoadFromJson(json);
     }
 
@@ -811,12 +1220,7 @@ public class Terrain
     /// </summary>
     public void UpdateFromFile(string filePath)
     {
-        using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-        if (file == null)
-        {
-            throw new InvalidOperationException($"Failed to open file for reading: {filePath}");
-        }
-        var json = file.GetAsText();
+        var json = GamePath.ReadAllText(filePath);
         UpdateFromJson(json);
     }
 
@@ -841,10 +1245,13 @@ public class Terrain
     /// <summary>
     /// TerrainJsonData로 현재 Terrain 업데이트
     /// </summary>
-    private void UpdateFromData(TerrainJsonData data)
+    internal void UpdateFromData(TerrainJsonData data)
     {
+        // 내용이 통째로 바뀌므로 다음 청크 저장은 전체 기록
+        _chunkIndex = null;
+
         // 기존 데이터 모두 제거
-        var regionIds = _regions.Keys.ToList();
+        var regionIds = AllRegionIds.ToList();
         foreach (var regionId in regionIds)
         {
             RemoveRegion(regionId);
@@ -940,18 +1347,43 @@ public class Terrain
     }
 
     /// <summary>
-    /// Terrain을 JSON 파일로 저장
+    /// 다른 Terrain(스트리밍 파서 결과 등)의 Region/RegionEdge를 넘겨받아 현재 내용 교체
+    /// 객체를 복사하지 않고 소유권만 옮기므로 source는 이후 사용하지 않아야 함
     /// </summary>
-    public void SaveToFile(string filePath)
+    internal void ReplaceWith(Terrain source)
     {
-        var json = ToJson();
+        // 내용이 통째로 바뀌므로 다음 청크 저장은 전체 기록
+        _chunkIndex = null;
 
-        using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Write);
-        if (file == null)
+        var regionIds = AllRegionIds.ToList();
+        foreach (var regionId in regionIds)
         {
-            throw new InvalidOperationException($"Failed to open file for writing: {filePath}");
+            RemoveRegion(regionId);
         }
-        file.StoreString(json);
+
+        Name = source.Name;
+
+        foreach (var region in source._regions.Values)
+        {
+            AddRegion(region);
+        }
+        foreach (var edge in source._regionEdges.Values)
+        {
+            AddRegionEdge(edge);
+        }
+
+        // 변경 플래그 초기화
+        ClearAllChangedFlags();
+    }
+
+    /// <summary>
+    /// Terrain을 JSON 파일로 저장 (항상 전체 기록, 변경분만 저장하려면 SaveChunks)
+    /// </summary>
+    public void SaveToFile(string filePath)
+    {
+        var json = ToJson();
+
+        GamePath.WriteAllText(filePath, json);
     }
 
     /// <summary>
@@ -973,68 +1405,90 @@ public class Terrain
     /// <summary>
     /// Terrain을 TerrainJsonData로 변환
     /// </summary>
-    private TerrainJsonData ExportToData()
+    internal TerrainJsonData ExportToData()
     {
         var data = new TerrainJsonData
         {
             Name = Name
         };
 
-        // Region 내보내기
-        foreach (var region in _regions.Values.OrderBy(r => r.Id))
+        // Region 내보내기 (페이징 모드에서 상주하지 않는 Region은 파일 내용을 그대로 사용)
+        foreach (var regionId in AllRegionIds.OrderBy(id => id))
         {
-            var regionData = new RegionJsonData
-            {
-                Id = region.Id,
-                Name = region.Name
-            };
+            data.Regions.Add(_regions.TryGetValue(regionId, out var region)
+                ? ExportRegion(region)
+                : _pageStore!.ReadData(regionId));
+        }
+
+        // RegionEdge 내보내기
+        data.RegionEdges.AddRange(ExportRegionEdges());
 
-            // Region Appearance 내보내기
-            if (region.Appearance.Count > 0)
-                regionData.Appearance = new Dictionary<string, string>(region.Appearance);
+        return data;
+    }
 
-            // Location 내보내기
-            foreach (var location in region.Locations.OrderBy(l => l.LocalId))
+    /// <summary>
+    /// Region을 RegionJsonData로 변환
+    /// </summary>
+    private static RegionJsonData ExportRegion(Region region)
+    {
+        var regionData = new RegionJsonData
+        {
+            Id = region.Id,
+            Name = region.Name
+        };
+
+        // Region Appearance 내보내기
+        if (region.Appearance.Count > 0)
+            regionData.Appearance = new Dictionary<string, string>(region.Appearance);
+
+        // Location 내보내기
+        foreach (var location in region.Locations.OrderBy(l => l.LocalId))
+        {
+            var locationData = new LocationJsonData
             {
-                var locationData = new LocationJsonData
-                {
-                    Id = location.LocalId,
-                    Name = location.Name
-                };
+                Id = location.LocalId,
+                Name = location.Name
+            };
 
-                // Appearance 내보내기
-                if (location.Appearance.Count > 0)
-                    locationData.Appearance = new Dictionary<string, string>(location.Appearance);
+            // Appearance 내보내기
+            if (location.Appearance.Count > 0)
+                locationData.Appearance = new Dictionary<string, string>(location.Appearance);
 
-                // 주의: Location의 바닥 아이템은 InventorySystem에서 관리됨
+            // 주의: Location의 바닥 아이템은 InventorySystem에서 관리됨
 
-                regionData.Locations.Add(locationData);
-            }
+            regionData.Locations.Add(locationData);
+        }
 
-            // Edge 내보내기
-            foreach (var edge in region.Edges)
+        // Edge 내보내기
+        foreach (var edge in region.Edges)
+        {
+            var edgeData = new EdgeJsonData
             {
-                var edgeData = new EdgeJsonData
-                {
-                    A = edge.LocationA.LocalId,
-                    B = edge.LocationB.LocalId,
-                    TimeAtoB = edge.TravelTimeAtoB,
-                    TimeBtoA = edge.TravelTimeBtoA,
-                    IsBlocked = edge.IsBlocked
-                };
-
-                if (edge.ConditionsAtoB.Count > 0)
-                    edgeData.ConditionsAtoB = new Dictionary<string, int>(edge.ConditionsAtoB);
-                if (edge.ConditionsBtoA.Count > 0)
-                    edgeData.ConditionsBtoA = new Dictionary<string, int>(edge.ConditionsBtoA);
+                A = edge.LocationA.LocalId,
+                B = edge.LocationB.LocalId,
+                TimeAtoB = edge.TravelTimeAtoB,
+                TimeBtoA = edge.TravelTimeBtoA,
+                IsBlocked = edge.IsBlocked
+            };
 
-                regionData.Edges.Add(edgeData);
-            }
+            if (edge.ConditionsAtoB.Count > 0)
+                edgeData.ConditionsAtoB = new Dictionary<string, int>(edge.ConditionsAtoB);
+            if (edge.ConditionsBtoA.Count > 0)
+                edgeData.ConditionsBtoA = new Dictionary<string, int>(edge.ConditionsBtoA);
 
-            data.Regions.Add(regionData);
+            regionData.Edges.Add(edgeData);
         }
 
-        // RegionEdge 내보내기
+        return regionData;
+    }
+
+
+    /// <summary>
+    /// 모든 RegionEdge를 ID 순으로 RegionEdgeJsonData로 변환
+    /// </summary>
+    private List<RegionEdgeJsonData> ExportRegionEdges()
+    {
+        var result = new List<RegionEdgeJsonData>(_regionEdges.Count);
         foreach (var edge in _regionEdges.Values.OrderBy(e => e.Id))
         {
             var edgeData = new RegionEdgeJsonData
@@ -1055,10 +1509,117 @@ public class Terrain
             if (edge.ConditionsBtoA.Count > 0)
                 edgeData.ConditionsBtoA = new Dictionary<string, int>(edge.ConditionsBtoA);
 
-            data.RegionEdges.Add(edgeData);
+            result.Add(edgeData);
         }
+        return result;
+    }
 
-        return data;
+    #endregion
+
+    #region Chunked Persistence
+
+    public const string ChunkIndexFile = "terrain_index.json";
+    public const string RegionEdgeChunkFile = "region_edges.json";
+
+    /// <summary>
+    /// 마지막으로 청크 저장/로드한 폴더 (다른 폴더로 저장하면 전체 기록)
+    /// </summary>
+    private string? _chunkDirectory;
+    /// <summary>
+    /// 마지막 청크 저장/로드 시점의 인덱스 (추가/삭제된 Region 판단용)
+    /// </summary>
+    private TerrainChunkIndexJsonData? _chunkIndex;
+
+    /// <summary>
+    /// 변경분만 청크 파일로 저장
+    /// - terrain_index.json: 이름 + Region ID 목록 (Region이 추가/삭제되었거나 이름이 바뀌었을 때만)
+    /// - region_{id}.json: 변경/추가된 Region만 (삭제된 Region 파일은 제거)
+    /// - region_edges.json: RegionEdge가 변경되었을 때만
+    /// 같은 폴더에 처음 저장할 때는 전체를 기록하며, 저장 후 변경 플래그를 초기화
+    /// </summary>
+    /// <param name="directory">저장 폴더 (예: "user://save/terrain/")</param>
+    /// <returns>기록한 파일 수</returns>
+    public int SaveChunks(string directory)
+    {
+        var store = new RegionFileStore(directory);
+        var previous = _chunkDirectory == store.Directory ? _chunkIndex : null;
+        var previousIds = previous != null ? new HashSet<int>(previous.Regions) : null;
+        int written = 0;
+
+        var index = new TerrainChunkIndexJsonData
+        {
+            Name = Name,
+            Regions = AllRegionIds.OrderBy(id => id).ToList()
+        };
+
+        // 1. Region 청크
+        foreach (var regionId in index.Regions)
+        {
+            if (previousIds != null && previousIds.Contains(regionId) && !_changedRegions.Contains(regionId))
+                continue;
+
+            store.Write(_regions.TryGetValue(regionId, out var region)
+                ? ExportRegion(region)
+                : _pageStore!.ReadData(regionId));
+            written++;
+        }
+
+        if (previousIds != null)
+        {
+            previousIds.ExceptWith(index.Regions);
+            foreach (var removedId in previousIds)
+            {
+                store.Delete(removedId);
+            }
+        }
+
+        // 2. RegionEdge 테이블
+        if (previous == null || _isRegionEdgeChanged)
+        {
+            store.WriteFile(RegionEdgeChunkFile, ExportRegionEdges());
+            written++;
+        }
+
+        // 3. 인덱스
+        if (previous == null || previous.Name != index.Name || !previous.Regions.SequenceEqual(index.Regions))
+        {
+            store.WriteFile(ChunkIndexFile, index);
+            written++;
+        }
+
+        _chunkDirectory = store.Directory;
+        _chunkIndex = index;
+        ClearAllChangedFlags();
+        return written;
+    }
+
+    /// <summary>
+    /// 청크 파일에서 Terrain 재구성 (SaveChunks의 역)
+    /// </summary>
+    /// <returns>인덱스 파일이 없으면 false</returns>
+    public bool LoadChunks(string directory)
+    {
+        var store = new RegionFileStore(directory);
+        var index = store.ReadFile<TerrainChunkIndexJsonData>(ChunkIndexFile);
+        if (index == null)
+            return false;
+
+        var data = new TerrainJsonData
+        {
+            Name = index.Name,
+            RegionEdges = store.ReadFile<List<RegionEdgeJsonData>>(RegionEdgeChunkFile) ?? new()
+        };
+        foreach (var regionId in index.Regions)
+        {
+            data.Regions.Add(store.ReadData(regionId));
+        }
+
+        // UpdateFromData 마지막에 ClearAllChangedFlags 호출
+        UpdateFromData(data);
+
+        _chunkDirectory = store.Directory;
+        _chunkIndex = index;
+        return true;
     }
 
     #endregion
@@ -1071,7 +1632,7 @@ public class Terrain
     public void DebugPrint(bool includeEdges = true, bool includeRegionEdges = true)
     {
         var output = GetDebugString(includeEdges, includeRegionEdges);
-        GD.Print(output);
+        _log.Debug(output);
     }
 
     /// <summary>
@@ -1090,7 +1651,7 @@ public class Terrain
         lines.Add("");
 
         // 각 Region 출력
-        foreach (var region in _regions.Values.OrderBy(r => r.Id))
+        foreach (var region in AllRegions().OrderBy(r => r.Id))
         {
             lines.Add($"┌─────────────────────────────────────────────────────────────┐");
             lines.Add($"│ Region [{region.Id}]: {region.Name ?? "Unnamed",-45} │");
@@ -1206,7 +1767,7 @@ public class Terrain
     public void DebugPrintSummary()
     {
         var output = GetDebugSummary();
-        GD.Print(output);
+        _log.Debug(output);
     }
 
     /// <summary>
@@ -1223,7 +1784,7 @@ public class Terrain
         lines.Add($"  RegionEdges: {RegionEdgeCount}");
         lines.Add("");
 
-        foreach (var region in _regions.Values.OrderBy(r => r.Id))
+        foreach (var region in AllRegions().OrderBy(r => r.Id))
         {
             lines.Add($"  [{region.Id}] {region.Name ?? "Unnamed"}: {region.LocationCount} locations, {region.EdgeCount} edges");
         }
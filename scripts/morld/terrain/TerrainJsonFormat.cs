@@ -125,4 +125,17 @@ public class RegionEdgeJsonData
     public bool IsBlocked { get; set; }
 }
 
+/// <summary>
+/// 청크 저장 인덱스 (terrain_index.json)
+/// Region 본문은 region_{id}.json, RegionEdge 테이블은 region_edges.json에 따로 저장
+/// </summary>
+public class TerrainChunkIndexJsonData
+{
+    [JsonPropertyName("name")]
+    public string Name { get; set; } = "unknown";
+
+    [JsonPropertyName("regions")]
+    public List<int> Regions { get; set; } = new();
+}
+
 #endregion
@@ -0,0 +1,258 @@
+namespace Morld;
+
+using System;
+using System.Collections.Generic;
+using System.Text.Json;
+
+/// <summary>
+/// location_data.json 스트리밍 파서
+/// TerrainJsonData를 거치지 않고 UTF-8 바이트에서 바로 Region/Location/Edge를 생성
+/// (워커 스레드에서 호출 가능 - 결과 Terrain은 어떤 월드에도 연결되지 않은 상태)
+/// </summary>
+internal static class TerrainStreamParser
+{
+    /// <summary>
+    /// 새 Terrain으로 파싱
+    /// </summary>
+    public static Terrain Parse(ReadOnlySpan<byte> utf8)
+    {
+        var reader = JsonStream.CreateReader(utf8);
+        var terrain = new Terrain();
+        var regionEdges = new List<RegionEdge>();
+
+        JsonStream.Expect(ref reader, JsonTokenType.StartObject);
+        while (JsonStream.NextProperty(ref reader))
+        {
+            if (reader.ValueTextEquals("name"u8))
+            {
+                terrain.Name = JsonStream.ReadString(ref reader) ?? "unknown";
+            }
+            else if (reader.ValueTextEquals("regions"u8))
+            {
+                if (!JsonStream.BeginArray(ref reader))
+                    continue;
+                while (JsonStream.NextElement(ref reader))
+                {
+                    terrain.AddRegion(ParseRegion(ref reader));
+                }
+            }
+            else if (reader.ValueTextEquals("regionEdges"u8))
+            {
+                if (!JsonStream.BeginArray(ref reader))
+                    continue;
+                while (JsonStream.NextElement(ref reader))
+                {
+                    regionEdges.Add(ParseRegionEdge(ref reader));
+                }
+            }
+            else
+            {
+                JsonStream.SkipValue(ref reader);
+            }
+        }
+
+        // RegionEdge는 양쪽 Region이 모두 있어야 추가 가능하므로 마지막에 연결
+        foreach (var edge in regionEdges)
+        {
+            terrain.AddRegionEdge(edge);
+        }
+
+        terrain.ClearAllChangedFlags();
+        return terrain;
+    }
+
+    /// <summary>
+    /// Region 하나로 파싱 (페이징 모드의 region_{id}.json)
+    /// </summary>
+    public static Region ParseRegion(ReadOnlySpan<byte> utf8)
+    {
+        var reader = JsonStream.CreateReader(utf8);
+        JsonStream.Expect(ref reader, JsonTokenType.StartObject);
+        var region = ParseRegion(ref reader);
+        region.ClearChangedFlag();
+        return region;
+    }
+
+    private static Region ParseRegion(ref Utf8JsonReader reader)
+    {
+        Region? region = null;
+        string name = "unknown";
+
+        while (JsonStream.NextProperty(ref reader))
+        {
+            if (reader.ValueTextEquals("id"u8))
+            {
+                region = new Region(JsonStream.ReadInt(ref reader));
+            }
+            else if (reader.ValueTextEquals("name"u8))
+            {
+                name = JsonStream.ReadString(ref reader) ?? "unknown";
+            }
+            else if (reader.ValueTextEquals("appearance"u8))
+            {
+                if (region == null) throw JsonStream.MissingId("region", ref reader);
+                JsonStream.ReadStringStringMap(ref reader, region.Appearance);
+            }
+            else if (reader.ValueTextEquals("locations"u8))
+            {
+                if (region == null) throw JsonStream.MissingId("region", ref reader);
+                if (!JsonStream.BeginArray(ref reader))
+                    continue;
+                while (JsonStream.NextElement(ref reader))
+                {
+                    ParseLocation(ref reader, region);
+                }
+            }
+            else if (reader.ValueTextEquals("edges"u8))
+            {
+                if (region == null) throw JsonStream.MissingId("region", ref reader);
+                if (!JsonStream.BeginArray(ref reader))
+                    continue;
+                while (JsonStream.NextElement(ref reader))
+                {
+                    ParseEdge(ref reader, region);
+                }
+            }
+            else
+            {
+                JsonStream.SkipValue(ref reader);
+            }
+        }
+
+        if (region == null)
+            throw new JsonException("region: missing 'id'");
+
+        region.Name = name;
+        return region;
+    }
+
+    private static void ParseLocation(ref Utf8JsonReader reader, Region region)
+    {
+        Location? location = null;
+        string name = "unknown";
+
+        while (JsonStream.NextProperty(ref reader))
+        {
+            if (reader.ValueTextEquals("id"u8))
+            {
+                location = region.AddLocation(JsonStream.ReadInt(ref reader));
+            }
+            else if (reader.ValueTextEquals("name"u8))
+            {
+                name = JsonStream.ReadString(ref reader) ?? "unknown";
+            }
+            else if (reader.ValueTextEquals("appearance"u8))
+            {
+                if (location == null) throw JsonStream.MissingId("location", ref reader);
+                JsonStream.ReadStringStringMap(ref reader, location.Appearance);
+            }
+            else
+            {
+                // 주의: Location의 바닥 아이템(inventory)은 InventorySystem에서 관리됨
+                JsonStream.SkipValue(ref reader);
+            }
+        }
+
+        if (location == null)
+            throw new JsonException($"region {region.Id}: location missing 'id'");
+
+        location.Name = name;
+    }
+
+    private static void ParseEdge(ref Utf8JsonReader reader, Region region)
+    {
+        int a = 0, b = 0;
+        int timeAtoB = -1, timeBtoA = -1;
+        bool isBlocked = false;
+        Dictionary<string, int>? conditionsAtoB = null;
+        Dictionary<string, int>? conditionsBtoA = null;
+
+        while (JsonStream.NextProperty(ref reader))
+        {
+            if (reader.ValueTextEquals("a"u8))
+                a = JsonStream.ReadInt(ref reader);
+            else if (reader.ValueTextEquals("b"u8))
+                b = JsonStream.ReadInt(ref reader);
+            else if (reader.ValueTextEquals("timeAtoB"u8))
+                timeAtoB = JsonStream.ReadInt(ref reader, -1);
+            else if (reader.ValueTextEquals("timeBtoA"u8))
+                timeBtoA = JsonStream.ReadInt(ref reader, -1);
+            else if (reader.ValueTextEquals("conditionsAtoB"u8))
+                JsonStream.ReadStringIntMap(ref reader, conditionsAtoB ??= new());
+            else if (reader.ValueTextEquals("conditionsBtoA"u8))
+                JsonStream.ReadStringIntMap(ref reader, conditionsBtoA ??= new());
+            else if (reader.ValueTextEquals("isBlocked"u8))
+                isBlocked = JsonStream.ReadBool(ref reader);
+            else
+                JsonStream.SkipValue(ref reader);
+        }
+
+        var edge = region.AddEdge(a, b, timeAtoB, timeBtoA);
+        if (conditionsAtoB != null)
+        {
+            foreach (var (tag, value) in conditionsAtoB)
+                edge.AddConditionAtoB(tag, value);
+        }
+        if (conditionsBtoA != null)
+        {
+            foreach (var (tag, value) in conditionsBtoA)
+                edge.AddConditionBtoA(tag, value);
+        }
+        edge.IsBlocked = isBlocked;
+    }
+
+    private static RegionEdge ParseRegionEdge(ref Utf8JsonReader reader)
+    {
+        int id = 0;
+        int regionA = 0, localA = 0, regionB = 0, localB = 0;
+        int timeAtoB = -1, timeBtoA = -1;
+        string name = "unknown";
+        bool isBlocked = false;
+        Dictionary<string, int>? conditionsAtoB = null;
+        Dictionary<string, int>? conditionsBtoA = null;
+
+        while (JsonStream.NextProperty(ref reader))
+        {
+            if (reader.ValueTextEquals("id"u8))
+                id = JsonStream.ReadInt(ref reader);
+            else if (reader.ValueTextEquals("name"u8))
+                name = JsonStream.ReadString(ref reader) ?? "unknown";
+            else if (reader.ValueTextEquals("regionA"u8))
+                regionA = JsonStream.ReadInt(ref reader);
+            else if (reader.ValueTextEquals("localA"u8))
+                localA = JsonStream.ReadInt(ref reader);
+            else if (reader.ValueTextEquals("regionB"u8))
+                regionB = JsonStream.ReadInt(ref reader);
+            else if (reader.ValueTextEquals("localB"u8))
+                localB = JsonStream.ReadInt(ref reader);
+            else if (reader.ValueTextEquals("timeAtoB"u8))
+                timeAtoB = JsonStream.ReadInt(ref reader, -1);
+            else if (reader.ValueTextEquals("timeBtoA"u8))
+                timeBtoA = JsonStream.ReadInt(ref reader, -1);
+            else if (reader.ValueTextEquals("conditionsAtoB"u8))
+                JsonStream.ReadStringIntMap(ref reader, conditionsAtoB ??= new());
+            else if (reader.ValueTextEquals("conditionsBtoA"u8))
+                JsonStream.ReadStringIntMap(ref reader, conditionsBtoA ??= new());
+            else if (reader.ValueTextEquals("isBlocked"u8))
+                isBlocked = JsonStream.ReadBool(ref reader);
+            else
+                JsonStream.SkipValue(ref reader);
+        }
+
+        var edge = new RegionEdge(id, regionA, localA, regionB, localB);
+        edge.SetTravelTime(timeAtoB, timeBtoA);
+        edge.Name = name;
+        edge.IsBlocked = isBlocked;
+        if (conditionsAtoB != null)
+        {
+            foreach (var (tag, value) in conditionsAtoB)
+                edge.AddConditionAtoB(tag, value);
+        }
+        if (conditionsBtoA != null)
+        {
+            foreach (var (tag, value) in conditionsBtoA)
+                edge.AddConditionBtoA(tag, value);
+        }
+        return edge;
+    }
+}
@@ -0,0 +1,344 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.Compression;
+using System.Text;
+using SE;
+
+namespace Morld;
+
+/// <summary>
+/// 행동 로그 링 버퍼 (고정 용량)
+/// - 용량 초과 시 가장 오래된 항목을 덮어씀 (메모리 일정)
+/// - 읽지 않은 로그 수를 카운터로 유지 (O(1))
+/// - 밀려난 항목은 선택적으로 gzip 히스토리 파일에 기록 (MaxHistoryBytes를 넘으면 .1로 교체, 최대 두 파일)
+/// - 체크포인트: 이후 추가된 항목 제거, 밀려난 항목 복원 (히스토리 파일은 되돌리지 않음)
+/// </summary>
+public class ActionLogBuffer : ICheckpointable
+{
+	private static readonly LogCategory _log = Log.Category("ActionLogBuffer");
+
+	private readonly ActionLogEntry?[] _entries;
+	private int _head = 0;        // 가장 오래된 항목 위치
+	private int _count = 0;
+	private long _nextSeq = 0;    // 다음에 추가될 항목의 순번 (누적)
+	private long _unreadFromSeq = 0;  // 이 순번 이전 항목은 MarkAllAsRead로 모두 읽음 처리됨
+	private int _unreadCount = 0;
+
+	// 히스토리 파일 (null = 기록 안 함)
+	private readonly string? _spillPath;
+	private readonly List<string> _pendingSpill = new();
+	private const int SpillBatchSize = 64;  // 이 개수만큼 모이면 gzip 멤버 하나로 기록
+
+	/// <summary>
+	/// 히스토리 파일 최대 크기 (바이트) - 넘으면 기존 파일을 .1로 옮기고 새 파일에 기록
+	/// </summary>
+	public long MaxHistoryBytes { get; set; } = 1 << 20;
+
+	// 체크포인트 레이어: 시작 순번과 그 이후 밀려난(체크포인트 이전) 항목
+	private readonly List<(long Seq, List<(long Seq, ActionLogEntry Entry)> Evicted)> _checkpoints = new();
+
+	/// <summary>
+	/// 최대 보관 개수
+	/// </summary>
+	public int Capacity => _entries.Length;
+
+	/// <summary>
+	/// 현재 보관 중인 로그 개수
+	/// </summary>
+	public int Count => _count;
+
+	/// <summary>
+	/// 읽지 않은 로그 개수
+	/// </summary>
+	public int UnreadCount => _unreadCount;
+
+	/// <summary>
+	/// 지금까지 추가된 전체 로그 수 (밀려난 항목 포함)
+	/// </summary>
+	public long TotalCount => _nextSeq;
+
+	/// <param name="capacity">최대 보관 개수</param>
+	/// <param name="spillPath">밀려난 로그를 기록할 gzip 파일 경로 (null = 기록 안 함, user:// 경로 가능)</param>
+	public ActionLogBuffer(int capacity, string? spillPath = null)
+	{
+		if (capacity <= 0)
+			throw new ArgumentException("Capacity must be positive", nameof(capacity));
+
+		_entries = new ActionLogEntry?[capacity];
+		_spillPath = spillPath;
+	}
+
+	/// <summary>
+	/// index번째 항목 (0 = 가장 오래된 항목)
+	/// </summary>
+	public ActionLogEntry this[int index]
+	{
+		get
+		{
+			if (index < 0 || index >= _count)
+				throw new ArgumentOutOfRangeException(nameof(index));
+			return _entries[(_head + index) % _entries.Length]!;
+		}
+	}
+
+	/// <summary>
+	/// 로그 추가 (용량 초과 시 가장 오래된 항목 제거)
+	/// </summary>
+	public void Add(ActionLogEntry entry)
+	{
+		if (_count == _entries.Length)
+		{
+			var evicted = _entries[_head]!;
+			KeepForCheckpoint(_nextSeq - _count, evicted);
+			if (!evicted.IsRead)
+				_unreadCount--;
+			if (_spillPath != null)
+				Spill(evicted);
+
+			_entries[_head] = entry;
+			_head = (_head + 1) % _entries.Length;
+		}
+		else
+		{
+			_entries[(_head + _count) % _entries.Length] = entry;
+			_count++;
+		}
+
+		if (!entry.IsRead)
+			_unreadCount++;
+		_nextSeq++;
+	}
+
+	/// <summary>
+	/// 최근 n개 항목 반환 (오래된 순) - O(n)
+	/// </summary>
+	public IReadOnlyList<ActionLogEntry> GetLast(int n)
+	{
+		int take = Math.Min(n, _count);
+		var result = new ActionLogEntry[take];
+		for (int i = 0; i < take; i++)
+		{
+			result[i] = this[_count - take + i];
+		}
+		return result;
+	}
+
+	/// <summary>
+	/// 최근 n개 항목 읽음 처리 - O(n)
+	/// </summary>
+	public void MarkLastAsRead(int n)
+	{
+		int take = Math.Min(n, _count);
+		for (int i = _count - take; i < _count; i++)
+		{
+			MarkAsRead(this[i]);
+		}
+	}
+
+	/// <summary>
+	/// 모든 항목 읽음 처리
+	/// 마지막 호출 이후 추가된 항목만 확인 (분할 상환 O(1))
+	/// </summary>
+	public void MarkAllAsRead()
+	{
+		if (_unreadCount > 0)
+		{
+			long oldestSeq = _nextSeq - _count;
+			long from = Math.Max(_unreadFromSeq, oldestSeq);
+			for (long seq = from; seq < _nextSeq; seq++)
+			{
+				MarkAsRead(this[(int)(seq - oldestSeq)]);
+			}
+		}
+		_unreadFromSeq = _nextSeq;
+	}
+
+	private void MarkAsRead(ActionLogEntry entry)
+	{
+		if (entry.IsRead) return;
+		entry.IsRead = true;
+		_unreadCount--;
+	}
+
+	/// <summary>
+	/// 보관 중인 항목 순회 (오래된 순)
+	/// </summary>
+	public IEnumerable<ActionLogEntry> Enumerate()
+	{
+		for (int i = 0; i < _count; i++)
+		{
+			yield return this[i];
+		}
+	}
+
+	/// <summary>
+	/// 전체 비우기 (히스토리 파일 대기분은 기록)
+	/// </summary>
+	public void Clear()
+	{
+		long oldestSeq = _nextSeq - _count;
+		for (int i = 0; i < _count; i++)
+		{
+			KeepForCheckpoint(oldestSeq + i, this[i]);
+		}
+
+		FlushHistory();
+		Array.Clear(_entries);
+		_head = 0;
+		_count = 0;
+		_unreadCount = 0;
+		_unreadFromSeq = _nextSeq;
+	}
+
+	// ===== 체크포인트 =====
+
+	/// <summary>
+	/// 버퍼에서 빠지는 항목이 활성 체크포인트 이전 것이면 보관
+	/// </summary>
+	private void KeepForCheckpoint(long seq, ActionLogEntry entry)
+	{
+		if (_checkpoints.Count == 0)
+			return;
+
+		var top = _checkpoints[^1];
+		if (seq < top.Seq)
+			top.Evicted.Add((seq, entry));
+	}
+
+	public void BeginCheckpoint()
+	{
+		_checkpoints.Add((_nextSeq, new List<(long Seq, ActionLogEntry Entry)>()));
+	}
+
+	public void RollbackCheckpoint()
+	{
+		var top = _checkpoints[^1];
+		_checkpoints.RemoveAt(_checkpoints.Count - 1);
+
+		// 밀려난 항목(오래된 순) + 남아 있는 체크포인트 이전 항목
+		var restored = new List<ActionLogEntry>(_entries.Length);
+		foreach (var (_, entry) in top.Evicted)
+		{
+			restored.Add(entry);
+		}
+		long oldestSeq = _nextSeq - _count;
+		for (int i = 0; i < _count && oldestSeq + i < top.Seq; i++)
+		{
+			restored.Add(this[i]);
+		}
+
+		int skip = Math.Max(0, restored.Count - _entries.Length);
+		Array.Clear(_entries);
+		_head = 0;
+		_count = restored.Count - skip;
+		_unreadCount = 0;
+		for (int i = 0; i < _count; i++)
+		{
+			var entry = restored[skip + i];
+			_entries[i] = entry;
+			if (!entry.IsRead)
+				_unreadCount++;
+		}
+
+		_nextSeq = top.Seq;
+		_unreadFromSeq = Math.Min(_unreadFromSeq, _nextSeq - _count);
+	}
+
+	public void ReleaseCheckpoint()
+	{
+		var top = _checkpoints[^1];
+		_checkpoints.RemoveAt(_checkpoints.Count - 1);
+		if (_checkpoints.Count == 0)
+			return;
+
+		var below = _checkpoints[^1];
+		foreach (var (seq, entry) in top.Evicted)
+		{
+			if (seq < below.Seq)
+				below.Evicted.Add((seq, entry));
+		}
+	}
+
+	// ===== 히스토리 파일 =====
+
+	private void Spill(ActionLogEntry entry)
+	{
+		_pendingSpill.Add(entry.Message);
+		if (_pendingSpill.Count >= SpillBatchSize)
+		{
+			FlushHistory();
+		}
+	}
+
+	/// <summary>
+	/// 대기 중인 히스토리를 gzip 멤버 하나로 파일 끝에 추가
+	/// (gzip은 여러 멤버를 이어 붙여도 하나의 스트림으로 해제 가능)
+	/// </summary>
+	public void FlushHistory()
+	{
+		if (_spillPath == null || _pendingSpill.Count == 0)
+			return;
+
+		try
+		{
+			var path = GamePath.Globalize(_spillPath);
+			RotateHistory(path);
+			using var file = new FileStream(path, FileMode.Append, System.IO.FileAccess.Write, FileShare.Read);
+			using var gzip = new GZipStream(file, CompressionLevel.Fastest);
+			using var writer = new StreamWriter(gzip, new UTF8Encoding(false));
+			foreach (var message in _pendingSpill)
+			{
+				writer.WriteLine(message);
+			}
+		}
+		catch (Exception ex)
+		{
+			_log.Error($"Failed to write history: {ex.Message}");
+		}
+
+		_pendingSpill.Clear();
+	}
+
+	/// <summary>
+	/// 히스토리 파일이 MaxHistoryBytes 이상이면 .1로 옮김 (기존 .1은 버림)
+	/// </summary>
+	private void RotateHistory(string path)
+	{
+		var info = new FileInfo(path);
+		if (!info.Exists || info.Length < MaxHistoryBytes)
+			return;
+
+		File.Move(path, path + ".1", overwrite: true);
+	}
+
+	/// <summary>
+	/// 히스토리 파일 읽기 (디버그/회상용, 교체된 이전 파일부터 순서대로)
+	/// </summary>
+	public IEnumerable<string> ReadHistory()
+	{
+		if (_spillPath == null)
+			yield break;
+
+		var path = GamePath.Globalize(_spillPath);
+		foreach (var line in ReadHistoryFile(path + ".1"))
+			yield return line;
+		foreach (var line in ReadHistoryFile(path))
+			yield return line;
+	}
+
+	private static IEnumerable<string> ReadHistoryFile(string path)
+	{
+		if (!File.Exists(path))
+			yield break;
+
+		using var file = new FileStream(path, FileMode.Open, System.IO.FileAccess.Read, FileShare.ReadWrite);
+		using var gzip = new GZipStream(file, CompressionMode.Decompress);
+		using var reader = new StreamReader(gzip, Encoding.UTF8);
+		string? line;
+		while ((line = reader.ReadLine()) != null)
+		{
+			yield return line;
+		}
+	}
+}
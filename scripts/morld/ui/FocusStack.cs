@@ -1,6 +1,5 @@
 using System;
 using System.Collections.Generic;
-using Godot;
 
 namespace Morld;
 
@@ -9,6 +8,8 @@ namespace Morld;
 /// </summary>
 public class FocusStack
 {
+	private static readonly LogCategory _log = Log.Category("FocusStack");
+
 	private readonly Stack<Focus> _layers = new();
 	private int _maxDepth = 10;
 
@@ -43,7 +44,7 @@ public class FocusStack
 		}
 		var before = _layers.Count;
 		_layers.Push(focus);
-		GD.Print($"[FocusStack] {before} -> {_layers.Count} (push {focus.Type})");
+		_log.Debug($"{before} -> {_layers.Count} (push {focus.Type})");
 	}
 
 	/// <summary>
@@ -57,11 +58,11 @@ public class FocusStack
 		}
 		if (_layers.Count == 1)
 		{
-			GD.PrintErr("[FocusStack] Warning: Pop called on stack with only 1 layer. This indicates a content or logic bug.");
+			_log.Warning("Pop called on stack with only 1 layer. This indicates a content or logic bug.");
 		}
 		var before = _layers.Count;
 		var popped = _layers.Pop();
-		GD.Print($"[FocusStack] {before} -> {_layers.Count} (pop {popped.Type})");
+		_log.Debug($"{before} -> {_layers.Count} (pop {popped.Type})");
 	}
 
 	/// <summary>
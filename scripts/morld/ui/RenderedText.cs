@@ -0,0 +1,143 @@
+using System.Collections.Generic;
+using System.Text;
+
+namespace Morld;
+
+/// <summary>
+/// 토글이 적용된 렌더링 결과 (hover 미적용 상태)
+/// [url=X]링크[/url] 의 링크 텍스트 위치를 미리 기록해두고,
+/// hover 변경 시 해당 링크 구간만 색상 태그로 감싸서 재출력
+/// </summary>
+public class RenderedText
+{
+	/// <summary>
+	/// 링크 텍스트 구간 (Text 내 [Start, End) 범위)
+	/// </summary>
+	private readonly struct UrlSpan
+	{
+		public readonly int Start;
+		public readonly int End;
+
+		public UrlSpan(int start, int end)
+		{
+			Start = start;
+			End = end;
+		}
+	}
+
+	private const string UrlPrefix = "[url=";
+	private const string UrlClose = "[/url]";
+	private const char TagEnd = ']';
+
+	private readonly Dictionary<string, List<UrlSpan>> _spansByMeta = new();
+
+	// 마지막 hover 출력 캐시 (같은 메타로 반복 요청 시 재사용)
+	private string? _lastHoveredMeta;
+	private string? _lastHoveredText;
+
+	/// <summary>
+	/// hover가 적용되지 않은 BBCode 텍스트
+	/// </summary>
+	public string Text { get; }
+
+	/// <summary>
+	/// 빈 렌더링 결과
+	/// </summary>
+	public static readonly RenderedText Empty = new("");
+
+	public RenderedText(string text)
+	{
+		Text = text ?? "";
+		IndexUrlSpans();
+	}
+
+	/// <summary>
+	/// 해당 메타의 링크가 존재하는지 확인
+	/// </summary>
+	public bool HasUrl(string meta) => _spansByMeta.ContainsKey(meta);
+
+	/// <summary>
+	/// 텍스트에 있는 링크 메타 목록 (처음 등장한 순서, 중복 없음)
+	/// </summary>
+	public IReadOnlyCollection<string> Metas => _spansByMeta.Keys;
+
+	/// <summary>
+	/// hover 색상을 적용한 BBCode 출력
+	/// hover 대상 링크가 없으면 Text를 그대로 반환 (재생성 없음)
+	/// </summary>
+	/// <param name="hoveredMeta">현재 hover 중인 메타 (null = 없음)</param>
+	/// <param name="hoverColor">hover 색상</param>
+	public string Emit(string? hoveredMeta, string hoverColor)
+	{
+		if (string.IsNullOrEmpty(hoveredMeta))
+			return Text;
+
+		if (!_spansByMeta.TryGetValue(hoveredMeta, out var spans))
+			return Text;
+
+		if (_lastHoveredMeta == hoveredMeta && _lastHoveredText != null)
+			return _lastHoveredText;
+
+		var colorOpen = $"[color={hoverColor}]";
+		const string colorClose = "[/color]";
+
+		var result = new StringBuilder(Text.Length + spans.Count * (colorOpen.Length + colorClose.Length));
+		int copied = 0;
+
+		// 링크 구간 사이는 통째로 복사, 링크 텍스트만 색상 태그로 감싸기
+		foreach (var span in spans)
+		{
+			result.Append(Text, copied, span.Start - copied);
+			result.Append(colorOpen);
+			result.Append(Text, span.Start, span.End - span.Start);
+			result.Append(colorClose);
+			copied = span.End;
+		}
+		result.Append(Text, copied, Text.Length - copied);
+
+		_lastHoveredMeta = hoveredMeta;
+		_lastHoveredText = result.ToString();
+		return _lastHoveredText;
+	}
+
+	/// <summary>
+	/// [url=X]...[/url] 링크 텍스트 위치 색인 (생성 시 1회)
+	/// </summary>
+	private void IndexUrlSpans()
+	{
+		int i = 0;
+
+		while (i < Text.Length)
+		{
+			int open = Text.IndexOf(UrlPrefix, i, System.StringComparison.Ordinal);
+			if (open < 0)
+				break;
+
+			int metaStart = open + UrlPrefix.Length;
+			int metaEnd = Text.IndexOf(TagEnd, metaStart);
+			if (metaEnd <= metaStart)
+			{
+				i = open + 1;
+				continue;
+			}
+
+			int linkStart = metaEnd + 1;
+			int closePos = Text.IndexOf(UrlClose, linkStart, System.StringComparison.Ordinal);
+			if (closePos <= linkStart)
+			{
+				i = linkStart;
+				continue;
+			}
+
+			string meta = Text.Substring(metaStart, metaEnd - metaStart);
+			if (!_spansByMeta.TryGetValue(meta, out var spans))
+			{
+				spans = new List<UrlSpan>();
+				_spansByMeta[meta] = spans;
+			}
+			spans.Add(new UrlSpan(linkStart, closePos));
+
+			i = closePos + UrlClose.Length;
+		}
+	}
+}
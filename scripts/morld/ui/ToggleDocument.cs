@@ -0,0 +1,233 @@
+using System.Collections.Generic;
+using System.Text;
+
+namespace Morld;
+
+/// <summary>
+/// 토글 마크업 문서 (파싱된 트리)
+/// 생성된 BBCode 텍스트를 한 번만 파싱하여 [hidden=X] 블록과 ▶/▼ 토글 아이콘을 노드로 보관
+/// 토글 펼침/접힘 변경 시 원본 텍스트를 다시 스캔하지 않고 트리에서 바로 출력
+/// </summary>
+public class ToggleDocument
+{
+	private const string HiddenOpenPrefix = "[hidden=";
+	private const string HiddenClosePrefix = "[/hidden=";
+	private const char TagEnd = ']';
+	private const string ToggleUrlPrefix = "[url=toggle:";
+	private const string CollapsedIcon = "▶";
+	private const string ExpandedIcon = "▼";
+
+	/// <summary>
+	/// 문서 노드 (텍스트 / 토글 아이콘 / 숨김 블록)
+	/// </summary>
+	private abstract class Node
+	{
+	}
+
+	/// <summary>
+	/// 그대로 출력되는 텍스트 조각
+	/// </summary>
+	private sealed class TextNode : Node
+	{
+		public readonly string Text;
+
+		public TextNode(string text)
+		{
+			Text = text;
+		}
+	}
+
+	/// <summary>
+	/// [url=toggle:X] 바로 뒤의 ▶/▼ 아이콘
+	/// </summary>
+	private sealed class IconNode : Node
+	{
+		public readonly string ToggleId;
+
+		public IconNode(string toggleId)
+		{
+			ToggleId = toggleId;
+		}
+	}
+
+	/// <summary>
+	/// [hidden=X]...[/hidden=X] 블록
+	/// </summary>
+	private sealed class HiddenNode : Node
+	{
+		public readonly string Id;
+		public readonly List<Node> Children = new();
+
+		public HiddenNode(string id)
+		{
+			Id = id;
+		}
+	}
+
+	private readonly List<Node> _root = new();
+
+	/// <summary>
+	/// 파싱한 원본 텍스트
+	/// </summary>
+	public string Source { get; }
+
+	/// <summary>
+	/// 숨김 블록 수
+	/// </summary>
+	public int HiddenBlockCount { get; private set; }
+
+	private ToggleDocument(string source)
+	{
+		Source = source;
+	}
+
+	/// <summary>
+	/// BBCode 텍스트를 문서 트리로 파싱 (텍스트 생성 시 1회)
+	/// </summary>
+	public static ToggleDocument Parse(string text)
+	{
+		var document = new ToggleDocument(text ?? "");
+		document.Build();
+		return document;
+	}
+
+	/// <summary>
+	/// 펼침 상태를 적용하여 출력 (hover 미적용)
+	/// </summary>
+	/// <param name="expanded">펼쳐진 토글 ID 목록</param>
+	public RenderedText Resolve(HashSet<string> expanded)
+	{
+		if (Source.Length == 0)
+			return RenderedText.Empty;
+
+		var result = new StringBuilder(Source.Length);
+		Emit(_root, expanded, result);
+		return new RenderedText(result.ToString());
+	}
+
+	/// <summary>
+	/// 노드 목록 출력 (접힌 블록은 하위 노드 전체 생략)
+	/// </summary>
+	private static void Emit(List<Node> nodes, HashSet<string> expanded, StringBuilder result)
+	{
+		foreach (var node in nodes)
+		{
+			switch (node)
+			{
+				case TextNode text:
+					result.Append(text.Text);
+					break;
+
+				case IconNode icon:
+					result.Append(expanded.Contains(icon.ToggleId) ? ExpandedIcon : CollapsedIcon);
+					break;
+
+				case HiddenNode hidden:
+					if (expanded.Contains(hidden.Id))
+					{
+						Emit(hidden.Children, expanded, result);
+					}
+					break;
+			}
+		}
+	}
+
+	/// <summary>
+	/// 트리 구성
+	/// 태그 후보('[')만 건너뛰며 확인하고, 나머지 구간은 통째로 TextNode로 보관
+	/// 열린 블록과 짝이 맞지 않는 닫기 태그는 무시, 닫히지 않은 블록은 텍스트 끝까지 적용
+	/// </summary>
+	private void Build()
+	{
+		var text = Source;
+		var stack = new Stack<HiddenNode>();
+		var current = _root;
+		int textStart = 0;
+		int i = 0;
+
+		while (i < text.Length)
+		{
+			int bracket = text.IndexOf('[', i);
+			if (bracket < 0)
+				break;
+			i = bracket;
+
+			// [hidden=X]
+			if (TryParseTag(text, i, HiddenOpenPrefix, out var openId, out var openEnd))
+			{
+				FlushText(current, text, textStart, i);
+				var hidden = new HiddenNode(openId);
+				current.Add(hidden);
+				stack.Push(hidden);
+				current = hidden.Children;
+				HiddenBlockCount++;
+				i = textStart = openEnd;
+				continue;
+			}
+
+			// [/hidden=X]
+			if (TryParseTag(text, i, HiddenClosePrefix, out var closeId, out var closeEnd))
+			{
+				FlushText(current, text, textStart, i);
+				if (stack.Count > 0 && stack.Peek().Id == closeId)
+				{
+					stack.Pop();
+					current = stack.Count > 0 ? stack.Peek().Children : _root;
+				}
+				i = textStart = closeEnd;
+				continue;
+			}
+
+			// [url=toggle:X]▶
+			if (TryParseTag(text, i, ToggleUrlPrefix, out var toggleId, out var toggleEnd)
+				&& toggleId.Length > 0
+				&& toggleEnd < text.Length
+				&& (text[toggleEnd] == CollapsedIcon[0] || text[toggleEnd] == ExpandedIcon[0]))
+			{
+				FlushText(current, text, textStart, toggleEnd);
+				current.Add(new IconNode(toggleId));
+				i = textStart = toggleEnd + 1;
+				continue;
+			}
+
+			i++;
+		}
+
+		FlushText(current, text, textStart, text.Length);
+	}
+
+	/// <summary>
+	/// [start, end) 구간을 TextNode로 추가
+	/// </summary>
+	private static void FlushText(List<Node> nodes, string text, int start, int end)
+	{
+		if (end > start)
+		{
+			nodes.Add(new TextNode(text.Substring(start, end - start)));
+		}
+	}
+
+	/// <summary>
+	/// prefix + ID + ']' 형태의 태그 파싱
+	/// </summary>
+	private static bool TryParseTag(string text, int pos, string prefix, out string id, out int endPos)
+	{
+		id = "";
+		endPos = pos;
+
+		if (pos + prefix.Length >= text.Length)
+			return false;
+
+		if (string.CompareOrdinal(text, pos, prefix, 0, prefix.Length) != 0)
+			return false;
+
+		int idStart = pos + prefix.Length;
+		int idEnd = text.IndexOf(TagEnd, idStart);
+		if (idEnd < 0)
+			return false;
+
+		id = text.Substring(idStart, idEnd - idStart);
+		endPos = idEnd + 1;
+		return true;
+	}
+}
@@ -0,0 +1,147 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Text;
+
+namespace Morld;
+
+/// <summary>
+/// ToggleRenderer 벤치마크
+/// 기존 문자 단위 렌더링(ToggleRenderer.Render)과 문서 트리 재출력(ToggleDocument)을 비교
+/// </summary>
+public static class BenchmarkToggleRenderer
+{
+	/// <summary>
+	/// 기존 렌더링 최대 반복 횟수 (아이템 수에 대해 O(n²)이라 큰 화면에서는 호출당 수백 ms)
+	/// 호출당 시간으로 비교하므로 반복 횟수가 달라도 결과는 그대로 비교 가능
+	/// </summary>
+	private const int MaxLegacyIterations = 20;
+
+	/// <summary>
+	/// 대형 인벤토리 화면으로 토글/hover 반복 비용 비교
+	/// </summary>
+	/// <param name="itemCount">생성할 아이템 줄 수</param>
+	/// <param name="iterations">반복 횟수 (기존 렌더링은 MaxLegacyIterations까지만)</param>
+	public static void Run(int itemCount = 200, int iterations = 20)
+	{
+		Console.WriteLine("=== ToggleRenderer Benchmark ===\n");
+
+		var text = GenerateInventoryText(itemCount);
+		var expanded = new HashSet<string>();
+		var legacyIterations = Math.Min(iterations, MaxLegacyIterations);
+		Console.WriteLine($"Items: {itemCount}, Text length: {text.Length}, Iterations: {iterations} (legacy: {legacyIterations})\n");
+
+		// 1. 결과 동일성 확인
+		Console.WriteLine("1. Verifying output...");
+		var document = ToggleDocument.Parse(text);
+		bool identical = true;
+		foreach (var toggleId in new[] { "item_0", "item_1", $"item_{itemCount / 2}" })
+		{
+			expanded.Add(toggleId);
+			var hovered = $"use:{itemCount / 2}";
+			var legacy = ToggleRenderer.Render(text, expanded, hovered);
+			var fromTree = ToggleRenderer.EmitHover(document.Resolve(expanded), hovered);
+			if (legacy != fromTree)
+			{
+				Console.WriteLine($"   ✗ FAILED: output mismatch (expanded: {string.Join(",", expanded)})");
+				identical = false;
+			}
+		}
+		expanded.Clear();
+		if (identical)
+		{
+			Console.WriteLine("   ✓ SUCCESS: Legacy and document outputs are identical");
+		}
+
+		// 2. 토글 전환 (매번 전체 렌더링 vs 트리 재출력)
+		Console.WriteLine("\n2. Toggle expand/collapse...");
+		var legacyToggle = Measure(legacyIterations, i =>
+		{
+			ToggleOnce(expanded, i, itemCount);
+			ToggleRenderer.Render(text, expanded, null);
+		});
+		expanded.Clear();
+		var treeToggle = Measure(iterations, i =>
+		{
+			ToggleOnce(expanded, i, itemCount);
+			document.Resolve(expanded);
+		});
+		expanded.Clear();
+		PrintResult("Legacy Render", legacyToggle, legacyIterations);
+		PrintResult("Document Resolve", treeToggle, iterations);
+
+		// 3. hover 이동 (매번 전체 렌더링 vs 캐시된 결과에 색상만 적용)
+		Console.WriteLine("\n3. Hover across links...");
+		var legacyHover = Measure(legacyIterations, i =>
+		{
+			ToggleRenderer.Render(text, expanded, $"item_inv_menu:{i % itemCount}");
+		});
+		var rendered = document.Resolve(expanded);
+		var treeHover = Measure(iterations, i =>
+		{
+			ToggleRenderer.EmitHover(rendered, $"item_inv_menu:{i % itemCount}");
+		});
+		PrintResult("Legacy Render", legacyHover, legacyIterations);
+		PrintResult("Cached EmitHover", treeHover, iterations);
+
+		// 4. 파싱 비용 (텍스트 생성 시 1회)
+		Console.WriteLine("\n4. Document parse (once per generated text)...");
+		var parse = Measure(iterations, _ => ToggleDocument.Parse(text));
+		PrintResult("ToggleDocument.Parse", parse, iterations);
+
+		Console.WriteLine("\n=== Benchmark Complete ===");
+	}
+
+	/// <summary>
+	/// 인벤토리 + 아이템별 토글 메뉴 형태의 BBCode 생성 (ProvidedAction.ToBBCode 형식)
+	/// </summary>
+	private static string GenerateInventoryText(int itemCount)
+	{
+		var sb = new StringBuilder();
+		sb.Append("[b]소지품[/b]\n\n");
+
+		for (int i = 0; i < itemCount; i++)
+		{
+			sb.Append($"  [url=item_inv_menu:{i}]아이템 {i} x{i % 5 + 1}[/url] ({i * 10}G)\n");
+			sb.Append($"  [url=toggle:item_{i}]▶ 행동[/url][hidden=item_{i}]\n");
+			sb.Append($"    [url=use:{i}]사용[/url]\n");
+			sb.Append($"    [url=drop:{i}]버리기[/url]\n");
+			sb.Append($"  [/hidden=item_{i}]\n");
+		}
+
+		sb.Append("\n[url=back]뒤로[/url]");
+		return sb.ToString();
+	}
+
+	/// <summary>
+	/// 반복마다 하나의 토글을 전환
+	/// </summary>
+	private static void ToggleOnce(HashSet<string> expanded, int iteration, int itemCount)
+	{
+		var toggleId = $"item_{iteration % itemCount}";
+		if (!expanded.Remove(toggleId))
+			expanded.Add(toggleId);
+	}
+
+	/// <summary>
+	/// 실행 시간 측정 (ms)
+	/// </summary>
+	private static double Measure(int iterations, Action<int> action)
+	{
+		// 워밍업
+		action(0);
+
+		var stopwatch = Stopwatch.StartNew();
+		for (int i = 0; i < iterations; i++)
+		{
+			action(i);
+		}
+		stopwatch.Stop();
+		return stopwatch.Elapsed.TotalMilliseconds;
+	}
+
+	private static void PrintResult(string label, double totalMs, int iterations)
+	{
+		Console.WriteLine($"   {label,-24} total {totalMs,10:F2} ms   per call {totalMs / iterations,8:F4} ms");
+	}
+}
@@ -189,15 +189,26 @@ public class Unit : IDescribable
 		IReadOnlyList<int>? equippedItems = null)
 	{
 		var result = new TraversalContext();
+		CopyActualTagsTo(result, itemSystem, inventory, equippedItems);
+		return result;
+	}
+
+	/// <summary>
+	/// GetActualTags와 같지만 기존 컨텍스트에 덮어씀 (매 Step 경로 탐색용, 할당 없음)
+	/// </summary>
+	public void CopyActualTagsTo(
+		TraversalContext target,
+		ItemSystem? itemSystem,
+		IReadOnlyDictionary<int, int>? inventory = null,
+		IReadOnlyList<int>? equippedItems = null)
+	{
+		var vector = target.Vector;
 
 		// 1. 기본 태그 복사
-		foreach (var (tag, value) in TraversalContext.Tags)
-		{
-			result.SetTag(tag, value);
-		}
+		vector.CopyFrom(TraversalContext.Vector);
 
 		if (itemSystem == null)
-			return result;
+			return;
 
 		// 2. 인벤토리 아이템의 PassiveTags 합산 (소유 효과)
 		if (inventory != null)
@@ -208,38 +219,28 @@ public class Unit : IDescribable
 				var item = itemSystem.GetItem(itemId);
 				if (item == null) continue;
 
-				foreach (var (tag, bonus) in item.PassiveTags)
-				{
-					var current = result.GetTagValue(tag);
-					result.SetTag(tag, current + bonus);
-				}
+				vector.Add(item.PassiveTags);
 			}
 		}
 
 		// 3. 장착 아이템의 EquipTags 합산 (장착 효과)
 		if (equippedItems != null)
 		{
-			foreach (var itemId in equippedItems)
+			for (int i = 0; i < equippedItems.Count; i++)
 			{
-				var item = itemSystem.GetItem(itemId);
+				var item = itemSystem.GetItem(equippedItems[i]);
 				if (item == null) continue;
 
-				foreach (var (tag, bonus) in item.EquipTags)
-				{
-					var current = result.GetTagValue(tag);
-					result.SetTag(tag, current + bonus);
-				}
+				vector.Add(item.EquipTags);
 			}
 		}
-
-		return result;
 	}
 
 	/// <summary>
 	/// 주어진 조건들을 모두 충족하는지 확인
 	/// </summary>
 	public bool CanPass(
-		Dictionary<string, int>? conditions,
+		TagMap? conditions,
 		ItemSystem? itemSystem,
 		IReadOnlyDictionary<int, int>? inventory = null,
 		IReadOnlyList<int>? equippedItems = null)
@@ -248,14 +249,88 @@ public class Unit : IDescribable
 			return true;
 
 		var actualTags = GetActualTags(itemSystem, inventory, equippedItems);
+		return actualTags.Satisfies(conditions);
+	}
 
-		foreach (var (tag, requiredValue) in conditions)
+	/// <summary>
+	/// 체크포인트용 상태 복사본 (스케줄 레이어는 참조 공유, 이동 정보와 컬렉션은 복사)
+	/// </summary>
+	internal sealed class State
+	{
+		public string Name = "";
+		public LocationRef Location;
+		public EdgeProgress? Edge;
+		public ScheduleEntry? Schedule;
+		public ScheduleLayer[] ScheduleStack = Array.Empty<ScheduleLayer>();
+		public TagVector Tags = new();
+		public UnitType Type;
+		public bool EventTracking;
+		public List<string> Actions = new();
+		public Dictionary<string, string> Appearance = new();
+		public HashSet<string> Mood = new();
+	}
+
+	/// <summary>
+	/// 현재 상태 복사 (체크포인트용)
+	/// </summary>
+	internal State CaptureState()
+	{
+		return new State
+		{
+			Name = Name,
+			Location = _currentLocation,
+			// EdgeProgress는 이동 중 ElapsedTime이 직접 갱신되므로 복사
+			Edge = _currentEdge != null
+				? new EdgeProgress
+				{
+					From = _currentEdge.From,
+					To = _currentEdge.To,
+					TotalTime = _currentEdge.TotalTime,
+					ElapsedTime = _currentEdge.ElapsedTime
+				}
+				: null,
+			Schedule = _currentSchedule,
+			ScheduleStack = ScheduleStack.ToArray(),
+			Tags = TraversalContext.Vector.Clone(),
+			Type = Type,
+			EventTracking = EventTracking,
+			Actions = new List<string>(Actions),
+			Appearance = new Dictionary<string, string>(Appearance),
+			Mood = new HashSet<string>(Mood)
+		};
+	}
+
+	/// <summary>
+	/// 복사해 둔 상태로 되돌림 (체크포인트 복원용)
+	/// </summary>
+	internal void RestoreState(State state)
+	{
+		Name = state.Name;
+		_currentLocation = state.Location;
+		_currentEdge = state.Edge != null
+			? new EdgeProgress
+			{
+				From = state.Edge.From,
+				To = state.Edge.To,
+				TotalTime = state.Edge.TotalTime,
+				ElapsedTime = state.Edge.ElapsedTime
+			}
+			: null;
+		_currentSchedule = state.Schedule;
+
+		// ToArray는 스택 최상위부터 나열되므로 역순으로 push
+		ScheduleStack.Clear();
+		for (int i = state.ScheduleStack.Length - 1; i >= 0; i--)
 		{
-			if (actualTags.GetTagValue(tag) < requiredValue)
-				return false;
+			ScheduleStack.Push(state.ScheduleStack[i]);
 		}
 
-		return true;
+		TraversalContext.ReplaceTags(state.Tags);
+		Type = state.Type;
+		EventTracking = state.EventTracking;
+		Actions = new List<string>(state.Actions);
+		Appearance = new Dictionary<string, string>(state.Appearance);
+		Mood = new HashSet<string>(state.Mood);
 	}
 
 	/// <summary>
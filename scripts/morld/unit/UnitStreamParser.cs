@@ -0,0 +1,256 @@
+namespace Morld;
+
+using System;
+using System.Collections.Generic;
+using System.Text.Json;
+using SE;
+
+/// <summary>
+/// unit_data.json 스트리밍 파싱 결과
+/// </summary>
+internal sealed class UnitStreamResult
+{
+	public List<Unit> Units { get; } = new();
+
+	/// <summary>
+	/// unit_data.json에 남아 있는 구버전 인벤토리 (InventorySystem 마이그레이션용)
+	/// </summary>
+	public List<(int UnitId, int ItemId, int Count)> Inventory { get; } = new();
+
+	/// <summary>
+	/// unit_data.json에 남아 있는 구버전 장착 정보 (InventorySystem 마이그레이션용)
+	/// </summary>
+	public List<(int UnitId, int ItemId)> EquippedItems { get; } = new();
+}
+
+/// <summary>
+/// unit_data.json 스트리밍 파서
+/// UnitJsonData를 거치지 않고 UTF-8 바이트에서 바로 Unit/ScheduleLayer를 생성
+/// (워커 스레드에서 호출 가능)
+/// </summary>
+internal static class UnitStreamParser
+{
+	public static UnitStreamResult Parse(ReadOnlySpan<byte> utf8)
+	{
+		var reader = JsonStream.CreateReader(utf8);
+		var result = new UnitStreamResult();
+		var scratch = new List<(int Key, int Value)>();
+
+		JsonStream.Expect(ref reader, JsonTokenType.StartArray);
+		while (JsonStream.NextElement(ref reader))
+		{
+			result.Units.Add(ParseUnit(ref reader, result, scratch));
+		}
+
+		return result;
+	}
+
+	private static Unit ParseUnit(ref Utf8JsonReader reader, UnitStreamResult result, List<(int Key, int Value)> scratch)
+	{
+		Unit? unit = null;
+		string name = string.Empty;
+		string? type = null;
+		int regionId = 0, locationId = 0;
+
+		while (JsonStream.NextProperty(ref reader))
+		{
+			if (reader.ValueTextEquals("id"u8))
+			{
+				unit = new Unit(JsonStream.ReadInt(ref reader), string.Empty, 0, 0);
+			}
+			else if (reader.ValueTextEquals("name"u8))
+			{
+				name = JsonStream.ReadString(ref reader) ?? string.Empty;
+			}
+			else if (reader.ValueTextEquals("type"u8))
+			{
+				type = JsonStream.ReadString(ref reader);
+			}
+			else if (reader.ValueTextEquals("regionId"u8))
+			{
+				regionId = JsonStream.ReadInt(ref reader);
+			}
+			else if (reader.ValueTextEquals("locationId"u8))
+			{
+				locationId = JsonStream.ReadInt(ref reader);
+			}
+			else if (reader.ValueTextEquals("tags"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				if (!JsonStream.BeginObject(ref reader))
+					continue;
+				while (JsonStream.NextProperty(ref reader))
+				{
+					var tag = reader.GetString()!;
+					unit.TraversalContext.SetTag(tag, JsonStream.ReadInt(ref reader));
+				}
+			}
+			else if (reader.ValueTextEquals("actions"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				JsonStream.ReadStringList(ref reader, unit.Actions);
+			}
+			else if (reader.ValueTextEquals("appearance"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				JsonStream.ReadStringStringMap(ref reader, unit.Appearance);
+			}
+			else if (reader.ValueTextEquals("mood"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				JsonStream.ReadStringList(ref reader, unit.Mood);
+			}
+			else if (reader.ValueTextEquals("scheduleStack"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				if (!JsonStream.BeginArray(ref reader))
+					continue;
+				// 배열 순서대로 push - 첫 요소가 스택 바닥
+				while (JsonStream.NextElement(ref reader))
+				{
+					unit.PushSchedule(ParseScheduleLayer(ref reader));
+				}
+			}
+			else if (reader.ValueTextEquals("currentEdge"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				if (JsonStream.BeginObject(ref reader))
+					unit.CurrentEdge = ParseEdgeProgress(ref reader);
+			}
+			else if (reader.ValueTextEquals("inventory"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				scratch.Clear();
+				JsonStream.ReadIntIntMap(ref reader, scratch);
+				foreach (var (itemId, count) in scratch)
+				{
+					result.Inventory.Add((unit.Id, itemId, count));
+				}
+			}
+			else if (reader.ValueTextEquals("equippedItems"u8))
+			{
+				if (unit == null) throw JsonStream.MissingId("unit", ref reader);
+				if (!JsonStream.BeginArray(ref reader))
+					continue;
+				while (JsonStream.NextElement(ref reader))
+				{
+					result.EquippedItems.Add((unit.Id, reader.GetInt32()));
+				}
+			}
+			else
+			{
+				JsonStream.SkipValue(ref reader);
+			}
+		}
+
+		if (unit == null)
+			throw new JsonException("unit: missing 'id'");
+
+		unit.Name = name;
+		unit.Type = UnitSystem.ParseUnitType(type ?? "male");
+
+		// CurrentEdge를 유지해야 하므로 SetLocation 대신 위치만 설정
+		unit.SetCurrentLocation(new LocationRef(regionId, locationId));
+		return unit;
+	}
+
+	private static ScheduleLayer ParseScheduleLayer(ref Utf8JsonReader reader)
+	{
+		var layer = new ScheduleLayer();
+
+		while (JsonStream.NextProperty(ref reader))
+		{
+			if (reader.ValueTextEquals("name"u8))
+			{
+				layer.Name = JsonStream.ReadString(ref reader) ?? string.Empty;
+			}
+			else if (reader.ValueTextEquals("schedule"u8))
+			{
+				if (!JsonStream.BeginArray(ref reader))
+					continue;
+
+				DailySchedule? schedule = null;
+				while (JsonStream.NextElement(ref reader))
+				{
+					// 시간 기반 스케줄은 엔트리가 있을 때만 생성
+					schedule ??= new DailySchedule();
+					ParseScheduleEntry(ref reader, schedule);
+				}
+				layer.Schedule = schedule;
+			}
+			else if (reader.ValueTextEquals("endConditionType"u8))
+			{
+				layer.EndConditionType = JsonStream.ReadString(ref reader);
+			}
+			else if (reader.ValueTextEquals("endConditionParam"u8))
+			{
+				layer.EndConditionParam = JsonStream.ReadString(ref reader);
+			}
+			else
+			{
+				JsonStream.SkipValue(ref reader);
+			}
+		}
+
+		return layer;
+	}
+
+	private static void ParseScheduleEntry(ref Utf8JsonReader reader, DailySchedule schedule)
+	{
+		string name = string.Empty;
+		string? activity = null;
+		int regionId = 0, locationId = 0, start = 0, end = 0;
+
+		while (JsonStream.NextProperty(ref reader))
+		{
+			if (reader.ValueTextEquals("name"u8))
+				name = JsonStream.ReadString(ref reader) ?? string.Empty;
+			else if (reader.ValueTextEquals("regionId"u8))
+				regionId = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("locationId"u8))
+				locationId = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("start"u8))
+				start = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("end"u8))
+				end = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("activity"u8))
+				activity = JsonStream.ReadString(ref reader);
+			else
+				JsonStream.SkipValue(ref reader);
+		}
+
+		schedule.AddEntry(name, regionId, locationId, start, end, activity ?? "");
+	}
+
+	private static EdgeProgress ParseEdgeProgress(ref Utf8JsonReader reader)
+	{
+		int fromRegionId = 0, fromLocalId = 0, toRegionId = 0, toLocalId = 0;
+		int totalTime = 0, elapsedTime = 0;
+
+		while (JsonStream.NextProperty(ref reader))
+		{
+			if (reader.ValueTextEquals("fromRegionId"u8))
+				fromRegionId = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("fromLocalId"u8))
+				fromLocalId = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("toRegionId"u8))
+				toRegionId = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("toLocalId"u8))
+				toLocalId = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("totalTime"u8))
+				totalTime = JsonStream.ReadInt(ref reader);
+			else if (reader.ValueTextEquals("elapsedTime"u8))
+				elapsedTime = JsonStream.ReadInt(ref reader);
+			else
+				JsonStream.SkipValue(ref reader);
+		}
+
+		return new EdgeProgress
+		{
+			From = new LocationRef(fromRegionId, fromLocalId),
+			To = new LocationRef(toRegionId, toLocalId),
+			TotalTime = totalTime,
+			ElapsedTime = elapsedTime
+		};
+	}
+}
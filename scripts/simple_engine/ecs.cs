@@ -1,6 +1,9 @@
+// 엔티티/컴포넌트 무결성 검사 (디버그용, 전체 엔티티 순회가 포함되므로 평소에는 끔)
+// #define ECS_VALIDATE
+
 using System;
 using System.Collections.Generic;
-using Godot;
+using System.Runtime.InteropServices;
 using SE;
 
 namespace ECS
@@ -16,12 +19,16 @@ namespace ECS
 
     public class Entity
     {
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("ECS");
+
 		public int Id {get; private set;}
         public bool Update {get; private set;} = true;
         public void Updated() {this.Update = true;}
         public void ReleaseUpdated(ECS ecs) {this.Update = false;} // ecs는 아무나 실행하지 않기 위한 필터링 개념. 실제로 기능하진 않음
 
         protected List<Component> _collection;
+        // 타입별 조회 결과 캐시 (없음 = null도 저장), 컴포넌트 추가/제거 시 초기화
+        private Dictionary<Type, Component> _lookup = new Dictionary<Type, Component>();
 
         public Entity() {
 			this.Id = GUID.GetUID();
@@ -31,17 +38,19 @@ namespace ECS
 		public Component AddComponent(Component component) {
 			this._collection.Add(component);
 			component.Entity = this;
+            _lookup.Clear();
             return component;
 		}
 
         public bool RemoveComponent(Component component) {
             if(this._collection.Contains(component) == false)
             {
-                GD.PrintErr("component not contains");
+                _log.Error("component not contains");
                 return false;
             }
             component.Entity = null;
             component.Destroy();
+            _lookup.Clear();
 			return this._collection.Remove(component);
 		}
 
@@ -51,18 +60,26 @@ namespace ECS
             //     // if(comp.GetType() == type) return comp;
             //     if(comp.GetType() == type ||
             //        comp.GetType().BaseType == type) return comp;
-            foreach(dynamic comp in _collection)
-                if(comp is T) return comp;
+            if(GetComponent(typeof(T)) is T comp) return comp;
             return default;
         }
 
         internal Component GetComponent(Type type) {
+            // 같은 타입은 첫 조회 이후 캐시에서 반환 (매 Step 리플렉션 없음)
+            if(_lookup.TryGetValue(type, out var cached))
+                return cached;
+
+            Component found = null;
             foreach(var comp in _collection)
                 // if(comp.GetType() == type) return comp; // child type only
                 // if(comp.GetType() == type ||
                 //    comp.GetType().BaseType == type) return comp; // child and parent type
-                if(comp.GetType().IsAssignableTo(type)) return comp;
-            return null;
+                if(comp.GetType().IsAssignableTo(type)) {
+                    found = comp;
+                    break;
+                }
+            _lookup[type] = found;
+            return found;
         }
 
         // internal void DestroyComponent(Component component)
@@ -121,6 +138,10 @@ namespace ECS
         // private Queue<HubMessage> _msgQ = new Queue<HubMessage>();
 
         public Type[] Filter { get; private set; }
+
+        // 등록 이름 (AddSystem의 name, 없으면 타입 이름)
+        public string Name { get; internal set; }
+
         public System(params Type[] types) {
             Filter = new Type[types.Length];
             if(Filter.Length > 0)
@@ -134,7 +155,8 @@ namespace ECS
             
             // if(systemDependence && group.System != this) return false;
 
-            var allComponents = _group.FilteredComponents();
+            // 그룹이 보관 중인 연속 배열을 그대로 전달 (Step마다 할당 없음)
+            var allComponents = _group.Rows;
             
 #region only debug
             // foreach(var comps in allComponents) {
@@ -143,10 +165,15 @@ namespace ECS
             // }
 #endregion
 
-            Proc(step, allComponents.AsSpan());
+            Proc(step, allComponents);
             return true;
         }
 
+        // Filter의 filterIndex번째 타입 컴포넌트 연속 배열 (Proc 안에서 사용)
+        protected Span<T> Column<T>(int filterIndex) where T : Component {
+            return _group.Column<T>(filterIndex);
+        }
+
         public virtual void Destroy() {}
 
         protected virtual void Proc(int step, Span<Component[]> allComponents) {}
@@ -158,17 +185,52 @@ namespace ECS
         public bool UpdateGroup(Entity entity) {
             return this._group.Update(entity);
         }
+
+        // 새 엔티티 하나만 Filter 검사 후 그룹에 추가
+        internal bool AddToGroup(Entity entity) {
+            return this._group.Add(entity);
+        }
+
+        internal bool RemoveFromGroup(Entity entity) {
+            return this._group.Remove(entity);
+        }
     }
 
 	public class Group
     {
+        private static readonly Morld.LogCategory _log = Morld.Log.Category("ECS");
+
         internal System _parent;
 
-        public List<(Entity entity, Component[] components)> _group = new List<(Entity,Component[])>();
+        public Type[] Filter { get; private set; }
+
+        // 행 단위 컴포넌트 배열 (Proc에 Span으로 전달)
+        private Component[][] _rows = new Component[16][];
+        private Entity[] _entities = new Entity[16];
+        // Filter 타입별 연속 배열 (열 단위, 요소 타입 = Filter 타입)
+        private Component[][] _columns;
+        private int _count = 0;
+        // entity → 행 인덱스 (O(1) 조회/제거)
+        private Dictionary<Entity, int> _index = new Dictionary<Entity, int>();
 
-        public Group(System system) {
+        public Group(System system) : this(system.Filter) {
             _parent = system;
         }
+
+        public Group(Type[] filter) {
+            Filter = filter;
+            _columns = new Component[filter.Length][];
+            for(int i=0;i<filter.Length;++i)
+                _columns[i] = CreateColumn(filter[i], _rows.Length);
+        }
+
+        // Filter 타입의 배열 생성 (Component 파생이 아니면 Component[])
+        static private Component[] CreateColumn(Type type, int capacity) {
+            if(typeof(Component).IsAssignableFrom(type))
+                return (Component[])Array.CreateInstance(type, capacity);
+            return new Component[capacity];
+        }
+
         static private Component[] filter(Entity entity, Type[] types) {
             // if(types == null)
             //     throw new Exception("types is null");
@@ -191,81 +253,172 @@ namespace ECS
             return _filter;
         }
 
-        public int Update(List<Entity> entities) {
-            _group.Clear();
-            foreach(var entity in entities) {
-                if(entity.IsValidComponents() == false) {
-                    GD.PrintErr("invalid components 3");
+        [global::System.Diagnostics.Conditional("ECS_VALIDATE")]
+        static private void check(Entity entity, Component[] comps) {
+            if(entity.IsValidComponents() == false) {
+                _log.Error("invalid components");
+                throw new Exception();
+            }
+            int idx = -1;
+            foreach(var c in comps) {
+                if(idx == -1)
+                    idx = c.Entity.Id;
+                else if(idx != c.Entity.Id) {
+                    _log.Error($"entity not same:{idx}/{c.Entity.Id}({c})");
                     throw new Exception();
                 }
-                var comps = filter(entity,_parent.Filter);
-                if(comps == null)
-                    continue;
-#region check
-                int idx = -1;
-                foreach(var c in comps) {
-                    if(idx == -1)
-                        idx = c.Entity.Id;
-                    else if(idx != c.Entity.Id) {
-                        GD.PrintErr($"entity not same:{idx}/{c.Entity.Id}({c})");
-                        throw new Exception();
-                    }
-                }
-#endregion
-                _group.Add((entity, comps));
             }
-            return _group.Count;
         }
 
+        public int Count => _count;
+
+        public bool Contains(Entity entity) => _index.ContainsKey(entity);
+
+        // 그룹에 속한 엔티티 (행 순서와 같음)
+        public ReadOnlySpan<Entity> Entities => new ReadOnlySpan<Entity>(_entities, 0, _count);
+
+        // 행 단위 컴포넌트 (할당 없음, 그룹이 바뀌면 무효)
+        public Span<Component[]> Rows => new Span<Component[]>(_rows, 0, _count);
+
+        // Filter의 filterIndex번째 타입 연속 배열 (할당 없음, 그룹이 바뀌면 무효)
+        public Span<T> Column<T>(int filterIndex) where T : Component {
+            var column = _columns[filterIndex];
+            if(column is T[] typed)
+                return new Span<T>(typed, 0, _count);
+            throw new InvalidCastException($"column {filterIndex} is {column.GetType().GetElementType()}, not {typeof(T)}");
+        }
+
+        private void EnsureCapacity(int capacity) {
+            if(capacity <= _rows.Length)
+                return;
+
+            int newCapacity = Math.Max(capacity, _rows.Length * 2);
+            Array.Resize(ref _rows, newCapacity);
+            Array.Resize(ref _entities, newCapacity);
+            for(int c=0;c<_columns.Length;++c) {
+                var column = CreateColumn(Filter[c], newCapacity);
+                Array.Copy(_columns[c], column, _count);
+                _columns[c] = column;
+            }
+        }
+
+        private void SetRow(int i, Entity entity, Component[] comps) {
+            _rows[i] = comps;
+            _entities[i] = entity;
+            for(int c=0;c<_columns.Length;++c)
+                _columns[c][i] = comps[c];
+        }
+
+        private void ClearRow(int i) {
+            _rows[i] = null;
+            _entities[i] = null;
+            for(int c=0;c<_columns.Length;++c)
+                _columns[c][i] = null;
+        }
+
+        // 전체 재구성
+        public int Update(List<Entity> entities) {
+            for(int i=0;i<_count;++i)
+                ClearRow(i);
+            _count = 0;
+            _index.Clear();
+            foreach(var entity in entities)
+                Add(entity);
+            return _count;
+        }
+
+        // 엔티티 하나의 컴포넌트 재검사
         public bool Update(Entity entity) {
-            if(entity.IsValidComponents() == false) {
-                GD.PrintErr("invalid components");
-                throw new Exception();
+            if(_index.TryGetValue(entity, out var i) == false) {
+                // GD.PrintErr("못찾음. 없는 듯?");
+                return false;
             }
 
-            for(int i=0;i<_group.Count;++i)
-            {
-                if(_group[i].entity == entity) {
-                    
-                    var comps = filter(entity,_parent.Filter);
-                    if(comps == null) {
-                        // GD.PrintErr("개수 안맞음");
-                        return false;
-                    }
-#region check
-                int idx = -1;
-                foreach(var c in comps) {
-                    if(idx == -1)
-                        idx = c.Entity.Id;
-                    else if(idx != c.Entity.Id) {
-                        GD.PrintErr($"entity not same:{idx}/{c.Entity.Id}({c})");
-                        throw new Exception();
-                    }
-                }
-#endregion
-                    _group[i] = (entity, comps);
-                    return true;
-                }
+            var comps = filter(entity,Filter);
+            if(comps == null) {
+                // GD.PrintErr("개수 안맞음");
+                return false;
+            }
+            check(entity, comps);
+            SetRow(i, entity, comps);
+            return true;
+        }
+
+        // 새 엔티티 추가 (Filter에 맞지 않거나 이미 있으면 false)
+        public bool Add(Entity entity) {
+            if(_index.ContainsKey(entity))
+                return false;
+
+            var comps = filter(entity,Filter);
+            if(comps == null)
+                return false;
+            check(entity, comps);
+
+            EnsureCapacity(_count + 1);
+            _index[entity] = _count;
+            SetRow(_count, entity, comps);
+            ++_count;
+            return true;
+        }
+
+        // 엔티티 제거 (마지막 행과 자리 교체, 순서는 유지되지 않음)
+        public bool Remove(Entity entity) {
+            if(_index.Remove(entity, out var i) == false)
+                return false;
+
+            int last = _count - 1;
+            if(i != last) {
+                SetRow(i, _entities[last], _rows[last]);
+                _index[_entities[i]] = i;
             }
-            // GD.PrintErr("못찾음. 없는 듯?");
-            return false;
+            ClearRow(last);
+            --_count;
+            return true;
         }
 
+        // 복사본 반환 (이전 API 호환용, Step에서는 Rows 사용)
         public Component[][] FilteredComponents() {
-            var res = new Component[_group.Count][];
-            for(int i=0;i<_group.Count;++i)
-                res[i] = _group[i].components;
-            return res;
+            return Rows.ToArray();
+        }
+    }
+
+    // System 하나의 할당 통계 (ECS.GetAllocationStats)
+    public readonly struct SystemAllocation
+    {
+        public readonly string Name;
+        public readonly long TotalBytes;
+        public readonly long LastStepBytes;
+
+        public SystemAllocation(string name, long totalBytes, long lastStepBytes) {
+            Name = name;
+            TotalBytes = totalBytes;
+            LastStepBytes = lastStepBytes;
         }
     }
 
 	public class ECS
     {
+        private static readonly Morld.LogCategory _log = Morld.Log.Category("ECS");
+
         protected List<Entity> _entities = new List<Entity>();
+        private HashSet<Entity> _entitySet = new HashSet<Entity>();  // 중복 검사용 (O(1))
+        // Filter 조합별 캐시된 쿼리 그룹 (엔티티 추가/제거 시 함께 갱신)
+        private Dictionary<string, Group> _queries = new Dictionary<string, Group>();
         private List<System> _systems = new List<System>();
 
         // private Queue<HubMessage> _queue = new Queue<HubMessage>();
         private Dictionary<string, System> _named = new Dictionary<string, System>();
+
+        // System별 할당량 (TrackAllocations일 때만 기록, 인덱스 = _systems 순서)
+        private long[] _allocTotal = Array.Empty<long>();
+        private long[] _allocLast = Array.Empty<long>();
+
+        // Step마다 System별 할당 바이트 측정 (GC.GetAllocatedBytesForCurrentThread, 기본 꺼짐)
+        public bool TrackAllocations { get; set; }
+
+        // 측정한 Step 수 / 마지막 Step 전체 할당 바이트
+        public long AllocationSteps { get; private set; }
+        public long LastStepAllocatedBytes { get; private set; }
         
         public ECS(){}
         ~ECS() {
@@ -282,9 +435,9 @@ namespace ECS
             if(system == null)
                 throw new ArgumentException("Parameter cannot be null", "original");
 			system._hub = this;
+            system.Name = name ?? system.GetType().Name;
 
-            var group = new Group(system);
-            group.Update(_entities);
+            system.UpdateGroup(_entities);
             
             _systems.Add(system);
 
@@ -300,6 +453,12 @@ namespace ECS
             foreach(var entity in _entities)
                 entity.OnDestory();
             _entities.Clear();
+            _entitySet.Clear();
+
+            foreach(var system in _systems)
+                system.UpdateGroup(_entities);
+            foreach(var query in _queries.Values)
+                query.Update(_entities);
         }
 
         internal void Destroy()
@@ -315,9 +474,31 @@ namespace ECS
             return _entities.FindAll(x=>x is T).ConvertAll(x=>(object)x);
         }
 
+        // 복사 없이 내부 목록을 Span으로 반환 (엔티티 추가/제거 시 무효)
         internal Span<Entity> GetEntities()
         {
-            return _entities.ToArray().AsSpan();
+            return CollectionsMarshal.AsSpan(_entities);
+        }
+
+        // Filter 조합으로 엔티티 조회 (처음 한 번만 전체 검사, 이후 증분 갱신되는 그룹 반환)
+        internal Group Query(params Type[] filter)
+        {
+            var key = QueryKey(filter);
+            if(_queries.TryGetValue(key, out var group) == false)
+            {
+                group = new Group((Type[])filter.Clone());
+                group.Update(_entities);
+                _queries.Add(key, group);
+            }
+            return group;
+        }
+
+        static private string QueryKey(Type[] filter)
+        {
+            var names = new string[filter.Length];
+            for(int i=0;i<filter.Length;++i)
+                names[i] = filter[i].AssemblyQualifiedName;
+            return string.Join("|", names);
         }
 
         // public bool SendMessage(string name, HubMessage msg) {
@@ -332,62 +513,63 @@ namespace ECS
         //     return true;
         // }
 
-        internal virtual bool AddEntity(Entity entity) {
-
+        [global::System.Diagnostics.Conditional("ECS_VALIDATE")]
+        private void validate(Entity entity, string tag) {
             foreach(var e in _entities)
                 if(e.IsValidComponents() == false)
-                    GD.PrintErr("ci 0");
+                    _log.Error($"ci {tag}");
 
-            if(_entities.Contains(entity))
-                return false;
-
-#region components check
-            {
-                if(entity.IsValidComponents() == false) {
-                    GD.PrintErr("components invalid 1");
-                    throw new Exception();
-                }
+            if(entity.IsValidComponents() == false) {
+                _log.Error($"components invalid {tag}");
+                throw new Exception();
             }
-#endregion
+        }
 
-            foreach(var e in _entities)
-                if(e.IsValidComponents() == false)
-                    GD.PrintErr("ci 1");
+        // 엔티티 추가: 새 엔티티만 각 System의 Filter로 검사 (O(systems))
+        internal virtual bool AddEntity(Entity entity) {
+            if(_entitySet.Add(entity) == false)
+                return false;
+
+            validate(entity, "1");
 
             _entities.Add(entity);
             entity.OnCreate();
 
-#region components check
-            {
-                if(entity.IsValidComponents() == false) {
-                    GD.PrintErr("components invalid 2");
-                    throw new Exception();
-                }
-            }
-#endregion
-
-
-            foreach(var e in _entities)
-                if(e.IsValidComponents() == false)
-                    GD.PrintErr("ci 3");
+            validate(entity, "2");
 
             foreach(var system in _systems)
-                system.UpdateGroup(_entities);
+                system.AddToGroup(entity);
+            foreach(var query in _queries.Values)
+                query.Add(entity);
 
             return true;
         }
 
+        // 여러 엔티티 일괄 추가 (O(N·systems)), 추가된 개수 반환
+        internal virtual int AddEntities(IEnumerable<Entity> entities) {
+            int added = 0;
+            foreach(var entity in entities)
+            {
+                if(AddEntity(entity))
+                    ++added;
+            }
+            return added;
+        }
+
         internal bool RemoveEntity(Entity entity) {
-            if(!_entities.Contains(entity))
+            if(!_entitySet.Contains(entity))
                 return false;
             
             entity.OnDestory();
 
             if(_entities.Remove(entity) == false)
                 return false;
+            _entitySet.Remove(entity);
             
             foreach(var system in _systems)
-                system.UpdateGroup(_entities);
+                system.RemoveFromGroup(entity);
+            foreach(var query in _queries.Values)
+                query.Remove(entity);
             
             return true;
         }
@@ -412,6 +594,11 @@ namespace ECS
 
         internal void Step(int step)
         {
+            if(TrackAllocations) {
+                StepTracked(step);
+                return;
+            }
+
             for(var i=0;i<_systems.Count;++i) {
                 _systems[i].Step(step);
             }
@@ -420,6 +607,53 @@ namespace ECS
                 entity.ReleaseUpdated(this);
         }
 
+        // Step과 같지만 System마다 할당 바이트를 기록 (마지막 칸 = ReleaseUpdated 순회)
+        private void StepTracked(int step)
+        {
+            if(_allocTotal.Length != _systems.Count + 1) {
+                Array.Resize(ref _allocTotal, _systems.Count + 1);
+                Array.Resize(ref _allocLast, _systems.Count + 1);
+            }
+
+            var stepStart = GC.GetAllocatedBytesForCurrentThread();
+            var before = stepStart;
+            for(var i=0;i<_systems.Count;++i) {
+                _systems[i].Step(step);
+                var after = GC.GetAllocatedBytesForCurrentThread();
+                _allocLast[i] = after - before;
+                _allocTotal[i] += after - before;
+                before = after;
+            }
+
+            foreach(var entity in this._entities)
+                entity.ReleaseUpdated(this);
+
+            var end = GC.GetAllocatedBytesForCurrentThread();
+            _allocLast[_systems.Count] = end - before;
+            _allocTotal[_systems.Count] += end - before;
+            LastStepAllocatedBytes = end - stepStart;
+            AllocationSteps++;
+        }
+
+        // System별 할당 통계 (등록 순서, 마지막 항목 "(entities)" = ReleaseUpdated 순회)
+        public SystemAllocation[] GetAllocationStats()
+        {
+            var result = new SystemAllocation[_allocTotal.Length];
+            for(int i=0;i<result.Length;++i) {
+                var name = i < _systems.Count ? _systems[i].Name : "(entities)";
+                result[i] = new SystemAllocation(name, _allocTotal[i], _allocLast[i]);
+            }
+            return result;
+        }
+
+        public void ResetAllocationStats()
+        {
+            Array.Clear(_allocTotal);
+            Array.Clear(_allocLast);
+            AllocationSteps = 0;
+            LastStepAllocatedBytes = 0;
+        }
+
         // internal void RemoveAll()
         // {
         //     foreach(var entity in _entities)
@@ -0,0 +1,128 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+
+namespace ECS
+{
+	/// <summary>
+	/// ECS 벤치마크 (엔티티 일괄 추가, Step 비용, 쿼리 캐시)
+	/// </summary>
+	public static class EcsBenchmark
+	{
+		private class BenchPosition : Component
+		{
+			public float X;
+			public float Y;
+		}
+
+		private class BenchVelocity : Component
+		{
+			public float Dx;
+			public float Dy;
+		}
+
+		private class BenchTag : Component {}
+
+		/// <summary>
+		/// Position += Velocity (열 단위 Span 순회)
+		/// </summary>
+		private class BenchMoveSystem : System
+		{
+			public BenchMoveSystem() : base(typeof(BenchPosition), typeof(BenchVelocity)) {}
+
+			protected override void Proc(int step, Span<Component[]> allComponents)
+			{
+				var positions = Column<BenchPosition>(0);
+				var velocities = Column<BenchVelocity>(1);
+				for(int i=0;i<positions.Length;++i)
+				{
+					positions[i].X += velocities[i].Dx * step;
+					positions[i].Y += velocities[i].Dy * step;
+				}
+			}
+		}
+
+		/// <summary>
+		/// 행 단위 Span 순회 (기존 Proc 방식)
+		/// </summary>
+		private class BenchRowSystem : System
+		{
+			public int Visited;
+
+			public BenchRowSystem() : base(typeof(BenchPosition)) {}
+
+			protected override void Proc(int step, Span<Component[]> allComponents)
+			{
+				Visited = 0;
+				foreach(var row in allComponents)
+				{
+					if(row[0] != null) ++Visited;
+				}
+			}
+		}
+
+		public static void Run(int entityCount = 10000, int steps = 1000)
+		{
+			Console.WriteLine("=== ECS Benchmark ===\n");
+			Console.WriteLine($"Entities: {entityCount}, Steps: {steps}\n");
+
+			var ecs = new ECS();
+			ecs.AddSystem(new BenchMoveSystem(), "move");
+			var rowSystem = ecs.AddSystem(new BenchRowSystem(), "row") as BenchRowSystem;
+
+			// 1. 엔티티 일괄 추가
+			var entities = new List<Entity>(entityCount);
+			for(int i=0;i<entityCount;++i)
+			{
+				var entity = new Entity();
+				entity.AddComponent(new BenchPosition());
+				if(i % 2 == 0)
+					entity.AddComponent(new BenchVelocity { Dx = 1, Dy = 0.5f });
+				if(i % 10 == 0)
+					entity.AddComponent(new BenchTag());
+				entities.Add(entity);
+			}
+
+			var stopwatch = Stopwatch.StartNew();
+			int added = ecs.AddEntities(entities);
+			stopwatch.Stop();
+			Console.WriteLine($"1. AddEntities: {added} entities in {stopwatch.Elapsed.TotalMilliseconds:F2} ms");
+
+			// 2. Step 비용 (워밍업 후 측정)
+			ecs.Step(1);
+			long allocatedBefore = GC.GetAllocatedBytesForCurrentThread();
+			stopwatch.Restart();
+			for(int i=0;i<steps;++i)
+				ecs.Step(1);
+			stopwatch.Stop();
+			long allocated = GC.GetAllocatedBytesForCurrentThread() - allocatedBefore;
+
+			double perStepUs = stopwatch.Elapsed.TotalMilliseconds * 1000.0 / steps;
+			Console.WriteLine($"2. Step: {perStepUs:F2} us/step, allocated {allocated / (double)steps:F1} bytes/step (row visits: {rowSystem?.Visited})");
+
+			// 3. 쿼리 캐시 (첫 조회는 전체 검사, 이후 캐시된 그룹)
+			stopwatch.Restart();
+			var tagged = ecs.Query(typeof(BenchPosition), typeof(BenchTag));
+			stopwatch.Stop();
+			double firstQueryMs = stopwatch.Elapsed.TotalMilliseconds;
+
+			stopwatch.Restart();
+			for(int i=0;i<steps;++i)
+				tagged = ecs.Query(typeof(BenchPosition), typeof(BenchTag));
+			stopwatch.Stop();
+			Console.WriteLine($"3. Query: first {firstQueryMs:F3} ms, cached {stopwatch.Elapsed.TotalMilliseconds * 1000.0 / steps:F3} us/call ({tagged.Count} matches)");
+
+			// 4. 엔티티 하나 추가/제거 (증분 갱신)
+			var extra = new Entity();
+			extra.AddComponent(new BenchPosition());
+			extra.AddComponent(new BenchTag());
+			stopwatch.Restart();
+			ecs.AddEntity(extra);
+			ecs.RemoveEntity(extra);
+			stopwatch.Stop();
+			Console.WriteLine($"4. Add+Remove one entity: {stopwatch.Elapsed.TotalMilliseconds * 1000.0:F2} us");
+
+			Console.WriteLine("\n=== Benchmark Complete ===");
+		}
+	}
+}
@@ -1,6 +1,5 @@
 
 using System;
-using Godot;
 using ECS;
 using System.Collections.Generic;
 
@@ -25,14 +24,25 @@ namespace SE
 
 	public class World : ECS.ECS
 	{
-        public Node Root {get; private set;}
+#if GODOT
+        public Godot.Node Root {get; private set;}
+#endif
 
 		// private Queue<Transaction> _q = new Queue<Transaction>();
 		
-        public World(Node root)
+#if GODOT
+        public World(Godot.Node root)
 		{
 			this.Root = root;
 		}
+#endif
+
+        /// <summary>
+        /// 씬 트리 없이 생성 (헤드리스 실행)
+        /// </summary>
+        public World()
+		{
+		}
 
         // internal override bool AddEntity(Entity entity)
         // {
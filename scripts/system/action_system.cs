@@ -1,5 +1,4 @@
 using ECS;
-using Godot;
 using Morld;
 using System.Collections.Generic;
 using System.Linq;
@@ -11,6 +10,8 @@ namespace SE
 	/// </summary>
 	public class ActionSystem : ECS.System
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("ActionSystem");
+
 		public ActionSystem()
 		{
 		}
@@ -171,11 +172,11 @@ namespace SE
 		/// </summary>
 		public void DebugPrint()
 		{
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-			GD.Print("  ActionSystem 로드됨");
-			GD.Print("  지원 액션: rest, sleep, wait, talk, trade, open, examine");
-			GD.Print("  지원 아이템 액션: pickup, drop, use, combine, give");
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug("  ActionSystem 로드됨");
+			_log.Debug("  지원 액션: rest, sleep, wait, talk, trade, open, examine");
+			_log.Debug("  지원 아이템 액션: pickup, drop, use, combine, give");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
 		}
 	}
 }
@@ -1,5 +1,4 @@
 using ECS;
-using Godot;
 using Morld;
 using System;
 
@@ -10,6 +9,8 @@ namespace SE
 	/// </summary>
 	public class BehaviorSystem : ECS.System
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("BehaviorSystem");
+
 		public BehaviorSystem()
 		{
 		}
@@ -19,7 +20,7 @@ namespace SE
 			var unitSystem = _hub.FindSystem("unitSystem") as UnitSystem;
 			if (unitSystem == null) return;
 
-			foreach (var unit in unitSystem.Units.Values)
+			foreach (var unit in unitSystem.UnitValues)
 			{
 				// 오브젝트는 스케줄 없음
 				if (unit.IsObject) continue;
@@ -32,10 +33,10 @@ namespace SE
 				{
 					var poppedLayer = unit.PopSchedule();
 #if DEBUG_LOG
-					GD.Print($"[BehaviorSystem] {unit.Name}: 스케줄 레이어 완료 - {poppedLayer?.Name}");
+					_log.Debug($"{unit.Name}: 스케줄 레이어 완료 - {poppedLayer?.Name}");
 					if (unit.CurrentScheduleLayer != null)
 					{
-						GD.Print($"  → 다음 레이어: {unit.CurrentScheduleLayer.Name}");
+						_log.Debug($"  → 다음 레이어: {unit.CurrentScheduleLayer.Name}");
 					}
 #endif
 				}
@@ -13,6 +13,8 @@ namespace SE
 	/// </summary>
 	public class DescribeSystem : ECS.System
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("DescribeSystem");
+
 		private readonly ActionProviderRegistry _actionRegistry = new();
 		private Dictionary<string, string> _actionMessages = new();
 
@@ -27,22 +29,20 @@ namespace SE
 		/// </summary>
 		public void LoadActionMessages(string filePath)
 		{
-			// Godot FileAccess를 사용해서 res:// 경로 지원
-			if (!Godot.FileAccess.FileExists(filePath))
+			// GamePath를 사용해서 res:// 경로 지원
+			if (!GamePath.FileExists(filePath))
 			{
-				Godot.GD.PrintErr($"[DescribeSystem] Action messages file not found: {filePath}");
+				_log.Error($"Action messages file not found: {filePath}");
 				return;
 			}
 
-			using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-			if (file == null)
+			if (!GamePath.TryReadAllText(filePath, out var json))
 			{
-				Godot.GD.PrintErr($"[DescribeSystem] Failed to open action messages file: {filePath}");
+				_log.Error($"Failed to open action messages file: {filePath}");
 				return;
 			}
-			var json = file.GetAsText();
 			_actionMessages = JsonSerializer.Deserialize<Dictionary<string, string>>(json) ?? new();
-			Godot.GD.Print($"[DescribeSystem] Loaded {_actionMessages.Count} action messages");
+			_log.Debug($"Loaded {_actionMessages.Count} action messages");
 		}
 
 		/// <summary>
@@ -465,7 +465,7 @@ namespace SE
 						else
 						{
 							// 형식 오류 - 디버그 정보와 함께 표시
-							Godot.GD.PrintErr($"[DescribeSystem] Invalid script action format: '{action}' (expected 'script:funcName:displayName')");
+							_log.Error($"Invalid script action format: '{action}' (expected 'script:funcName:displayName')");
 							lines.Add($"  [color=red][오류: {action}][/color]");
 						}
 					}
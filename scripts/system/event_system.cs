@@ -1,11 +1,9 @@
-#define DEBUG_LOG
-
 using ECS;
-using Godot;
 using Morld;
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Threading.Tasks;
 
 namespace SE
 {
@@ -17,6 +15,8 @@ namespace SE
 	/// </summary>
 	public class EventSystem : ECS.System
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("EventSystem");
+
 		// 이번 Step에서 발생한 이벤트 큐
 		private readonly List<GameEvent> _pendingEvents = new();
 
@@ -33,6 +33,9 @@ namespace SE
 		private readonly HashSet<string> _lastMeetings = new();
 		// 역방향 인덱스: 유닛 ID → 해당 유닛이 포함된 만남 키 집합
 		private readonly Dictionary<int, HashSet<string>> _unitToMeetings = new();
+		// DetectMeetings 작업용 / 직전 감지 구성 (같으면 키 문자열 생성 생략)
+		private readonly List<int> _meetingIds = new();
+		private readonly List<int> _lastMeetingIds = new();
 
 		// 초기화 완료 여부 (첫 Step에서 위치 초기화용)
 		private bool _initialized = false;
@@ -62,9 +65,7 @@ namespace SE
 		public void Enqueue(GameEvent evt)
 		{
 			_pendingEvents.Add(evt);
-#if DEBUG_LOG
-			GD.Print($"[EventSystem] Enqueued: {evt}");
-#endif
+			_log.Debug($"Enqueued: {evt}");
 		}
 
 		/// <summary>
@@ -85,9 +86,7 @@ namespace SE
 			}
 			_initialized = true;
 
-#if DEBUG_LOG
-			GD.Print($"[EventSystem] Initialized locations for {_lastLocations.Count} units");
-#endif
+			_log.Info($"Initialized locations for {_lastLocations.Count} units");
 		}
 
 		/// <summary>
@@ -104,7 +103,7 @@ namespace SE
 				return;
 			}
 
-			foreach (var unit in _unitSystem.Units.Values)
+			foreach (var unit in _unitSystem.UnitValues)
 			{
 				// 이벤트 비활성 유닛은 스킵
 				if (!unit.GeneratesEvents) continue;
@@ -138,29 +137,47 @@ namespace SE
 			var player = _unitSystem.GetUnit(playerId);
 			if (player == null) return;
 
-			// 플레이어와 같은 위치에 있는 이벤트 활성 유닛 수집
-			var unitsAtSameLocation = _unitSystem.Units.Values
-				.Where(u => u.Id != playerId
-						 && u.CurrentLocation == player.CurrentLocation
-						 && u.GeneratesEvents)
-				.Select(u => u.Id)
-				.OrderBy(id => id)  // 정렬하여 키 정규화
-				.ToList();
+			// 플레이어와 같은 위치에 있는 이벤트 활성 유닛 수집 (플레이어 포함, 재사용 리스트)
+			var playerLocation = player.CurrentLocation;
+			_meetingIds.Clear();
+			_meetingIds.Add(playerId);
+			foreach (var unit in _unitSystem.UnitValues)
+			{
+				if (unit.Id != playerId && unit.CurrentLocation == playerLocation && unit.GeneratesEvents)
+					_meetingIds.Add(unit.Id);
+			}
+
+			if (_meetingIds.Count == 1) return;
 
-			if (unitsAtSameLocation.Count == 0) return;
+			// 정렬하여 키 정규화
+			_meetingIds.Sort();
+
+			// 직전 감지와 같은 구성이면 이미 기록된 만남 (키 문자열을 만들지 않음)
+			if (SameIds(_meetingIds, _lastMeetingIds)) return;
+
+			_lastMeetingIds.Clear();
+			_lastMeetingIds.AddRange(_meetingIds);
 
 			// 만남 키 생성 (플레이어 + 다른 유닛들, 정렬됨)
-			var allIds = new List<int> { playerId };
-			allIds.AddRange(unitsAtSameLocation);
-			allIds.Sort();
-			var meetingKey = string.Join(",", allIds);
+			var meetingKey = string.Join(",", _meetingIds);
 
 			// 이미 발생한 만남인지 확인
 			if (_lastMeetings.Contains(meetingKey)) return;
 
 			// 새로운 만남 기록 및 이벤트 생성
-			AddMeetingKey(meetingKey, allIds.ToArray());
-			Enqueue(GameEvent.OnMeet(allIds.ToArray()));
+			var allIds = _meetingIds.ToArray();
+			AddMeetingKey(meetingKey, allIds);
+			Enqueue(GameEvent.OnMeet(allIds));
+		}
+
+		private static bool SameIds(List<int> a, List<int> b)
+		{
+			if (a.Count != b.Count) return false;
+			for (int i = 0; i < a.Count; i++)
+			{
+				if (a[i] != b[i]) return false;
+			}
+			return true;
 		}
 
 		/// <summary>
@@ -171,9 +188,7 @@ namespace SE
 		{
 			if (_pendingEvents.Count == 0) return false;
 
-#if DEBUG_LOG
-			GD.Print($"[EventSystem] Flushing {_pendingEvents.Count} events");
-#endif
+			_log.Debug($"Flushing {_pendingEvents.Count} events");
 
 			// Python에 이벤트 리스트 전달
 			var result = _scriptSystem?.CallEventHandler(_pendingEvents);
@@ -183,6 +198,26 @@ namespace SE
 			return ProcessEventResult(result);
 		}
 
+		/// <summary>
+		/// FlushEvents 비동기 버전 (ScriptSystem 비동기 모드에서 Python 호출을 전용 스레드로)
+		/// 결과 처리(모놀로그 표시)는 메인 스레드에서 Task 완료 시 수행
+		/// </summary>
+		/// <returns>처리 결과 (모놀로그 표시 시 true)</returns>
+		public Task<bool> FlushEventsAsync()
+		{
+			if (_scriptSystem == null || !_scriptSystem.IsAsync)
+				return Task.FromResult(FlushEvents());
+			if (_pendingEvents.Count == 0)
+				return Task.FromResult(false);
+
+			_log.Debug($"Flushing {_pendingEvents.Count} events (async)");
+
+			var call = _scriptSystem.CallEventHandlerAsync(_pendingEvents);
+			_pendingEvents.Clear();
+
+			return call.ContinueWith(t => ProcessEventResult(t.Result), TaskContinuationOptions.ExecuteSynchronously);
+		}
+
 		/// <summary>
 		/// 이벤트 결과 처리
 		/// </summary>
@@ -208,9 +243,7 @@ namespace SE
 							monoResult.ButtonType,
 							monoResult.DoneCallback,
 							monoResult.CancelCallback);
-#if DEBUG_LOG
-						GD.Print($"[EventSystem] Showing monologue ({monoResult.Pages.Count} pages)");
-#endif
+						_log.Debug($"Showing monologue ({monoResult.Pages.Count} pages)");
 						return true;
 					}
 					break;
@@ -243,6 +276,8 @@ namespace SE
 				foreach (var key in keys)
 					_lastMeetings.Remove(key);
 				_unitToMeetings.Remove(unitId);
+				// 지워진 만남이 다시 감지되도록
+				_lastMeetingIds.Clear();
 			}
 		}
 
@@ -1,7 +1,9 @@
+// 디버그 덤프는 DEBUG 빌드에서만 (릴리스 빌드에서는 출력 문자열을 만들지 않음)
+#if DEBUG
 #define DEBUG_LOG
+#endif
 
 using ECS;
-using Godot;
 using Morld;
 using System;
 using System.Collections.Generic;
@@ -42,13 +44,16 @@ namespace SE
 	/// - IDataProvider: 자체 데이터 저장/로드
 	/// - IActionProvider: "소지품 확인" 행동 제공
 	///
+	/// 내부 저장은 정수 소유자 핸들(OwnerRegistry) 기준, 문자열 키는 저장/호환용
 	/// 키 형식:
-	/// - "unit:{id}" - 유닛 (캐릭터/오브젝트)
+	/// - "{id}" - 유닛 (캐릭터/오브젝트)
 	/// - "location:{regionId}:{localId}" - 위치 (바닥)
 	/// - "item:{id}" - 아이템 (가방 등)
 	/// </summary>
-	public class InventorySystem : ECS.System, IDataProvider, IActionProvider
+	public class InventorySystem : ECS.System, IDataProvider, IActionProvider, ICheckpointable
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("InventorySystem");
+
 		// === IDataProvider ===
 		public string DataId => "inventory";
 
@@ -56,126 +61,208 @@ namespace SE
 		public string ProviderId => "inventory";
 
 		/// <summary>
-		/// 통합 인벤토리 (ownerKey → {itemId → count})
-		/// ownerKey: "unit:0", "location:0:1", "item:5" 등
+		/// 소유자 핸들 관리 (유닛 = unitId, 위치/아이템 = 발급된 음수 핸들)
 		/// </summary>
-		private readonly Dictionary<string, Dictionary<int, int>> _inventories = new();
+		private readonly OwnerRegistry _owners = new();
 
 		/// <summary>
-		/// 장착 아이템 (ownerKey → [itemId, ...])
+		/// 통합 인벤토리 (ownerHandle → {itemId → count})
+		/// </summary>
+		private readonly Dictionary<int, ItemStacks> _inventories = new();
+
+		/// <summary>
+		/// 장착 아이템 (ownerHandle → [itemId, ...])
 		/// 주로 유닛에서 사용
 		/// </summary>
-		private readonly Dictionary<string, List<int>> _equippedItems = new();
+		private readonly Dictionary<int, List<int>> _equippedItems = new();
 
 		/// <summary>
-		/// 인벤토리 가시성 (ownerKey → isVisible)
+		/// 인벤토리 가시성 (ownerHandle → isVisible)
 		/// true면 아이템이 외부에서 보임 (열린 상자, 바닥 등)
 		/// </summary>
-		private readonly Dictionary<string, bool> _visibility = new();
+		private readonly Dictionary<int, bool> _visibility = new();
+
+		private static readonly List<int> EmptyEquipped = new();
 
 		/// <summary>
 		/// 인벤토리 변경 이벤트 콜백
 		/// </summary>
 		public Action<InventoryEvent>? OnInventoryChanged { get; set; }
 
+		/// <summary>
+		/// 변경 저널 (null = 사용 안 함, EnableJournal로 활성화)
+		/// </summary>
+		private ChangeJournal? _journal;
+
+		/// <summary>
+		/// 체크포인트 복원 후 저널에 되돌린 변경이 남아 있으므로 다음 자동 저장은 전체 스냅샷
+		/// </summary>
+		private bool _snapshotRequired = false;
+
+		/// <summary>
+		/// 체크포인트별 변경 전 값 (처음 수정되는 소유자만 복사)
+		/// </summary>
+		private readonly UndoLayers<int, ItemStacks> _inventoryUndo = new();
+		private readonly UndoLayers<int, List<int>> _equippedUndo = new();
+		private readonly UndoLayers<int, bool> _visibilityUndo = new();
+
 		public InventorySystem()
 		{
 		}
 
+		/// <summary>
+		/// 변경 이벤트 발생 (저널 기록 후 콜백 호출)
+		/// </summary>
+		private void Raise(InventoryEvent evt)
+		{
+			_journal?.Append(ToJournalRecord(evt));
+			OnInventoryChanged?.Invoke(evt);
+		}
+
 		// ===== 키 생성 헬퍼 =====
 
 		/// <summary>
 		/// 유닛 키 생성 (unitId를 문자열로 변환)
+		/// 저장 데이터/스크립트 호환용 - 내부 조회는 핸들 사용
 		/// </summary>
 		public static string UnitKey(int unitId) => unitId.ToString();
 
-		// ===== 범용 인벤토리 조회 API =====
+		/// <summary>
+		/// 문자열 키 → 소유자 핸들
+		/// </summary>
+		public int OwnerHandle(string ownerKey) => _owners.FromKey(ownerKey);
+
+		/// <summary>
+		/// 위치(바닥) 소유자 핸들
+		/// </summary>
+		public int LocationHandle(int regionId, int localId) => _owners.Location(regionId, localId);
 
 		/// <summary>
-		/// 인벤토리 가져오기 (읽기 전용)
+		/// 아이템 컨테이너 소유자 핸들
 		/// </summary>
-		public IReadOnlyDictionary<int, int> GetInventory(string ownerKey)
+		public int ItemContainerHandle(int itemId) => _owners.Item(itemId);
+
+		/// <summary>
+		/// 소유자 핸들 → 문자열 키 (이벤트/저장용, 핸들별 캐시)
+		/// </summary>
+		public string OwnerKey(int ownerHandle) => _owners.ToKey(ownerHandle);
+
+		// ===== 범용 인벤토리 조회 API (핸들) =====
+
+		/// <summary>
+		/// 인벤토리 가져오기 (읽기 전용, 없으면 빈 인벤토리)
+		/// </summary>
+		public IReadOnlyDictionary<int, int> GetInventory(int ownerHandle)
 		{
-			return _inventories.TryGetValue(ownerKey, out var inv)
-				? inv
-				: new Dictionary<int, int>();
+			return _inventories.TryGetValue(ownerHandle, out var inv) ? inv : ItemStacks.Empty;
 		}
 
 		/// <summary>
 		/// 인벤토리가 있는지 확인
 		/// </summary>
-		public bool HasInventory(string ownerKey)
+		public bool HasInventory(int ownerHandle)
 		{
-			return _inventories.ContainsKey(ownerKey);
+			return _inventories.ContainsKey(ownerHandle);
 		}
 
 		/// <summary>
 		/// 장착 아이템 목록 가져오기 (읽기 전용)
 		/// </summary>
-		public IReadOnlyList<int> GetEquippedItems(string ownerKey)
+		public IReadOnlyList<int> GetEquippedItems(int ownerHandle)
 		{
-			return _equippedItems.TryGetValue(ownerKey, out var items)
-				? items
-				: new List<int>();
+			return _equippedItems.TryGetValue(ownerHandle, out var items) ? items : EmptyEquipped;
 		}
 
+		/// <summary>
+		/// 특정 아이템을 가지고 있는지 확인 (할당 없음)
+		/// </summary>
+		public bool HasItem(int ownerHandle, int itemId, int count = 1)
+		{
+			return _inventories.TryGetValue(ownerHandle, out var inv) && inv.Get(itemId) >= count;
+		}
+
+		/// <summary>
+		/// 보유 개수 (없으면 0)
+		/// </summary>
+		public int GetItemCount(int ownerHandle, int itemId)
+		{
+			return _inventories.TryGetValue(ownerHandle, out var inv) ? inv.Get(itemId) : 0;
+		}
+
+		// ===== 범용 인벤토리 조회 API (문자열 키) =====
+
+		public IReadOnlyDictionary<int, int> GetInventory(string ownerKey)
+			=> GetInventory(OwnerHandle(ownerKey));
+
+		public bool HasInventory(string ownerKey)
+			=> HasInventory(OwnerHandle(ownerKey));
+
+		public IReadOnlyList<int> GetEquippedItems(string ownerKey)
+			=> GetEquippedItems(OwnerHandle(ownerKey));
+
+		public bool HasItem(string ownerKey, int itemId, int count = 1)
+			=> HasItem(OwnerHandle(ownerKey), itemId, count);
+
 		// ===== 유닛 전용 편의 메서드 =====
 
 		/// <summary>
 		/// 유닛의 인벤토리 가져오기
 		/// </summary>
 		public IReadOnlyDictionary<int, int> GetUnitInventory(int unitId)
-			=> GetInventory(UnitKey(unitId));
+			=> GetInventory(OwnerRegistry.Unit(unitId));
 
 		/// <summary>
 		/// 유닛이 인벤토리를 가지고 있는지 확인
 		/// </summary>
 		public bool HasUnitInventory(int unitId)
-			=> HasInventory(UnitKey(unitId));
+			=> HasInventory(OwnerRegistry.Unit(unitId));
 
 		/// <summary>
 		/// 유닛의 장착 아이템 목록
 		/// </summary>
 		public IReadOnlyList<int> GetUnitEquippedItems(int unitId)
-			=> GetEquippedItems(UnitKey(unitId));
+			=> GetEquippedItems(OwnerRegistry.Unit(unitId));
 
-		// ===== 범용 인벤토리 조작 API =====
+		// ===== 범용 인벤토리 조작 API (핸들) =====
 
 		/// <summary>
-		/// 인벤토리 생성 (이미 있으면 무시)
+		/// 인벤토리 가져오기 (없으면 생성)
 		/// </summary>
-		public void CreateInventory(string ownerKey)
+		private ItemStacks GetOrCreate(int ownerHandle)
 		{
-			if (!_inventories.ContainsKey(ownerKey))
+			TouchInventory(ownerHandle);
+			if (!_inventories.TryGetValue(ownerHandle, out var inv))
 			{
-				_inventories[ownerKey] = new Dictionary<int, int>();
+				inv = new ItemStacks();
+				_inventories[ownerHandle] = inv;
 			}
+			return inv;
+		}
+
+		/// <summary>
+		/// 인벤토리 생성 (이미 있으면 무시)
+		/// </summary>
+		public void CreateInventory(int ownerHandle)
+		{
+			GetOrCreate(ownerHandle);
 		}
 
 		/// <summary>
 		/// 인벤토리에 아이템 추가
 		/// </summary>
-		public bool AddItem(string ownerKey, int itemId, int count = 1)
+		public bool AddItem(int ownerHandle, int itemId, int count = 1)
 		{
 			if (count <= 0) return false;
 
-			if (!_inventories.TryGetValue(ownerKey, out var inv))
-			{
-				inv = new Dictionary<int, int>();
-				_inventories[ownerKey] = inv;
-			}
-
-			if (!inv.ContainsKey(itemId))
-				inv[itemId] = 0;
-			inv[itemId] += count;
+			GetOrCreate(ownerHandle).Add(itemId, count);
 
 			// 이벤트 발생
-			OnInventoryChanged?.Invoke(new InventoryEvent
+			Raise(new InventoryEvent
 			{
 				Type = InventoryEventType.ItemAdded,
 				ItemId = itemId,
 				Count = count,
-				ToOwner = ownerKey
+				ToOwner = OwnerKey(ownerHandle)
 			});
 
 			return true;
@@ -184,27 +271,21 @@ namespace SE
 		/// <summary>
 		/// 인벤토리에서 아이템 제거
 		/// </summary>
-		public bool RemoveItem(string ownerKey, int itemId, int count = 1)
+		public bool RemoveItem(int ownerHandle, int itemId, int count = 1)
 		{
 			if (count <= 0) return false;
 
-			if (!_inventories.TryGetValue(ownerKey, out var inv))
-				return false;
-
-			if (!inv.TryGetValue(itemId, out int available) || available < count)
+			TouchInventory(ownerHandle);
+			if (!_inventories.TryGetValue(ownerHandle, out var inv) || !inv.Remove(itemId, count))
 				return false;
 
-			inv[itemId] -= count;
-			if (inv[itemId] <= 0)
-				inv.Remove(itemId);
-
 			// 이벤트 발생
-			OnInventoryChanged?.Invoke(new InventoryEvent
+			Raise(new InventoryEvent
 			{
 				Type = InventoryEventType.ItemRemoved,
 				ItemId = itemId,
 				Count = count,
-				FromOwner = ownerKey
+				FromOwner = OwnerKey(ownerHandle)
 			});
 
 			return true;
@@ -214,177 +295,245 @@ namespace SE
 		/// 아이템 잃음 처리 (사용/소모로 인한 삭제)
 		/// RemoveItem과 동일하지만 ItemLost 이벤트 발생
 		/// </summary>
-		public bool LostItem(string ownerKey, int itemId, int count = 1)
+		public bool LostItem(int ownerHandle, int itemId, int count = 1)
 		{
 			if (count <= 0) return false;
 
-			if (!_inventories.TryGetValue(ownerKey, out var inv))
-				return false;
-
-			if (!inv.TryGetValue(itemId, out int available) || available < count)
+			TouchInventory(ownerHandle);
+			if (!_inventories.TryGetValue(ownerHandle, out var inv) || !inv.Remove(itemId, count))
 				return false;
 
-			inv[itemId] -= count;
-			if (inv[itemId] <= 0)
-				inv.Remove(itemId);
-
 			// ItemLost 이벤트 발생 (액션 로그에 사용)
-			OnInventoryChanged?.Invoke(new InventoryEvent
+			Raise(new InventoryEvent
 			{
 				Type = InventoryEventType.ItemLost,
 				ItemId = itemId,
 				Count = count,
-				FromOwner = ownerKey
+				FromOwner = OwnerKey(ownerHandle)
 			});
 
 			return true;
 		}
 
-		/// <summary>
-		/// 특정 아이템을 가지고 있는지 확인
-		/// </summary>
-		public bool HasItem(string ownerKey, int itemId, int count = 1)
-		{
-			if (!_inventories.TryGetValue(ownerKey, out var inv))
-				return false;
-
-			return inv.TryGetValue(itemId, out int available) && available >= count;
-		}
-
 		/// <summary>
 		/// 인벤토리 간 아이템 이동 (내부용 - 이벤트 없이)
 		/// </summary>
-		private bool TransferItemInternal(string fromKey, string toKey, int itemId, int count = 1)
+		private bool TransferItemInternal(int fromHandle, int toHandle, int itemId, int count = 1)
 		{
 			if (count <= 0) return false;
 
-			if (!_inventories.TryGetValue(fromKey, out var fromInv))
+			TouchInventory(fromHandle);
+			if (!_inventories.TryGetValue(fromHandle, out var fromInv) || !fromInv.Remove(itemId, count))
 				return false;
 
-			if (!fromInv.TryGetValue(itemId, out int available) || available < count)
-				return false;
-
-			// 제거
-			fromInv[itemId] -= count;
-			if (fromInv[itemId] <= 0)
-				fromInv.Remove(itemId);
-
-			// 추가
-			if (!_inventories.TryGetValue(toKey, out var toInv))
-			{
-				toInv = new Dictionary<int, int>();
-				_inventories[toKey] = toInv;
-			}
-			if (!toInv.ContainsKey(itemId))
-				toInv[itemId] = 0;
-			toInv[itemId] += count;
-
+			GetOrCreate(toHandle).Add(itemId, count);
 			return true;
 		}
 
 		/// <summary>
 		/// 인벤토리 간 아이템 이동
 		/// </summary>
-		public bool TransferItem(string fromKey, string toKey, int itemId, int count = 1)
+		public bool TransferItem(int fromHandle, int toHandle, int itemId, int count = 1)
 		{
-			if (!TransferItemInternal(fromKey, toKey, itemId, count))
+			if (!TransferItemInternal(fromHandle, toHandle, itemId, count))
 				return false;
 
 			// 이벤트 발생
-			OnInventoryChanged?.Invoke(new InventoryEvent
+			Raise(new InventoryEvent
 			{
 				Type = InventoryEventType.ItemTransferred,
 				ItemId = itemId,
 				Count = count,
-				FromOwner = fromKey,
-				ToOwner = toKey
+				FromOwner = OwnerKey(fromHandle),
+				ToOwner = OwnerKey(toHandle)
 			});
 
 			return true;
 		}
 
+		/// <summary>
+		/// 여러 아이템 묶음을 한 번에 이동 (전리품 획득, 거래 등)
+		/// 보유량이 부족한 묶음은 건너뜀
+		/// </summary>
+		/// <returns>실제로 이동한 묶음 수</returns>
+		public int TransferMany(int fromHandle, int toHandle, IEnumerable<(int ItemId, int Count)> stacks)
+		{
+			if (!_inventories.TryGetValue(fromHandle, out var fromInv))
+				return 0;
+
+			TouchInventory(fromHandle);
+			var toInv = GetOrCreate(toHandle);
+			string? fromKey = null;
+			string? toKey = null;
+			int moved = 0;
+
+			foreach (var (itemId, count) in stacks)
+			{
+				if (count <= 0 || !fromInv.Remove(itemId, count))
+					continue;
+
+				toInv.Add(itemId, count);
+				moved++;
+
+				if (OnInventoryChanged != null || _journal != null)
+				{
+					fromKey ??= OwnerKey(fromHandle);
+					toKey ??= OwnerKey(toHandle);
+					Raise(new InventoryEvent
+					{
+						Type = InventoryEventType.ItemTransferred,
+						ItemId = itemId,
+						Count = count,
+						FromOwner = fromKey,
+						ToOwner = toKey
+					});
+				}
+			}
+
+			return moved;
+		}
+
+		/// <summary>
+		/// 인벤토리 전체 이동 (모두 가져가기)
+		/// </summary>
+		/// <returns>실제로 이동한 묶음 수</returns>
+		public int TransferAll(int fromHandle, int toHandle)
+		{
+			if (!_inventories.TryGetValue(fromHandle, out var fromInv) || fromInv.Count == 0)
+				return 0;
+
+			// 순회 중 수정 방지를 위해 스냅샷
+			var stacks = new (int ItemId, int Count)[fromInv.Count];
+			int i = 0;
+			foreach (var (itemId, count) in fromInv)
+			{
+				stacks[i++] = (itemId, count);
+			}
+			return TransferMany(fromHandle, toHandle, stacks);
+		}
+
+		// ===== 범용 인벤토리 조작 API (문자열 키) =====
+
+		public void CreateInventory(string ownerKey)
+			=> CreateInventory(OwnerHandle(ownerKey));
+
+		public bool AddItem(string ownerKey, int itemId, int count = 1)
+			=> AddItem(OwnerHandle(ownerKey), itemId, count);
+
+		public bool RemoveItem(string ownerKey, int itemId, int count = 1)
+			=> RemoveItem(OwnerHandle(ownerKey), itemId, count);
+
+		public bool LostItem(string ownerKey, int itemId, int count = 1)
+			=> LostItem(OwnerHandle(ownerKey), itemId, count);
+
+		public bool TransferItem(string fromKey, string toKey, int itemId, int count = 1)
+			=> TransferItem(OwnerHandle(fromKey), OwnerHandle(toKey), itemId, count);
+
+		public int TransferMany(string fromKey, string toKey, IEnumerable<(int ItemId, int Count)> stacks)
+			=> TransferMany(OwnerHandle(fromKey), OwnerHandle(toKey), stacks);
+
 		// ===== 유닛 전용 조작 편의 메서드 =====
 
 		/// <summary>
 		/// 유닛에게 인벤토리 생성
 		/// </summary>
 		public void CreateUnitInventory(int unitId)
-			=> CreateInventory(UnitKey(unitId));
+			=> CreateInventory(OwnerRegistry.Unit(unitId));
 
 		/// <summary>
 		/// 유닛 인벤토리에 아이템 추가
 		/// </summary>
 		public bool AddItemToUnit(int unitId, int itemId, int count = 1)
-			=> AddItem(UnitKey(unitId), itemId, count);
+			=> AddItem(OwnerRegistry.Unit(unitId), itemId, count);
 
 		/// <summary>
 		/// 유닛 인벤토리에서 아이템 제거
 		/// </summary>
 		public bool RemoveItemFromUnit(int unitId, int itemId, int count = 1)
-			=> RemoveItem(UnitKey(unitId), itemId, count);
+			=> RemoveItem(OwnerRegistry.Unit(unitId), itemId, count);
 
 		/// <summary>
 		/// 유닛 인벤토리에서 아이템 잃음 처리 (사용/소모)
 		/// </summary>
 		public bool LostItemFromUnit(int unitId, int itemId, int count = 1)
-			=> LostItem(UnitKey(unitId), itemId, count);
+			=> LostItem(OwnerRegistry.Unit(unitId), itemId, count);
 
 		/// <summary>
 		/// 유닛이 특정 아이템을 가지고 있는지 확인
 		/// </summary>
 		public bool UnitHasItem(int unitId, int itemId, int count = 1)
-			=> HasItem(UnitKey(unitId), itemId, count);
+			=> HasItem(OwnerRegistry.Unit(unitId), itemId, count);
 
 		/// <summary>
 		/// 유닛 간 아이템 이동
 		/// </summary>
 		public bool TransferBetweenUnits(int fromUnitId, int toUnitId, int itemId, int count = 1)
-			=> TransferItem(UnitKey(fromUnitId), UnitKey(toUnitId), itemId, count);
+			=> TransferItem(OwnerRegistry.Unit(fromUnitId), OwnerRegistry.Unit(toUnitId), itemId, count);
+
+		/// <summary>
+		/// 유닛 간 여러 아이템 묶음 이동
+		/// </summary>
+		public int TransferManyBetweenUnits(int fromUnitId, int toUnitId, IEnumerable<(int ItemId, int Count)> stacks)
+			=> TransferMany(OwnerRegistry.Unit(fromUnitId), OwnerRegistry.Unit(toUnitId), stacks);
 
 		// ===== 가시성 API =====
 
 		/// <summary>
 		/// 인벤토리 가시성 설정
 		/// </summary>
-		public void SetVisible(string ownerKey, bool isVisible)
+		public void SetVisible(int ownerHandle, bool isVisible)
 		{
-			_visibility[ownerKey] = isVisible;
+			TouchVisibility(ownerHandle);
+			_visibility[ownerHandle] = isVisible;
+			_journal?.Append(new JournalRecord
+			{
+				Op = "visible",
+				Owner = OwnerKey(ownerHandle),
+				Value = isVisible ? 1 : 0
+			});
 		}
 
 		/// <summary>
 		/// 인벤토리가 외부에서 보이는지 확인
 		/// </summary>
-		public bool IsVisible(string ownerKey)
+		public bool IsVisible(int ownerHandle)
 		{
-			return _visibility.TryGetValue(ownerKey, out var visible) && visible;
+			return _visibility.TryGetValue(ownerHandle, out var visible) && visible;
 		}
 
+		public void SetVisible(string ownerKey, bool isVisible)
+			=> SetVisible(OwnerHandle(ownerKey), isVisible);
+
+		public bool IsVisible(string ownerKey)
+			=> IsVisible(OwnerHandle(ownerKey));
+
 		/// <summary>
 		/// 유닛 인벤토리가 외부에서 보이는지 확인
 		/// </summary>
 		public bool IsUnitInventoryVisible(int unitId)
-			=> IsVisible(UnitKey(unitId));
+			=> IsVisible(OwnerRegistry.Unit(unitId));
 
 		/// <summary>
 		/// 유닛 인벤토리 가시성 설정
 		/// </summary>
 		public void SetUnitInventoryVisible(int unitId, bool isVisible)
-			=> SetVisible(UnitKey(unitId), isVisible);
+			=> SetVisible(OwnerRegistry.Unit(unitId), isVisible);
 
 		// ===== 장착 API =====
 
 		/// <summary>
 		/// 아이템 장착
 		/// </summary>
-		public bool EquipItem(string ownerKey, int itemId)
+		public bool EquipItem(int ownerHandle, int itemId)
 		{
-			if (!HasItem(ownerKey, itemId))
+			if (!HasItem(ownerHandle, itemId))
 				return false;
 
-			if (!_equippedItems.TryGetValue(ownerKey, out var equipped))
+			TouchEquipped(ownerHandle);
+			if (!_equippedItems.TryGetValue(ownerHandle, out var equipped))
 			{
 				equipped = new List<int>();
-				_equippedItems[ownerKey] = equipped;
+				_equippedItems[ownerHandle] = equipped;
 			}
 
 			if (!equipped.Contains(itemId))
@@ -392,12 +541,12 @@ namespace SE
 				equipped.Add(itemId);
 
 				// 이벤트 발생
-				OnInventoryChanged?.Invoke(new InventoryEvent
+				Raise(new InventoryEvent
 				{
 					Type = InventoryEventType.ItemEquipped,
 					ItemId = itemId,
 					Count = 1,
-					ToOwner = ownerKey
+					ToOwner = OwnerKey(ownerHandle)
 				});
 			}
 
@@ -407,20 +556,21 @@ namespace SE
 		/// <summary>
 		/// 아이템 장착 해제
 		/// </summary>
-		public bool UnequipItem(string ownerKey, int itemId)
+		public bool UnequipItem(int ownerHandle, int itemId)
 		{
-			if (!_equippedItems.TryGetValue(ownerKey, out var equipped))
+			if (!_equippedItems.TryGetValue(ownerHandle, out var equipped))
 				return false;
 
+			TouchEquipped(ownerHandle);
 			if (equipped.Remove(itemId))
 			{
 				// 이벤트 발생
-				OnInventoryChanged?.Invoke(new InventoryEvent
+				Raise(new InventoryEvent
 				{
 					Type = InventoryEventType.ItemUnequipped,
 					ItemId = itemId,
 					Count = 1,
-					FromOwner = ownerKey
+					FromOwner = OwnerKey(ownerHandle)
 				});
 				return true;
 			}
@@ -431,24 +581,33 @@ namespace SE
 		/// <summary>
 		/// 아이템이 장착되어 있는지 확인
 		/// </summary>
-		public bool IsEquipped(string ownerKey, int itemId)
+		public bool IsEquipped(int ownerHandle, int itemId)
 		{
-			if (!_equippedItems.TryGetValue(ownerKey, out var equipped))
+			if (!_equippedItems.TryGetValue(ownerHandle, out var equipped))
 				return false;
 
 			return equipped.Contains(itemId);
 		}
 
+		public bool EquipItem(string ownerKey, int itemId)
+			=> EquipItem(OwnerHandle(ownerKey), itemId);
+
+		public bool UnequipItem(string ownerKey, int itemId)
+			=> UnequipItem(OwnerHandle(ownerKey), itemId);
+
+		public bool IsEquipped(string ownerKey, int itemId)
+			=> IsEquipped(OwnerHandle(ownerKey), itemId);
+
 		// ===== 유닛 장착 편의 메서드 =====
 
 		public bool EquipItemOnUnit(int unitId, int itemId)
-			=> EquipItem(UnitKey(unitId), itemId);
+			=> EquipItem(OwnerRegistry.Unit(unitId), itemId);
 
 		public bool UnequipItemFromUnit(int unitId, int itemId)
-			=> UnequipItem(UnitKey(unitId), itemId);
+			=> UnequipItem(OwnerRegistry.Unit(unitId), itemId);
 
 		public bool IsEquippedOnUnit(int unitId, int itemId)
-			=> IsEquipped(UnitKey(unitId), itemId);
+			=> IsEquipped(OwnerRegistry.Unit(unitId), itemId);
 
 		// ===== IActionProvider 구현 =====
 
@@ -479,56 +638,66 @@ namespace SE
 		/// 데이터 저장
 		/// </summary>
 		public void SaveData(string basePath)
+		{
+			var data = ExportToData();
+
+			var options = new JsonSerializerOptions
+			{
+				WriteIndented = true,
+				PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+			};
+
+			var json = JsonSerializer.Serialize(data, options);
+			var path = $"{basePath}{DataId}_data.json";
+
+			if (GamePath.TryWriteAllText(path, json))
+			{
+				// 스냅샷에 모두 반영되었으므로 저널 비움
+				_journal?.Truncate();
+				_snapshotRequired = false;
+				_log.Info($"저장됨: {path}");
+			}
+			else
+			{
+				_log.Error($"저장 실패: {path}");
+			}
+		}
+
+		/// <summary>
+		/// InventoryDataJson으로 변환 (빈 인벤토리/장착, false 가시성 제외)
+		/// </summary>
+		internal InventoryDataJson ExportToData()
 		{
 			var data = new InventoryDataJson
 			{
 				Inventories = new Dictionary<string, Dictionary<int, int>>(),
 				EquippedItems = new Dictionary<string, List<int>>(),
-				Visibility = new Dictionary<string, bool>()
+				Visibility = new Dictionary<string, bool>(),
+				JournalSeq = _journal?.LastSeq ?? 0
 			};
 
 			// 인벤토리 복사 (빈 것 제외)
-			foreach (var (key, inv) in _inventories)
+			foreach (var (handle, inv) in _inventories)
 			{
 				if (inv.Count > 0)
-					data.Inventories[key] = new Dictionary<int, int>(inv);
+					data.Inventories[OwnerKey(handle)] = new Dictionary<int, int>(inv);
 			}
 
 			// 장착 아이템 복사 (빈 것 제외)
-			foreach (var (key, items) in _equippedItems)
+			foreach (var (handle, items) in _equippedItems)
 			{
 				if (items.Count > 0)
-					data.EquippedItems[key] = new List<int>(items);
+					data.EquippedItems[OwnerKey(handle)] = new List<int>(items);
 			}
 
 			// 가시성 복사 (true인 것만)
-			foreach (var (key, visible) in _visibility)
+			foreach (var (handle, visible) in _visibility)
 			{
 				if (visible)
-					data.Visibility[key] = true;
+					data.Visibility[OwnerKey(handle)] = true;
 			}
 
-			var options = new JsonSerializerOptions
-			{
-				WriteIndented = true,
-				PropertyNamingPolicy = JsonNamingPolicy.CamelCase
-			};
-
-			var json = JsonSerializer.Serialize(data, options);
-			var path = $"{basePath}{DataId}_data.json";
-
-			using var file = Godot.FileAccess.Open(path, Godot.FileAccess.ModeFlags.Write);
-			if (file != null)
-			{
-				file.StoreString(json);
-#if DEBUG_LOG
-				GD.Print($"[InventorySystem] 저장됨: {path}");
-#endif
-			}
-			else
-			{
-				GD.PrintErr($"[InventorySystem] 저장 실패: {path}");
-			}
+			return data;
 		}
 
 		/// <summary>
@@ -538,72 +707,293 @@ namespace SE
 		{
 			var path = $"{basePath}{DataId}_data.json";
 
-			if (!Godot.FileAccess.FileExists(path))
+			if (!GamePath.FileExists(path))
 			{
-#if DEBUG_LOG
-				GD.Print($"[InventorySystem] 파일 없음, 빈 상태로 시작: {path}");
-#endif
+				// 스냅샷 없이 저널만 있는 경우 (첫 압축 전 종료)
+				if (ReplayJournal(0) > 0)
+					return true;
+				_log.Debug($"파일 없음, 빈 상태로 시작: {path}");
 				return false;
 			}
 
-			using var file = Godot.FileAccess.Open(path, Godot.FileAccess.ModeFlags.Read);
-			if (file == null)
+			byte[] bytes;
+			try
 			{
-				GD.PrintErr($"[InventorySystem] 파일 열기 실패: {path}");
-				return false;
+				bytes = GamePath.ReadAllBytes(path);
 			}
-
-			var json = file.GetAsText();
-			var options = new JsonSerializerOptions
+			catch (InvalidOperationException)
 			{
-				PropertyNamingPolicy = JsonNamingPolicy.CamelCase
-			};
+				_log.Error($"파일 열기 실패: {path}");
+				return false;
+			}
 
 			try
 			{
-				var data = JsonSerializer.Deserialize<InventoryDataJson>(json, options);
-				if (data == null)
-					return false;
+				return ApplyLoadedData(ParseData(bytes));
+			}
+			catch (Exception ex)
+			{
+				_log.Error($"JSON 파싱 실패: {ex.Message}");
+				return false;
+			}
+		}
+
+		private static readonly JsonSerializerOptions DataJsonOptions = new()
+		{
+			PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+		};
+
+		/// <summary>
+		/// UTF-8 JSON 바이트에서 InventoryDataJson 파싱 (워커 스레드에서 호출 가능)
+		/// </summary>
+		internal static InventoryDataJson? ParseData(ReadOnlySpan<byte> utf8)
+		{
+			return JsonSerializer.Deserialize<InventoryDataJson>(utf8, DataJsonOptions);
+		}
+
+		/// <summary>
+		/// 파싱된 스냅샷 적용 후 저널 재생 (LoadData의 메인 스레드 부분)
+		/// </summary>
+		/// <param name="data">스냅샷 (null = 파일 없음, 저널만 재생)</param>
+		/// <returns>로드된 데이터가 있으면 true</returns>
+		internal bool ApplyLoadedData(InventoryDataJson? data)
+		{
+			if (data == null)
+				return ReplayJournal(0) > 0;
+
+			UpdateFromData(data);
+
+			// 스냅샷 이후 변경 재생
+			ReplayJournal(data.JournalSeq);
+
+			_log.Info($"로드됨: 인벤토리 {_inventories.Count}개, 장착 {_equippedItems.Count}개, 가시성 {_visibility.Count}개");
+			return true;
+		}
 
-				ClearData();
+		/// <summary>
+		/// InventoryDataJson으로 전체 상태 교체 (이벤트/저널 없음)
+		/// </summary>
+		internal void UpdateFromData(InventoryDataJson data)
+		{
+			ClearData();
 
-				// 인벤토리 로드
-				if (data.Inventories != null)
+			// 인벤토리 로드
+			if (data.Inventories != null)
+			{
+				foreach (var (key, inv) in data.Inventories)
 				{
-					foreach (var (key, inv) in data.Inventories)
-					{
-						_inventories[key] = new Dictionary<int, int>(inv);
-					}
+					var handle = OwnerHandle(key);
+					TouchInventory(handle);
+					_inventories[handle] = new ItemStacks(inv);
 				}
+			}
 
-				// 장착 아이템 로드
-				if (data.EquippedItems != null)
+			// 장착 아이템 로드
+			if (data.EquippedItems != null)
+			{
+				foreach (var (key, items) in data.EquippedItems)
 				{
-					foreach (var (key, items) in data.EquippedItems)
-					{
-						_equippedItems[key] = new List<int>(items);
-					}
+					var handle = OwnerHandle(key);
+					TouchEquipped(handle);
+					_equippedItems[handle] = new List<int>(items);
 				}
+			}
 
-				// 가시성 로드
-				if (data.Visibility != null)
+			// 가시성 로드
+			if (data.Visibility != null)
+			{
+				foreach (var (key, visible) in data.Visibility)
 				{
-					foreach (var (key, visible) in data.Visibility)
-					{
-						_visibility[key] = visible;
-					}
+					var handle = OwnerHandle(key);
+					TouchVisibility(handle);
+					_visibility[handle] = visible;
 				}
+			}
+		}
+
+		// ===== 변경 저널 =====
+
+		/// <summary>
+		/// 변경 저널 활성화
+		/// 이후 모든 변경은 {DataId}_journal.jsonl에 추가 기록되고,
+		/// LoadData는 스냅샷 로드 후 저널을 재생
+		/// </summary>
+		/// <param name="basePath">저장 경로 (스냅샷과 같은 위치, 예: "user://save/")</param>
+		/// <param name="compactThreshold">이 레코드 수를 넘으면 Autosave가 스냅샷으로 압축</param>
+		public void EnableJournal(string basePath, int compactThreshold = 512)
+		{
+			_journal = new ChangeJournal($"{basePath}{DataId}_journal.jsonl", compactThreshold);
+		}
+
+		/// <summary>
+		/// 자동 저장 (변경분만 저널에 추가, 임계치를 넘으면 전체 스냅샷으로 압축)
+		/// 저널이 비활성화되어 있으면 전체 저장
+		/// </summary>
+		/// <returns>전체 스냅샷을 저장했으면 true</returns>
+		public bool Autosave(string basePath)
+		{
+			if (_journal == null || _journal.NeedsCompaction || _snapshotRequired)
+			{
+				SaveData(basePath);
+				return true;
+			}
+
+			_journal.Flush();
+			return false;
+		}
+
+		/// <summary>
+		/// 대기 중인 저널 기록 (종료 시 호출)
+		/// </summary>
+		public void FlushJournal()
+		{
+			_journal?.Flush();
+		}
+
+		private JournalRecord ToJournalRecord(InventoryEvent evt)
+		{
+			return evt.Type switch
+			{
+				InventoryEventType.ItemAdded => new JournalRecord { Op = "add", Owner = evt.ToOwner, ItemId = evt.ItemId, Count = evt.Count },
+				InventoryEventType.ItemRemoved or InventoryEventType.ItemLost => new JournalRecord { Op = "remove", Owner = evt.FromOwner, ItemId = evt.ItemId, Count = evt.Count },
+				InventoryEventType.ItemTransferred => new JournalRecord { Op = "transfer", Owner = evt.FromOwner, ToOwner = evt.ToOwner, ItemId = evt.ItemId, Count = evt.Count },
+				InventoryEventType.ItemEquipped => new JournalRecord { Op = "equip", Owner = evt.ToOwner, ItemId = evt.ItemId },
+				InventoryEventType.ItemUnequipped => new JournalRecord { Op = "unequip", Owner = evt.FromOwner, ItemId = evt.ItemId },
+				_ => new JournalRecord { Op = evt.Type.ToString() }
+			};
+		}
+
+		/// <summary>
+		/// 저널 재생 (이벤트 없이 상태만 적용)
+		/// </summary>
+		/// <returns>적용한 레코드 수</returns>
+		private int ReplayJournal(long afterSeq)
+		{
+			if (_journal == null)
+				return 0;
+
+			var records = _journal.ReadAfter(afterSeq);
+			foreach (var record in records)
+			{
+				if (record.Owner == null)
+					continue;
+
+				int owner = OwnerHandle(record.Owner);
+				switch (record.Op)
+				{
+					case "add":
+						GetOrCreate(owner).Add(record.ItemId, record.Count);
+						break;
+					case "remove":
+						TouchInventory(owner);
+						if (_inventories.TryGetValue(owner, out var inv))
+							inv.Remove(record.ItemId, record.Count);
+						break;
+					case "transfer":
+						if (record.ToOwner != null)
+							TransferItemInternal(owner, OwnerHandle(record.ToOwner), record.ItemId, record.Count);
+						break;
+					case "equip":
+						TouchEquipped(owner);
+						if (!_equippedItems.TryGetValue(owner, out var equipped))
+						{
+							equipped = new List<int>();
+							_equippedItems[owner] = equipped;
+						}
+						if (!equipped.Contains(record.ItemId))
+							equipped.Add(record.ItemId);
+						break;
+					case "unequip":
+						TouchEquipped(owner);
+						if (_equippedItems.TryGetValue(owner, out var unequipped))
+							unequipped.Remove(record.ItemId);
+						break;
+					case "visible":
+						TouchVisibility(owner);
+						_visibility[owner] = record.Value != 0;
+						break;
+				}
+			}
 
 #if DEBUG_LOG
-				GD.Print($"[InventorySystem] 로드됨: 인벤토리 {_inventories.Count}개, 장착 {_equippedItems.Count}개, 가시성 {_visibility.Count}개");
+			if (records.Count > 0)
+				_log.Debug($"저널 재생: {records.Count}개 변경");
 #endif
-				return true;
+			return records.Count;
+		}
+
+		// ===== 체크포인트 (copy-on-write) =====
+
+		/// <summary>
+		/// 수정 직전 호출: 활성 체크포인트에서 처음 수정되는 인벤토리만 복사
+		/// </summary>
+		private void TouchInventory(int ownerHandle)
+		{
+			if (!_inventoryUndo.NeedsCapture(ownerHandle))
+				return;
+
+			bool present = _inventories.TryGetValue(ownerHandle, out var inv);
+			_inventoryUndo.Capture(ownerHandle, present, inv?.Clone());
+		}
+
+		private void TouchEquipped(int ownerHandle)
+		{
+			if (!_equippedUndo.NeedsCapture(ownerHandle))
+				return;
+
+			bool present = _equippedItems.TryGetValue(ownerHandle, out var items);
+			_equippedUndo.Capture(ownerHandle, present, items != null ? new List<int>(items) : null);
+		}
+
+		private void TouchVisibility(int ownerHandle)
+		{
+			if (!_visibilityUndo.NeedsCapture(ownerHandle))
+				return;
+
+			bool present = _visibility.TryGetValue(ownerHandle, out var visible);
+			_visibilityUndo.Capture(ownerHandle, present, visible);
+		}
+
+		public void BeginCheckpoint()
+		{
+			_inventoryUndo.Push();
+			_equippedUndo.Push();
+			_visibilityUndo.Push();
+		}
+
+		public void RollbackCheckpoint()
+		{
+			foreach (var (handle, (present, inv)) in _inventoryUndo.Pop())
+			{
+				if (present)
+					_inventories[handle] = inv!;
+				else
+					_inventories.Remove(handle);
 			}
-			catch (Exception ex)
+			foreach (var (handle, (present, items)) in _equippedUndo.Pop())
 			{
-				GD.PrintErr($"[InventorySystem] JSON 파싱 실패: {ex.Message}");
-				return false;
+				if (present)
+					_equippedItems[handle] = items!;
+				else
+					_equippedItems.Remove(handle);
 			}
+			foreach (var (handle, (present, visible)) in _visibilityUndo.Pop())
+			{
+				if (present)
+					_visibility[handle] = visible;
+				else
+					_visibility.Remove(handle);
+			}
+
+			if (_journal != null)
+				_snapshotRequired = true;
+		}
+
+		public void ReleaseCheckpoint()
+		{
+			_inventoryUndo.Merge();
+			_equippedUndo.Merge();
+			_visibilityUndo.Merge();
 		}
 
 		/// <summary>
@@ -611,6 +1001,13 @@ namespace SE
 		/// </summary>
 		public void ClearData()
 		{
+			foreach (var handle in _inventories.Keys)
+				TouchInventory(handle);
+			foreach (var handle in _equippedItems.Keys)
+				TouchEquipped(handle);
+			foreach (var handle in _visibility.Keys)
+				TouchVisibility(handle);
+
 			_inventories.Clear();
 			_equippedItems.Clear();
 			_visibility.Clear();
@@ -624,9 +1021,7 @@ namespace SE
 			var describeSystem = _hub?.FindSystem("describeSystem") as DescribeSystem;
 			describeSystem?.ActionRegistry.Register(this);
 
-#if DEBUG_LOG
-			GD.Print("[InventorySystem] 액션 프로바이더 등록됨");
-#endif
+			_log.Debug("액션 프로바이더 등록됨");
 		}
 
 		/// <summary>
@@ -637,9 +1032,7 @@ namespace SE
 			var describeSystem = _hub?.FindSystem("describeSystem") as DescribeSystem;
 			describeSystem?.ActionRegistry.Unregister(this);
 
-#if DEBUG_LOG
-			GD.Print("[InventorySystem] 액션 프로바이더 해제됨");
-#endif
+			_log.Debug("액션 프로바이더 해제됨");
 
 			base.Destroy();
 		}
@@ -655,24 +1048,24 @@ namespace SE
 		public void DebugPrint()
 		{
 #if DEBUG_LOG
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-			GD.Print("[InventorySystem] 인벤토리 현황");
-			GD.Print($"  총 인벤토리: {_inventories.Count}개");
-			foreach (var (key, inv) in _inventories)
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug("인벤토리 현황");
+			_log.Debug($"  총 인벤토리: {_inventories.Count}개");
+			foreach (var (handle, inv) in _inventories)
 			{
 				var items = string.Join(", ", inv.Select(kv => $"아이템{kv.Key}x{kv.Value}"));
-				GD.Print($"    {key}: {items}");
+				_log.Debug($"    {OwnerKey(handle)}: {items}");
 			}
 			if (_equippedItems.Count > 0)
 			{
-				GD.Print($"  장착 정보: {_equippedItems.Count}개");
-				foreach (var (key, items) in _equippedItems)
+				_log.Debug($"  장착 정보: {_equippedItems.Count}개");
+				foreach (var (handle, items) in _equippedItems)
 				{
 					var itemStr = string.Join(", ", items.Select(id => $"아이템{id}"));
-					GD.Print($"    {key}: {itemStr}");
+					_log.Debug($"    {OwnerKey(handle)}: {itemStr}");
 				}
 			}
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
 #endif
 		}
 	}
@@ -701,5 +1094,11 @@ namespace SE
 		/// </summary>
 		[JsonPropertyName("visibility")]
 		public Dictionary<string, bool>? Visibility { get; set; }
+
+		/// <summary>
+		/// 이 스냅샷에 반영된 마지막 저널 순번 (이후 레코드만 재생)
+		/// </summary>
+		[JsonPropertyName("journalSeq")]
+		public long JournalSeq { get; set; }
 	}
 }
@@ -1,5 +1,4 @@
 using ECS;
-using Godot;
 using Morld;
 using System;
 using System.Collections.Generic;
@@ -10,6 +9,8 @@ namespace SE
 {
 	public class ItemSystem : ECS.System
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("ItemSystem");
+
 		private readonly Dictionary<int, Item> _items = new();
 
 		public ItemSystem()
@@ -61,12 +62,7 @@ namespace SE
 		/// </summary>
 		public ItemSystem UpdateFromFile(string filePath)
 		{
-			using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-			if (file == null)
-			{
-				throw new InvalidOperationException($"Failed to open file for reading: {filePath}");
-			}
-			var json = file.GetAsText();
+			var json = GamePath.ReadAllText(filePath);
 			UpdateFromJson(json);
 			return this;
 		}
@@ -92,7 +88,7 @@ namespace SE
 		/// <summary>
 		/// ItemJsonData 배열로 아이템 데이터 로드
 		/// </summary>
-		private void UpdateFromData(ItemJsonData[] dataList)
+		internal void UpdateFromData(ItemJsonData[] dataList)
 		{
 			// 기존 아이템 모두 제거
 			ClearItems();
@@ -140,12 +136,7 @@ namespace SE
 		{
 			var json = ToJson();
 
-			using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Write);
-			if (file == null)
-			{
-				throw new InvalidOperationException($"Failed to open file for writing: {filePath}");
-			}
-			file.StoreString(json);
+			GamePath.WriteAllText(filePath, json);
 		}
 
 		/// <summary>
@@ -167,7 +158,7 @@ namespace SE
 		/// <summary>
 		/// ItemJsonData 배열로 변환
 		/// </summary>
-		private ItemJsonData[] ExportToData()
+		internal ItemJsonData[] ExportToData()
 		{
 			return _items.Values.Select(item => new ItemJsonData
 			{
@@ -191,23 +182,23 @@ namespace SE
 		/// </summary>
 		public void DebugPrint()
 		{
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-			GD.Print($"  아이템 수: {_items.Count}");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug($"  아이템 수: {_items.Count}");
 			foreach (var item in _items.Values)
 			{
-				GD.Print($"  - {item}");
+				_log.Debug($"  - {item}");
 				if (item.PassiveTags.Count > 0)
 				{
 					var tags = string.Join(", ", item.PassiveTags.Select(t => $"{t.Key}:{t.Value}"));
-					GD.Print($"    PassiveTags: {tags}");
+					_log.Debug($"    PassiveTags: {tags}");
 				}
 				if (item.EquipTags.Count > 0)
 				{
 					var tags = string.Join(", ", item.EquipTags.Select(t => $"{t.Key}:{t.Value}"));
-					GD.Print($"    EquipTags: {tags}");
+					_log.Debug($"    EquipTags: {tags}");
 				}
 			}
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
 		}
 	}
 }
@@ -1,7 +1,8 @@
+#if DEBUG
 #define DEBUG_LOG
+#endif
 
 using ECS;
-using Godot;
 using Morld;
 using System;
 using System.Collections.Generic;
@@ -17,6 +18,17 @@ namespace SE
 	/// </summary>
 	public class MovementSystem : ECS.System
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("MovementSystem");
+		private static readonly Morld.LogCategory _collisionLog = Morld.Log.Category("Collision");
+
+		// 경로 탐색용 태그 (유닛마다 덮어써서 재사용)
+		private readonly TraversalContext _pathContext = new();
+
+		/// <summary>
+		/// 누적 경로 탐색 횟수 (벤치마크에서 경로 계산이 일어난 Step 구분용)
+		/// </summary>
+		public long PathQueries { get; private set; }
+
 		public MovementSystem()
 		{
 		}
@@ -41,24 +53,27 @@ namespace SE
 				return;
 
 #if DEBUG_LOG
-			// 모든 유닛의 이동 경로 계산 (충돌 감지용)
-			var movements = new Dictionary<int, MovementPlan>();
-			foreach (var unit in unitSystem.Units.Values)
+			// 모든 유닛의 이동 경로 계산 (충돌 감지용) - 유닛마다 경로 탐색이라 로그가 꺼져 있으면 생략
+			if (_collisionLog.IsEnabled(Morld.LogLevel.Debug))
 			{
-				// 오브젝트는 이동하지 않음
-				if (unit.IsObject) continue;
+				var movements = new Dictionary<int, MovementPlan>();
+				foreach (var unit in unitSystem.UnitValues)
+				{
+					// 오브젝트는 이동하지 않음
+					if (unit.IsObject) continue;
 
-				var plan = CalculateMovementPlan(unit, duration, terrain, time);
-				if (plan != null)
-					movements[unit.Id] = plan;
-			}
+					var plan = CalculateMovementPlan(unit, duration, terrain, time);
+					if (plan != null)
+						movements[unit.Id] = plan;
+				}
 
-			// 충돌 감지 (디버그 출력)
-			DetectCollisions(movements, unitSystem, terrain);
+				// 충돌 감지 (디버그 출력)
+				DetectCollisions(movements, unitSystem, terrain);
+			}
 #endif
 
 			// 이동 처리
-			foreach (var unit in unitSystem.Units.Values)
+			foreach (var unit in unitSystem.UnitValues)
 			{
 				// 오브젝트는 이동하지 않음
 				if (unit.IsObject) continue;
@@ -70,10 +85,13 @@ namespace SE
 			time.AddMinutes(duration);
 
 #if DEBUG_LOG
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-			GD.Print($"[MovementSystem] Time advanced: {duration}분 → {time}");
-			PrintUnitStates(unitSystem, terrain);
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			if (_log.IsEnabled(Morld.LogLevel.Debug))
+			{
+				_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+				_log.Debug($"Time advanced: {duration}분 → {time}");
+				PrintUnitStates(unitSystem, terrain);
+				_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			}
 #endif
 		}
 
@@ -144,7 +162,7 @@ namespace SE
 						{
 							var unitA = unitSystem.GetUnit(ids[i]);
 							var unitB = unitSystem.GetUnit(ids[j]);
-							GD.Print($"[Collision] {unitA?.Name} & {unitB?.Name} @ {loc.Name} (t={timeA}~{timeB})");
+							_collisionLog.Debug($"{unitA?.Name} & {unitB?.Name} @ {loc.Name} (t={timeA}~{timeB})");
 						}
 					}
 				}
@@ -156,7 +174,7 @@ namespace SE
 		/// </summary>
 		private void PrintUnitStates(UnitSystem unitSystem, Terrain terrain)
 		{
-			foreach (var unit in unitSystem.Units.Values)
+			foreach (var unit in unitSystem.UnitValues)
 			{
 				// 오브젝트는 스킵
 				if (unit.IsObject) continue;
@@ -176,7 +194,7 @@ namespace SE
 				// 현재 스케줄 레이어 정보
 				var layerName = unit.CurrentScheduleLayer?.Name ?? "없음";
 
-				GD.Print($"  • {unit.Name}: {regionName}/{locationName} [{stateStr}]{activityStr} (레이어: {layerName})");
+				_log.Debug($"  • {unit.Name}: {regionName}/{locationName} [{stateStr}]{activityStr} (레이어: {layerName})");
 
 				// 이동 중이면 목적지 정보도 출력
 				if (unit.IsMoving && unit.CurrentEdge != null)
@@ -185,7 +203,7 @@ namespace SE
 					var destName = destination?.Name ?? "Unknown";
 					var destRegion = destination != null ? terrain.GetRegion(destination.RegionId) : null;
 					var destRegionName = destRegion?.Name ?? "Unknown";
-					GD.Print($"    → Destination: {destRegionName}/{destName}");
+					_log.Debug($"    → Destination: {destRegionName}/{destName}");
 				}
 			}
 		}
@@ -213,8 +231,11 @@ namespace SE
 						unit.CurrentEdge = null;
 						remainingTime -= timeToComplete;
 #if DEBUG_LOG
-						var destLocation = terrain.GetLocation(edge.To);
-						GD.Print($"[MovementSystem] {unit.Name} arrived at {destLocation?.Name ?? "Unknown"}");
+						if (_log.IsEnabled(Morld.LogLevel.Debug))
+						{
+							var destLocation = terrain.GetLocation(edge.To);
+							_log.Debug($"{unit.Name} arrived at {destLocation?.Name ?? "Unknown"}");
+						}
 #endif
 					}
 					else
@@ -244,8 +265,10 @@ namespace SE
 				// 아이템 효과가 반영된 태그로 경로 탐색
 				var inventory = inventorySystem?.GetUnitInventory(unit.Id);
 				var equippedItems = inventorySystem?.GetUnitEquippedItems(unit.Id);
-				var actualTags = unit.GetActualTags(itemSystem, inventory, equippedItems);
-				var pathResult = terrain.FindPath(unit.CurrentLocation, goalLocation.Value, actualTags);
+				unit.CopyActualTagsTo(_pathContext, itemSystem, inventory, equippedItems);
+				// 다음 Edge만 필요하므로 페이징 모드에서 경로상의 Region을 모두 읽어오지 않음
+				var pathResult = terrain.FindPath(unit.CurrentLocation, goalLocation.Value, _pathContext, expandRoute: false);
+				PathQueries++;
 				if (!pathResult.Found || pathResult.Path.Count < 2)
 				{
 					break;
@@ -1,7 +1,8 @@
+#if DEBUG
 #define DEBUG_LOG
+#endif
 
 using ECS;
-using Godot;
 using Morld;
 using System;
 using System.Collections.Generic;
@@ -18,11 +19,18 @@ namespace SE
 	/// </summary>
 	public class PlayerSystem : ECS.System
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("PlayerSystem");
+
 		/// <summary>
 		/// 다음 Step에서 진행할 시간 (분)
 		/// </summary>
 		public int NextStepDuration { get; private set; } = 0;
 
+		/// <summary>
+		/// Step 하나의 최대 진행 시간 (분) - StepScheduler가 프레임 예산에 맞춰 조정
+		/// </summary>
+		public int MaxStepMinutes { get; set; } = int.MaxValue;
+
 		/// <summary>
 		/// 아직 처리해야 할 남은 시간 (분)
 		/// </summary>
@@ -67,12 +75,12 @@ namespace SE
 			_currentAction = actionName;
 
 #if DEBUG_LOG
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-			GD.Print($"[PlayerSystem] 시간 진행 요청!");
-			GD.Print($"  액션: {actionName}");
-			GD.Print($"  요청 시간: {minutes}분");
-			GD.Print($"  총 대기 시간: {_remainingDuration}분");
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug($"시간 진행 요청!");
+			_log.Debug($"  액션: {actionName}");
+			_log.Debug($"  요청 시간: {minutes}분");
+			_log.Debug($"  총 대기 시간: {_remainingDuration}분");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
 #endif
 		}
 
@@ -81,6 +89,11 @@ namespace SE
 		/// </summary>
 		public bool HasPendingTime => _remainingDuration > 0;
 
+		/// <summary>
+		/// 이번 Step까지 진행한 뒤 남은 시간 (분)
+		/// </summary>
+		public int RemainingMinutes => _remainingDuration - _lastSetDuration;
+
 		#region 플레이어 액션 요청
 
 		/// <summary>
@@ -112,9 +125,7 @@ namespace SE
 					}
 					break;
 				default:
-#if DEBUG_LOG
-					GD.Print($"[PlayerSystem] 알 수 없는 명령: {action}");
-#endif
+					_log.Debug($"알 수 없는 명령: {action}");
 					break;
 			}
 		}
@@ -142,13 +153,11 @@ namespace SE
 			var inventory = inventorySystem?.GetUnitInventory(player.Id);
 			var equippedItems = inventorySystem?.GetUnitEquippedItems(player.Id);
 			var actualTags = player.GetActualTags(itemSystem, inventory, equippedItems);
-			var pathResult = terrain.FindPath(player.CurrentLocation, destination, actualTags);
+			var pathResult = terrain.FindPath(player.CurrentLocation, destination, actualTags, expandRoute: false);
 
 			if (!pathResult.Found || pathResult.Path.Count < 2)
 			{
-#if DEBUG_LOG
-				GD.Print($"[PlayerSystem] 경로를 찾을 수 없음: {player.CurrentLocation} → {destination}");
-#endif
+				_log.Debug($"경로를 찾을 수 없음: {player.CurrentLocation} → {destination}");
 				return;
 			}
 
@@ -168,9 +177,7 @@ namespace SE
 			var destLocation = terrain.GetLocation(destination);
 			RequestTimeAdvance(totalTime, $"{destLocation?.Name ?? destination.ToString()}(으)로 이동");
 
-#if DEBUG_LOG
-			GD.Print($"[PlayerSystem] 이동 요청: {player.CurrentLocation} → {destination} ({totalTime}분)");
-#endif
+			_log.Debug($"이동 요청: {player.CurrentLocation} → {destination} ({totalTime}분)");
 		}
 
 		/// <summary>
@@ -181,9 +188,7 @@ namespace SE
 			// 시간 진행 요청 (스택 변화 없음)
 			RequestTimeAdvance(minutes, $"휴식 ({minutes}분)");
 
-#if DEBUG_LOG
-			GD.Print($"[PlayerSystem] 휴식 요청: {minutes}분");
-#endif
+			_log.Debug($"휴식 요청: {minutes}분");
 		}
 
 		/// <summary>
@@ -194,6 +199,10 @@ namespace SE
 			if (!pathResult.Found || pathResult.Path.Count < 2)
 				return 0;
 
+			// 페이징 모드에서 요약 구간을 펼치지 않은 경로는 탐색 시 계산한 총 시간 사용
+			if (pathResult.IsPartial)
+				return (int)pathResult.TotalTravelTime;
+
 			int totalTime = 0;
 			for (int i = 0; i < pathResult.Path.Count - 1; i++)
 			{
@@ -277,7 +286,7 @@ namespace SE
 #if DEBUG_LOG
 			var itemSystem = _hub.FindSystem("itemSystem") as ItemSystem;
 			var itemName = itemSystem?.GetItem(itemId)?.Name ?? $"아이템{itemId}";
-			GD.Print($"[PlayerSystem] {targetUnit.Name}에서 가져오기: {itemName} x{count}");
+			_log.Debug($"{targetUnit.Name}에서 가져오기: {itemName} x{count}");
 #endif
 
 			return true;
@@ -309,7 +318,7 @@ namespace SE
 #if DEBUG_LOG
 			var itemSystem = _hub.FindSystem("itemSystem") as ItemSystem;
 			var itemName = itemSystem?.GetItem(itemId)?.Name ?? $"아이템{itemId}";
-			GD.Print($"[PlayerSystem] {targetUnit.Name}에 넣기: {itemName} x{count}");
+			_log.Debug($"{targetUnit.Name}에 넣기: {itemName} x{count}");
 #endif
 
 			return true;
@@ -370,22 +379,25 @@ namespace SE
 				_remainingDuration -= _lastSetDuration;
 
 #if DEBUG_LOG
-				GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-				GD.Print($"[PlayerSystem] Step 완료");
-				GD.Print($"  현재 시간: {time}");
-				GD.Print($"  액션: {_currentAction}");
-				GD.Print($"  소비된 시간: {_lastSetDuration}분");
-				GD.Print($"  남은 시간: {_remainingDuration}분");
-				if (_remainingDuration > 0)
+				if (_log.IsEnabled(Morld.LogLevel.Debug))
 				{
-					GD.Print($"  ⚠ 다음 Step에서 계속 진행 예정");
-				}
-				else
-				{
-					GD.Print($"  ✓ 완료!");
-					_currentAction = "";
+					_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+					_log.Debug($"Step 완료");
+					_log.Debug($"  현재 시간: {time}");
+					_log.Debug($"  액션: {_currentAction}");
+					_log.Debug($"  소비된 시간: {_lastSetDuration}분");
+					_log.Debug($"  남은 시간: {_remainingDuration}분");
+					if (_remainingDuration > 0)
+					{
+						_log.Debug($"  ⚠ 다음 Step에서 계속 진행 예정");
+					}
+					else
+					{
+						_log.Debug($"  ✓ 완료!");
+						_currentAction = "";
+					}
+					_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
 				}
-				GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
 #endif
 			}
 
@@ -401,13 +413,11 @@ namespace SE
 			var minutesToMidnight = 1440 - time.MinuteOfDay;
 			if (minutesToMidnight <= 0) minutesToMidnight = 1440;
 
-			// 4. 다음 Step에서 진행할 시간 설정 (자정 제한)
-			NextStepDuration = Math.Min(_remainingDuration, minutesToMidnight);
+			// 4. 다음 Step에서 진행할 시간 설정 (자정 제한, Step 크기 제한)
+			NextStepDuration = Math.Min(Math.Min(_remainingDuration, minutesToMidnight), MaxStepMinutes);
 			_lastSetDuration = NextStepDuration;
 
-#if DEBUG_LOG
-			GD.Print($"[PlayerSystem] 다음 Step 예약: {NextStepDuration}분");
-#endif
+			_log.Debug($"다음 Step 예약: {NextStepDuration}분");
 		}
 
 		#region Look 기능
@@ -535,18 +545,69 @@ namespace SE
 		}
 
 		/// <summary>
-		/// 경로 정보 생성 (조건 필터링 적용)
+		/// Look 경로 캐시 항목 (계산 당시의 이동 태그와 결과)
+		/// </summary>
+		private sealed class RouteCacheEntry
+		{
+			public required TraversalContext Tags { get; init; }
+			public required List<RouteInfo> Routes { get; init; }
+		}
+
+		// Look 경로 캐시: (Location, 이동 태그 지문) → 경로 목록
+		// Terrain.Version이 바뀌면 전체 무효화
+		private readonly Dictionary<(LocationRef Location, int TagFingerprint), RouteCacheEntry> _routeCache = new();
+		private Terrain? _routeCacheTerrain;
+		private long _routeCacheVersion = -1;
+
+		/// <summary>
+		/// 경로 캐시 비우기 (지형 교체 등 외부에서 강제로 무효화할 때)
+		/// </summary>
+		public void InvalidateRouteCache()
+		{
+			_routeCache.Clear();
+			_routeCacheTerrain = null;
+			_routeCacheVersion = -1;
+		}
+
+		/// <summary>
+		/// 경로 정보 조회 (조건 필터링 적용)
+		/// 같은 위치 + 같은 이동 태그 + 지형 변경 없음이면 캐시된 목록 반환 (읽기 전용으로 사용)
 		/// </summary>
 		private List<RouteInfo> BuildRoutes(Unit player, Terrain? terrain, Region? region, Location? location, ItemSystem? itemSystem, InventorySystem? inventorySystem)
 		{
-			var routes = new List<RouteInfo>();
-			if (region == null || location == null || terrain == null) return routes;
+			if (region == null || location == null || terrain == null) return new List<RouteInfo>();
 
 			// InventorySystem에서 인벤토리 데이터 가져오기
 			var inventory = inventorySystem?.GetUnitInventory(player.Id);
 			var equippedItems = inventorySystem?.GetUnitEquippedItems(player.Id);
 			var actualTags = player.GetActualTags(itemSystem, inventory, equippedItems);
 
+			// 지형이 바뀌었으면 캐시 전체 무효화
+			if (!ReferenceEquals(_routeCacheTerrain, terrain) || _routeCacheVersion != terrain.Version)
+			{
+				_routeCache.Clear();
+				_routeCacheTerrain = terrain;
+				_routeCacheVersion = terrain.Version;
+			}
+
+			var key = (player.CurrentLocation, actualTags.GetFingerprint());
+			if (_routeCache.TryGetValue(key, out var cached) && cached.Tags.HasSameTags(actualTags))
+			{
+				return cached.Routes;
+			}
+
+			var routes = ComputeRoutes(player, terrain, region, location, actualTags);
+			_routeCache[key] = new RouteCacheEntry { Tags = actualTags, Routes = routes };
+			return routes;
+		}
+
+		/// <summary>
+		/// 경로 정보 생성 (Region 내부 Edge + RegionEdge)
+		/// </summary>
+		private static List<RouteInfo> ComputeRoutes(Unit player, Terrain terrain, Region region, Location location, TraversalContext actualTags)
+		{
+			var routes = new List<RouteInfo>();
+
 			// Region 내부 Edge
 			var edges = region.GetEdges(location);
 			foreach (var edge in edges)
@@ -555,18 +616,9 @@ namespace SE
 				if (edge.IsBlocked) continue;
 
 				var conditions = edge.GetConditions(location);
-				bool canPass = true;
-				string? blockedReason = null;
-
-				foreach (var (tag, requiredValue) in conditions)
-				{
-					if (actualTags.GetTagValue(tag) < requiredValue)
-					{
-						canPass = false;
-						blockedReason = $"{tag}이(가) 필요합니다";
-						break;
-					}
-				}
+				var missingTag = actualTags.FindMissingTag(conditions);
+				bool canPass = missingTag == null;
+				string? blockedReason = missingTag != null ? $"{missingTag}이(가) 필요합니다" : null;
 
 				var neighbor = edge.GetOtherLocation(location);
 				routes.Add(new RouteInfo
@@ -587,18 +639,9 @@ namespace SE
 				if (regionEdge.IsBlocked) continue;
 
 				var conditions = regionEdge.GetConditions(player.CurrentLocation);
-				bool canPass = true;
-				string? blockedReason = null;
-
-				foreach (var (tag, requiredValue) in conditions)
-				{
-					if (actualTags.GetTagValue(tag) < requiredValue)
-					{
-						canPass = false;
-						blockedReason = $"{tag}이(가) 필요합니다";
-						break;
-					}
-				}
+				var missingTag = actualTags.FindMissingTag(conditions);
+				bool canPass = missingTag == null;
+				string? blockedReason = missingTag != null ? $"{missingTag}이(가) 필요합니다" : null;
 
 				var destination = regionEdge.GetOtherLocation(player.CurrentLocation);
 				var destLocation = terrain.GetLocation(destination);
@@ -628,12 +671,7 @@ namespace SE
 		/// </summary>
 		public PlayerSystem UpdateFromFile(string filePath)
 		{
-			using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-			if (file == null)
-			{
-				throw new InvalidOperationException($"Failed to open file for reading: {filePath}");
-			}
-			var json = file.GetAsText();
+			var json = GamePath.ReadAllText(filePath);
 			UpdateFromJson(json);
 			return this;
 		}
@@ -663,12 +701,7 @@ namespace SE
 		{
 			var json = ToJson();
 
-			using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Write);
-			if (file == null)
-			{
-				throw new InvalidOperationException($"Failed to open file for writing: {filePath}");
-			}
-			file.StoreString(json);
+			GamePath.WriteAllText(filePath, json);
 		}
 
 		/// <summary>
@@ -9,6 +9,9 @@ namespace SE
     /// </summary>
     public class ScriptSystem : ECS.System
     {
+        private static readonly Morld.LogCategory _log = Morld.Log.Category("ScriptSystem");
+        private static readonly Morld.LogCategory _morldLog = Morld.Log.Category("morld");
+
         private IntegratedPythonInterpreter _interpreter;
 
         // 게임 시스템 참조 (morld 모듈에서 사용)
@@ -17,6 +20,59 @@ namespace SE
         private UnitSystem _unitSystem;
         private TextUISystem _textUISystem;
 
+        /// <summary>
+        /// morld.set_flag / clear_flag로 변경된 플래그 (세이브/저널용)
+        /// </summary>
+        public Morld.FlagStore Flags { get; } = new();
+
+        // Python 실행 시간 집계 (중첩 호출은 가장 바깥 호출만 집계)
+        private int _interpreterDepth = 0;
+        private long _interpreterStart = 0;
+
+        /// <summary>
+        /// 누적 Python 실행 시간 (Stopwatch tick, 실행 중 호출된 morld API 시간 포함)
+        /// </summary>
+        public long InterpreterTicks { get; private set; }
+
+        /// <summary>
+        /// 누적 Python 실행 횟수 (가장 바깥 Execute/Eval 기준)
+        /// </summary>
+        public long InterpreterCalls { get; private set; }
+
+        /// <summary>
+        /// morld.* API 호출 통계 (ApiStats.Enabled = true 또는 morld.set_stats_enabled(True)로 기록 시작)
+        /// </summary>
+        public Morld.ApiCallStats ApiStats { get; } = new();
+
+        /// <summary>
+        /// 스크립트 진입점 프로파일러 (Profiler.Enabled = true로 기록 시작, EnableScriptTracing으로 Python 함수까지 추적)
+        /// </summary>
+        public Morld.ScriptProfiler Profiler { get; } = new();
+
+        // 비동기 실행 (EnableAsyncExecution 후 CallFunctionAsync/CallEventHandlerAsync가 전용 스레드에서 실행)
+        private Morld.ScriptWorker _worker;
+
+        // 스크립트 스레드에서 설정한 플래그 (메인 스레드 적용 전에도 같은 호출 안의 get_flag에 반영)
+        private readonly System.Collections.Generic.Dictionary<string, int> _pendingFlags = new();
+
+        // 스크립트 스레드에서 보낸 아이템 증감 ((유닛, 아이템) → 개수 변화, 메인 스레드 적용 전 remove/lost/has_item 예측용)
+        private readonly System.Collections.Generic.Dictionary<(int UnitId, int ItemId), int> _pendingItems = new();
+
+        /// <summary>
+        /// 비동기 실행 모드인지
+        /// </summary>
+        public bool IsAsync => _worker != null;
+
+        /// <summary>
+        /// 완료되지 않은 비동기 스크립트 호출이 있는지 (메인 스레드 기준)
+        /// </summary>
+        public bool IsBusy => _worker?.IsBusy ?? false;
+
+        /// <summary>
+        /// 현재 스레드가 스크립트 전용 스레드인지 (morld.* 변경을 명령 큐로 보낼지 판단)
+        /// </summary>
+        private bool IsScriptThread => _worker != null && _worker.IsWorkerThread;
+
         // 시나리오 경로
         private string _scenarioPath = "";
         public string ScenarioPath => _scenarioPath;
@@ -36,7 +92,7 @@ namespace SE
         public void SetScenarioPath(string scenarioPath)
         {
             _scenarioPath = scenarioPath;
-            Godot.GD.Print($"[ScriptSystem] Scenario path set to: {scenarioPath}");
+            _log.Info($"Scenario path set to: {scenarioPath}");
 
             // 시나리오 Python 폴더를 sys.path에 추가
             AddScenarioPathToSysPath();
@@ -55,13 +111,13 @@ namespace SE
                 if (sysModule.ModuleDict.TryGetValue("path", out PyObject pathObj) && pathObj is PyList pathList)
                 {
                     // 시나리오 Python 경로를 맨 앞에 추가 (최우선)
-                    pathList.Insert(0, new PyString(ScenarioPythonPath));
-                    Godot.GD.Print($"[ScriptSystem] Added scenario Python path to sys.path: {ScenarioPythonPath}");
+                    pathList.Insert(0, new PyString(Morld.GamePath.Platform(ScenarioPythonPath)));
+                    _log.Info($"Added scenario Python path to sys.path: {ScenarioPythonPath}");
                 }
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] Failed to add scenario path to sys.path: {ex.Message}");
+                _log.Error($"Failed to add scenario path to sys.path: {ex.Message}");
             }
         }
 
@@ -78,13 +134,13 @@ namespace SE
                 if (sysModule.ModuleDict.TryGetValue("path", out PyObject pathObj) && pathObj is PyList pathList)
                 {
                     // sharpPy Lib 경로만 추가 (Python 표준 라이브러리)
-                    pathList.Insert(0, new PyString("res://util/sharpPy/Lib"));
-                    Godot.GD.Print("[ScriptSystem] Added sharpPy Lib to sys.path");
+                    pathList.Insert(0, new PyString(Morld.GamePath.Platform("res://util/sharpPy/Lib")));
+                    _log.Info("Added sharpPy Lib to sys.path");
                 }
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] Failed to add Godot paths to sys.path: {ex.Message}");
+                _log.Error($"Failed to add Godot paths to sys.path: {ex.Message}");
             }
         }
 
@@ -124,7 +180,7 @@ namespace SE
         /// </summary>
         private void RegisterMorldModule()
         {
-            Godot.GD.Print("[ScriptSystem] Registering morld module...");
+            _log.Info("Registering morld module...");
 
             try
             {
@@ -132,14 +188,14 @@ namespace SE
                 var morldModule = new PyModule("morld", "<morld module>");
 
                 // === 플레이어 API ===
-                morldModule.ModuleDict["get_player_id"] = new PyBuiltinFunction("get_player_id", args =>
+                morldModule.ModuleDict["get_player_id"] = Builtin("get_player_id", args =>
                 {
                     if (_playerSystem == null) return new PyInt(-1);
                     return new PyInt(_playerSystem.PlayerId);
                 });
 
                 // === 인벤토리 API ===
-                morldModule.ModuleDict["give_item"] = new PyBuiltinFunction("give_item", args =>
+                morldModule.ModuleDict["give_item"] = Builtin("give_item", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("give_item(unit_id, item_id, count=1) requires at least 2 arguments");
@@ -150,14 +206,16 @@ namespace SE
 
                     if (_inventorySystem != null)
                     {
-                        _inventorySystem.AddItemToUnit(unitId, itemId, count);
-                        Godot.GD.Print($"[morld] give_item: unit={unitId}, item={itemId}, count={count}");
+                        if (IsScriptThread && count > 0)
+                            AddPendingItem(unitId, itemId, count);
+                        RunOnMainThread(() => _inventorySystem.AddItemToUnit(unitId, itemId, count));
+                        _morldLog.Debug($"give_item: unit={unitId}, item={itemId}, count={count}");
                         return PyBool.True;
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["remove_item"] = new PyBuiltinFunction("remove_item", args =>
+                morldModule.ModuleDict["remove_item"] = Builtin("remove_item", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("remove_item(unit_id, item_id, count=1) requires at least 2 arguments");
@@ -168,14 +226,16 @@ namespace SE
 
                     if (_inventorySystem != null)
                     {
-                        bool success = _inventorySystem.RemoveItemFromUnit(unitId, itemId, count);
-                        Godot.GD.Print($"[morld] remove_item: unit={unitId}, item={itemId}, count={count}, success={success}");
+                        bool success = RunOnMainThread(
+                            () => _inventorySystem.RemoveItemFromUnit(unitId, itemId, count),
+                            () => TakePendingItem(unitId, itemId, count));
+                        _morldLog.Debug($"remove_item: unit={unitId}, item={itemId}, count={count}, success={success}");
                         return PyBool.FromBool(success);
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["lost_item"] = new PyBuiltinFunction("lost_item", args =>
+                morldModule.ModuleDict["lost_item"] = Builtin("lost_item", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("lost_item(unit_id, item_id, count=1) requires at least 2 arguments");
@@ -186,14 +246,16 @@ namespace SE
 
                     if (_inventorySystem != null)
                     {
-                        bool success = _inventorySystem.LostItemFromUnit(unitId, itemId, count);
-                        Godot.GD.Print($"[morld] lost_item: unit={unitId}, item={itemId}, count={count}, success={success}");
+                        bool success = RunOnMainThread(
+                            () => _inventorySystem.LostItemFromUnit(unitId, itemId, count),
+                            () => TakePendingItem(unitId, itemId, count));
+                        _morldLog.Debug($"lost_item: unit={unitId}, item={itemId}, count={count}, success={success}");
                         return PyBool.FromBool(success);
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["get_inventory"] = new PyBuiltinFunction("get_inventory", args =>
+                morldModule.ModuleDict["get_inventory"] = Builtin("get_inventory", args =>
                 {
                     if (args.Length < 1)
                         throw PyTypeError.Create("get_inventory(unit_id) requires 1 argument");
@@ -203,17 +265,19 @@ namespace SE
                     if (_inventorySystem != null)
                     {
                         var inventory = _inventorySystem.GetUnitInventory(unitId);
+                        var bridge = ApiStats.BeginBridge();
                         var pyDict = new PyDict();
                         foreach (var kvp in inventory)
                         {
                             pyDict.SetItem(new PyInt(kvp.Key), new PyInt(kvp.Value));
                         }
+                        ApiStats.EndBridge(bridge);
                         return pyDict;
                     }
                     return new PyDict();
                 });
 
-                morldModule.ModuleDict["has_item"] = new PyBuiltinFunction("has_item", args =>
+                morldModule.ModuleDict["has_item"] = Builtin("has_item", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("has_item(unit_id, item_id, count=1) requires at least 2 arguments");
@@ -224,17 +288,15 @@ namespace SE
 
                     if (_inventorySystem != null)
                     {
-                        var inventory = _inventorySystem.GetUnitInventory(unitId);
-                        if (inventory.TryGetValue(itemId, out int owned))
-                        {
-                            return PyBool.FromBool(owned >= count);
-                        }
+                        if (IsScriptThread)
+                            return PyBool.FromBool(PendingItemCount(unitId, itemId) >= count);
+                        return PyBool.FromBool(_inventorySystem.UnitHasItem(unitId, itemId, count));
                     }
                     return PyBool.False;
                 });
 
                 // === 유닛 API ===
-                morldModule.ModuleDict["get_unit_info"] = new PyBuiltinFunction("get_unit_info", args =>
+                morldModule.ModuleDict["get_unit_info"] = Builtin("get_unit_info", args =>
                 {
                     if (args.Length < 1)
                         throw PyTypeError.Create("get_unit_info(unit_id) requires 1 argument");
@@ -253,6 +315,7 @@ namespace SE
                         return PyNone.Instance;
 
                     // 유닛 정보를 PyDict로 반환
+                    var bridge = ApiStats.BeginBridge();
                     var result = new PyDict();
                     result.SetItem(new PyString("id"), new PyInt(unit.Id));
                     result.SetItem(new PyString("name"), new PyString(unit.Name ?? ""));
@@ -278,11 +341,12 @@ namespace SE
                     // 이동 중인지 여부
                     result.SetItem(new PyString("is_moving"), PyBool.FromBool(unit.IsMoving));
 
+                    ApiStats.EndBridge(bridge);
                     return result;
                 });
 
                 // === 태그/플래그 API (플레이어 태그 기반) ===
-                morldModule.ModuleDict["set_flag"] = new PyBuiltinFunction("set_flag", args =>
+                morldModule.ModuleDict["set_flag"] = Builtin("set_flag", args =>
                 {
                     if (args.Length < 1)
                         throw PyTypeError.Create("set_flag(flag_name, value=1) requires at least 1 argument");
@@ -297,18 +361,21 @@ namespace SE
                     if (player == null)
                         return PyBool.False;
 
-                    player.TraversalContext.SetTag(flagName, value);
-                    Godot.GD.Print($"[morld] set_flag: {flagName} = {value}");
+                    SetFlagValue(player, flagName, value);
+                    _morldLog.Debug($"set_flag: {flagName} = {value}");
                     return new PyInt(value);
                 });
 
-                morldModule.ModuleDict["get_flag"] = new PyBuiltinFunction("get_flag", args =>
+                morldModule.ModuleDict["get_flag"] = Builtin("get_flag", args =>
                 {
                     if (args.Length < 1)
                         throw PyTypeError.Create("get_flag(flag_name) requires 1 argument");
 
                     string flagName = args[0].AsString();
 
+                    if (IsScriptThread && _pendingFlags.TryGetValue(flagName, out var pendingValue))
+                        return new PyInt(pendingValue);
+
                     if (_playerSystem == null || _unitSystem == null)
                         return new PyInt(0);
 
@@ -320,7 +387,7 @@ namespace SE
                     return new PyInt(value);
                 });
 
-                morldModule.ModuleDict["clear_flag"] = new PyBuiltinFunction("clear_flag", args =>
+                morldModule.ModuleDict["clear_flag"] = Builtin("clear_flag", args =>
                 {
                     if (args.Length < 1)
                         throw PyTypeError.Create("clear_flag(flag_name) requires 1 argument");
@@ -334,32 +401,32 @@ namespace SE
                     if (player == null)
                         return PyBool.False;
 
-                    player.TraversalContext.SetTag(flagName, 0);
-                    Godot.GD.Print($"[morld] clear_flag: {flagName}");
+                    SetFlagValue(player, flagName, 0);
+                    _morldLog.Debug($"clear_flag: {flagName}");
                     return PyBool.True;
                 });
 
                 // === 시나리오 API ===
-                morldModule.ModuleDict["get_scenario_path"] = new PyBuiltinFunction("get_scenario_path", args =>
+                morldModule.ModuleDict["get_scenario_path"] = Builtin("get_scenario_path", args =>
                 {
                     // 시나리오 기본 경로 반환 (res://scenarios/scenario01/)
                     return new PyString(_scenarioPath);
                 });
 
-                morldModule.ModuleDict["get_scenario_data_path"] = new PyBuiltinFunction("get_scenario_data_path", args =>
+                morldModule.ModuleDict["get_scenario_data_path"] = Builtin("get_scenario_data_path", args =>
                 {
                     // 시나리오 데이터 폴더 경로 반환 (res://scenarios/scenario01/data/)
                     return new PyString(_scenarioPath + "data/");
                 });
 
-                morldModule.ModuleDict["get_scenario_python_path"] = new PyBuiltinFunction("get_scenario_python_path", args =>
+                morldModule.ModuleDict["get_scenario_python_path"] = Builtin("get_scenario_python_path", args =>
                 {
                     // 시나리오 Python 폴더 경로 반환 (res://scenarios/scenario01/python/)
                     return new PyString(ScenarioPythonPath);
                 });
 
                 // === 액션 로그 API ===
-                morldModule.ModuleDict["add_action_log"] = new PyBuiltinFunction("add_action_log", args =>
+                morldModule.ModuleDict["add_action_log"] = Builtin("add_action_log", args =>
                 {
                     if (args.Length < 1)
                         throw PyTypeError.Create("add_action_log(message) requires 1 argument");
@@ -368,30 +435,180 @@ namespace SE
 
                     if (_textUISystem != null)
                     {
-                        _textUISystem.AddActionLog(message);
-                        Godot.GD.Print($"[morld] add_action_log: {message}");
+                        RunOnMainThread(() => _textUISystem.AddActionLog(message));
+                        _morldLog.Debug($"add_action_log: {message}");
                         return PyBool.True;
                     }
                     return PyBool.False;
                 });
 
+                // === 계측 API ===
+                morldModule.ModuleDict["stats"] = new PyBuiltinFunction("stats", args =>
+                {
+                    // {api: {"calls", "errors", "total_us", "bridge_us", "max_us", "p50_us", "p99_us", "histogram": {상한µs: 횟수}}} (마지막 구간은 그 이상 전부)
+                    var reset = args.Length >= 1 && args[0] is not PyNone && args[0].ToInt() != 0;
+                    var result = new PyDict();
+                    foreach (var entry in ApiStats.GetSorted())
+                    {
+                        var item = new PyDict();
+                        item.SetItem(new PyString("calls"), new PyInt(entry.Calls));
+                        item.SetItem(new PyString("errors"), new PyInt(entry.Errors));
+                        item.SetItem(new PyString("total_us"), new PyInt((long)(entry.TotalMs * 1000)));
+                        item.SetItem(new PyString("bridge_us"), new PyInt((long)(entry.BridgeMs * 1000)));
+                        item.SetItem(new PyString("max_us"), new PyInt((long)(entry.MaxMs * 1000)));
+                        item.SetItem(new PyString("p50_us"), new PyInt((long)(entry.PercentileMs(0.5) * 1000)));
+                        item.SetItem(new PyString("p99_us"), new PyInt((long)(entry.PercentileMs(0.99) * 1000)));
+
+                        var histogram = new PyDict();
+                        var buckets = entry.Histogram;
+                        for (int i = 0; i < buckets.Length; i++)
+                        {
+                            if (buckets[i] > 0)
+                                histogram.SetItem(new PyInt(Morld.ApiCallStats.BucketUpperUs(i)), new PyInt(buckets[i]));
+                        }
+                        item.SetItem(new PyString("histogram"), histogram);
+                        result.SetItem(new PyString(entry.Name), item);
+                    }
+                    if (reset)
+                        ApiStats.Reset();
+                    return result;
+                });
+
+                morldModule.ModuleDict["set_stats_enabled"] = new PyBuiltinFunction("set_stats_enabled", args =>
+                {
+                    ApiStats.Enabled = args.Length < 1 || (args[0] is not PyNone && args[0].ToInt() != 0);
+                    return PyNone.Instance;
+                });
+
+                // 프로파일러 프레임 (EnableScriptTracing이 설치한 Python 래퍼에서 호출)
+                morldModule.ModuleDict["profile_enter"] = new PyBuiltinFunction("profile_enter", args =>
+                {
+                    if (args.Length < 1)
+                        throw PyTypeError.Create("profile_enter(frame) requires 1 argument");
+                    return PyBool.FromBool(Profiler.Enter("py", args[0].AsString()));
+                });
+
+                morldModule.ModuleDict["profile_exit"] = new PyBuiltinFunction("profile_exit", args =>
+                {
+                    Profiler.Exit();
+                    return PyNone.Instance;
+                });
+
                 // sys.modules에 등록
                 PyImportSystem.SetModule("morld", morldModule);
 
-                Godot.GD.Print("[ScriptSystem] morld module registered successfully.");
+                _log.Info("morld module registered successfully.");
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] RegisterMorldModule error: {ex.Message}");
+                _log.Error($"RegisterMorldModule error: {ex.Message}");
             }
         }
 
+        /// <summary>
+        /// morld builtin 생성 - ApiStats로 호출 수/시간 기록
+        /// </summary>
+        private PyBuiltinFunction Builtin(string name, System.Func<PyObject[], PyObject> body)
+        {
+            var batchName = "morld." + name;
+            return new PyBuiltinFunction(name, ApiStats.Wrap<PyObject[], PyObject>(name, args =>
+            {
+                var profiled = Profiler.Enter("morld", name);
+                // 시작 trace 기록 중이면 연속된 같은 API 호출을 한 구간으로 묶음
+                var traceStart = Morld.TraceRecorder.Active != null ? System.Diagnostics.Stopwatch.GetTimestamp() : 0;
+                try
+                {
+                    return body(args);
+                }
+                finally
+                {
+                    if (profiled) Profiler.Exit();
+                    if (traceStart != 0) Morld.TraceRecorder.RecordBatch(batchName, traceStart);
+                }
+            }));
+        }
+
+        /// <summary>
+        /// 게임 상태 변경 실행 - 스크립트 스레드에서는 메인 스레드 명령 큐로 보내고, 그 외에는 바로 실행
+        /// </summary>
+        private void RunOnMainThread(System.Action command)
+        {
+            if (IsScriptThread)
+                _worker.Post(command);
+            else
+                command();
+        }
+
+        /// <summary>
+        /// 결과가 있는 게임 상태 변경 실행 - 스크립트 스레드에서는 predict로 결과를 예측하고 변경은 명령 큐로
+        /// </summary>
+        private bool RunOnMainThread(System.Func<bool> command, System.Func<bool> predict)
+        {
+            if (!IsScriptThread)
+                return command();
+
+            _worker.Post(() => command());
+            return predict();
+        }
+
+        /// <summary>
+        /// 현재 호출이 보낸 증감까지 반영한 아이템 개수 (스크립트 스레드 전용)
+        /// 메인 스레드는 호출이 끝날 때까지 명령을 적용하지 않으므로 인벤토리 + 대기 중인 증감이 호출 안에서 보이는 값
+        /// </summary>
+        private int PendingItemCount(int unitId, int itemId)
+        {
+            _pendingItems.TryGetValue((unitId, itemId), out var delta);
+            return _inventorySystem.GetItemCount(Morld.OwnerRegistry.Unit(unitId), itemId) + delta;
+        }
+
+        private void AddPendingItem(int unitId, int itemId, int delta)
+        {
+            _pendingItems.TryGetValue((unitId, itemId), out var current);
+            _pendingItems[(unitId, itemId)] = current + delta;
+        }
+
+        /// <summary>
+        /// remove_item/lost_item 결과 예측 - 성공하면 대기 중인 증감에서 차감 (같은 호출의 다음 예측에 반영)
+        /// </summary>
+        private bool TakePendingItem(int unitId, int itemId, int count)
+        {
+            if (count <= 0 || PendingItemCount(unitId, itemId) < count)
+                return false;
+
+            AddPendingItem(unitId, itemId, -count);
+            return true;
+        }
+
+        /// <summary>
+        /// 스크립트 스레드에서 작업 시작 시 이전 호출의 예측 상태 초기화
+        /// </summary>
+        private void BeginScriptJob()
+        {
+            _pendingFlags.Clear();
+            _pendingItems.Clear();
+        }
+
+        /// <summary>
+        /// 플레이어 태그 + FlagStore 갱신 (스크립트 스레드에서는 같은 호출 안의 get_flag용으로 기억)
+        /// </summary>
+        private void SetFlagValue(Morld.Unit player, string flagName, int value)
+        {
+            if (IsScriptThread)
+                _pendingFlags[flagName] = value;
+
+            RunOnMainThread(() =>
+            {
+                player.TraversalContext.SetTag(flagName, value);
+                Flags.Set(flagName, value);
+            });
+        }
+
         /// <summary>
         /// morld 모듈에 데이터 조작 API 추가 (Python에서 직접 게임 데이터 생성)
         /// </summary>
         private void RegisterDataManipulationAPI()
         {
-            Godot.GD.Print("[ScriptSystem] Registering data manipulation API...");
+            _log.Info("Registering data manipulation API...");
 
             try
             {
@@ -399,7 +616,7 @@ namespace SE
                 var morldModule = PyImportSystem.Import("morld");
 
                 // === Region/Location API (WorldSystem) ===
-                morldModule.ModuleDict["add_region"] = new PyBuiltinFunction("add_region", args =>
+                morldModule.ModuleDict["add_region"] = Builtin("add_region", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("add_region(id, name, appearance=None) requires at least 2 arguments");
@@ -420,13 +637,13 @@ namespace SE
                                 region.Appearance[key] = value;
                         }
                         terrain.AddRegion(region);
-                        Godot.GD.Print($"[morld] add_region: id={id}, name={name}");
+                        _morldLog.Debug($"add_region: id={id}, name={name}");
                         return PyBool.True;
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["add_location"] = new PyBuiltinFunction("add_location", args =>
+                morldModule.ModuleDict["add_location"] = Builtin("add_location", args =>
                 {
                     if (args.Length < 3)
                         throw PyTypeError.Create("add_location(region_id, local_id, name, appearance=None) requires at least 3 arguments");
@@ -451,14 +668,14 @@ namespace SE
                                 foreach (var (key, value) in appearance)
                                     location.Appearance[key] = value;
                             }
-                            Godot.GD.Print($"[morld] add_location: region={regionId}, local={localId}, name={name}");
+                            _morldLog.Debug($"add_location: region={regionId}, local={localId}, name={name}");
                             return PyBool.True;
                         }
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["add_edge"] = new PyBuiltinFunction("add_edge", args =>
+                morldModule.ModuleDict["add_edge"] = Builtin("add_edge", args =>
                 {
                     if (args.Length < 3)
                         throw PyTypeError.Create("add_edge(region_id, from_id, to_id, travel_time=5, conditions=None) requires at least 3 arguments");
@@ -484,14 +701,14 @@ namespace SE
                                 foreach (var (key, value) in conditions)
                                     edge.AddCondition(key, value);
                             }
-                            Godot.GD.Print($"[morld] add_edge: region={regionId}, {fromId}<->{toId}, time={travelTime}");
+                            _morldLog.Debug($"add_edge: region={regionId}, {fromId}<->{toId}, time={travelTime}");
                             return PyBool.True;
                         }
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["add_region_edge"] = new PyBuiltinFunction("add_region_edge", args =>
+                morldModule.ModuleDict["add_region_edge"] = Builtin("add_region_edge", args =>
                 {
                     if (args.Length < 4)
                         throw PyTypeError.Create("add_region_edge(from_region, from_local, to_region, to_local, time_ab=30, time_ba=30) requires at least 4 arguments");
@@ -514,14 +731,14 @@ namespace SE
                         );
                         regionEdge.SetTravelTime(timeAB, timeBA);
                         terrain.AddRegionEdge(regionEdge);
-                        Godot.GD.Print($"[morld] add_region_edge: {fromRegion}:{fromLocal} <-> {toRegion}:{toLocal}");
+                        _morldLog.Debug($"add_region_edge: {fromRegion}:{fromLocal} <-> {toRegion}:{toLocal}");
                         return PyBool.True;
                     }
                     return PyBool.False;
                 });
 
                 // === Time API (GameTime) ===
-                morldModule.ModuleDict["set_time"] = new PyBuiltinFunction("set_time", args =>
+                morldModule.ModuleDict["set_time"] = Builtin("set_time", args =>
                 {
                     if (args.Length < 4)
                         throw PyTypeError.Create("set_time(year, month, day, hour, minute=0) requires at least 4 arguments");
@@ -537,14 +754,14 @@ namespace SE
                         var time = _worldSystem.GetTime();
                         // SetTime(year, month, day, hour, minute)
                         time.SetTime(year, month, day, hour, minute);
-                        Godot.GD.Print($"[morld] set_time: {year}/{month}/{day} {hour}:{minute:D2}");
+                        _morldLog.Debug($"set_time: {year}/{month}/{day} {hour}:{minute:D2}");
                         return PyBool.True;
                     }
                     return PyBool.False;
                 });
 
                 // === Item API (ItemSystem) ===
-                morldModule.ModuleDict["add_item_def"] = new PyBuiltinFunction("add_item_def", args =>
+                morldModule.ModuleDict["add_item_def"] = Builtin("add_item_def", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("add_item_def(id, name, passive_tags=None, equip_tags=None, value=0, actions=None) requires at least 2 arguments");
@@ -568,14 +785,14 @@ namespace SE
                             item.Actions.AddRange(actions);
 
                         _itemSystem.AddItem(item);
-                        Godot.GD.Print($"[morld] add_item_def: id={id}, name={name}");
+                        _morldLog.Debug($"add_item_def: id={id}, name={name}");
                         return PyBool.True;
                     }
                     return PyBool.False;
                 });
 
                 // === Unit API (UnitSystem) ===
-                morldModule.ModuleDict["add_unit"] = new PyBuiltinFunction("add_unit", args =>
+                morldModule.ModuleDict["add_unit"] = Builtin("add_unit", args =>
                 {
                     if (args.Length < 4)
                         throw PyTypeError.Create("add_unit(id, name, region_id, location_id, type='male', actions=None, appearance=None, mood=None) requires at least 4 arguments");
@@ -606,13 +823,13 @@ namespace SE
                             foreach (var m in mood) unit.Mood.Add(m);
 
                         _unitSystem.AddUnit(unit);
-                        Godot.GD.Print($"[morld] add_unit: id={id}, name={name}, type={type}");
+                        _morldLog.Debug($"add_unit: id={id}, name={name}, type={type}");
                         return PyBool.True;
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["set_unit_tags"] = new PyBuiltinFunction("set_unit_tags", args =>
+                morldModule.ModuleDict["set_unit_tags"] = Builtin("set_unit_tags", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("set_unit_tags(unit_id, tags) requires 2 arguments");
@@ -625,15 +842,15 @@ namespace SE
                         var unit = _unitSystem.GetUnit(unitId);
                         if (unit != null)
                         {
-                            unit.TraversalContext.SetTags(tags);
-                            Godot.GD.Print($"[morld] set_unit_tags: unit={unitId}, tags={tags.Count}");
+                            RunOnMainThread(() => unit.TraversalContext.SetTags(tags));
+                            _morldLog.Debug($"set_unit_tags: unit={unitId}, tags={tags.Count}");
                             return PyBool.True;
                         }
                     }
                     return PyBool.False;
                 });
 
-                morldModule.ModuleDict["push_schedule"] = new PyBuiltinFunction("push_schedule", args =>
+                morldModule.ModuleDict["push_schedule"] = Builtin("push_schedule", args =>
                 {
                     if (args.Length < 2)
                         throw PyTypeError.Create("push_schedule(unit_id, name, end_type=None, end_param=None, schedule=None) requires at least 2 arguments");
@@ -668,14 +885,15 @@ namespace SE
                                 }
                             }
 
-                            unit.PushSchedule(new Morld.ScheduleLayer
+                            var layer = new Morld.ScheduleLayer
                             {
                                 Name = name,
                                 Schedule = schedule,
                                 EndConditionType = endType,
                                 EndConditionParam = endParam
-                            });
-                            Godot.GD.Print($"[morld] push_schedule: unit={unitId}, name={name}");
+                            };
+                            RunOnMainThread(() => unit.PushSchedule(layer));
+                            _morldLog.Debug($"push_schedule: unit={unitId}, name={name}");
                             return PyBool.True;
                         }
                     }
@@ -685,11 +903,11 @@ namespace SE
                 // === 초기화 완료 플래그 ===
                 morldModule.ModuleDict["data_api_ready"] = PyBool.True;
 
-                Godot.GD.Print("[ScriptSystem] Data manipulation API registered successfully.");
+                _log.Info("Data manipulation API registered successfully.");
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] RegisterDataManipulationAPI error: {ex.Message}");
+                _log.Error($"RegisterDataManipulationAPI error: {ex.Message}");
             }
         }
 
@@ -698,6 +916,7 @@ namespace SE
         /// </summary>
         private System.Collections.Generic.Dictionary<string, string> PyDictToStringDict(PyDict dict)
         {
+            var bridge = ApiStats.BeginBridge();
             var result = new System.Collections.Generic.Dictionary<string, string>();
             var keys = dict.Keys();  // PyList 반환
             for (int i = 0; i < keys.Length(); i++)
@@ -708,6 +927,7 @@ namespace SE
                 var valueStr = value is PyString vs ? vs.Value : value?.ToString() ?? "";
                 result[keyStr] = valueStr;
             }
+            ApiStats.EndBridge(bridge);
             return result;
         }
 
@@ -716,6 +936,7 @@ namespace SE
         /// </summary>
         private System.Collections.Generic.Dictionary<string, int> PyDictToIntDict(PyDict dict)
         {
+            var bridge = ApiStats.BeginBridge();
             var result = new System.Collections.Generic.Dictionary<string, int>();
             var keys = dict.Keys();  // PyList 반환
             for (int i = 0; i < keys.Length(); i++)
@@ -726,6 +947,7 @@ namespace SE
                 var valueInt = value is PyInt vi ? (int)vi.Value : 0;
                 result[keyStr] = valueInt;
             }
+            ApiStats.EndBridge(bridge);
             return result;
         }
 
@@ -734,12 +956,14 @@ namespace SE
         /// </summary>
         private System.Collections.Generic.List<string> PyListToStringList(PyList list)
         {
+            var bridge = ApiStats.BeginBridge();
             var result = new System.Collections.Generic.List<string>();
             for (int i = 0; i < list.Length(); i++)
             {
                 var item = list.GetItem(i);
                 result.Add(item is PyString ps ? ps.Value : item?.ToString() ?? "");
             }
+            ApiStats.EndBridge(bridge);
             return result;
         }
 
@@ -748,7 +972,9 @@ namespace SE
         /// </summary>
         private string GetPyDictString(PyDict dict, string key, string defaultValue)
         {
+            var bridge = ApiStats.BeginBridge();
             var value = dict.Get(new PyString(key));
+            ApiStats.EndBridge(bridge);
             return value is PyString ps ? ps.Value : defaultValue;
         }
 
@@ -757,7 +983,9 @@ namespace SE
         /// </summary>
         private int GetPyDictInt(PyDict dict, string key, int defaultValue)
         {
+            var bridge = ApiStats.BeginBridge();
             var value = dict.Get(new PyString(key));
+            ApiStats.EndBridge(bridge);
             return value is PyInt pi ? (int)pi.Value : defaultValue;
         }
 
@@ -766,7 +994,15 @@ namespace SE
         /// </summary>
         public PyObject Execute(string code)
         {
-            return _interpreter.Execute(code);
+            EnterInterpreter();
+            try
+            {
+                return _interpreter.Execute(code);
+            }
+            finally
+            {
+                ExitInterpreter();
+            }
         }
 
         /// <summary>
@@ -775,7 +1011,30 @@ namespace SE
         /// </summary>
         public PyObject Eval(string expression)
         {
-            return _interpreter.ExecuteEval(expression);
+            EnterInterpreter();
+            try
+            {
+                return _interpreter.ExecuteEval(expression);
+            }
+            finally
+            {
+                ExitInterpreter();
+            }
+        }
+
+        private void EnterInterpreter()
+        {
+            if (_interpreterDepth++ == 0)
+                _interpreterStart = System.Diagnostics.Stopwatch.GetTimestamp();
+        }
+
+        private void ExitInterpreter()
+        {
+            if (--_interpreterDepth == 0)
+            {
+                InterpreterTicks += System.Diagnostics.Stopwatch.GetTimestamp() - _interpreterStart;
+                InterpreterCalls++;
+            }
         }
 
         /// <summary>
@@ -783,32 +1042,27 @@ namespace SE
         /// </summary>
         public PyObject ExecuteFile(string filePath)
         {
-            string code;
-
-            // res:// 경로는 Godot FileAccess로 읽기
-            if (filePath.StartsWith("res://"))
+            // res://, user:// 또는 일반 파일 시스템 경로
+            if (!Morld.GamePath.FileExists(filePath))
             {
-                using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-                if (file == null)
-                {
-                    var error = Godot.FileAccess.GetOpenError();
-                    Godot.GD.PrintErr($"[ScriptSystem] Failed to open file: {filePath} (Error: {error})");
-                    return PyNone.Instance;
-                }
-                code = file.GetAsText();
+                _log.Error($"File not found: {filePath}");
+                return PyNone.Instance;
             }
-            else
+            if (!Morld.GamePath.TryReadAllText(filePath, out var code))
             {
-                // 일반 파일 시스템 경로
-                if (!System.IO.File.Exists(filePath))
-                {
-                    Godot.GD.PrintErr($"[ScriptSystem] File not found: {filePath}");
-                    return PyNone.Instance;
-                }
-                code = System.IO.File.ReadAllText(filePath);
+                _log.Error($"Failed to open file: {filePath}");
+                return PyNone.Instance;
             }
 
-            return _interpreter.Execute(code, filePath, false, false, false);
+            EnterInterpreter();
+            try
+            {
+                return _interpreter.Execute(code, filePath, false, false, false);
+            }
+            finally
+            {
+                ExitInterpreter();
+            }
         }
 
         /// <summary>
@@ -816,53 +1070,49 @@ namespace SE
         /// </summary>
         public void LoadMonologueScripts()
         {
-            Godot.GD.Print("[ScriptSystem] Loading monologue scripts...");
+            _log.Info("Loading monologue scripts...");
 
             // 시나리오 경로가 설정되지 않은 경우 경고
             if (string.IsNullOrEmpty(_scenarioPath))
             {
-                Godot.GD.PrintErr("[ScriptSystem] Scenario path not set! Call SetScenarioPath() first.");
+                _log.Error("Scenario path not set! Call SetScenarioPath() first.");
                 return;
             }
 
             try
             {
                 // 파일 내용을 읽어서 Execute로 직접 실행 (ExecuteFile 대신)
-                string code;
                 var filePath = ScenarioPythonPath + "monologues.py";
 
-                using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-                if (file == null)
+                if (!Morld.GamePath.TryReadAllText(filePath, out var code))
                 {
-                    var error = Godot.FileAccess.GetOpenError();
-                    Godot.GD.PrintErr($"[ScriptSystem] Failed to open monologue file: {filePath} (Error: {error})");
+                    _log.Error($"Failed to open monologue file: {filePath}");
                     return;
                 }
-                code = file.GetAsText();
 
-                Godot.GD.Print($"[ScriptSystem] Monologue file loaded from: {filePath} ({code.Length} chars)");
-                Godot.GD.Print($"[ScriptSystem] First 200 chars: {code.Substring(0, System.Math.Min(200, code.Length))}");
+                _log.Info($"Monologue file loaded from: {filePath} ({code.Length} chars)");
+                _log.Debug($"First 200 chars: {code.Substring(0, System.Math.Min(200, code.Length))}");
 
                 // Execute로 직접 실행 (전역 스코프에 함수 등록)
                 var execResult = Execute(code);
-                Godot.GD.Print($"[ScriptSystem] Execute result: {execResult?.GetType().Name} = {execResult}");
+                _log.Debug($"Execute result: {execResult?.GetType().Name} = {execResult}");
 
-                Godot.GD.Print("[ScriptSystem] Monologue scripts loaded successfully.");
+                _log.Info("Monologue scripts loaded successfully.");
 
                 // events.py 로드 (EventSystem용)
                 LoadEventsScript();
 
                 // 테스트: 함수가 정의되었는지 확인 (Eval 모드로 호출)
                 var testResult = Eval("get_monologue_page_count('intro_001')");
-                Godot.GD.Print($"[ScriptSystem] Test get_monologue_page_count: {testResult?.GetType().Name} = {testResult}");
+                _log.Debug($"Test get_monologue_page_count: {testResult?.GetType().Name} = {testResult}");
 
                 // 비교 테스트: RegisterTestFunctions에서 등록한 함수 호출
                 var testDialogueResult = Eval("test_dialogue('테스트')");
-                Godot.GD.Print($"[ScriptSystem] test_dialogue result: {testDialogueResult?.GetType().Name} = {testDialogueResult}");
+                _log.Debug($"test_dialogue result: {testDialogueResult?.GetType().Name} = {testDialogueResult}");
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] LoadMonologueScripts error: {ex.Message}");
+                _log.Error($"LoadMonologueScripts error: {ex.Message}");
             }
         }
 
@@ -875,25 +1125,23 @@ namespace SE
             {
                 var filePath = ScenarioPythonPath + "events.py";
 
-                using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-                if (file == null)
+                if (!Morld.GamePath.TryReadAllText(filePath, out var code))
                 {
                     // events.py는 선택적이므로 경고만 출력
-                    Godot.GD.Print($"[ScriptSystem] events.py not found (optional): {filePath}");
+                    _log.Debug($"events.py not found (optional): {filePath}");
                     return;
                 }
-                var code = file.GetAsText();
 
-                Godot.GD.Print($"[ScriptSystem] Events file loaded from: {filePath} ({code.Length} chars)");
+                _log.Info($"Events file loaded from: {filePath} ({code.Length} chars)");
 
                 // Execute로 직접 실행 (전역 스코프에 함수 등록)
                 Execute(code);
 
-                Godot.GD.Print("[ScriptSystem] Events script loaded successfully.");
+                _log.Info("Events script loaded successfully.");
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] LoadEventsScript error: {ex.Message}");
+                _log.Error($"LoadEventsScript error: {ex.Message}");
             }
         }
 
@@ -905,14 +1153,13 @@ namespace SE
         {
             var initPath = ScenarioPythonPath + "__init__.py";
 
-            using var file = Godot.FileAccess.Open(initPath, Godot.FileAccess.ModeFlags.Read);
-            if (file == null)
+            if (!Morld.GamePath.FileExists(initPath))
             {
-                Godot.GD.Print($"[ScriptSystem] Not a package-style scenario (no __init__.py)");
+                _log.Debug($"Not a package-style scenario (no __init__.py)");
                 return false;
             }
 
-            Godot.GD.Print($"[ScriptSystem] Loading package-style scenario...");
+            _log.Info($"Loading package-style scenario...");
 
             try
             {
@@ -926,14 +1173,17 @@ from objects import get_all_objects
 from objects.furniture import mirror_look
 from characters.player.events import job_select, job_confirm
 ";
-                Execute(importCode);
+                using (Morld.TraceRecorder.Span("import scenario package", "python"))
+                {
+                    Execute(importCode);
+                }
 
-                Godot.GD.Print("[ScriptSystem] Package-style scenario loaded successfully.");
+                _log.Info("Package-style scenario loaded successfully.");
                 return true;
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] LoadScenarioPackage error: {ex.Message}");
+                _log.Error($"LoadScenarioPackage error: {ex.Message}");
                 return false;
             }
         }
@@ -949,7 +1199,7 @@ from characters.player.events import job_select, job_confirm
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] LoadWorldDataFromPython error: {ex.Message}");
+                _log.Error($"LoadWorldDataFromPython error: {ex.Message}");
                 return null;
             }
         }
@@ -965,7 +1215,7 @@ from characters.player.events import job_select, job_confirm
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] LoadTimeDataFromPython error: {ex.Message}");
+                _log.Error($"LoadTimeDataFromPython error: {ex.Message}");
                 return null;
             }
         }
@@ -981,7 +1231,7 @@ from characters.player.events import job_select, job_confirm
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] LoadItemDataFromPython error: {ex.Message}");
+                _log.Error($"LoadItemDataFromPython error: {ex.Message}");
                 return null;
             }
         }
@@ -997,7 +1247,7 @@ from characters.player.events import job_select, job_confirm
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] LoadUnitDataFromPython error: {ex.Message}");
+                _log.Error($"LoadUnitDataFromPython error: {ex.Message}");
                 return null;
             }
         }
@@ -1008,42 +1258,51 @@ from characters.player.events import job_select, job_confirm
         public bool IsPythonDataSource()
         {
             var initPath = ScenarioPythonPath + "__init__.py";
-            return Godot.FileAccess.FileExists(initPath);
+            return Morld.GamePath.FileExists(initPath);
         }
 
+        // initialize_scenario()를 한 줄씩 나눈 실행 순서
+        private static readonly string[] InitializeScenarioSteps =
+        {
+            "import world",
+            "import items",
+            "from characters import initialize_characters",
+            "from objects import initialize_objects",
+            "print('[scenario] Initializing scenario data via morld API...')",
+            "world.initialize_world()",
+            "world.initialize_time()",
+            "items.initialize_items()",
+            "initialize_characters()",
+            "initialize_objects()",
+            "print('[scenario] Scenario data initialization complete!')",
+        };
+
         /// <summary>
         /// Python 시나리오의 initialize_scenario() 함수 호출
         /// morld API를 통해 게임 데이터를 직접 등록
         /// </summary>
         public void CallInitializeScenario()
         {
-            Godot.GD.Print("[ScriptSystem] Calling initialize_scenario()...");
+            _log.Debug("Calling initialize_scenario()...");
 
             try
             {
                 // 현재 sys.path에 시나리오 python 폴더가 있으므로 직접 모듈 import
                 // __init__.py의 initialize_scenario() 내용을 직접 실행
-                var code = @"
-import world
-import items
-from characters import initialize_characters
-from objects import initialize_objects
-
-print('[scenario] Initializing scenario data via morld API...')
-world.initialize_world()
-world.initialize_time()
-items.initialize_items()
-initialize_characters()
-initialize_objects()
-print('[scenario] Scenario data initialization complete!')
-";
-                Execute(code);
+                // (시작 trace에서 모듈/함수별로 구분되도록 한 줄씩 실행)
+                foreach (var line in InitializeScenarioSteps)
+                {
+                    using (Morld.TraceRecorder.Span(line, "python"))
+                    {
+                        Execute(line);
+                    }
+                }
 
-                Godot.GD.Print("[ScriptSystem] initialize_scenario() completed.");
+                _log.Info("initialize_scenario() completed.");
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] CallInitializeScenario error: {ex.Message}");
+                _log.Error($"CallInitializeScenario error: {ex.Message}");
             }
         }
 
@@ -1052,16 +1311,16 @@ print('[scenario] Scenario data initialization complete!')
         /// </summary>
         public void TestHelloWorld()
         {
-            Godot.GD.Print("[ScriptSystem] Testing Python Hello World...");
+            _log.Debug("Testing Python Hello World...");
 
             try
             {
                 var result = Execute("print('Hello, World from Python!')");
-                Godot.GD.Print($"[ScriptSystem] Execution completed. Result: {result}");
+                _log.Info($"Execution completed. Result: {result}");
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] Error: {ex.Message}");
+                _log.Error($"Error: {ex.Message}");
             }
         }
 
@@ -1074,8 +1333,9 @@ print('[scenario] Scenario data initialization complete!')
         /// <returns>함수 실행 결과 (ScriptResult)</returns>
         public ScriptResult CallFunctionEx(string functionName, string[] args, int? contextUnitId = null)
         {
-            Godot.GD.Print($"[ScriptSystem] CallFunctionEx: {functionName}({string.Join(", ", args)}) [contextUnitId={contextUnitId?.ToString() ?? "null"}]");
+            _log.Debug($"CallFunctionEx: {functionName}({string.Join(", ", args)}) [contextUnitId={contextUnitId?.ToString() ?? "null"}]");
 
+            var profiled = Profiler.Enter("script", functionName);
             try
             {
                 // 인자를 Python 형태로 변환
@@ -1099,12 +1359,12 @@ print('[scenario] Scenario data initialization complete!')
                 }
 
                 var code = $"{functionName}({string.Join(", ", pyArgs)})";
-                Godot.GD.Print($"[ScriptSystem] Evaluating: {code}");
+                _log.Debug($"Evaluating: {code}");
 
                 // Eval 모드로 실행해야 함수 호출 결과를 반환받을 수 있음
                 var result = Eval(code);
 
-                Godot.GD.Print($"[ScriptSystem] Result type: {result?.GetType().Name ?? "null"}, value: {result}");
+                _log.Debug($"Result type: {result?.GetType().Name ?? "null"}, value: {result}");
 
                 // PyDict인 경우 구조화된 결과로 파싱
                 if (result is PyDict dict)
@@ -1131,9 +1391,13 @@ print('[scenario] Scenario data initialization complete!')
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] CallFunctionEx error: {ex.Message}");
+                _log.Error($"CallFunctionEx error: {ex.Message}");
                 return new ScriptResult { Type = "error", Message = ex.Message };
             }
+            finally
+            {
+                if (profiled) Profiler.Exit();
+            }
         }
 
         /// <summary>
@@ -1190,7 +1454,7 @@ print('[scenario] Scenario data initialization complete!')
                 string doneCallback = (doneCallbackObj as PyString)?.Value;
                 string cancelCallback = (cancelCallbackObj as PyString)?.Value;
 
-                Godot.GD.Print($"[ScriptSystem] Parsed {type} result: {pages.Count} pages, {timeConsumed}min, button={buttonType}");
+                _log.Debug($"Parsed {type} result: {pages.Count} pages, {timeConsumed}min, button={buttonType}");
                 return new MonologueScriptResult
                 {
                     Type = type,  // "monologue" 또는 "update"
@@ -1221,12 +1485,175 @@ print('[scenario] Scenario data initialization complete!')
             return result.Message;
         }
 
+        // ===== 비동기 실행 =====
+
+        /// <summary>
+        /// 비동기 실행 모드 시작 - 이후 *Async 호출은 전용 스레드에서 실행
+        /// morld.* 변경은 명령 큐에 쌓였다가 ApplyPendingCommands()에서 메인 스레드로 적용
+        /// </summary>
+        public void EnableAsyncExecution()
+        {
+            if (_worker != null)
+                return;
+
+            _worker = new Morld.ScriptWorker();
+            _log.Info("Async script execution enabled");
+        }
+
+        /// <summary>
+        /// 비동기 실행 모드 종료 (남은 호출을 기다려 적용한 뒤 스레드 종료)
+        /// </summary>
+        public void DisableAsyncExecution()
+        {
+            if (_worker == null)
+                return;
+
+            _worker.Drain();
+            _worker.Dispose();
+            _worker = null;
+        }
+
+        /// <summary>
+        /// 스크립트 스레드가 쌓은 명령 적용 및 완료된 호출 처리 (메인 스레드, 프레임 시작에서 호출)
+        /// </summary>
+        /// <returns>처리한 항목 수</returns>
+        public int ApplyPendingCommands()
+        {
+            return _worker?.Pump() ?? 0;
+        }
+
+        /// <summary>
+        /// CallFunctionEx 비동기 버전 - 비동기 모드가 아니면 바로 실행하고 완료된 Task 반환
+        /// Task는 메인 스레드에서, 호출 중 생긴 morld.* 변경이 모두 적용된 뒤 완료됨
+        /// </summary>
+        public System.Threading.Tasks.Task<ScriptResult> CallFunctionAsync(string functionName, string[] args, int? contextUnitId = null)
+        {
+            if (_worker == null)
+                return System.Threading.Tasks.Task.FromResult(CallFunctionEx(functionName, args, contextUnitId));
+
+            return _worker.Submit(() =>
+            {
+                BeginScriptJob();
+                return CallFunctionEx(functionName, args, contextUnitId);
+            });
+        }
+
+        /// <summary>
+        /// CallEventHandler 비동기 버전 (이벤트 목록은 복사해서 전달)
+        /// </summary>
+        public System.Threading.Tasks.Task<ScriptResult> CallEventHandlerAsync(System.Collections.Generic.List<Morld.GameEvent> events)
+        {
+            if (_worker == null)
+                return System.Threading.Tasks.Task.FromResult(CallEventHandler(events));
+
+            var snapshot = new System.Collections.Generic.List<Morld.GameEvent>(events);
+            return _worker.Submit(() =>
+            {
+                BeginScriptJob();
+                return CallEventHandler(snapshot);
+            });
+        }
+
+        /// <summary>
+        /// Python 함수 추적 설치 - 시나리오 패키지 모듈의 함수를 morld.profile_enter/exit 래퍼로 교체
+        /// 캐릭터별 events.py 핸들러처럼 Python 안에서 호출되는 함수도 프로파일러 스택에 나타남
+        /// 시나리오 로드 후 호출, 이미 감싼 함수는 건너뜀
+        /// </summary>
+        /// <returns>새로 감싼 함수 수</returns>
+        public int EnableScriptTracing()
+        {
+            var modules = new System.Collections.Generic.List<string>();
+            var root = Morld.GamePath.Globalize(ScenarioPythonPath);
+            if (System.IO.Directory.Exists(root))
+                CollectModuleNames(root, "", modules);
+
+            var code = new System.Text.StringBuilder(TracingHelperCode);
+            foreach (var module in modules)
+            {
+                var dot = module.LastIndexOf('.');
+                var importLine = dot < 0
+                    ? $"import {module} as __morld_m"
+                    : $"from {module.Substring(0, dot)} import {module.Substring(dot + 1)} as __morld_m";
+                code.Append($"try:\n    {importLine}\n    __morld_trace_count += __morld_trace_module(__morld_m, '{module}')\nexcept Exception as e:\n    print(f'[trace] {module}: {{e}}')\n");
+            }
+
+            try
+            {
+                Execute(code.ToString());
+                var count = Eval("__morld_trace_count") is PyInt pyInt ? (int)pyInt.Value : 0;
+                _log.Debug($"Script tracing enabled: {count} functions in {modules.Count} modules");
+                return count;
+            }
+            catch (System.Exception ex)
+            {
+                _log.Error($"EnableScriptTracing error: {ex.Message}");
+                return 0;
+            }
+        }
+
+        private static void CollectModuleNames(string directory, string prefix, System.Collections.Generic.List<string> modules)
+        {
+            foreach (var file in System.IO.Directory.GetFiles(directory, "*.py"))
+            {
+                var name = System.IO.Path.GetFileNameWithoutExtension(file);
+                modules.Add(name == "__init__" ? prefix.TrimEnd('.') : prefix + name);
+            }
+            foreach (var sub in System.IO.Directory.GetDirectories(directory))
+            {
+                if (System.IO.File.Exists(System.IO.Path.Combine(sub, "__init__.py")))
+                    CollectModuleNames(sub, prefix + System.IO.Path.GetFileName(sub) + ".", modules);
+            }
+            modules.RemoveAll(string.IsNullOrEmpty);
+        }
+
+        // 모듈 소속 함수만 감쌈 (from X import f 로 가져온 함수는 원래 모듈에서 감쌈)
+        private const string TracingHelperCode = @"
+import morld
+
+try:
+    __morld_trace_count
+except NameError:
+    __morld_trace_count = 0
+    __morld_traced = {}
+
+def __morld_wrap(fn, frame):
+    def traced(*args, **kwargs):
+        entered = morld.profile_enter(frame)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            if entered:
+                morld.profile_exit()
+    return traced
+
+def __morld_trace_module(module, module_name):
+    count = 0
+    for name in dir(module):
+        if name.startswith('_'):
+            continue
+        fn = getattr(module, name)
+        if type(fn).__name__ != 'function':
+            continue
+        owner = getattr(fn, '__module__', None)
+        if owner is not None and owner != module_name:
+            continue
+        frame = module_name + '.' + name
+        if __morld_traced.get(frame) is fn:
+            continue
+        wrapped = __morld_wrap(fn, frame)
+        setattr(module, name, wrapped)
+        __morld_traced[frame] = wrapped
+        count += 1
+    return count
+
+";
+
         /// <summary>
         /// 테스트용 Python 함수 등록
         /// </summary>
         public void RegisterTestFunctions()
         {
-            Godot.GD.Print("[ScriptSystem] Registering test functions...");
+            _log.Info("Registering test functions...");
 
             var testCode = @"
 def test_dialogue(character_name):
@@ -1245,11 +1672,11 @@ def calculate(a, b):
             try
             {
                 Execute(testCode);
-                Godot.GD.Print("[ScriptSystem] Test functions registered successfully.");
+                _log.Info("Test functions registered successfully.");
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] RegisterTestFunctions error: {ex.Message}");
+                _log.Error($"RegisterTestFunctions error: {ex.Message}");
             }
         }
 
@@ -1262,8 +1689,9 @@ def calculate(a, b):
         {
             if (events == null || events.Count == 0) return null;
 
-            Godot.GD.Print($"[ScriptSystem] CallEventHandler: {events.Count} events");
+            _log.Debug($"CallEventHandler: {events.Count} events");
 
+            var profiled = Profiler.Enabled && Profiler.Enter("event", GetEventTypeKey(events));
             try
             {
                 // 이벤트 목록을 Python 리스트 리터럴로 변환
@@ -1286,7 +1714,7 @@ def calculate(a, b):
 
                 var listLiteral = $"[{string.Join(", ", eventStrings)}]";
                 var code = $"on_event_list({listLiteral})";
-                Godot.GD.Print($"[ScriptSystem] Evaluating: {code}");
+                _log.Debug($"Evaluating: {code}");
 
                 // on_event_list() 호출
                 var result = Eval(code);
@@ -1302,14 +1730,33 @@ def calculate(a, b):
                     return ParseDictResult(dict);
                 }
 
-                Godot.GD.Print($"[ScriptSystem] Unknown event result: {result}");
+                _log.Debug($"Unknown event result: {result}");
                 return null;
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] CallEventHandler error: {ex.Message}");
+                _log.Error($"CallEventHandler error: {ex.Message}");
                 return null;
             }
+            finally
+            {
+                if (profiled) Profiler.Exit();
+            }
+        }
+
+        /// <summary>
+        /// 프로파일러 프레임 이름용 이벤트 타입 목록 (등장 순서, 중복 제거, 예: "game_start+on_meet")
+        /// </summary>
+        private static string GetEventTypeKey(System.Collections.Generic.List<Morld.GameEvent> events)
+        {
+            var types = new System.Collections.Generic.List<string>();
+            foreach (var evt in events)
+            {
+                var type = evt.ToPythonTuple()[0] as string ?? "unknown";
+                if (!types.Contains(type))
+                    types.Add(type);
+            }
+            return string.Join("+", types);
         }
 
         /// <summary>
@@ -1326,6 +1773,7 @@ def calculate(a, b):
             var result = new System.Collections.Generic.List<string>();
             if (unitIds == null || unitIds.Count == 0) return result;
 
+            var profiled = Profiler.Enter("", "presence");
             try
             {
                 // Python 리스트 리터럴 생성
@@ -1348,7 +1796,11 @@ def calculate(a, b):
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] GetCharacterPresenceTexts error: {ex.Message}");
+                _log.Error($"GetCharacterPresenceTexts error: {ex.Message}");
+            }
+            finally
+            {
+                if (profiled) Profiler.Exit();
             }
 
             return result;
@@ -1361,7 +1813,7 @@ def calculate(a, b):
         /// <returns>이벤트 결과 (EventResult)</returns>
         public EventResult TriggerEvent(string eventName)
         {
-            Godot.GD.Print($"[ScriptSystem] TriggerEvent: {eventName}");
+            _log.Debug($"TriggerEvent: {eventName}");
 
             try
             {
@@ -1403,7 +1855,7 @@ def calculate(a, b):
                             timeConsumed = (int)timeInt.Value;
                         }
 
-                        Godot.GD.Print($"[ScriptSystem] Event result: monologue ({pages.Count} pages, {timeConsumed}min)");
+                        _log.Debug($"Event result: monologue ({pages.Count} pages, {timeConsumed}min)");
                         return new MonologueEventResult
                         {
                             Type = "monologue",
@@ -1413,12 +1865,12 @@ def calculate(a, b):
                     }
                 }
 
-                Godot.GD.Print($"[ScriptSystem] Unknown event result: {result}");
+                _log.Debug($"Unknown event result: {result}");
                 return null;
             }
             catch (System.Exception ex)
             {
-                Godot.GD.PrintErr($"[ScriptSystem] TriggerEvent error: {ex.Message}");
+                _log.Error($"TriggerEvent error: {ex.Message}");
                 return null;
             }
         }
@@ -1,7 +1,4 @@
-#define DEBUG_LOG
-
 using ECS;
-using Godot;
 using Morld;
 using System;
 using System.Collections.Generic;
@@ -15,6 +12,8 @@ namespace SE
 	/// </summary>
 	public class SingASongSystem : ECS.System, IActionProvider
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("SingASongSystem");
+
 		public string ProviderId => "singasong";
 
 		public SingASongSystem()
@@ -57,9 +56,7 @@ namespace SE
 			var describeSystem = _hub?.FindSystem("describeSystem") as DescribeSystem;
 			describeSystem?.ActionRegistry.Register(this);
 
-#if DEBUG_LOG
-			GD.Print("[SingASongSystem] 노래 부르기 시스템 활성화됨");
-#endif
+			_log.Debug("노래 부르기 시스템 활성화됨");
 		}
 
 		/// <summary>
@@ -70,9 +67,7 @@ namespace SE
 			var describeSystem = _hub?.FindSystem("describeSystem") as DescribeSystem;
 			describeSystem?.ActionRegistry.Unregister(this);
 
-#if DEBUG_LOG
-			GD.Print("[SingASongSystem] 노래 부르기 시스템 비활성화됨");
-#endif
+			_log.Debug("노래 부르기 시스템 비활성화됨");
 
 			base.Destroy();
 		}
@@ -4,7 +4,6 @@ using System.IO;
 using System.Linq;
 using System.Text.Json;
 using ECS;
-using Godot;
 using Morld;
 
 namespace SE
@@ -27,30 +26,53 @@ namespace SE
 	/// UI 텍스트 시스템 (Focus 스택 기반)
 	/// 스택에는 Focus 정보만 저장하고, 표시 시 항상 최신 데이터로 렌더링
 	/// </summary>
-	public class TextUISystem : ECS.System
+	public class TextUISystem : ECS.System, ICheckpointable
 	{
-		private readonly RichTextLabel _textUi;
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("TextUISystem");
+
+		private readonly Action<string> _present;
 		private readonly FocusStack _stack = new();
 		private readonly DescribeSystem _describeSystem;
 		private string? _hoveredMeta = null;
+		private string? _progressText = null;   // 시간 진행 중 표시 (StepScheduler 진행률)
 
-		// 행동 로그 시스템
-		private readonly List<ActionLogEntry> _actionLogs = new();
+		// 행동 로그 시스템 (고정 용량 링 버퍼)
 		private const int MaxLogLength = 20;   // 최대 로그 보관 개수
 		private const int PrintCount = 5;      // 화면에 표시할 최근 로그 개수
+		private readonly ActionLogBuffer _actionLogs;
 
 		// Lazy update 플래그
 		private bool _needsUpdateDisplay = false;
+		private bool _needsToggleUpdate = false;  // 토글만 바뀐 경우 (문서 트리에서 재출력)
+		private bool _needsHoverUpdate = false;   // hover만 바뀐 경우 (재렌더링 없이 색상만 갱신)
+
+		// 마지막 렌더링 결과 (토글/hover 변경 시 재사용)
+		private ToggleDocument? _document = null;
+		private RenderedText? _rendered = null;
 
 		// 데이터 조회용 참조 (UpdateDisplay에서 사용)
 		private PlayerSystem? _playerSystem;
 		private InventorySystem? _inventorySystem;
 		private ScriptSystem? _scriptSystem;
 
-		public TextUISystem(RichTextLabel textUi, DescribeSystem describeSystem)
+#if GODOT
+		/// <param name="logHistoryPath">밀려난 행동 로그를 기록할 gzip 파일 경로 (null = 기록 안 함)</param>
+		public TextUISystem(Godot.RichTextLabel textUi, DescribeSystem describeSystem, string? logHistoryPath = null)
+			: this(text => textUi.Text = text, describeSystem, logHistoryPath)
+		{
+		}
+#endif
+
+		/// <summary>
+		/// 렌더링 결과(BBCode)를 RichTextLabel 대신 콜백으로 전달 (헤드리스 실행용)
+		/// </summary>
+		/// <param name="present">FlushDisplay마다 최종 BBCode 텍스트를 받는 콜백</param>
+		/// <param name="logHistoryPath">밀려난 행동 로그를 기록할 gzip 파일 경로 (null = 기록 안 함)</param>
+		public TextUISystem(Action<string> present, DescribeSystem describeSystem, string? logHistoryPath = null)
 		{
-			_textUi = textUi;
+			_present = present;
 			_describeSystem = describeSystem;
+			_actionLogs = new ActionLogBuffer(MaxLogLength, logHistoryPath);
 		}
 
 		/// <summary>
@@ -70,7 +92,18 @@ namespace SE
 		{
 			if (_hoveredMeta == meta) return;
 			_hoveredMeta = meta;
-			RequestUpdateDisplay();
+			_needsHoverUpdate = true;
+		}
+
+		/// <summary>
+		/// 시간 진행 표시 설정 (null = 숨김)
+		/// 화면 하단에 덧붙이며, 재렌더링 없이 hover 갱신 경로로 다시 출력
+		/// </summary>
+		public void SetProgress(string? text)
+		{
+			if (_progressText == text) return;
+			_progressText = text;
+			_needsHoverUpdate = true;
 		}
 
 		/// <summary>
@@ -87,27 +120,55 @@ namespace SE
 		/// </summary>
 		public bool IsStackEmpty() => _stack.Count == 0;
 
+		/// <summary>
+		/// 최종 텍스트 출력 (진행 표시가 있으면 하단에 덧붙임)
+		/// </summary>
+		private void Present(string text)
+		{
+			_present(_progressText == null ? text : $"{text}\n\n[color=gray]{_progressText}[/color]");
+		}
+
 		/// <summary>
 		/// 대기 중인 UI 업데이트 수행 (lazy update 적용)
 		/// </summary>
 		public void FlushDisplay()
 		{
-			if (!_needsUpdateDisplay) return;
+			// 비동기 스크립트 실행 중에는 전체 렌더링(presence text 등 Python 호출 포함)을 완료 후로 미룸
+			if (!_needsUpdateDisplay || (_scriptSystem?.IsBusy ?? false))
+			{
+				// 토글만 바뀐 경우: 보관된 문서 트리에서 재출력
+				if (_needsToggleUpdate && _document != null && _stack.Current != null)
+				{
+					_needsToggleUpdate = false;
+					_needsHoverUpdate = false;
+					_rendered = _document.Resolve(_stack.Current.ExpandedToggles);
+					Present(ToggleRenderer.EmitHover(_rendered, _hoveredMeta));
+				}
+				// hover만 바뀐 경우: 보관된 렌더링 결과에 색상만 다시 적용
+				else if (_needsHoverUpdate && _rendered != null)
+				{
+					_needsHoverUpdate = false;
+					Present(ToggleRenderer.EmitHover(_rendered, _hoveredMeta));
+				}
+				return;
+			}
 			_needsUpdateDisplay = false;
+			_needsToggleUpdate = false;
+			_needsHoverUpdate = false;
 
 			if (_stack.Current == null)
 			{
-				_textUi.Text = "";
+				_document = null;
+				_rendered = null;
+				_present("");
 				return;
 			}
 
 			var text = RenderFocus(_stack.Current);
 
-			_textUi.Text = ToggleRenderer.Render(
-				text,
-				_stack.Current.ExpandedToggles,
-				_hoveredMeta
-			);
+			_document = ToggleDocument.Parse(text);
+			_rendered = _document.Resolve(_stack.Current.ExpandedToggles);
+			Present(ToggleRenderer.EmitHover(_rendered, _hoveredMeta));
 
 			// 읽음 처리는 FlushDisplay에서 하지 않음
 			// OnPlayerAction()에서 플레이어 액션 시점에 처리
@@ -147,14 +208,9 @@ namespace SE
 		/// </summary>
 		public void AddActionLog(string message)
 		{
+			// MaxLogLength 초과 시 가장 오래된 로그를 덮어씀
 			_actionLogs.Add(new ActionLogEntry(message));
 
-			// MaxLogLength 초과 시 오래된 로그 삭제
-			while (_actionLogs.Count > MaxLogLength)
-			{
-				_actionLogs.RemoveAt(0);
-			}
-
 			// UI 업데이트 요청 (lazy)
 			RequestUpdateDisplay();
 		}
@@ -165,9 +221,7 @@ namespace SE
 		public IReadOnlyList<ActionLogEntry> GetPrintableLogs()
 		{
 			// 최근 PrintCount개만 반환
-			return _actionLogs
-				.TakeLast(PrintCount)
-				.ToList();
+			return _actionLogs.GetLast(PrintCount);
 		}
 
 		/// <summary>
@@ -175,10 +229,7 @@ namespace SE
 		/// </summary>
 		public void MarkAllLogsAsRead()
 		{
-			foreach (var log in _actionLogs)
-			{
-				log.IsRead = true;
-			}
+			_actionLogs.MarkAllAsRead();
 		}
 
 		/// <summary>
@@ -187,17 +238,33 @@ namespace SE
 		private void MarkPrintedLogsAsRead()
 		{
 			// 최근 PrintCount개만 읽음 처리
-			var printedLogs = _actionLogs.TakeLast(PrintCount);
-			foreach (var log in printedLogs)
-			{
-				log.IsRead = true;
-			}
+			_actionLogs.MarkLastAsRead(PrintCount);
 		}
 
 		/// <summary>
 		/// 읽지 않은 로그 개수
 		/// </summary>
-		public int UnreadLogCount => _actionLogs.Count(e => !e.IsRead);
+		public int UnreadLogCount => _actionLogs.UnreadCount;
+
+		/// <summary>
+		/// 밀려난 행동 로그 히스토리 파일 기록 (대기분 flush)
+		/// </summary>
+		public void FlushLogHistory()
+		{
+			_actionLogs.FlushHistory();
+		}
+
+		// ===== 체크포인트 (행동 로그) =====
+
+		public void BeginCheckpoint() => _actionLogs.BeginCheckpoint();
+
+		public void RollbackCheckpoint()
+		{
+			_actionLogs.RollbackCheckpoint();
+			RequestUpdateDisplay();
+		}
+
+		public void ReleaseCheckpoint() => _actionLogs.ReleaseCheckpoint();
 
 		/// <summary>
 		/// 디버그용: 전체 로그 상태 출력
@@ -205,11 +272,11 @@ namespace SE
 		public void DebugPrintLogs()
 		{
 #if DEBUG_LOG
-			GD.Print($"[ActionLogs] Total: {_actionLogs.Count}, Unread: {UnreadLogCount}");
-			foreach (var log in _actionLogs)
+			_log.Debug($"[ActionLogs] Total: {_actionLogs.Count}, Unread: {UnreadLogCount}");
+			foreach (var log in _actionLogs.Enumerate())
 			{
 				var readMark = log.IsRead ? "[R]" : "[U]";
-				GD.Print($"  {readMark} {log.Message}");
+				_log.Debug($"  {readMark} {log.Message}");
 			}
 #endif
 		}
@@ -538,7 +605,11 @@ namespace SE
 			else
 				toggles.Add(toggleId);
 
-			RequestUpdateDisplay();
+			// 텍스트 내용은 그대로이므로 파싱된 문서에서 재출력
+			if (_document != null)
+				_needsToggleUpdate = true;
+			else
+				RequestUpdateDisplay();
 		}
 
 		/// <summary>
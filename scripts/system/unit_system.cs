@@ -1,5 +1,4 @@
 using ECS;
-using Godot;
 using Morld;
 using System;
 using System.Collections.Generic;
@@ -8,8 +7,10 @@ using System.Text.Json;
 
 namespace SE
 {
-	public class UnitSystem : ECS.System
+	public class UnitSystem : ECS.System, ICheckpointable
 	{
+		private static readonly Morld.LogCategory _log = Morld.Log.Category("UnitSystem");
+
 		private readonly Dictionary<int, Unit> _units = new();
 
 		public UnitSystem()
@@ -21,6 +22,11 @@ namespace SE
 		/// </summary>
 		public IReadOnlyDictionary<int, Unit> Units => _units;
 
+		/// <summary>
+		/// 모든 유닛 값 (매 Step 순회용 - 구조체 열거자라 할당 없음)
+		/// </summary>
+		public Dictionary<int, Unit>.ValueCollection UnitValues => _units.Values;
+
 		/// <summary>
 		/// 유닛 추가
 		/// </summary>
@@ -56,17 +62,52 @@ namespace SE
 			_units.Clear();
 		}
 
+		#region Checkpoint
+
 		/// <summary>
-		/// JSON 파일에서 유닛 데이터 로드
+		/// 체크포인트 레이어 (체크포인트 시점의 유닛 목록과 각 유닛 상태)
+		/// 유닛 상태는 여러 시스템(이동, 스케줄, 스크립트)에서 직접 수정되므로
+		/// 수정 시점 추적 대신 체크포인트 시작 시 한 번에 복사
 		/// </summary>
-		public UnitSystem UpdateFromFile(string filePath)
+		private readonly List<Dictionary<Unit, Unit.State>> _checkpoints = new();
+
+		public void BeginCheckpoint()
 		{
-			using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Read);
-			if (file == null)
+			var states = new Dictionary<Unit, Unit.State>(_units.Count);
+			foreach (var unit in _units.Values)
+			{
+				states[unit] = unit.CaptureState();
+			}
+			_checkpoints.Add(states);
+		}
+
+		public void RollbackCheckpoint()
+		{
+			var states = _checkpoints[^1];
+			_checkpoints.RemoveAt(_checkpoints.Count - 1);
+
+			// 체크포인트 이후 추가/교체된 유닛 제거, 기존 유닛 객체는 그대로 재사용
+			_units.Clear();
+			foreach (var (unit, state) in states)
 			{
-				throw new InvalidOperationException($"Failed to open file for reading: {filePath}");
+				unit.RestoreState(state);
+				_units[unit.Id] = unit;
 			}
-			var json = file.GetAsText();
+		}
+
+		public void ReleaseCheckpoint()
+		{
+			_checkpoints.RemoveAt(_checkpoints.Count - 1);
+		}
+
+		#endregion
+
+		/// <summary>
+		/// JSON 파일에서 유닛 데이터 로드
+		/// </summary>
+		public UnitSystem UpdateFromFile(string filePath)
+		{
+			var json = GamePath.ReadAllText(filePath);
 			UpdateFromJson(json);
 			return this;
 		}
@@ -92,7 +133,7 @@ namespace SE
 		/// <summary>
 		/// UnitJsonData 배열로 유닛 데이터 로드
 		/// </summary>
-		private void UpdateFromData(UnitJsonData[] dataList)
+		internal void UpdateFromData(UnitJsonData[] dataList)
 		{
 			// 기존 유닛 모두 제거
 			ClearUnits();
@@ -189,12 +230,7 @@ namespace SE
 		{
 			var json = ToJson();
 
-			using var file = Godot.FileAccess.Open(filePath, Godot.FileAccess.ModeFlags.Write);
-			if (file == null)
-			{
-				throw new InvalidOperationException($"Failed to open file for writing: {filePath}");
-			}
-			file.StoreString(json);
+			GamePath.WriteAllText(filePath, json);
 		}
 
 		/// <summary>
@@ -217,7 +253,7 @@ namespace SE
 		/// UnitJsonData 배열로 변환
 		/// 주의: Inventory와 EquippedItems는 InventorySystem에서 저장됨
 		/// </summary>
-		private UnitJsonData[] ExportToData()
+		internal UnitJsonData[] ExportToData()
 		{
 			return _units.Values.Select(unit => new UnitJsonData
 			{
@@ -270,7 +306,7 @@ namespace SE
 		/// <summary>
 		/// 문자열을 UnitType으로 변환
 		/// </summary>
-		private static UnitType ParseUnitType(string type)
+		internal static UnitType ParseUnitType(string type)
 		{
 			return type?.ToLower() switch
 			{
@@ -287,10 +323,8 @@ namespace SE
 		/// </summary>
 		public void MigrateInventoryData(string jsonFilePath, InventorySystem inventorySystem)
 		{
-			using var file = Godot.FileAccess.Open(jsonFilePath, Godot.FileAccess.ModeFlags.Read);
-			if (file == null) return;
+			if (!GamePath.TryReadAllText(jsonFilePath, out var json)) return;
 
-			var json = file.GetAsText();
 			var options = new JsonSerializerOptions
 			{
 				PropertyNameCaseInsensitive = true
@@ -320,9 +354,7 @@ namespace SE
 				}
 			}
 
-#if DEBUG_LOG
-			GD.Print($"[UnitSystem] 인벤토리 데이터 마이그레이션 완료");
-#endif
+			_log.Debug($"인벤토리 데이터 마이그레이션 완료");
 		}
 
 		/// <summary>
@@ -333,37 +365,37 @@ namespace SE
 			var characters = _units.Values.Where(u => !u.IsObject).ToList();
 			var objects = _units.Values.Where(u => u.IsObject).ToList();
 
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-			GD.Print($"  캐릭터 수: {characters.Count}, 오브젝트 수: {objects.Count}");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug($"  캐릭터 수: {characters.Count}, 오브젝트 수: {objects.Count}");
 			foreach (var unit in characters)
 			{
-				GD.Print($"  - {unit}");
-				GD.Print($"    스케줄 스택: {unit.ScheduleStack.Count}개 레이어");
+				_log.Debug($"  - {unit}");
+				_log.Debug($"    스케줄 스택: {unit.ScheduleStack.Count}개 레이어");
 				if (unit.CurrentScheduleLayer != null)
 				{
 					var layer = unit.CurrentScheduleLayer;
 					var scheduleInfo = layer.Schedule != null ? $"{layer.Schedule.Entries.Count}개 엔트리" : "없음";
-					GD.Print($"    현재 레이어: {layer.Name} (스케줄: {scheduleInfo})");
+					_log.Debug($"    현재 레이어: {layer.Name} (스케줄: {scheduleInfo})");
 				}
 				if (unit.TraversalContext.Tags.Count > 0)
 				{
 					var tags = string.Join(", ", unit.TraversalContext.Tags.Select(t => $"{t.Key}:{t.Value}"));
-					GD.Print($"    태그: {tags}");
+					_log.Debug($"    태그: {tags}");
 				}
 				if (unit.Actions.Count > 0)
 				{
-					GD.Print($"    액션: {string.Join(", ", unit.Actions)}");
+					_log.Debug($"    액션: {string.Join(", ", unit.Actions)}");
 				}
 			}
 			foreach (var obj in objects)
 			{
-				GD.Print($"  - [Object] {obj.Name} @ {obj.CurrentLocation}");
+				_log.Debug($"  - [Object] {obj.Name} @ {obj.CurrentLocation}");
 				if (obj.Actions.Count > 0)
 				{
-					GD.Print($"    액션: {string.Join(", ", obj.Actions)}");
+					_log.Debug($"    액션: {string.Join(", ", obj.Actions)}");
 				}
 			}
-			GD.Print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+			_log.Debug("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
 		}
 	}
 }
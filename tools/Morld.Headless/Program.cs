@@ -0,0 +1,27 @@
+using System.IO;
+
+/// <summary>
+/// Godot 런타임 없이 실행하는 헤드리스 진입점
+/// res:// 는 project.godot가 있는 폴더(현재 폴더부터 위로 탐색)로 연결, 인자 처리는 HeadlessCommand
+/// </summary>
+public static class Program
+{
+	public static int Main(string[] args)
+	{
+		var root = FindProjectRoot(Directory.GetCurrentDirectory());
+		if (root != null)
+			Morld.GamePath.ResourceRoot = root;
+
+		return HeadlessCommand.Run(args);
+	}
+
+	private static string? FindProjectRoot(string start)
+	{
+		for (var dir = new DirectoryInfo(start); dir != null; dir = dir.Parent)
+		{
+			if (File.Exists(Path.Combine(dir.FullName, "project.godot")))
+				return dir.FullName;
+		}
+		return null;
+	}
+}